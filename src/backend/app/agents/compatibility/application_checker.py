@@ -6,7 +6,7 @@ import logging
 from typing import Dict, List
 from datetime import datetime
 
-from ....models.product import Product
+from ...models.product import Product
 from .models import CompatibilityResult, CompatibilityLevel, CompatibilityType
 from .utils import determine_compatibility_level
 
@@ -1,23 +1,192 @@
 """
 Kompatibilitási cache és statisztikák
+
+A cache kulcsa mindkét termék azonosítóját és verzióját (`updated_at`)
+tartalmazza, így egy termék műszaki adatainak módosítása után a régi
+eredmény többé nem kerül elő. A tárolás cserélhető backenden történik:
+folyamaton belüli LRU (alapértelmezés), vagy Redis a meglévő `REDIS_URL`-en,
+amelyet az API és a Celery workerek közösen használnak. Tesztekhez a
+RedisCacheBackend egy fakeredis klienssel is létrehozható.
 """
 
+import json
 import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict
 from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
 
-from .models import CompatibilityResult, CompatibilityLevel
+from .models import CompatibilityResult, CompatibilityLevel, CompatibilityType
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_MAX_ENTRIES = 10000
+DEFAULT_TTL_SECONDS = 24 * 3600
+
+
+class InMemoryCacheBackend:
+    """Méretkorlátos (LRU), TTL-es, folyamaton belüli cache backend."""
+
+    name = "memory"
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at and time.monotonic() > expires_at:
+                del self._entries[key]
+                self.expirations += 1
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[int]):
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds else 0.0
+        with self._lock:
+            self._entries[key] = (value, expires_at)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+class RedisCacheBackend:
+    """
+    Redis backend: az értékek TTL-lel (SETEX) tárolódnak, a méretkorlátot
+    egy hozzáférési idő szerint rendezett sorted set (LRU index) tartja.
+    """
+
+    name = "redis"
+
+    def __init__(
+        self,
+        client=None,
+        url: Optional[str] = None,
+        prefix: str = "compatibility:",
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        if client is None:
+            import redis
+            client = redis.Redis.from_url(
+                url or os.environ.get('REDIS_URL', 'redis://cache:6379/0')
+            )
+        self.client = client
+        self.prefix = prefix
+        self.lru_key = f"{prefix}__lru__"
+        self.max_entries = max_entries
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: str) -> Optional[str]:
+        full_key = self.prefix + key
+        value = self.client.get(full_key)
+        if value is None:
+            # Lejárt (vagy soha nem volt): az LRU indexből is kivesszük
+            if self.client.zrem(self.lru_key, full_key):
+                self.expirations += 1
+            return None
+        self.client.zadd(self.lru_key, {full_key: time.time()})
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    def set(self, key: str, value: str, ttl_seconds: Optional[int]):
+        full_key = self.prefix + key
+        pipe = self.client.pipeline()
+        if ttl_seconds:
+            pipe.setex(full_key, int(ttl_seconds), value)
+        else:
+            pipe.set(full_key, value)
+        pipe.zadd(self.lru_key, {full_key: time.time()})
+        pipe.zcard(self.lru_key)
+        size = pipe.execute()[-1]
+
+        overflow = size - self.max_entries
+        if overflow > 0:
+            evicted = [
+                member for member, _ in self.client.zpopmin(self.lru_key, overflow)
+            ]
+            if evicted:
+                self.client.delete(*evicted)
+                self.evictions += len(evicted)
+
+    def clear(self):
+        members = self.client.zrange(self.lru_key, 0, -1)
+        if members:
+            self.client.delete(*members)
+        self.client.delete(self.lru_key)
+
+    def size(self) -> int:
+        return int(self.client.zcard(self.lru_key))
+
+
+def create_cache_backend(max_entries: int = DEFAULT_MAX_ENTRIES):
+    """
+    Backend kiválasztása a COMPATIBILITY_CACHE_BACKEND környezeti változó
+    alapján ("memory" vagy "redis"); Redis hiba esetén memóriára vált.
+    """
+    backend_name = os.environ.get('COMPATIBILITY_CACHE_BACKEND', 'memory').lower()
+    if backend_name == 'redis':
+        try:
+            backend = RedisCacheBackend(max_entries=max_entries)
+            backend.client.ping()
+            return backend
+        except Exception as e:
+            logger.warning(f"Redis cache nem elérhető, memória backend használata: {e}")
+    return InMemoryCacheBackend(max_entries=max_entries)
+
+
+def _serialize_results(results: List[CompatibilityResult]) -> str:
+    payload = []
+    for result in results:
+        item = asdict(result)
+        item['compatibility_type'] = result.compatibility_type.value
+        item['compatibility_level'] = result.compatibility_level.value
+        item['checked_at'] = result.checked_at.isoformat()
+        payload.append(item)
+    return json.dumps(payload, ensure_ascii=False)
+
+
+def _deserialize_results(data: str) -> List[CompatibilityResult]:
+    results = []
+    for item in json.loads(data):
+        item['compatibility_type'] = CompatibilityType(item['compatibility_type'])
+        item['compatibility_level'] = CompatibilityLevel(item['compatibility_level'])
+        item['checked_at'] = datetime.fromisoformat(item['checked_at'])
+        results.append(CompatibilityResult(**item))
+    return results
+
 
 class CompatibilityCache:
     """
     Kompatibilitási cache és statisztikák kezelésért felelős osztály.
     """
     
-    def __init__(self):
-        self.cache: Dict[Tuple[int, int], List[CompatibilityResult]] = {}
+    def __init__(
+        self,
+        backend=None,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: Optional[int] = DEFAULT_TTL_SECONDS
+    ):
+        self.backend = backend or create_cache_backend(max_entries)
+        self.ttl_seconds = ttl_seconds
         self.stats = self._initialize_stats()
     
     def _initialize_stats(self) -> Dict[str, Any]:
@@ -34,24 +203,44 @@ class CompatibilityCache:
         }
     
     def get_cached_result(
-        self, product_a_id: int, product_b_id: int
+        self, product_a_id: int, product_b_id: int,
+        version_a: Optional[str] = None, version_b: Optional[str] = None
     ) -> Optional[List[CompatibilityResult]]:
-        """Lekér egy cache-elt eredményt."""
-        cache_key = self._get_cache_key(product_a_id, product_b_id)
-        if cache_key in self.cache:
+        """Lekér egy cache-elt eredményt (a termék verziókkal együtt kulcsolva)."""
+        cache_key = self._get_cache_key(
+            product_a_id, product_b_id, version_a, version_b
+        )
+        try:
+            data = self.backend.get(cache_key)
+        except Exception as e:
+            logger.warning(f"Cache olvasási hiba: {e}")
+            data = None
+        if data is not None:
             self.stats['cache_hits'] += 1
-            return self.cache[cache_key]
+            return _deserialize_results(data)
         
         self.stats['cache_misses'] += 1
         return None
     
     def cache_result(
         self, product_a_id: int, product_b_id: int, 
-        results: List[CompatibilityResult]
+        results: List[CompatibilityResult],
+        version_a: Optional[str] = None, version_b: Optional[str] = None
     ):
         """Cache-el egy eredményt."""
-        cache_key = self._get_cache_key(product_a_id, product_b_id)
-        self.cache[cache_key] = results
+        cache_key = self._get_cache_key(
+            product_a_id, product_b_id, version_a, version_b
+        )
+        try:
+            self.backend.set(
+                cache_key, _serialize_results(results), self.ttl_seconds
+            )
+        except Exception as e:
+            logger.warning(f"Cache írási hiba: {e}")
+    
+    def clear(self):
+        """Cache ürítése."""
+        self.backend.clear()
     
     def update_statistics(self, compatibility_results: List[CompatibilityResult]):
         """Frissíti a kompatibilitási statisztikákat."""
@@ -117,11 +306,23 @@ class CompatibilityCache:
         """Statisztikák lekérése."""
         stats = self.stats.copy()
         stats['cache_hit_rate_percentage'] = self.calculate_cache_hit_rate()
+        stats['cache_backend'] = self.backend.name
+        stats['cache_evictions'] = self.backend.evictions
+        stats['cache_expirations'] = self.backend.expirations
+        try:
+            stats['cache_entries'] = self.backend.size()
+        except Exception:
+            stats['cache_entries'] = None
+        stats['cache_max_entries'] = self.backend.max_entries
         return stats
 
     @staticmethod
     def _get_cache_key(
-        product_a_id: int, product_b_id: int
-    ) -> Tuple[int, int]:
-        """Generates a consistent cache key."""
-        return tuple(sorted((product_a_id, product_b_id))) 
\ No newline at end of file
+        product_a_id: int, product_b_id: int,
+        version_a: Optional[str] = None, version_b: Optional[str] = None
+    ) -> str:
+        """Generates a consistent, version-aware cache key."""
+        pairs = sorted(
+            ((product_a_id, version_a or "0"), (product_b_id, version_b or "0"))
+        )
+        return "|".join(f"{product_id}@{version}" for product_id, version in pairs)
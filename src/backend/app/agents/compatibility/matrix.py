@@ -0,0 +1,340 @@
+"""
+Kompatibilitási mátrix motor
+
+N termék összes párjának kompatibilitását számolja ki egyszerre. Minden
+termék specifikációi, alkalmazási területei és szabványai pontosan egyszer
+normalizálódnak; a páronkénti pontszámok ezután NumPy tömbműveletek
+(broadcast és mátrixszorzás), ugyanazokkal a szabályokkal, mint a
+páronkénti ellenőrzők.
+"""
+
+import logging
+import re
+from typing import Any, Dict, List, Optional
+
+import numpy as np
+
+from ...models.product import Product
+from .application_checker import ApplicationCompatibilityChecker
+from .models import CompatibilityLevel, CompatibilityType
+from .standards_checker import StandardsCompatibilityChecker
+from .technical_checker import TechnicalCompatibilityChecker
+
+logger = logging.getLogger(__name__)
+
+# Szint kódok a vektorizált összesítéshez
+LEVEL_ORDER = [
+    CompatibilityLevel.UNKNOWN,
+    CompatibilityLevel.INCOMPATIBLE,
+    CompatibilityLevel.CONDITIONALLY_COMPATIBLE,
+    CompatibilityLevel.PARTIALLY_COMPATIBLE,
+    CompatibilityLevel.FULLY_COMPATIBLE,
+]
+_UNKNOWN, _INCOMPATIBLE, _CONDITIONAL, _PARTIAL, _FULL = range(len(LEVEL_ORDER))
+
+_BUILDING_APPS = ["homlokzat", "padlás", "tetőszigetelés"]
+_INDUSTRIAL_APPS = ["ipari"]
+
+
+def _levels_from_scores(scores: np.ndarray, thresholds: Dict[str, float]) -> np.ndarray:
+    """`determine_compatibility_level` vektorizált megfelelője (szint kódok)."""
+    return np.select(
+        [
+            scores >= thresholds.get('fully', 0.8),
+            scores >= thresholds.get('partially', 0.5),
+            scores >= thresholds.get('conditionally', 0.2),
+        ],
+        [_FULL, _PARTIAL, _CONDITIONAL],
+        default=_INCOMPATIBLE,
+    )
+
+
+class CompatibilityMatrixEngine:
+    """Tömb alapú, páronkénti kompatibilitás számítás több termékre."""
+
+    def __init__(
+        self,
+        technical_checker: TechnicalCompatibilityChecker,
+        application_checker: ApplicationCompatibilityChecker,
+        standards_checker: StandardsCompatibilityChecker,
+    ):
+        self.technical_checker = technical_checker
+        self.application_checker = application_checker
+        self.standards_checker = standards_checker
+
+    # --- Termékenkénti normalizálás --------------------------------------
+
+    def _normalize(self, value: Any) -> Any:
+        try:
+            return self.technical_checker._normalize_technical_value(value)
+        except TypeError:
+            # Nem hash-elhető érték (pl. lista): nem numerikus
+            return value
+
+    def _technical_columns(self, products: List[Product]) -> Dict[str, Dict[str, np.ndarray]]:
+        """Szabályonként: jelenlét, pontozható-e, számérték és egyezési kód."""
+        size = len(products)
+        columns = {}
+        for spec_name in self.technical_checker.technical_rules:
+            present = np.zeros(size, dtype=bool)
+            defined = np.zeros(size, dtype=bool)
+            numeric = np.zeros(size, dtype=bool)
+            values = np.full(size, np.nan)
+            codes = np.full(size, -1, dtype=np.int64)
+            code_map: Dict[Any, int] = {}
+
+            for row, product in enumerate(products):
+                specs = product.technical_specs or {}
+                if spec_name not in specs:
+                    continue
+                present[row] = True
+                normalized = self._normalize(specs[spec_name])
+                if normalized is None:
+                    continue
+                defined[row] = True
+                if isinstance(normalized, (int, float)):
+                    numeric[row] = True
+                    values[row] = float(normalized)
+                try:
+                    codes[row] = code_map.setdefault(normalized, len(code_map))
+                except TypeError:
+                    codes[row] = code_map.setdefault(repr(normalized), len(code_map))
+
+            columns[spec_name] = {
+                'present': present,
+                'defined': defined,
+                'numeric': numeric,
+                'values': values,
+                'codes': codes,
+            }
+        return columns
+
+    def _standard_keys(self, standards: List[str]) -> List[str]:
+        """Szabványok összehasonlítási kulcsa: alapszám, vagy a nagybetűs név."""
+        keys = []
+        for std in standards:
+            match = re.search(r'\d+(?:-\d+)*', std)
+            keys.append(match.group() if match else std.strip().upper())
+        return keys
+
+    # --- Pontszám mátrixok -----------------------------------------------
+
+    def technical_scores(self, products: List[Product]):
+        """
+        Műszaki pontszám és szint mátrix. A szabályok megegyeznek a
+        TechnicalCompatibilityChecker-rel: tolerancián belül lineárisan
+        csökkenő súly, azon kívül 0.2, pontos egyezést igénylő paraméternél
+        a súly vagy 0; a nevező a közös paraméterek teljes súlya.
+        """
+        size = len(products)
+        score_sum = np.zeros((size, size))
+        weight_total = np.zeros((size, size))
+        scored = np.zeros((size, size), dtype=np.int32)
+        has_common = np.zeros((size, size), dtype=bool)
+
+        columns = self._technical_columns(products)
+        for spec_name, rule in self.technical_checker.technical_rules.items():
+            column = columns[spec_name]
+            weight = rule['weight']
+            both_present = np.outer(column['present'], column['present'])
+            if not both_present.any():
+                continue
+            has_common |= both_present
+            weight_total += weight * both_present
+            both_defined = np.outer(column['defined'], column['defined'])
+
+            if rule.get('exact_match_required', False):
+                codes = column['codes']
+                equal = codes[:, None] == codes[None, :]
+                score_sum += np.where(both_defined & equal, weight, 0.0)
+                scored += both_defined
+                continue
+
+            both_numeric = np.outer(column['numeric'], column['numeric'])
+            a = column['values'][:, None]
+            b = column['values'][None, :]
+            with np.errstate(invalid='ignore', divide='ignore'):
+                maximum = np.maximum(a, b)
+                diff = np.abs(a - b) / maximum
+                tolerance = rule.get('tolerance_percentage', 10) / 100
+                tolerance_score = np.where(
+                    diff <= tolerance, (1 - diff / tolerance) * weight, 0.2
+                )
+                zero_score = np.where(a == b, weight, 0.0)
+            spec_score = np.where(maximum == 0, zero_score, tolerance_score)
+            score_sum += np.where(both_numeric, spec_score, 0.0)
+            scored += both_numeric
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            overall = np.where(
+                (scored > 0) & (weight_total > 0), score_sum / weight_total, 0.5
+            )
+        overall = np.where(has_common, overall, 0.1)
+        levels = _levels_from_scores(
+            overall, {'fully': 0.8, 'partially': 0.6, 'conditionally': 0.3}
+        )
+        levels = np.where(has_common, levels, _UNKNOWN)
+        return overall, levels
+
+    def application_scores(self, products: List[Product]):
+        """Alkalmazási terület pontszám és szint mátrix (Jaccard + kapcsolódó területek)."""
+        per_product = [
+            self.application_checker._extract_applications(product)
+            for product in products
+        ]
+        app_index: Dict[str, int] = {}
+        for apps in per_product:
+            for app in apps:
+                app_index.setdefault(app, len(app_index))
+        categories = list(app_index)
+        membership = np.zeros((len(products), max(len(categories), 1)), dtype=np.int32)
+        for row, apps in enumerate(per_product):
+            for app in apps:
+                membership[row, app_index[app]] = 1
+
+        counts = membership.sum(axis=1)
+        common = membership @ membership.T
+        union = counts[:, None] + counts[None, :] - common
+
+        def any_of(terms):
+            idx = [app_index[term] for term in terms if term in app_index]
+            return membership[:, idx].any(axis=1) if idx else np.zeros(len(products), dtype=bool)
+
+        building = any_of(_BUILDING_APPS)
+        industrial = any_of(_INDUSTRIAL_APPS)
+        related = np.outer(building, building) | np.outer(industrial, industrial)
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            jaccard = np.where(union > 0, common / union, 0.0)
+        scores = np.where(common > 0, jaccard, np.where(related, 0.3, 0.1))
+        known = np.outer(counts > 0, counts > 0)
+        scores = np.where(known, scores, 0.1)
+        levels = _levels_from_scores(
+            scores, {'fully': 0.7, 'partially': 0.4, 'conditionally': 0.2}
+        )
+        levels = np.where(known, levels, _UNKNOWN)
+        return scores, levels
+
+    def standards_scores(self, products: List[Product]):
+        """Szabvány pontszám és szint mátrix (kompatibilis párok / max. darabszám)."""
+        per_product = [
+            self._standard_keys(self.standards_checker._extract_standards_from_product(product))
+            for product in products
+        ]
+        key_index: Dict[str, int] = {}
+        for keys in per_product:
+            for key in keys:
+                key_index.setdefault(key, len(key_index))
+
+        counts_matrix = np.zeros((len(products), max(len(key_index), 1)), dtype=np.int32)
+        for row, keys in enumerate(per_product):
+            for key in keys:
+                counts_matrix[row, key_index[key]] += 1
+
+        totals = np.array([len(keys) for keys in per_product])
+        compatible_pairs = counts_matrix @ counts_matrix.T
+        max_len = np.maximum(totals[:, None], totals[None, :])
+        with np.errstate(invalid='ignore', divide='ignore'):
+            ratio = np.where(max_len > 0, compatible_pairs / max_len, 0.0)
+        scores = np.where(compatible_pairs > 0, ratio, 0.1)
+        levels = np.where(
+            compatible_pairs > 0,
+            _levels_from_scores(scores, {'fully': 0.8, 'partially': 0.5, 'conditionally': 0.2}),
+            _INCOMPATIBLE,
+        )
+        known = np.outer(totals > 0, totals > 0)
+        scores = np.where(known, scores, 0.1)
+        levels = np.where(known, levels, _UNKNOWN)
+        return scores, levels
+
+    # --- Összesítés ------------------------------------------------------
+
+    @staticmethod
+    def overall_levels(level_matrices: List[np.ndarray]) -> np.ndarray:
+        """`_calculate_overall_compatibility` vektorizált megfelelője."""
+        stacked = np.stack(level_matrices)
+        overall = np.full(stacked.shape[1:], _UNKNOWN)
+        overall = np.where((stacked == _CONDITIONAL).any(axis=0), _CONDITIONAL, overall)
+        overall = np.where((stacked == _PARTIAL).any(axis=0), _PARTIAL, overall)
+        overall = np.where((stacked == _FULL).all(axis=0), _FULL, overall)
+        overall = np.where((stacked == _INCOMPATIBLE).any(axis=0), _INCOMPATIBLE, overall)
+        return overall
+
+    def compute(
+        self,
+        products: List[Product],
+        compatibility_types: Optional[List[CompatibilityType]] = None,
+        output: str = "dense",
+        min_score: float = 0.0,
+    ) -> Dict[str, Any]:
+        """
+        Kiszámolja az összes pár pontszám mátrixát.
+
+        Args:
+            products: A vizsgált termékek (a sorrend a mátrix indexe)
+            compatibility_types: Vizsgált típusok (alapértelmezés: műszaki,
+                alkalmazási, szabvány)
+            output: "dense" (N×N listák) vagy "sparse" (csak a min_score
+                feletti átlagú párok, "a-b" kulccsal)
+            min_score: Küszöb a sparse kimenethez
+        """
+        compatibility_types = compatibility_types or [
+            CompatibilityType.TECHNICAL_SPECS,
+            CompatibilityType.APPLICATION_AREAS,
+            CompatibilityType.STANDARDS_COMPLIANCE,
+        ]
+        calculators = {
+            CompatibilityType.TECHNICAL_SPECS: self.technical_scores,
+            CompatibilityType.APPLICATION_AREAS: self.application_scores,
+            CompatibilityType.STANDARDS_COMPLIANCE: self.standards_scores,
+        }
+
+        scores: Dict[CompatibilityType, np.ndarray] = {}
+        levels: Dict[CompatibilityType, np.ndarray] = {}
+        for comp_type in compatibility_types:
+            calculator = calculators.get(comp_type)
+            if calculator is None:
+                logger.warning(f"Mátrix módban nem támogatott típus: {comp_type}")
+                continue
+            scores[comp_type], levels[comp_type] = calculator(products)
+
+        product_ids = [product.id for product in products]
+        size = len(products)
+        if not scores:
+            return {'product_ids': product_ids, 'pairs_evaluated': 0}
+
+        overall = self.overall_levels(list(levels.values()))
+        mean_score = np.mean(np.stack(list(scores.values())), axis=0)
+        level_names = np.array([level.value for level in LEVEL_ORDER])
+
+        result: Dict[str, Any] = {
+            'product_ids': product_ids,
+            'compatibility_types': [comp_type.value for comp_type in scores],
+            'pairs_evaluated': size * (size - 1) // 2,
+            'output': output,
+        }
+        if output == "sparse":
+            rows, cols = np.triu_indices(size, k=1)
+            keep = mean_score[rows, cols] >= min_score
+            pairs = {}
+            for i, j in zip(rows[keep], cols[keep]):
+                pairs[f"{product_ids[i]}-{product_ids[j]}"] = {
+                    'overall_compatibility': str(level_names[overall[i, j]]),
+                    'mean_score': float(mean_score[i, j]),
+                    'scores': {
+                        comp_type.value: float(matrix[i, j])
+                        for comp_type, matrix in scores.items()
+                    },
+                }
+            result['pairs'] = pairs
+        else:
+            result['score_matrices'] = {
+                comp_type.value: matrix.round(4).tolist()
+                for comp_type, matrix in scores.items()
+            }
+            result['level_matrices'] = {
+                comp_type.value: level_names[matrix].tolist()
+                for comp_type, matrix in levels.items()
+            }
+            result['overall_matrix'] = level_names[overall].tolist()
+        return result
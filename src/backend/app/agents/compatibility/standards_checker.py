@@ -7,7 +7,7 @@ import re
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 
-from ....models.product import Product
+from ...models.product import Product
 from .models import (
     CompatibilityResult, 
     CompatibilityLevel, 
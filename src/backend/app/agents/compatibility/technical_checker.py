@@ -9,7 +9,7 @@ from functools import lru_cache
 from datetime import datetime
 from dataclasses import dataclass
 
-from ....models.product import Product
+from ...models.product import Product
 from .models import CompatibilityResult, CompatibilityLevel, CompatibilityType
 from .utils import determine_compatibility_level
 
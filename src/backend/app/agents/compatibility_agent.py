@@ -13,14 +13,15 @@ from datetime import datetime
 from functools import lru_cache
 from dataclasses import dataclass
 
-from ...models.product import Product
-from ...database import get_db
+from ..models.product import Product
+from ..database import get_db, SessionLocal
 
 from .compatibility.models import CompatibilityType, CompatibilityResult
 from .compatibility.technical_checker import TechnicalCompatibilityChecker
 from .compatibility.application_checker import ApplicationCompatibilityChecker
 from .compatibility.standards_checker import StandardsCompatibilityChecker
 from .compatibility.cache import CompatibilityCache
+from .compatibility.matrix import CompatibilityMatrixEngine
 
 
 logger = logging.getLogger(__name__)
@@ -51,6 +52,11 @@ class CompatibilityAgent:
         self.application_checker = ApplicationCompatibilityChecker()
         self.standards_checker = StandardsCompatibilityChecker()
         self.cache_manager = CompatibilityCache()
+        self.matrix_engine = CompatibilityMatrixEngine(
+            self.technical_checker,
+            self.application_checker,
+            self.standards_checker
+        )
         
         # Dispatch table for different compatibility types
         self.check_dispatch_table = {
@@ -99,6 +105,26 @@ class CompatibilityAgent:
             if db:
                 db.close()
 
+    def _get_product_versions(self, product_ids: List[int]) -> Dict[int, str]:
+        """Termék verziók (updated_at/created_at) egyetlen könnyű lekérdezéssel"""
+        db = SessionLocal()
+        try:
+            rows = (
+                db.query(Product.id, Product.updated_at, Product.created_at)
+                .filter(Product.id.in_(product_ids))
+                .all()
+            )
+            return {
+                row.id: (row.updated_at or row.created_at).isoformat()
+                if (row.updated_at or row.created_at) else "0"
+                for row in rows
+            }
+        except Exception as e:
+            logger.warning(f"Termék verzió lekérési hiba: {e}")
+            return {}
+        finally:
+            db.close()
+
     async def check_compatibility(
         self, 
         product_a_id: int, 
@@ -120,8 +146,13 @@ class CompatibilityAgent:
         ]
         
         try:
+            versions = await asyncio.to_thread(
+                self._get_product_versions, [product_a_id, product_b_id]
+            )
+            version_a = versions.get(product_a_id)
+            version_b = versions.get(product_b_id)
             cached_results = self.cache_manager.get_cached_result(
-                product_a_id, product_b_id
+                product_a_id, product_b_id, version_a, version_b
             )
             if cached_results:
                 logger.info("Kompatibilitási eredmény cache-ből")
@@ -140,7 +171,8 @@ class CompatibilityAgent:
             )
             
             self.cache_manager.cache_result(
-                product_a_id, product_b_id, compatibility_results
+                product_a_id, product_b_id, compatibility_results,
+                version_a, version_b
             )
             
             self.cache_manager.update_statistics(compatibility_results)
@@ -269,8 +301,31 @@ class CompatibilityAgent:
             'checked_at': result.checked_at.isoformat()
         }
 
-    async def analyze_compatibility_matrix(self, product_ids: List[int]) -> Dict:
-        """Kompatibilitási mátrix elemzése több termékre"""
+    def _load_products_bulk(self, product_ids: List[int]) -> List[Product]:
+        """Az összes termék betöltése egyetlen lekérdezéssel, a megadott sorrendben"""
+        db = SessionLocal()
+        try:
+            products = db.query(Product).filter(Product.id.in_(product_ids)).all()
+            by_id = {product.id: product for product in products}
+            return [by_id[pid] for pid in dict.fromkeys(product_ids) if pid in by_id]
+        finally:
+            db.close()
+
+    async def analyze_compatibility_matrix(
+        self,
+        product_ids: List[int],
+        mode: str = "pairwise",
+        compatibility_types: Optional[List[CompatibilityType]] = None,
+        output: str = "dense",
+        min_score: float = 0.0
+    ) -> Dict:
+        """
+        Kompatibilitási mátrix elemzése több termékre.
+
+        mode="pairwise": páronként check_compatibility (részletes indoklással).
+        mode="matrix": egy lekérdezés + vektorizált pontszám mátrixok
+        (`output` = "dense" vagy "sparse", lásd CompatibilityMatrixEngine).
+        """
         logger.info(f"Kompatibilitási mátrix elemzése {len(product_ids)} termékre")
         
         if len(product_ids) < 2:
@@ -279,6 +334,11 @@ class CompatibilityAgent:
                 'provided_count': len(product_ids)
             }
         
+        if mode == "matrix":
+            return await self._analyze_matrix_mode(
+                product_ids, compatibility_types, output, min_score
+            )
+        
         matrix_results = {}
         total_pairs = 0
         successful_pairs = 0
@@ -320,6 +380,47 @@ class CompatibilityAgent:
             'timestamp': datetime.now().isoformat()
         }
 
+    async def _analyze_matrix_mode(
+        self,
+        product_ids: List[int],
+        compatibility_types: Optional[List[CompatibilityType]],
+        output: str,
+        min_score: float
+    ) -> Dict:
+        """Mátrix mód: termékek bulk betöltése és vektorizált pontozás"""
+        start_time = datetime.now()
+        try:
+            products = await asyncio.to_thread(self._load_products_bulk, product_ids)
+            found_ids = {product.id for product in products}
+            missing_ids = [pid for pid in product_ids if pid not in found_ids]
+            if len(products) < 2:
+                return {
+                    'agent_id': self.agent_id,
+                    'error': 'Legalább 2 létező termék szükséges a mátrix elemzéshez',
+                    'missing_product_ids': missing_ids
+                }
+            
+            matrix = await asyncio.to_thread(
+                self.matrix_engine.compute,
+                products, compatibility_types, output, min_score
+            )
+        except Exception as e:
+            logger.error(f"Kompatibilitási mátrix hiba: {e}", exc_info=True)
+            return {
+                'agent_id': self.agent_id,
+                'error': str(e),
+                'timestamp': datetime.now().isoformat()
+            }
+        
+        return {
+            'agent_id': self.agent_id,
+            'mode': 'matrix',
+            **matrix,
+            'missing_product_ids': missing_ids,
+            'duration_seconds': (datetime.now() - start_time).total_seconds(),
+            'timestamp': datetime.now().isoformat()
+        }
+
     async def health_check(self) -> Dict:
         """Agent egészség ellenőrzés"""
         db = None
@@ -12,11 +12,11 @@ import hashlib
 from typing import Dict, List, Optional, Any, Set
 from datetime import datetime
 from enum import Enum
-from difflib import SequenceMatcher
 
 from ..models.product import Product
 from ..scraper.data_validator import DataValidator
-from ..database import get_db
+from ..database import get_db, SessionLocal
+from .near_duplicate import NearDuplicateIndex
 
 logger = logging.getLogger(__name__)
 
@@ -53,11 +53,20 @@ class DataProcessingAgent:
     - Szöveges tartalom tisztítása
     """
     
-    def __init__(self, similarity_threshold: float = 0.85, batch_size: int = 100):
+    def __init__(self, similarity_threshold: float = 0.85, batch_size: int = 100,
+                 lsh_threshold: float = 0.5, num_perm: int = 128,
+                 dedupe_against_database: bool = False):
         self.similarity_threshold = similarity_threshold
         self.batch_size = batch_size
         self.validator = DataValidator()
         
+        # Közel-duplikátum keresés (MinHash/LSH) beállításai
+        self.lsh_threshold = lsh_threshold
+        self.num_perm = num_perm
+        self.dedupe_against_database = dedupe_against_database
+        self._existing_index: Optional[NearDuplicateIndex] = None
+        self._existing_source_urls: Dict[int, Optional[str]] = {}
+        
         # Agent állapot
         self.agent_id = f"data_processing_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
         self.status = ProcessingStatus.PENDING
@@ -302,9 +311,22 @@ class DataProcessingAgent:
         return normalized_apps
     
     async def _remove_duplicates(self, data: List[Dict]) -> List[Dict]:
-        """Duplikátumok eltávolítása"""
+        """
+        Duplikátumok eltávolítása
+        
+        Pontos aláírás egyezés után MinHash/LSH index adja a hasonlósági
+        jelölteket; a név/leírás hasonlóság csak ezekre fut le. Ha a
+        `dedupe_against_database` be van kapcsolva, az adatbázisban már
+        meglévő termékek közel-duplikátumai is kiesnek (az azonos forrás
+        URL-ű elemek nem, azok frissítésként mentődnek).
+        """
         logger.info(f"Duplikátum eltávolítás: {len(data)} elem")
         
+        batch_index = self._new_near_duplicate_index()
+        existing_index = None
+        if self.dedupe_against_database:
+            existing_index = await self._get_existing_index()
+        
         unique_data = []
         seen_signatures = set()
         
@@ -312,16 +334,31 @@ class DataProcessingAgent:
             try:
                 # Aláírás készítése a termékhez
                 signature = self._generate_item_signature(item)
+                if signature in seen_signatures:
+                    continue
                 
-                if signature not in seen_signatures:
-                    # Hasonlóság ellenőrzés meglévő elemekkel
-                    is_duplicate = await self._check_similarity_with_existing(item, unique_data)
-                    
-                    if not is_duplicate:
-                        seen_signatures.add(signature)
-                        unique_data.append(item)
-                    else:
-                        logger.debug(f"Duplikátum eltávolítva: {item.get('name', 'Névtelen')}")
+                name = item.get('name') or ''
+                description = item.get('description') or ''
+                minhash = batch_index.signature(name, description)
+                
+                # Hasonlóság ellenőrzés a batch korábbi elemeivel
+                if batch_index.find_match(name, description, minhash):
+                    logger.debug(f"Duplikátum eltávolítva: {item.get('name', 'Névtelen')}")
+                    continue
+                
+                # Hasonlóság ellenőrzés a már mentett termékekkel
+                if existing_index is not None:
+                    match = existing_index.find_match(name, description, minhash)
+                    if match and self._existing_source_urls.get(match[0]) != item.get('source_url'):
+                        logger.debug(
+                            f"Meglévő termék duplikátuma eltávolítva: "
+                            f"{item.get('name', 'Névtelen')} (termék ID: {match[0]})"
+                        )
+                        continue
+                
+                seen_signatures.add(signature)
+                batch_index.add(len(unique_data), name, description, minhash)
+                unique_data.append(item)
                         
             except Exception as e:
                 logger.error(f"Duplikátum ellenőrzési hiba: {e}")
@@ -331,6 +368,39 @@ class DataProcessingAgent:
         logger.info(f"Duplikátum eltávolítás befejezve: {len(data)} -> {len(unique_data)} elem")
         return unique_data
     
+    def _new_near_duplicate_index(self) -> NearDuplicateIndex:
+        """Üres MinHash/LSH index az agent küszöbeivel"""
+        return NearDuplicateIndex(
+            threshold=self.similarity_threshold,
+            lsh_threshold=self.lsh_threshold,
+            num_perm=self.num_perm,
+        )
+    
+    async def _get_existing_index(self) -> NearDuplicateIndex:
+        """Az adatbázisban lévő termékek indexe (mentésig cache-elve)"""
+        if self._existing_index is None:
+            self._existing_index = await asyncio.to_thread(self._build_existing_index)
+        return self._existing_index
+    
+    def _build_existing_index(self) -> NearDuplicateIndex:
+        """MinHash/LSH index építése a meglévő termékek nevéből és leírásából"""
+        index = self._new_near_duplicate_index()
+        source_urls: Dict[int, Optional[str]] = {}
+        db = SessionLocal()
+        try:
+            query = db.query(Product.id, Product.name, Product.description, Product.source_url)
+            for row in query.yield_per(1000):
+                index.add(row.id, row.name or '', row.description or '')
+                source_urls[row.id] = row.source_url
+        except Exception as e:
+            logger.error(f"Meglévő termékek indexelési hiba: {e}")
+        finally:
+            db.close()
+        
+        self._existing_source_urls = source_urls
+        logger.info(f"Közel-duplikátum index felépítve: {len(index)} meglévő termék")
+        return index
+    
     def _generate_item_signature(self, item: Dict) -> str:
         """Termék aláírás generálása duplikátum ellenőrzéshez"""
         name = item.get('name', '').lower().strip()
@@ -340,29 +410,6 @@ class DataProcessingAgent:
         signature_text = f"{name}|{url}"
         return hashlib.md5(signature_text.encode()).hexdigest()[:16]
     
-    async def _check_similarity_with_existing(self, item: Dict, existing_items: List[Dict]) -> bool:
-        """Hasonlóság ellenőrzés meglévő elemekkel"""
-        item_name = item.get('name', '').lower()
-        item_desc = item.get('description', '').lower()
-        
-        for existing in existing_items:
-            existing_name = existing.get('name', '').lower()
-            existing_desc = existing.get('description', '').lower()
-            
-            # Név hasonlóság
-            name_similarity = SequenceMatcher(None, item_name, existing_name).ratio()
-            
-            # Leírás hasonlóság
-            desc_similarity = SequenceMatcher(None, item_desc, existing_desc).ratio()
-            
-            # Átlagos hasonlóság
-            avg_similarity = (name_similarity + desc_similarity) / 2
-            
-            if avg_similarity >= self.similarity_threshold:
-                return True
-        
-        return False
-    
     async def _categorize_data(self, data: List[Dict]) -> List[Dict]:
         """Adatok kategorizálása"""
         logger.info(f"Adatok kategorizálása: {len(data)} elem")
@@ -628,6 +675,8 @@ class DataProcessingAgent:
                     logger.error(f"Termék mentési hiba: {e}")
             
             db.commit()
+            # Az új/frissített termékek miatt az index újraépül
+            self._existing_index = None
             logger.info(f"Adatmentés befejezve: {saved_count} elem mentve")
             
         except Exception as e:
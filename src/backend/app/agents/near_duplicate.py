@@ -0,0 +1,236 @@
+"""
+Near-Duplicate Index - MinHash/LSH alapú közel-duplikátum keresés
+
+A DataProcessingAgent duplikátum szűréséhez. Minden elem (név + leírás)
+karakter shingle halmazából MinHash aláírás készül, az aláírás sávjai
+(band) hash vödrökbe kerülnek. Egy új elemhez csak azok a meglévő elemek
+lesznek jelöltek, amelyekkel legalább egy sávban ütközik; a pontos
+(SequenceMatcher alapú) hasonlóság csak ezekre a jelölt párokra fut le,
+így a szűrés nem N² összehasonlítás.
+
+Ugyanaz az index használható egy batch-en belül és a PostgreSQL-ben már
+meglévő termékekkel szemben is.
+"""
+
+import logging
+import re
+from difflib import SequenceMatcher
+from typing import Any, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_MAX_HASH = np.uint64((1 << 32) - 1)
+_SHIFT_32 = np.uint64(32)
+# Polinom hash alapja a shingle-ök kódpontjaihoz (páratlan 64 bites konstans)
+_SHINGLE_BASE = np.uint64(0x9E3779B97F4A7C15)
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_text(text: Any) -> str:
+    """Kisbetűs, egységes szóközű szöveg a shingle-ökhöz."""
+    return _WHITESPACE_RE.sub(" ", str(text or "")).strip().lower()
+
+
+def text_shingles(text: str, size: int) -> Set[str]:
+    """Átfedő, `size` hosszú karakter shingle-ök halmaza."""
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+def shingle_hashes(text: str, size: int) -> np.ndarray:
+    """
+    A `text_shingles` halmaz 32 bites hash-ei shingle-enkénti Python
+    ciklus nélkül: a kódpontok csúszó ablakaiból polinom hash, majd
+    egyedi értékek.
+    """
+    codes = np.frombuffer(text.encode('utf-32-le'), dtype=np.uint32).astype(np.uint64)
+    if codes.size == 0:
+        return codes
+    size = min(size, codes.size)
+    count = codes.size - size + 1
+    # Horner-séma a `size` eltolt nézeten; az uint64 túlcsordulás szándékos
+    hashes = codes[:count].copy()
+    for offset in range(1, size):
+        hashes *= _SHINGLE_BASE
+        hashes += codes[offset:offset + count]
+    return np.unique((hashes >> _SHIFT_32) ^ (hashes & _MAX_HASH))
+
+
+def pair_similarity(name_a: str, desc_a: str, name_b: str, desc_b: str,
+                    threshold: Optional[float] = None) -> float:
+    """
+    Név és leírás SequenceMatcher arányának átlaga (a korábbi páronkénti
+    ellenőrzés mértéke). Ha `threshold` adott, az olcsó felső becslések
+    alapján korán visszatér, amikor a küszöb már nem érhető el.
+    """
+    name_matcher = SequenceMatcher(None, name_a, name_b)
+    desc_matcher = SequenceMatcher(None, desc_a, desc_b)
+    if threshold is not None:
+        if (name_matcher.real_quick_ratio() + desc_matcher.real_quick_ratio()) / 2 < threshold:
+            return 0.0
+        if (name_matcher.quick_ratio() + desc_matcher.quick_ratio()) / 2 < threshold:
+            return 0.0
+    return (name_matcher.ratio() + desc_matcher.ratio()) / 2
+
+
+def _trapezoid(values: np.ndarray, grid: np.ndarray) -> float:
+    """
+    Trapézszabályos integrál. Az újabb NumPy `np.trapz`-t már nem ismeri,
+    a régebbiekben (pl. 1.26) pedig még nincs `np.trapezoid`.
+    """
+    trapezoid = getattr(np, "trapezoid", None)
+    if trapezoid is not None:
+        return float(trapezoid(values, grid))
+    return float(np.sum((values[1:] + values[:-1]) * np.diff(grid)) / 2)
+
+
+def optimal_bands(lsh_threshold: float, num_perm: int) -> Tuple[int, int]:
+    """
+    (sávok, sorok) felosztás, amely minimalizálja a hamis pozitív és hamis
+    negatív valószínűség összegét a Jaccard küszöb körül.
+    """
+    grid = np.linspace(0.0, 1.0, 201)
+    best, best_error = (num_perm, 1), float("inf")
+    for bands in range(1, num_perm + 1):
+        rows = num_perm // bands
+        probability = 1 - (1 - grid ** rows) ** bands
+        below = grid < lsh_threshold
+        false_positive = _trapezoid(np.where(below, probability, 0.0), grid)
+        false_negative = _trapezoid(np.where(below, 0.0, 1 - probability), grid)
+        error = false_positive + false_negative
+        if error < best_error:
+            best, best_error = (bands, rows), error
+    return best
+
+
+class NearDuplicateIndex:
+    """
+    MinHash aláírások LSH sáv indexszel, pontos ellenőrzéssel a jelölteken.
+
+    Args:
+        threshold: Pontos hasonlósági küszöb (név/leírás arány átlaga)
+        lsh_threshold: Becsült Jaccard küszöb a jelöltek kiválasztásához;
+            alacsonyabb érték több jelöltet (jobb felidézést) és több
+            pontos összehasonlítást jelent
+        num_perm: MinHash permutációk száma
+        shingle_size: Karakter shingle hossz
+        bands: Sávok száma (alapértelmezés: `lsh_threshold`-ból számolva)
+        seed: A permutációk véletlen magja
+    """
+
+    def __init__(self, threshold: float = 0.85, lsh_threshold: float = 0.5,
+                 num_perm: int = 128, shingle_size: int = 5,
+                 bands: Optional[int] = None, seed: int = 1):
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.shingle_size = shingle_size
+        if bands is None:
+            bands, rows = optimal_bands(lsh_threshold, num_perm)
+        else:
+            rows = num_perm // bands
+        self.bands = bands
+        self.rows = rows
+
+        # Multiply-shift hash család: (a * h + b) >> 32, páratlan `a`-val
+        generator = np.random.RandomState(seed)
+        max_uint64 = np.iinfo(np.uint64).max
+        self._a = generator.randint(0, max_uint64, size=num_perm, dtype=np.uint64) | np.uint64(1)
+        self._b = generator.randint(0, max_uint64, size=num_perm, dtype=np.uint64)
+
+        self._buckets: List[Dict[bytes, List[Hashable]]] = [{} for _ in range(bands)]
+        self._texts: Dict[Hashable, Tuple[str, str]] = {}
+        self.stats = {'candidates_checked': 0, 'matches': 0}
+
+    def __len__(self) -> int:
+        return len(self._texts)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._texts
+
+    # --- Aláírás ---------------------------------------------------------
+
+    def signature(self, name: str, description: str) -> np.ndarray:
+        """MinHash aláírás a név és leírás shingle halmazából."""
+        text = normalize_text(f"{name} {description}")
+        hashes = shingle_hashes(text, self.shingle_size)
+        if hashes.size == 0:
+            return np.full(self.num_perm, _MAX_HASH, dtype=np.uint64)
+        # Az uint64 túlcsordulás szándékos; a felső 32 bit a hash érték
+        permuted = (hashes[:, None] * self._a + self._b) >> _SHIFT_32
+        return permuted.min(axis=0)
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [
+            signature[band * self.rows:(band + 1) * self.rows].tobytes()
+            for band in range(self.bands)
+        ]
+
+    # --- Index műveletek -------------------------------------------------
+
+    def add(self, key: Hashable, name: str, description: str,
+            signature: Optional[np.ndarray] = None):
+        """Elem felvétele az indexbe."""
+        if signature is None:
+            signature = self.signature(name, description)
+        self._texts[key] = ((name or '').lower(), (description or '').lower())
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(band_key, []).append(key)
+
+    def candidates(self, signature: np.ndarray) -> Set[Hashable]:
+        """Azok a kulcsok, amelyek legalább egy sávban ütköznek az aláírással."""
+        found: Set[Hashable] = set()
+        for band, band_key in enumerate(self._band_keys(signature)):
+            bucket = self._buckets[band].get(band_key)
+            if bucket:
+                found.update(bucket)
+        return found
+
+    def find_match(self, name: str, description: str,
+                   signature: Optional[np.ndarray] = None) -> Optional[Tuple[Hashable, float]]:
+        """
+        A legjobban hasonlító, küszöb feletti elem (kulcs, hasonlóság),
+        vagy None. Csak az LSH jelöltek kerülnek pontos összehasonlításra.
+        """
+        if signature is None:
+            signature = self.signature(name, description)
+        name = (name or '').lower()
+        description = (description or '').lower()
+
+        best: Optional[Tuple[Hashable, float]] = None
+        for key in self.candidates(signature):
+            other_name, other_desc = self._texts[key]
+            self.stats['candidates_checked'] += 1
+            similarity = pair_similarity(name, description, other_name, other_desc, self.threshold)
+            if similarity >= self.threshold and (best is None or similarity > best[1]):
+                best = (key, similarity)
+        if best is not None:
+            self.stats['matches'] += 1
+        return best
+
+    def find_duplicates(self, items: Iterable[Tuple[Hashable, str, str]]) -> Dict[Hashable, Hashable]:
+        """
+        Batch-en belüli szűrés: az elemeket sorban veszi fel, és minden
+        duplikátumhoz visszaadja a korábban felvett eredeti kulcsát.
+        """
+        duplicates: Dict[Hashable, Hashable] = {}
+        for key, name, description in items:
+            signature = self.signature(name, description)
+            match = self.find_match(name, description, signature)
+            if match is not None:
+                duplicates[key] = match[0]
+            else:
+                self.add(key, name, description, signature)
+        return duplicates
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            'items': len(self),
+            'bands': self.bands,
+            'rows': self.rows,
+            'num_perm': self.num_perm,
+            'threshold': self.threshold,
+        }
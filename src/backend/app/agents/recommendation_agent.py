@@ -18,6 +18,10 @@ from chromadb.utils import embedding_functions
 
 from ..models.product import Product
 from ..database import get_db
+from ..services.product_snapshot_cache import get_product_snapshot_cache
+from .recommendation_index import (
+    ProductSpecIndex, parse_spec_number, product_category_name
+)
 
 logger = logging.getLogger(__name__)
 
@@ -73,8 +77,12 @@ class RecommendationAgent:
             )
         )
         
-        # Termék cache (opcionális, a gyorsabb hozzáférésért)
+        # Termék cache: a folyamaton belül megosztott snapshot aktuális nézete
+        self.snapshot_cache = get_product_snapshot_cache()
         self.product_cache = {}
+        # Oszlopos spec index a cache felett (lustán épül, snapshot verzióhoz kötve)
+        self._spec_index: Optional[ProductSpecIndex] = None
+        self._spec_index_version = -1
         
         # Ajánlási statisztikák
         self.recommendation_stats = {
@@ -165,17 +173,18 @@ class RecommendationAgent:
             }
     
     async def _update_product_cache_if_needed(self) -> None:
-        """Termék cache frissítése, ha szükséges"""
-        if not self.product_cache:
-            try:
-                db = get_db()
-                products = db.query(Product).all()
-                for product in products:
-                    self.product_cache[product.id] = product.to_dict(include_relations=True)
-                db.close()
-                logger.info(f"Termék cache frissítve: {len(self.product_cache)} termék")
-            except Exception as e:
-                logger.error(f"Cache frissítési hiba: {e}")
+        """Termék cache frissítése a megosztott, inkrementális snapshotból"""
+        try:
+            self.product_cache = await asyncio.to_thread(self.snapshot_cache.refresh)
+        except Exception as e:
+            logger.error(f"Cache frissítési hiba: {e}")
+    
+    def _get_spec_index(self) -> ProductSpecIndex:
+        """A termék cache oszlopos indexe, a snapshot változásakor újraépítve"""
+        if self._spec_index is None or self._spec_index_version != self.snapshot_cache.version:
+            self._spec_index = ProductSpecIndex(self.product_cache)
+            self._spec_index_version = self.snapshot_cache.version
+        return self._spec_index
     
     async def search_vector_database(self, query_text: str, n_results: int = 10) -> List[Dict]:
         """Vektor adatbázis keresés"""
@@ -217,18 +226,26 @@ class RecommendationAgent:
             return []
         
         reference_product = self.product_cache[reference_product_id]
-        ref_category = reference_product['category']
+        ref_category = product_category_name(reference_product)
         complementary_products = []
         
         # Kiegészítő kategóriák meghatározása
         complementary_categories = self._get_complementary_categories(ref_category)
         
-        for product_id, product in self.product_cache.items():
-            if product_id != reference_product_id and product['category'] in complementary_categories:
+        index = self._get_spec_index()
+        candidate_rows = sorted(
+            row
+            for category in complementary_categories
+            for row in index.rows_for_category(category, exact=True)
+        )
+        for row in candidate_rows:
+            product_id = int(index.product_ids[row])
+            product = index.products[row]
+            if product_id != reference_product_id:
                 # Alkalmazási terület kompatibilitás ellenőrzés
                 compatibility_score = self._calculate_application_compatibility(
-                    reference_product['applications'],
-                    product['applications']
+                    reference_product.get('applications') or [],
+                    product.get('applications') or []
                 )
                 
                 if compatibility_score > 0.3:
@@ -283,33 +300,34 @@ class RecommendationAgent:
         
         matching_products = []
         search_terms = [target_application, project_type]
-        
-        for product_id, product in self.product_cache.items():
-            match_score = 0.0
-            match_reasons = []
-            
-            # Alkalmazási területek ellenőrzése
-            for app in product['applications']:
-                for search_term in search_terms:
-                    if search_term and search_term.lower() in app.lower():
-                        match_score += 0.5
-                        match_reasons.append(f"Alkalmas: {app}")
-            
-            # Kategória ellenőrzése
-            if target_application:
-                for category, keywords in self.application_compatibility.items():
-                    if product['category'] == category:
-                        for keyword in keywords:
-                            if keyword.lower() in target_application.lower():
-                                match_score += 0.3
-                                match_reasons.append(f"Kategória egyezés: {category}")
-            
-            if match_score > 0.3:
-                matching_products.append({
-                    'product': product,
-                    'match_score': match_score,
-                    'match_reason': '; '.join(match_reasons)
-                })
+        index = self._get_spec_index()
+        
+        # Alkalmazási területek ellenőrzése (fordított indexen)
+        match_scores = index.application_hits(search_terms) * 0.5
+        category_reasons: Dict[int, List[str]] = {}
+        
+        # Kategória ellenőrzése
+        if target_application:
+            target_lower = target_application.lower()
+            for category, keywords in self.application_compatibility.items():
+                keyword_hits = sum(1 for keyword in keywords if keyword.lower() in target_lower)
+                if not keyword_hits:
+                    continue
+                for row in index.rows_for_category(category, exact=True):
+                    match_scores[row] += 0.3 * keyword_hits
+                    category_reasons.setdefault(int(row), []).extend(
+                        [f"Kategória egyezés: {category}"] * keyword_hits
+                    )
+        
+        for row in np.flatnonzero(match_scores > 0.3):
+            match_reasons = [
+                f"Alkalmas: {app}" for app in index.applications_matching(row, search_terms)
+            ] + category_reasons.get(int(row), [])
+            matching_products.append({
+                'product': index.products[row],
+                'match_score': float(match_scores[row]),
+                'match_reason': '; '.join(match_reasons)
+            })
         
         # Rendezés egyezés szerint
         matching_products.sort(key=lambda x: x['match_score'], reverse=True)
@@ -326,40 +344,47 @@ class RecommendationAgent:
             return []
         
         matching_products = []
-        
-        for product_id, product in self.product_cache.items():
-            product_specs = product['technical_specs']
-            match_score = 0.0
+        index = self._get_spec_index()
+        match_scores = np.zeros(len(index))
+        key_scores = {}
+        
+        for req_key, req_value in required_specs.items():
+            if isinstance(req_value, dict):
+                # Tartomány követelmény: {'min': ..., 'max': ...}
+                scores = np.zeros(len(index))
+                scores[index.range_query(req_key, req_value.get('min'), req_value.get('max'))] = 1.0
+            else:
+                # Tolerancia alapú egyezés (±10%), minimum 80%, vagy szöveges egyezés
+                scores = index.tolerance_scores(req_key, req_value)
+            key_scores[req_key] = scores
+            match_scores += scores
+        
+        for row in np.flatnonzero(match_scores > 0.5):
+            product = index.products[row]
+            product_specs = product.get('technical_specs') or {}
             match_reasons = []
+            for req_key, scores in key_scores.items():
+                req_value = required_specs[req_key]
+                if scores[row] == 1.0:
+                    if isinstance(req_value, dict):
+                        match_reasons.append(
+                            f"{req_key}: {product_specs[req_key]} "
+                            f"({req_value.get('min', '')}–{req_value.get('max', '')})"
+                        )
+                    else:
+                        match_reasons.append(f"{req_key}: {product_specs[req_key]} (≈{req_value})")
+                elif scores[row] == 0.5:
+                    required_number = parse_spec_number(req_value)
+                    if not required_number or np.isnan(index.numeric_columns[req_key][row]):
+                        match_reasons.append(f"{req_key}: {product_specs[req_key]}")
+                    else:
+                        match_reasons.append(f"{req_key}: {product_specs[req_key]} (min. {req_value})")
             
-            for req_key, req_value in required_specs.items():
-                if req_key in product_specs:
-                    try:
-                        # Numerikus összehasonlítás
-                        req_num = float(str(req_value).replace(',', '.'))
-                        prod_num = float(str(product_specs[req_key]).replace(',', '.'))
-                        
-                        # Tolerancia alapú egyezés (±10%)
-                        tolerance = 0.1
-                        if abs(prod_num - req_num) / req_num <= tolerance:
-                            match_score += 1.0
-                            match_reasons.append(f"{req_key}: {product_specs[req_key]} (≈{req_value})")
-                        elif prod_num >= req_num * 0.8:  # Minimális követelmény
-                            match_score += 0.5
-                            match_reasons.append(f"{req_key}: {product_specs[req_key]} (min. {req_value})")
-                            
-                    except (ValueError, ZeroDivisionError):
-                        # Szöveges egyezés
-                        if str(req_value).lower() in str(product_specs[req_key]).lower():
-                            match_score += 0.5
-                            match_reasons.append(f"{req_key}: {product_specs[req_key]}")
-            
-            if match_score > 0.5:
-                matching_products.append({
-                    'product': product,
-                    'match_score': match_score,
-                    'match_reason': '; '.join(match_reasons)
-                })
+            matching_products.append({
+                'product': product,
+                'match_score': float(match_scores[row]),
+                'match_reason': '; '.join(match_reasons)
+            })
         
         # Rendezés műszaki egyezés szerint
         matching_products.sort(key=lambda x: x['match_score'], reverse=True)
@@ -376,17 +401,18 @@ class RecommendationAgent:
             return []
         
         category_products = []
+        index = self._get_spec_index()
         
-        for product_id, product in self.product_cache.items():
-            if preferred_category.lower() in product['category'].lower():
-                # Minőségi pontszám a termék részletessége alapján
-                quality_score = self._calculate_product_quality_score(product)
-                
-                category_products.append({
-                    'product': product,
-                    'quality_score': quality_score,
-                    'match_reason': f'Kategória: {product["category"]}'
-                })
+        for row in sorted(index.rows_for_category(preferred_category)):
+            product = index.products[row]
+            # Minőségi pontszám a termék részletessége alapján
+            quality_score = self._calculate_product_quality_score(product)
+            
+            category_products.append({
+                'product': product,
+                'quality_score': quality_score,
+                'match_reason': f'Kategória: {index.category_names[row]}'
+            })
         
         # Rendezés minőség szerint
         category_products.sort(key=lambda x: x['quality_score'], reverse=True)
@@ -476,7 +502,7 @@ class RecommendationAgent:
         logger.info(f"Termék összehasonlítás: {len(product_ids)} termék")
         
         try:
-            await self._update_product_cache()
+            await self._update_product_cache_if_needed()
             
             products = []
             for product_id in product_ids:
@@ -597,6 +623,7 @@ class RecommendationAgent:
             'statistics': self.recommendation_stats.copy(),
             'cache_info': {
                 'products_cached': len(self.product_cache),
+                'snapshot': self.snapshot_cache.get_statistics(),
                 'feature_matrix_shape': self.feature_matrix.shape if self.feature_matrix is not None else None,
                 'similarity_matrix_shape': self.similarity_matrix.shape if self.similarity_matrix is not None else None
             },
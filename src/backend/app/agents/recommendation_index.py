@@ -0,0 +1,192 @@
+"""
+Product Spec Index - Oszlopos termék index az ajánlásokhoz
+
+A RecommendationAgent termék cache-éből épített, tömb alapú index.
+Minden műszaki paraméter kulcshoz egy előre normalizált NumPy oszlop
+tartozik (NaN, ha a termék nem rendelkezik számértékkel), így a
+tolerancia- és tartomány-lekérdezések vektorizált maszkok lesznek a
+termékenkénti `float(str(...).replace(',', '.'))` újraparszolás helyett.
+
+A kategóriákhoz és alkalmazási területekhez fordított (inverted) index
+készül: az egyedi értékek száma jóval kisebb a termékek számánál, ezért a
+részszöveg-egyezést csak ezeken kell elvégezni.
+"""
+
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def parse_spec_number(value: Any) -> Optional[float]:
+    """A spec érték számként, vagy None ha nem numerikus."""
+    try:
+        return float(str(value).replace(',', '.'))
+    except (TypeError, ValueError):
+        return None
+
+
+def product_category_name(product: Dict[str, Any]) -> str:
+    """Kategória neve a termék dict-ből (név vagy beágyazott dict)."""
+    category = product.get('category') or ''
+    if isinstance(category, dict):
+        return category.get('name') or ''
+    return str(category)
+
+
+class ProductSpecIndex:
+    """
+    Oszlopos index egy termék halmaz felett.
+
+    A sorok sorrendje megegyezik a `product_ids` tömbbel; minden lekérdezés
+    sor pozíciókat vagy bool maszkot ad vissza.
+    """
+
+    def __init__(self, products: Dict[int, Dict[str, Any]]):
+        self.product_ids = np.fromiter(products.keys(), dtype=np.int64, count=len(products))
+        self.products: List[Dict[str, Any]] = list(products.values())
+        size = len(self.products)
+
+        # Numerikus oszlopok és a nyers (kisbetűs) szöveges értékek
+        self.numeric_columns: Dict[str, np.ndarray] = {}
+        self.text_columns: Dict[str, List[Optional[str]]] = {}
+        # Rendezett nézet a tartomány-lekérdezésekhez: (rendezett értékek, sor pozíciók)
+        self._sorted_columns: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+
+        # Fordított indexek: egyedi érték (kisbetűs) -> sor pozíciók
+        self.category_index: Dict[str, np.ndarray] = {}
+        self.application_index: Dict[str, np.ndarray] = {}
+        self.category_names: List[str] = []
+        self.application_counts = np.zeros(size, dtype=np.int32)
+        self.spec_counts = np.zeros(size, dtype=np.int32)
+
+        categories: Dict[str, List[int]] = {}
+        applications: Dict[str, List[int]] = {}
+
+        for row, product in enumerate(self.products):
+            specs = product.get('technical_specs') or {}
+            self.spec_counts[row] = len(specs)
+            for key, value in specs.items():
+                if key not in self.numeric_columns:
+                    self.numeric_columns[key] = np.full(size, np.nan)
+                    self.text_columns[key] = [None] * size
+                number = parse_spec_number(value)
+                if number is not None:
+                    self.numeric_columns[key][row] = number
+                self.text_columns[key][row] = str(value).lower()
+
+            category = product_category_name(product)
+            self.category_names.append(category)
+            categories.setdefault(category.lower(), []).append(row)
+
+            product_apps = product.get('applications') or []
+            self.application_counts[row] = len(product_apps)
+            for app in product_apps:
+                # Ismétlődő alkalmazás többször is számít, mint a lineáris keresésnél
+                applications.setdefault(str(app).lower(), []).append(row)
+
+        self.category_index = {
+            name: np.asarray(rows, dtype=np.int64) for name, rows in categories.items()
+        }
+        self.application_index = {
+            name: np.asarray(rows, dtype=np.int64) for name, rows in applications.items()
+        }
+        logger.info(
+            f"Spec index felépítve: {size} termék, "
+            f"{len(self.numeric_columns)} paraméter oszlop"
+        )
+
+    def __len__(self) -> int:
+        return len(self.products)
+
+    # --- Műszaki paraméterek ---------------------------------------------
+
+    def has_spec(self, key: str) -> np.ndarray:
+        """Maszk: a terméknek van ilyen kulcsú paramétere."""
+        texts = self.text_columns.get(key)
+        if texts is None:
+            return np.zeros(len(self), dtype=bool)
+        return np.fromiter((t is not None for t in texts), dtype=bool, count=len(self))
+
+    def tolerance_scores(
+        self, key: str, required: Any, tolerance: float = 0.1, minimum_ratio: float = 0.8
+    ) -> np.ndarray:
+        """
+        Pontszám vektor egy követelményre: 1.0 ha ±tolerance-en belül,
+        0.5 ha legalább minimum_ratio * követelmény, illetve 0.5 szöveges
+        egyezésnél (nem numerikus érték esetén).
+        """
+        scores = np.zeros(len(self))
+        if key not in self.text_columns:
+            return scores
+
+        present = self.has_spec(key)
+        column = self.numeric_columns[key]
+        required_number = parse_spec_number(required)
+
+        text_rows = present
+        if required_number is not None and required_number != 0:
+            numeric = present & ~np.isnan(column)
+            with np.errstate(invalid='ignore'):
+                within = numeric & (np.abs(column - required_number) / required_number <= tolerance)
+                above = numeric & ~within & (column >= required_number * minimum_ratio)
+            scores[within] = 1.0
+            scores[above] = 0.5
+            text_rows = present & ~numeric
+
+        if text_rows.any():
+            needle = str(required).lower()
+            texts = self.text_columns[key]
+            for row in np.flatnonzero(text_rows):
+                if needle in texts[row]:
+                    scores[row] = 0.5
+        return scores
+
+    def range_query(
+        self, key: str, low: Optional[float] = None, high: Optional[float] = None
+    ) -> np.ndarray:
+        """Sor pozíciók, ahol low <= érték <= high (rendezett oszlopon bináris kereséssel)."""
+        if key not in self.numeric_columns:
+            return np.empty(0, dtype=np.int64)
+        if key not in self._sorted_columns:
+            column = self.numeric_columns[key]
+            rows = np.flatnonzero(~np.isnan(column))
+            order = np.argsort(column[rows], kind='stable')
+            self._sorted_columns[key] = (column[rows][order], rows[order])
+        values, rows = self._sorted_columns[key]
+        start = 0 if low is None else np.searchsorted(values, low, side='left')
+        end = len(values) if high is None else np.searchsorted(values, high, side='right')
+        return rows[start:end]
+
+    # --- Kategória és alkalmazás -----------------------------------------
+
+    def rows_for_category(self, category: str, exact: bool = False) -> np.ndarray:
+        """Sor pozíciók, ahol a kategória egyezik (vagy tartalmazza a szöveget)."""
+        needle = category.lower()
+        if exact:
+            return self.category_index.get(needle, np.empty(0, dtype=np.int64))
+        matches = [rows for name, rows in self.category_index.items() if needle in name]
+        return np.concatenate(matches) if matches else np.empty(0, dtype=np.int64)
+
+    def application_hits(self, search_terms: Iterable[str]) -> np.ndarray:
+        """
+        Termékenkénti (alkalmazás, keresőszó) egyezések száma részszöveg
+        alapon, csak az egyedi alkalmazás értékeken végigmenve.
+        """
+        hits = np.zeros(len(self), dtype=np.int32)
+        terms = [term.lower() for term in search_terms if term]
+        for app, rows in self.application_index.items():
+            matched = sum(1 for term in terms if term in app)
+            if matched:
+                np.add.at(hits, rows, matched)
+        return hits
+
+    def applications_matching(self, row: int, search_terms: Iterable[str]) -> List[str]:
+        """Egy termék azon alkalmazásai, amelyekre egyezés volt (indokláshoz)."""
+        terms = [term.lower() for term in search_terms if term]
+        return [
+            app for app in (self.products[row].get('applications') or [])
+            for term in terms if term in str(app).lower()
+        ]
@@ -18,6 +18,8 @@ from ..database import get_db
 from ..models.manufacturer import Manufacturer
 from ..models.category import Category
 from ..models.product import Product
+from ..services.chroma_pool import get_chroma_pool
+from ..services.search_cache import get_rag_search_cache
 # ProcessedFileLog is in backend/models/, not app/models/
 # from models.processed_file_log import ProcessedFileLog
 
@@ -39,7 +41,8 @@ async def test_admin_endpoint():
             "/admin/database/overview",
             "/admin/database/products", 
             "/admin/database/manufacturers",
-            "/admin/database/categories"
+            "/admin/database/categories",
+            "/admin/search-cache/stats"
         ]
     }
 
@@ -404,4 +407,30 @@ async def get_extraction_comparison_report():
         return {"success": True, "data": comparison_data}
     except Exception as e:
         logger.error(f"Failed to read or parse extraction results: {e}")
-        raise HTTPException(status_code=500, detail="Failed to process extraction results.") 
\ No newline at end of file
+        raise HTTPException(status_code=500, detail="Failed to process extraction results.")
+
+
+@router.get("/search-cache/stats")
+async def get_search_cache_stats():
+    """
+    📈 RAG keresési cache (embedding + találatok) és ChromaDB kapcsolat statisztikái.
+    """
+    return {
+        "success": True,
+        "search_cache": get_rag_search_cache().get_statistics(),
+        "chroma_pool": get_chroma_pool().get_statistics(),
+    }
+
+
+@router.post("/search-cache/clear")
+async def clear_search_cache():
+    """
+    🧹 RAG keresési cache ürítése.
+    """
+    removed = get_rag_search_cache().clear()
+    logger.info(f"RAG search cache cleared: {removed}")
+    return {
+        "success": True,
+        "removed_entries": removed,
+        "cleared_at": datetime.now().isoformat()
+    }
@@ -22,6 +22,7 @@ import httpx
 from app.database import get_db
 from app.config.ai_config import get_ai_config, reload_ai_config, AIModelConfig, PromptTemplates
 from app.services.ai_service import AnalysisService
+from app.services.ai_response_cache import get_ai_response_cache
 
 logger = logging.getLogger(__name__)
 
@@ -173,6 +174,7 @@ class AIModelConfigRequest(BaseModel):
     token_decrement: int = Field(..., ge=256, le=4096, description="Token decrement")
     max_retries: int = Field(..., ge=1, le=10, description="Maximum retries")
     timeout_seconds: int = Field(..., ge=5, le=300, description="Timeout seconds")
+    max_concurrent_requests: int = Field(5, ge=1, le=50, description="Maximum concurrent AI requests")
     max_text_length: int = Field(..., ge=1000, le=50000, description="Max text length")
     max_tables_summary: int = Field(..., ge=1, le=20, description="Max tables summary")
     
@@ -250,6 +252,7 @@ async def get_ai_config_status():
                 "token_decrement": model_config.token_decrement,
                 "max_retries": model_config.max_retries,
                 "timeout_seconds": model_config.timeout_seconds,
+                "max_concurrent_requests": model_config.max_concurrent_requests,
                 "max_text_length": model_config.max_text_length,
                 "max_tables_summary": model_config.max_tables_summary,
             },
@@ -295,6 +298,7 @@ async def update_model_config(
             token_decrement=config_request.token_decrement,
             max_retries=config_request.max_retries,
             timeout_seconds=config_request.timeout_seconds,
+            max_concurrent_requests=config_request.max_concurrent_requests,
             max_text_length=config_request.max_text_length,
             max_tables_summary=config_request.max_tables_summary,
         )
@@ -604,6 +608,42 @@ async def reload_ai_configuration():
         raise HTTPException(status_code=500, detail=f"Configuration reload failed: {str(e)}")
 
 
+@router.get("/cache/stats", summary="Get AI response cache statistics")
+async def get_response_cache_stats():
+    """Get hit/miss counters and size of the AI response cache."""
+    try:
+        return get_ai_response_cache().get_statistics()
+    except Exception as e:
+        logger.error(f"Failed to get response cache stats: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to get cache stats: {str(e)}")
+
+
+@router.post("/cache/clear", summary="Clear the AI response cache")
+async def clear_response_cache():
+    """Remove all cached AI responses."""
+    try:
+        removed = get_ai_response_cache().clear()
+        logger.info(f"AI response cache cleared ({removed} entries)")
+        return {
+            "success": True,
+            "removed_entries": removed,
+            "cleared_at": datetime.now().isoformat()
+        }
+    except Exception as e:
+        logger.error(f"Failed to clear response cache: {e}")
+        raise HTTPException(status_code=500, detail=f"Cache clear failed: {str(e)}")
+
+
+@router.put("/cache/enabled", summary="Enable or bypass the AI response cache")
+async def set_response_cache_enabled(enabled: bool):
+    """Toggle the response cache at runtime (bypass without clearing)."""
+    cache = get_ai_response_cache()
+    cache.enabled = enabled
+    get_ai_config().update_model_config(response_cache_enabled=enabled)
+    logger.info(f"AI response cache {'enabled' if enabled else 'bypassed'}")
+    return {"success": True, "enabled": cache.enabled}
+
+
 @router.post("/validate-key/{provider}", summary="Validate an API key for a given provider")
 async def validate_api_key(provider: str):
     """
@@ -5,7 +5,7 @@ FastAPI Endpoints for MCP Orchestrator
 REST API endpoints for PDF extraction using the MCP orchestrated system.
 """
 
-from fastapi import APIRouter, HTTPException, BackgroundTasks, File, UploadFile
+from fastapi import APIRouter, HTTPException, File, UploadFile
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 import tempfile
@@ -15,14 +15,18 @@ import uuid
 import asyncio
 
 from ..mcp_orchestrator import MCPOrchestrator
+from ..mcp_orchestrator.task_store import (
+    DEFAULT_LANE, PRIORITY_LANES, get_extraction_task_store
+)
 
 router = APIRouter(prefix="/api/v1/mcp", tags=["MCP Extraction"])
 
 # Global orchestrator instance
 orchestrator = MCPOrchestrator()
 
-# In-memory task storage (in production, use Redis or database)
-active_extractions: Dict[str, Dict[str, Any]] = {}
+# Background tasks live in the durable task store and are run by
+# `python -m app.mcp_orchestrator.task_worker` processes, so any API
+# process can submit, poll and cancel them.
 
 
 class ExtractionRequest(BaseModel):
@@ -33,10 +37,10 @@ class ExtractionRequest(BaseModel):
         description="Whether to use cost-optimized tiered approach"
     )
     max_cost_tier: int = Field(
-        3, 
+        4, 
         ge=1, 
         le=4, 
-        description="Maximum cost tier to escalate to (1-4)"
+        description="Maximum cost tier to escalate to (1-4, 4 = Claude AI)"
     )
     timeout_seconds: int = Field(
         300, 
@@ -46,6 +50,23 @@ class ExtractionRequest(BaseModel):
     )
 
 
+class AsyncExtractionRequest(ExtractionRequest):
+    """Request model for queued (background) extraction"""
+    lane: str = Field(
+        DEFAULT_LANE,
+        description=f"Priority lane: {', '.join(PRIORITY_LANES)}"
+    )
+
+
+class BatchExtractionRequest(BaseModel):
+    """Request model for queueing many PDFs with the same settings"""
+    pdf_paths: List[str] = Field(..., min_length=1)
+    use_tiered_approach: bool = True
+    max_cost_tier: int = Field(4, ge=1, le=4)
+    timeout_seconds: int = Field(300, ge=30, le=600)
+    lane: str = Field("bulk", description="Priority lane for the batch")
+
+
 class ExtractionResponse(BaseModel):
     """Response model for extraction results"""
     task_id: str
@@ -66,10 +87,14 @@ class TaskStatusResponse(BaseModel):
     task_id: str
     status: str
     pdf_path: Optional[str] = None
+    lane: Optional[str] = None
+    attempts: Optional[int] = None
     created_at: Optional[str] = None
     started_at: Optional[str] = None
+    finished_at: Optional[str] = None
     progress: Optional[str] = None
     error_message: Optional[str] = None
+    result: Optional[Dict[str, Any]] = None
 
 
 @router.post("/extract", response_model=ExtractionResponse)
@@ -122,6 +147,11 @@ async def extract_pdf(request: ExtractionRequest):
             ai_notes=golden_record.ai_adjudication_notes
         )
         
+    except asyncio.TimeoutError:
+        raise HTTPException(
+            status_code=504,
+            detail=f"Extraction timed out after {request.timeout_seconds}s"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -129,38 +159,62 @@ async def extract_pdf(request: ExtractionRequest):
         )
 
 
+def _extraction_options(request) -> Dict[str, Any]:
+    return {
+        'use_tiered_approach': request.use_tiered_approach,
+        'max_cost_tier': request.max_cost_tier,
+        'timeout_seconds': request.timeout_seconds,
+    }
+
+
+def _check_lane(lane: str):
+    if lane not in PRIORITY_LANES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown lane '{lane}', use one of: {', '.join(PRIORITY_LANES)}"
+        )
+
+
 @router.post("/extract-async")
-async def extract_pdf_async(
-    request: ExtractionRequest, 
-    background_tasks: BackgroundTasks
-):
+async def extract_pdf_async(request: AsyncExtractionRequest):
     """
-    Start PDF extraction in the background and return task ID
+    Queue a PDF extraction and return its task ID
     
     Use this for long-running extractions. Poll /status/{task_id} for progress.
+    The task is stored durably and run by an extraction worker process.
     """
+    _check_lane(request.lane)
+    task_id = await asyncio.to_thread(
+        get_extraction_task_store().submit,
+        request.pdf_path,
+        _extraction_options(request),
+        request.lane,
+    )
     
-    task_id = str(uuid.uuid4())
-    
-    # Store task info
-    active_extractions[task_id] = {
+    return {
+        'task_id': task_id,
         'status': 'pending',
-        'pdf_path': request.pdf_path,
-        'created_at': asyncio.get_event_loop().time(),
-        'progress': 'Initializing extraction...'
+        'lane': request.lane,
+        'message': 'Extraction queued'
     }
-    
-    # Start background extraction
-    background_tasks.add_task(
-        _run_background_extraction,
-        task_id,
-        request
+
+
+@router.post("/extract-batch")
+async def extract_pdf_batch(request: BatchExtractionRequest):
+    """Queue many PDF extractions with the same settings in one request"""
+    _check_lane(request.lane)
+    task_ids = await asyncio.to_thread(
+        get_extraction_task_store().submit_many,
+        request.pdf_paths,
+        _extraction_options(request),
+        request.lane,
     )
     
     return {
-        'task_id': task_id,
+        'task_ids': task_ids,
         'status': 'pending',
-        'message': 'Extraction started in background'
+        'lane': request.lane,
+        'message': f'{len(task_ids)} extractions queued'
     }
 
 
@@ -168,22 +222,27 @@ async def extract_pdf_async(
 async def get_extraction_status(task_id: str):
     """Get the status of a background extraction task"""
     
-    if task_id not in active_extractions:
+    task_info = await asyncio.to_thread(
+        get_extraction_task_store().get, task_id
+    )
+    if task_info is None:
         raise HTTPException(
             status_code=404,
             detail=f"Task not found: {task_id}"
         )
     
-    task_info = active_extractions[task_id]
-    
     return TaskStatusResponse(
         task_id=task_id,
         status=task_info['status'],
         pdf_path=task_info.get('pdf_path'),
+        lane=task_info.get('lane'),
+        attempts=task_info.get('attempts'),
         created_at=task_info.get('created_at'),
         started_at=task_info.get('started_at'),
+        finished_at=task_info.get('finished_at'),
         progress=task_info.get('progress'),
-        error_message=task_info.get('error_message')
+        error_message=task_info.get('error_message'),
+        result=task_info.get('result')
     )
 
 
@@ -192,18 +251,17 @@ async def get_orchestrator_stats():
     """Get orchestrator performance statistics"""
     
     stats = orchestrator.get_orchestrator_stats()
+    task_stats = await asyncio.to_thread(
+        get_extraction_task_store().get_stats
+    )
+    by_status = task_stats['by_status']
     
     return {
         'orchestrator_stats': stats,
-        'active_tasks': len(active_extractions),
-        'pending_tasks': len([
-            t for t in active_extractions.values() 
-            if t['status'] == 'pending'
-        ]),
-        'running_tasks': len([
-            t for t in active_extractions.values() 
-            if t['status'] == 'running'
-        ])
+        'active_tasks': by_status.get('pending', 0) + by_status.get('running', 0),
+        'pending_tasks': by_status.get('pending', 0),
+        'running_tasks': by_status.get('running', 0),
+        'task_store': task_stats
     }
 
 
@@ -211,7 +269,7 @@ async def get_orchestrator_stats():
 async def upload_and_extract(
     file: UploadFile = File(..., description="PDF file to extract"),
     use_tiered_approach: bool = True,
-    max_cost_tier: int = 3,
+    max_cost_tier: int = 4,
     timeout_seconds: int = 300
 ):
     """
@@ -257,60 +315,36 @@ async def upload_and_extract(
 
 @router.delete("/tasks/{task_id}")
 async def cancel_extraction_task(task_id: str):
-    """Cancel a running extraction task"""
+    """
+    Cancel an extraction task
+    
+    Pending tasks are cancelled at once. Running tasks are stopped by their
+    worker at its next lease renewal.
+    """
     
-    if task_id not in active_extractions:
+    task_info = await asyncio.to_thread(
+        get_extraction_task_store().get, task_id
+    )
+    if task_info is None:
         raise HTTPException(
             status_code=404,
             detail=f"Task not found: {task_id}"
         )
     
-    task_info = active_extractions[task_id]
-    
     if task_info['status'] in ['completed', 'failed', 'cancelled']:
         return {
             'message': f"Task {task_id} is already {task_info['status']}"
         }
     
-    # Mark as cancelled
-    task_info['status'] = 'cancelled'
-    task_info['progress'] = 'Cancelled by user'
+    status = await asyncio.to_thread(
+        get_extraction_task_store().request_cancel, task_id
+    )
     
+    if status == 'cancelled':
+        return {
+            'message': f"Task {task_id} cancelled successfully"
+        }
     return {
-        'message': f"Task {task_id} cancelled successfully"
+        'message': f"Cancellation of task {task_id} requested",
+        'status': status
     }
-
-
-# Background task function
-async def _run_background_extraction(task_id: str, request: ExtractionRequest):
-    """Run extraction in background"""
-    
-    task_info = active_extractions[task_id]
-    
-    try:
-        task_info['status'] = 'running'
-        task_info['started_at'] = asyncio.get_event_loop().time()
-        task_info['progress'] = 'Running extraction strategies...'
-        
-        # Run extraction
-        golden_record = await orchestrator.extract_pdf(
-            pdf_path=request.pdf_path,
-            use_tiered_approach=request.use_tiered_approach,
-            max_cost_tier=request.max_cost_tier,
-            timeout_seconds=request.timeout_seconds
-        )
-        
-        # Store results
-        task_info['status'] = 'completed'
-        task_info['progress'] = 'Extraction completed successfully'
-        task_info['results'] = {
-            'confidence': golden_record.overall_confidence,
-            'strategies_used': golden_record.strategies_used,
-            'requires_review': golden_record.requires_human_review,
-            'field_count': len(golden_record.extracted_data)
-        }
-        
-    except Exception as e:
-        task_info['status'] = 'failed'
-        task_info['error_message'] = str(e)
-        task_info['progress'] = f'Failed: {str(e)}' 
\ No newline at end of file
@@ -25,9 +25,23 @@ celery_app = Celery(
     'tasks',
     broker=REDIS_URL,
     backend=REDIS_URL,
-    include=['app.celery_tasks.scraping_tasks']
+    include=[
+        'app.celery_tasks.scraping_tasks',
+        'app.celery_tasks.pipeline_tasks',
+    ]
 )
 
+# Pipeline szakaszok külön queue-kon, hogy szakaszonként skálázhatók
+# legyenek (pl. `celery worker -Q cpu --concurrency=8`)
+PIPELINE_TASK_ROUTES = {
+    'tasks.run_*': {'queue': 'scraping'},
+    'tasks.pipeline.scrape': {'queue': 'scraping'},
+    'tasks.pipeline.dispatch': {'queue': 'scraping'},
+    'tasks.pipeline.extract_pdf': {'queue': 'cpu'},
+    'tasks.pipeline.analyze_pdf': {'queue': 'ai'},
+    'tasks.pipeline.ingest_batch': {'queue': 'db'},
+}
+
 # Celery konfiguráció
 celery_app.conf.update(
     task_serializer='json',
@@ -38,6 +52,11 @@ celery_app.conf.update(
     worker_prefetch_multiplier=1,
     task_acks_late=True,
     broker_connection_retry_on_startup=True,
+    task_default_queue='celery',
+    task_routes=PIPELINE_TASK_ROUTES,
+    # Tesztekhez: broker nélküli, szinkron futtatás
+    task_always_eager=os.environ.get('CELERY_TASK_ALWAYS_EAGER', '').lower() in ('1', 'true'),
+    task_eager_propagates=True,
 )
 
 # A `beat_schedule` és a `setup_periodic_tasks` funkciók eltávolítva,
@@ -3,17 +3,20 @@ Celery Tasks modul - Lambda.hu Backend
 
 Ez a modul tartalmazza az összes aszinkron feladatot a Lambda.hu rendszerhez:
 - Scraping feladatok
+- PDF pipeline (scrape → extract → analyze → ingest)
 - Adatbázis karbantartás
 - Email értesítések
 """
 
 # Celery tasks modulok importálása
 from . import scraping_tasks
+from . import pipeline_tasks
 from . import database_tasks
 from . import notification_tasks
 
 __all__ = [
     'scraping_tasks',
+    'pipeline_tasks',
     'database_tasks', 
     'notification_tasks'
 ] 
\ No newline at end of file
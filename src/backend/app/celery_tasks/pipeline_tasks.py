@@ -0,0 +1,183 @@
+"""
+Celery PDF Pipeline: scrape → extract → analyze → ingest
+--------------------------------------------------------
+Splits the PDF -> DB pipeline into per-stage tasks, each routed to its own
+queue so every bottleneck can be scaled with its own worker pool:
+
+- `scraping`: runs a scraper and hands over the new/changed PDFs
+- `cpu`:      one extraction task per PDF (text + tables, no network)
+- `ai`:       AI analysis per PDF, rate limited (`PIPELINE_AI_RATE_LIMIT`;
+              Celery enforces it per worker, so the total is the limit
+              times the number of `ai` workers)
+- `db`:       batched ingestion into PostgreSQL + ChromaDB
+
+The workflow for one scrape is
+
+    chain(scrape, dispatch)  ->  N x chord(
+        group(chain(extract_pdf, analyze_pdf) per PDF),
+        ingest_batch,
+    )
+
+i.e. the PDFs are split into batches of `PIPELINE_INGEST_BATCH_SIZE`, and
+each batch is ingested as soon as all of its PDFs have been analyzed.
+
+Queue routing and worker pools are configured in `app.celery_app`.
+"""
+
+import asyncio
+import logging
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from celery import chain, chord, group, shared_task
+
+logger = logging.getLogger(__name__)
+
+INGEST_BATCH_SIZE = int(os.environ.get('PIPELINE_INGEST_BATCH_SIZE', '25'))
+AI_RATE_LIMIT = os.environ.get('PIPELINE_AI_RATE_LIMIT', '30/m')
+
+SCRAPERS = {
+    'datasheet': 'RockwoolProductScraper',
+    'brochure': 'RockwoolBrochureScraper',
+}
+
+
+def _batches(items: List[Any], size: int) -> List[List[Any]]:
+    return [items[i:i + size] for i in range(0, len(items), max(1, size))]
+
+
+@shared_task(name="tasks.pipeline.scrape")
+def scrape_task(scraper_name: str) -> List[str]:
+    """Runs a scraper; returns the PDFs with new content."""
+    from app import scrapers
+    from app.celery_tasks.scraping_tasks import _run_scraper
+
+    logger.info(f"▶️ Pipeline scrape: {scraper_name}")
+    scraper = getattr(scrapers, SCRAPERS[scraper_name])()
+    asyncio.run(_run_scraper(scraper))
+
+    pdf_paths = list(getattr(scraper, 'changed_files', []))
+    logger.info(f"✅ Scrape finished, {len(pdf_paths)} PDFs to process.")
+    return pdf_paths
+
+
+@shared_task(name="tasks.pipeline.dispatch")
+def dispatch_task(pdf_paths: List[str]) -> Dict[str, Any]:
+    """Fans the PDFs out into per-batch extract/analyze/ingest chords."""
+    if not pdf_paths:
+        logger.info("⏭️ No PDFs to process.")
+        return {'pdfs': 0, 'batches': 0, 'chords': []}
+
+    chord_ids = []
+    for batch in _batches(list(pdf_paths), INGEST_BATCH_SIZE):
+        workflow = chord(
+            group(chain(extract_pdf_task.s(path), analyze_pdf_task.s()) for path in batch),
+            ingest_batch_task.s(),
+        )
+        chord_ids.append(workflow.apply_async().id)
+
+    logger.info(
+        f"🚀 Dispatched {len(pdf_paths)} PDFs in {len(chord_ids)} ingest batches."
+    )
+    return {'pdfs': len(pdf_paths), 'batches': len(chord_ids), 'chords': chord_ids}
+
+
+@shared_task(name="tasks.pipeline.extract_pdf")
+def extract_pdf_task(pdf_path: str) -> Optional[Dict[str, Any]]:
+    """
+    CPU stage: hashes the file and extracts text and tables from one
+    shared parse. Returns None for files that are already ingested.
+    """
+    from app.database import SessionLocal
+    from app.processing.file_handler import FileHandler
+    from processing.pdf_pipeline import extract_document
+
+    path = Path(pdf_path)
+    db_session = SessionLocal()
+    try:
+        file_handler = FileHandler(db_session)
+        file_hash = file_handler.calculate_file_hash(path)
+        if not file_hash or file_handler.is_duplicate(file_hash):
+            logger.info(f"⏭️ Skipping {path.name} (missing or already ingested)")
+            return None
+    finally:
+        db_session.close()
+
+    return extract_document(str(path), file_hash)
+
+
+@shared_task(name="tasks.pipeline.analyze_pdf", rate_limit=AI_RATE_LIMIT)
+def analyze_pdf_task(extraction: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """AI stage: analyzes one extraction and builds the final result."""
+    if extraction is None:
+        return None
+
+    from app.processing.analysis_service import AnalysisService
+    from app.processing.confidence_scorer import ConfidenceScorer
+    from processing.pdf_pipeline import table_result_from_extraction
+    from processing.real_pdf_processor import consolidate_results
+
+    path = Path(extraction['pdf_path'])
+    table_result = table_result_from_extraction(extraction)
+    ai_analysis = asyncio.run(AnalysisService().analyze_content(
+        text_content=extraction['text'],
+        tables=table_result.tables if table_result else extraction['simple_tables'],
+        pdf_name=path.name,
+    ))
+    result = consolidate_results(
+        ConfidenceScorer(),
+        path,
+        datetime.fromisoformat(extraction['started_at']),
+        extraction['text'],
+        extraction['text_method'],
+        table_result,
+        ai_analysis,
+    )
+    return {
+        'pdf_path': str(path),
+        'file_hash': extraction['file_hash'],
+        'result': result.to_dict(),
+    }
+
+
+@shared_task(name="tasks.pipeline.ingest_batch")
+def ingest_batch_task(analyses: List[Optional[Dict[str, Any]]]) -> Dict[str, Any]:
+    """DB stage: ingests one batch of analyzed PDFs in a single transaction."""
+    from app.database import SessionLocal
+    from app.models.processing_models import PDFExtractionResult
+    from app.services.ingestion_service import DataIngestionService
+
+    analyses = [a for a in analyses if a]
+    if not analyses:
+        return {'status': 'success', 'ingested': 0, 'skipped': 0}
+
+    db_session = SessionLocal()
+    try:
+        product_ids = DataIngestionService(db_session).ingest_batch(
+            [PDFExtractionResult(**a['result']) for a in analyses],
+            file_hashes=[a['file_hash'] for a in analyses],
+            pdf_paths=[Path(a['pdf_path']) for a in analyses],
+        )
+    finally:
+        db_session.close()
+
+    ingested = sum(1 for product_id in product_ids if product_id)
+    logger.info(f"✅ Ingested batch: {ingested}/{len(analyses)} products")
+    return {
+        'status': 'success',
+        'ingested': ingested,
+        'skipped': len(analyses) - ingested,
+        'product_ids': product_ids,
+    }
+
+
+def run_pipeline(scraper_name: str = 'datasheet'):
+    """Starts scrape -> extract -> analyze -> ingest for one scraper."""
+    return chain(scrape_task.s(scraper_name), dispatch_task.s()).apply_async()
+
+
+def run_pipeline_for_files(pdf_paths: List[str]):
+    """Starts extract -> analyze -> ingest for already downloaded PDFs."""
+    return dispatch_task.delay([str(p) for p in pdf_paths])
@@ -24,6 +24,16 @@ except IndexError as e:
     RockwoolBrochureScraper = None
 
 
+async def _run_scraper(scraper):
+    """Runs a scraper and closes the shared HTTP client of this event loop."""
+    from app.scrapers.http_client import close_scraping_client
+
+    try:
+        await scraper.run()
+    finally:
+        await close_scraping_client()
+
+
 @shared_task(name="tasks.run_datasheet_scraping")
 def run_datasheet_scraping_task():
     """Execute datasheet scraping with clean import structure."""
@@ -32,9 +42,19 @@ def run_datasheet_scraping_task():
         if RockwoolProductScraper is None:
             raise ImportError("RockwoolProductScraper not available due to import issues")
         scraper = RockwoolProductScraper()
-        asyncio.run(scraper.run())
+        asyncio.run(_run_scraper(scraper))
         logger.info("✅ Datasheet scraping task finished successfully.")
-        return {"status": "success", "scraper": "datasheet"}
+
+        # Only datasheets with new content go through the PDF -> DB pipeline
+        if scraper.changed_files:
+            from app.celery_tasks.pipeline_tasks import run_pipeline_for_files
+            run_pipeline_for_files(scraper.changed_files)
+        return {
+            "status": "success",
+            "scraper": "datasheet",
+            "delta": scraper.delta.summary() if scraper.delta else None,
+            "changed_files": len(scraper.changed_files),
+        }
     except Exception as e:
         logger.error(f"❌ Datasheet scraping task failed: {e}", exc_info=True)
         return {"status": "failed", "error": str(e)}
@@ -46,7 +66,7 @@ def run_brochure_scraping_task():
     logger.info("▶️ Starting brochure and pricelist scraping task...")
     try:
         scraper = RockwoolBrochureScraper()
-        asyncio.run(scraper.run())
+        asyncio.run(_run_scraper(scraper))
         logger.info(
             "✅ Brochure and pricelist scraping task finished successfully."
         )
@@ -19,6 +19,16 @@ from typing import Dict, Any, Optional
 from dataclasses import dataclass, field
 
 
+def _parse_bool(value: str) -> bool:
+    """Parse a boolean environment variable value."""
+    normalized = value.strip().lower()
+    if normalized in ("1", "true", "yes", "on"):
+        return True
+    if normalized in ("0", "false", "no", "off"):
+        return False
+    raise ValueError(f"Invalid boolean value: {value}")
+
+
 @dataclass
 class AIModelConfig:
     """Configuration for AI model settings."""
@@ -36,6 +46,20 @@ class AIModelConfig:
     # Retry and timeout settings
     max_retries: int = 3
     timeout_seconds: int = 30
+    retry_backoff_seconds: float = 1.0
+    max_backoff_seconds: float = 30.0
+    
+    # Concurrency settings
+    max_concurrent_requests: int = 5
+    
+    # Optional API endpoint override (e.g. a local stub server)
+    base_url: Optional[str] = None
+    
+    # Response cache settings
+    response_cache_enabled: bool = True
+    response_cache_ttl_seconds: int = 30 * 24 * 3600
+    response_cache_max_entries: int = 10000
+    response_cache_path: Optional[str] = None
     
     # Content limits
     max_text_length: int = 8000
@@ -173,6 +197,14 @@ class AIConfigManager:
             'AI_TOKEN_DECREMENT': ('token_decrement', int),
             'AI_MAX_RETRIES': ('max_retries', int),
             'AI_TIMEOUT_SECONDS': ('timeout_seconds', int),
+            'AI_RETRY_BACKOFF_SECONDS': ('retry_backoff_seconds', float),
+            'AI_MAX_BACKOFF_SECONDS': ('max_backoff_seconds', float),
+            'AI_MAX_CONCURRENT_REQUESTS': ('max_concurrent_requests', int),
+            'AI_BASE_URL': 'base_url',
+            'AI_RESPONSE_CACHE_ENABLED': ('response_cache_enabled', _parse_bool),
+            'AI_RESPONSE_CACHE_TTL_SECONDS': ('response_cache_ttl_seconds', int),
+            'AI_RESPONSE_CACHE_MAX_ENTRIES': ('response_cache_max_entries', int),
+            'AI_RESPONSE_CACHE_PATH': 'response_cache_path',
             'AI_MAX_TEXT_LENGTH': ('max_text_length', int),
             'AI_MAX_TABLES_SUMMARY': ('max_tables_summary', int),
         }
@@ -236,6 +268,14 @@ class AIConfigManager:
                 'token_decrement': self.model_config.token_decrement,
                 'max_retries': self.model_config.max_retries,
                 'timeout_seconds': self.model_config.timeout_seconds,
+                'retry_backoff_seconds': self.model_config.retry_backoff_seconds,
+                'max_backoff_seconds': self.model_config.max_backoff_seconds,
+                'max_concurrent_requests': self.model_config.max_concurrent_requests,
+                'base_url': self.model_config.base_url,
+                'response_cache_enabled': self.model_config.response_cache_enabled,
+                'response_cache_ttl_seconds': self.model_config.response_cache_ttl_seconds,
+                'response_cache_max_entries': self.model_config.response_cache_max_entries,
+                'response_cache_path': self.model_config.response_cache_path,
                 'max_text_length': self.model_config.max_text_length,
                 'max_tables_summary': self.model_config.max_tables_summary,
             },
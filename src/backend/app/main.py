@@ -23,7 +23,6 @@ from fastapi.responses import HTMLResponse, RedirectResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
 import logging
-import chromadb
 
 # Relative imports for app context
 from .database import get_db
@@ -31,6 +30,8 @@ from . import models
 from . import schemas
 from .api import admin
 from .api import ai_config_admin
+from .services.chroma_pool import get_chroma_pool
+from .services.search_cache import get_rag_search_cache
 
 # Create the database tables
 # Base.metadata.create_all(bind=engine)  # Temporarily disabled due to UTF-8 issues
@@ -197,23 +198,30 @@ async def get_manufacturers(db: Session = Depends(get_db)):
 
 # ==================== CHROMA DB CONNECTION ====================
 
+RAG_COLLECTION = "pdf_products"
+
+
+@app.on_event("startup")
+async def start_chroma_pool():
+    """A ChromaDB kliens és a háttér health check indítása."""
+    get_chroma_pool().start_health_checker()
+
+
+@app.on_event("shutdown")
+async def stop_chroma_pool():
+    get_chroma_pool().stop_health_checker()
+
+
 def get_chroma_client():
-    """Get ChromaDB client with fallback connection logic"""
+    """Get the shared ChromaDB client (connected once, with failover)"""
     try:
-        chroma_client = chromadb.HttpClient(host="chroma", port=8000)
-        chroma_client.heartbeat()
-        return chroma_client
-    except Exception:
-        try:
-            chroma_client = chromadb.HttpClient(host="localhost", port=8001)
-            chroma_client.heartbeat()
-            return chroma_client
-        except Exception as e:
-            logging.error(f"ChromaDB connection failed: {e}")
-            raise HTTPException(
-                status_code=503, 
-                detail=f"Kereső szolgáltatás nem elérhető: {e}"
-            )
+        return get_chroma_pool().get_client()
+    except ConnectionError as e:
+        logging.error(f"ChromaDB connection failed: {e}")
+        raise HTTPException(
+            status_code=503, 
+            detail=f"Kereső szolgáltatás nem elérhető: {e}"
+        )
 
 # ==================== HTML GENERATION FUNCTIONS ====================
 
@@ -378,13 +386,17 @@ def generate_product_html(product) -> str:
 
 # ==================== SEARCH FUNCTIONS ====================
 
-def execute_vector_search(client, query: str, limit: int):
-    """Execute vector search in ChromaDB"""
-    collection = client.get_collection("pdf_products")
-    return collection.query(
-        query_texts=[query],
-        n_results=limit
-    )
+def execute_vector_search(query: str, limit: int):
+    """Execute vector search in ChromaDB through the embedding/result cache"""
+    search_cache = get_rag_search_cache()
+    try:
+        return search_cache.search(RAG_COLLECTION, query, limit)
+    except ConnectionError:
+        raise
+    except Exception:
+        # Stale handle or dropped connection: reconnect once and retry
+        get_chroma_pool().invalidate_connection()
+        return search_cache.search(RAG_COLLECTION, query, limit)
 
 def build_search_results(results, db: Session):
     """Build search results from ChromaDB query results"""
@@ -418,11 +430,10 @@ def build_search_results(results, db: Session):
     
     return search_results
 
-def get_collection_size(client):
-    """Get the size of the ChromaDB collection"""
+def get_collection_size():
+    """Get the cached size of the ChromaDB collection"""
     try:
-        collection = client.get_collection("pdf_products")
-        return collection.count()
+        return get_chroma_pool().collection_count(RAG_COLLECTION)
     except Exception:
         return 0
 
@@ -437,10 +448,10 @@ async def search_interface():
 async def rag_search(request: schemas.SearchRequest, db: Session = Depends(get_db)):
     """Végrehajt egy szemantikus keresést a vektor adatbázisban"""
     try:
-        client = get_chroma_client()
-        results = execute_vector_search(client, request.query, request.limit)
+        get_chroma_client()
+        results = execute_vector_search(request.query, request.limit)
         search_results = build_search_results(results, db)
-        collection_size = get_collection_size(client)
+        collection_size = get_collection_size()
         
         return {
             "query": request.query,
@@ -449,6 +460,8 @@ async def rag_search(request: schemas.SearchRequest, db: Session = Depends(get_d
             "results": search_results
         }
         
+    except HTTPException:
+        raise
     except Exception as e:
         logging.error(f"RAG search failed: {e}")
         raise HTTPException(
@@ -14,11 +14,13 @@ Architecture:
 """
 
 from .models import (
+    BatchStatistics,
     ConfidenceLevel,
     ExtractionResult,
     ExtractionTask,
     FieldConfidence,
     GoldenRecord,
+    StageTiming,
     StrategyType,
     TaskStatus,
 )
@@ -26,23 +28,30 @@ from .strategies import (
     NativePDFStrategy,
     PDFPlumberStrategy,
     PyMuPDFStrategy,
+    RuleBasedStrategy,
 )
 from .validator import AIValidator
+from .executor import ExtractionExecutor, ParsePayload
 from .orchestrator import MCPOrchestrator
 from .chroma_client import ChromaClient
 
 
 __all__ = [
+    "BatchStatistics",
     "ConfidenceLevel",
     "ExtractionResult",
     "ExtractionTask",
     "FieldConfidence",
     "GoldenRecord",
+    "StageTiming",
     "StrategyType",
     "TaskStatus",
     "NativePDFStrategy",
     "PDFPlumberStrategy",
     "PyMuPDFStrategy",
+    "RuleBasedStrategy",
     "AIValidator",
+    "ExtractionExecutor",
+    "ParsePayload",
     "ChromaClient",
 ]
\ No newline at end of file
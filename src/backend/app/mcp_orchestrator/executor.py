@@ -0,0 +1,158 @@
+"""
+Extraction Executor
+===================
+
+Runs the CPU-bound parsing part of extraction strategies in a process pool,
+so that `asyncio.gather` over several strategies (and several PDFs) gives
+real parallelism and the event loop stays responsive.
+
+Parse functions must be module-level callables taking a `ParsedDocument`
+and returning a plain dict; results travel back to the parent as a compact,
+picklable `ParsePayload`. All parse functions for one task run in the same
+worker against one ParsedDocument, so the PDF is opened and parsed once.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from app.services.parsed_document import ParsedDocument
+
+logger = logging.getLogger(__name__)
+
+ParseFunction = Callable[[ParsedDocument], Dict[str, Any]]
+
+
+class ParsePayload(NamedTuple):
+    """Compact result of a single parse job, safe to pass between processes."""
+    success: bool
+    data: Dict[str, Any]
+    error_message: Optional[str]
+    execution_time_seconds: float
+
+
+def _run_parse_function(
+    parse_function: ParseFunction, document: ParsedDocument
+) -> ParsePayload:
+    start_time = time.time()
+    try:
+        data = parse_function(document)
+        return ParsePayload(True, data, None, time.time() - start_time)
+    except Exception as e:
+        return ParsePayload(False, {}, str(e), time.time() - start_time)
+
+
+def run_parse_job(parse_function: ParseFunction, pdf_path: str) -> ParsePayload:
+    """Worker entry point: runs one parse function and never raises."""
+    with ParsedDocument(pdf_path) as document:
+        return _run_parse_function(parse_function, document)
+
+
+def run_document_job(
+    parse_functions: Sequence[Tuple[Any, ParseFunction]], pdf_path: str
+) -> Dict[Any, ParsePayload]:
+    """
+    Worker entry point: runs several parse functions against a single
+    ParsedDocument, which is evicted when the job finishes.
+    """
+    with ParsedDocument(pdf_path) as document:
+        return {
+            key: _run_parse_function(parse_function, document)
+            for key, parse_function in parse_functions
+        }
+
+
+class ExtractionExecutor:
+    """
+    Thin async wrapper around a ProcessPoolExecutor.
+
+    The worker count defaults to the `MCP_EXTRACTION_WORKERS` environment
+    variable, falling back to the number of CPUs.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None):
+        env_workers = os.getenv("MCP_EXTRACTION_WORKERS")
+        self.max_workers = (
+            max_workers
+            or (int(env_workers) if env_workers else None)
+            or os.cpu_count()
+            or 1
+        )
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    @property
+    def pool(self) -> ProcessPoolExecutor:
+        """Lazily start the pool so importing this module stays cheap."""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            logger.info(
+                f"Started extraction process pool with {self.max_workers} workers"
+            )
+        return self._pool
+
+    async def run(self, parse_function: ParseFunction, pdf_path: str) -> ParsePayload:
+        """Run one parse job off-loop and await its payload."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.pool, run_parse_job, parse_function, str(pdf_path)
+        )
+
+    async def run_document(
+        self, parse_functions: Sequence[Tuple[Any, ParseFunction]], pdf_path: str
+    ) -> Dict[Any, ParsePayload]:
+        """Run several parse functions over one shared parse of a PDF."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.pool, run_document_job, tuple(parse_functions), str(pdf_path)
+        )
+
+    async def run_batch(
+        self,
+        jobs: Iterable[Tuple[Any, Sequence[Tuple[Any, ParseFunction]], str]]
+    ) -> Dict[Any, Dict[Any, ParsePayload]]:
+        """
+        Submit many document jobs at once.
+
+        Args:
+            jobs: Iterable of (key, parse_functions, pdf_path) tuples, where
+                parse_functions is a sequence of (function_key, function)
+                pairs. The key is any hashable identifier chosen by the
+                caller, typically the task id.
+
+        Returns:
+            Dictionary mapping each key to its {function_key: ParsePayload}.
+        """
+        loop = asyncio.get_running_loop()
+        keys: List[Any] = []
+        futures = []
+        for key, parse_functions, pdf_path in jobs:
+            keys.append(key)
+            futures.append(
+                loop.run_in_executor(
+                    self.pool, run_document_job,
+                    tuple(parse_functions), str(pdf_path)
+                )
+            )
+        payloads = await asyncio.gather(*futures)
+        return dict(zip(keys, payloads))
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=wait, cancel_futures=True)
+            self._pool = None
+
+
+# Global executor instance
+_extraction_executor: Optional[ExtractionExecutor] = None
+
+
+def get_extraction_executor() -> ExtractionExecutor:
+    """Get the process-wide extraction executor."""
+    global _extraction_executor
+    if _extraction_executor is None:
+        _extraction_executor = ExtractionExecutor()
+    return _extraction_executor
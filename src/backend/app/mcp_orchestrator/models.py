@@ -27,6 +27,7 @@ class StrategyType(Enum):
     """The type of extraction strategy used"""
     PDFPLUMBER = "pdfplumber"
     PYMUPDF = "pymupdf"
+    RULE_BASED = "rule_based"
     NATIVE_PDF = "native_pdf"
     UNKNOWN = "unknown"
 
@@ -60,6 +61,8 @@ class ExtractionResult:
     confidence_score: float = 0.0
     execution_time_seconds: float = 0.0
     error_message: Optional[str] = None
+    # Per-field confidence; fields not listed use `confidence_score`
+    field_confidences: Dict[str, float] = field(default_factory=dict)
 
 
 @dataclass
@@ -70,6 +73,20 @@ class FieldConfidence:
     confidence_score: float
     strategy_used: StrategyType
     conflicting_values: List[Any] = field(default_factory=list)
+    supporting_strategies: List[str] = field(default_factory=list)
+    notes: str = ""
+
+    def get_confidence_level(self) -> ConfidenceLevel:
+        """Maps the numeric score onto a ConfidenceLevel."""
+        if self.confidence_score >= 0.9:
+            return ConfidenceLevel.VERY_HIGH
+        if self.confidence_score >= 0.75:
+            return ConfidenceLevel.HIGH
+        if self.confidence_score >= 0.5:
+            return ConfidenceLevel.MEDIUM
+        if self.confidence_score >= 0.25:
+            return ConfidenceLevel.LOW
+        return ConfidenceLevel.VERY_LOW
 
 
 @dataclass
@@ -87,6 +104,8 @@ class GoldenRecord:
         default_factory=dict
     )
     overall_confidence: float = 0.0
+    completeness_score: float = 0.0
+    consistency_score: float = 0.0
     
     # Metadata
     id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -96,6 +115,74 @@ class GoldenRecord:
     requires_human_review: bool = False
     ai_adjudication_notes: Optional[str] = None
     
+    # Strategies that contributed results, and the highest cost tier run
+    strategies_used: List[str] = field(default_factory=list)
+    highest_cost_tier: int = 0
+    
+    # Wall-clock seconds spent in each orchestration stage
+    stage_timings: Dict[str, float] = field(default_factory=dict)
+    total_processing_time: float = 0.0
+    
     def get_modality(self, key: str, default: Any = None) -> Any:
         """Safely get a data modality from the extracted_data dictionary."""
-        return self.extracted_data.get(key, default) 
\ No newline at end of file
+        return self.extracted_data.get(key, default) 
+
+
+@dataclass
+class StageTiming:
+    """Aggregated timing for one orchestration stage across a batch"""
+    count: int = 0
+    total_seconds: float = 0.0
+    min_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    def add(self, seconds: float):
+        self.min_seconds = seconds if self.count == 0 else min(self.min_seconds, seconds)
+        self.max_seconds = max(self.max_seconds, seconds)
+        self.total_seconds += seconds
+        self.count += 1
+
+    @property
+    def mean_seconds(self) -> float:
+        return self.total_seconds / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "total_seconds": round(self.total_seconds, 3),
+            "mean_seconds": round(self.mean_seconds, 3),
+            "min_seconds": round(self.min_seconds, 3),
+            "max_seconds": round(self.max_seconds, 3),
+        }
+
+
+@dataclass
+class BatchStatistics:
+    """Running statistics for MCPOrchestrator.process_batch"""
+    submitted: int = 0
+    completed: int = 0
+    failed: int = 0
+    wall_time_seconds: float = 0.0
+    stage_timings: Dict[str, StageTiming] = field(default_factory=dict)
+
+    def record(self, golden_record: "GoldenRecord"):
+        """Adds a finished record's stage timings to the aggregates."""
+        for stage, seconds in golden_record.stage_timings.items():
+            self.stage_timings.setdefault(stage, StageTiming()).add(seconds)
+        task = golden_record.task
+        if task is not None and task.status == TaskStatus.FAILED:
+            self.failed += 1
+        else:
+            self.completed += 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "submitted": self.submitted,
+            "completed": self.completed,
+            "failed": self.failed,
+            "wall_time_seconds": round(self.wall_time_seconds, 3),
+            "stage_timings": {
+                stage: timing.to_dict()
+                for stage, timing in self.stage_timings.items()
+            },
+        }
@@ -1,93 +1,414 @@
 import asyncio
 import logging
-from typing import List, Any
+import time
+from collections import defaultdict
+from contextlib import nullcontext
+from typing import AsyncIterator, Dict, Iterable, List, Any, Optional, Tuple
 from pathlib import Path
 
 from .models import (
-    ExtractionTask, ExtractionResult, GoldenRecord, TaskStatus, StrategyType
+    BatchStatistics, ExtractionTask, ExtractionResult, GoldenRecord,
+    TaskStatus, StrategyType
 )
 from .strategies import (
-    PDFPlumberStrategy, PyMuPDFStrategy, NativePDFStrategy
+    PDFPlumberStrategy, PyMuPDFStrategy, RuleBasedStrategy, NativePDFStrategy
 )
-from .validator import AIValidator
+from .validator import AIValidator, CONFIDENCE_THRESHOLD
 from .chroma_client import ChromaClient
+from .executor import ExtractionExecutor, get_extraction_executor
 from ..database import SessionLocal
 from ..models import Product
 
 
 logger = logging.getLogger(__name__)
 
+MAX_COST_TIER = 4
+# Tiers from here on call paid AI APIs and run under the AI concurrency limit
+AI_COST_TIER = 3
+
 
 class MCPOrchestrator:
-    def __init__(self):
+    def __init__(
+        self,
+        executor: ExtractionExecutor = None,
+        confidence_threshold: float = CONFIDENCE_THRESHOLD,
+    ):
+        self.executor = executor or get_extraction_executor()
+        self.confidence_threshold = confidence_threshold
+        self.last_batch_stats: Optional[BatchStatistics] = None
         self.chroma_client = ChromaClient()
         self.validator = AIValidator(chroma_client=self.chroma_client)
         self.strategies = {
             StrategyType.PDFPLUMBER: PDFPlumberStrategy(),
             StrategyType.PYMUPDF: PyMuPDFStrategy(),
+            StrategyType.RULE_BASED: RuleBasedStrategy(),
             StrategyType.NATIVE_PDF: NativePDFStrategy(),
         }
 
-    async def process_task(self, task: ExtractionTask) -> GoldenRecord:
+    async def extract_pdf(
+        self,
+        pdf_path: str,
+        use_tiered_approach: bool = True,
+        max_cost_tier: int = MAX_COST_TIER,
+        timeout_seconds: Optional[float] = None,
+    ) -> GoldenRecord:
+        """
+        Extracts one PDF with the tiered scheduler.
+
+        Args:
+            pdf_path: Path to the PDF.
+            use_tiered_approach: Stop escalating once the Golden Record
+                reaches `confidence_threshold`. If False, every tier up to
+                `max_cost_tier` runs.
+            max_cost_tier: Most expensive strategy tier that may run.
+            timeout_seconds: Per-task deadline. Running strategies are
+                cancelled when it expires; the tiers finished by then are
+                merged into a record flagged for human review. Raises
+                asyncio.TimeoutError if not even the first tier finished.
+        """
+        task = ExtractionTask(pdf_path=str(pdf_path))
+        return await self.process_task(
+            task,
+            use_tiered_approach=use_tiered_approach,
+            max_cost_tier=max_cost_tier,
+            timeout_seconds=timeout_seconds,
+        )
+
+    async def process_task(
+        self,
+        task: ExtractionTask,
+        use_tiered_approach: bool = True,
+        max_cost_tier: int = MAX_COST_TIER,
+        timeout_seconds: Optional[float] = None,
+    ) -> GoldenRecord:
+        return await self._execute_task(
+            task,
+            use_tiered_approach=use_tiered_approach,
+            max_cost_tier=max_cost_tier,
+            timeout_seconds=timeout_seconds,
+        )
+
+    async def process_batch(
+        self,
+        tasks: Iterable[ExtractionTask],
+        max_parse_concurrency: int = 8,
+        max_ai_concurrency: int = 4,
+        batch_stats: Optional[BatchStatistics] = None,
+    ) -> AsyncIterator[GoldenRecord]:
+        """
+        Processes many tasks and yields Golden Records as they complete.
+
+        The cheap parse stage and the expensive AI stage have separate
+        concurrency limits, so parsing keeps the process pool busy while
+        at most `max_ai_concurrency` Claude analyses are in flight. Tasks
+        are pulled lazily from `tasks`, so large iterables are never fully
+        materialized.
+
+        Args:
+            tasks: Iterable of ExtractionTasks.
+            max_parse_concurrency: Max tasks in the parse stage at once.
+            max_ai_concurrency: Max tasks in the AI stage at once.
+            batch_stats: Optional BatchStatistics that receives per-stage
+                timing aggregates while the batch runs. The final value is
+                also stored on `self.last_batch_stats`.
+        """
+        stats = batch_stats if batch_stats is not None else BatchStatistics()
+        self.last_batch_stats = stats
+        parse_limit = asyncio.Semaphore(max_parse_concurrency)
+        ai_limit = asyncio.Semaphore(max_ai_concurrency)
+        # Bound the number of admitted-but-not-yet-consumed tasks so a huge
+        # iterable does not spawn one coroutine per file up front, and a slow
+        # consumer applies backpressure to the whole batch.
+        admission = asyncio.Semaphore(max_parse_concurrency + max_ai_concurrency)
+        done: asyncio.Queue = asyncio.Queue()
+        batch_start = time.perf_counter()
+
+        async def run_one(task: ExtractionTask):
+            try:
+                record = await self._execute_task(task, parse_limit, ai_limit)
+            except Exception as e:
+                logger.error(f"Batch task {task.task_id} failed: {e}")
+                task.status = TaskStatus.FAILED
+                record = GoldenRecord(
+                    task=task,
+                    requires_human_review=True,
+                    ai_adjudication_notes=f"Processing failed: {e}"
+                )
+            await done.put(record)
+
+        async def feed():
+            for task in tasks:
+                await admission.acquire()
+                stats.submitted += 1
+                worker = asyncio.create_task(run_one(task))
+                running.add(worker)
+                worker.add_done_callback(running.discard)
+
+        running = set()
+        feeder = asyncio.create_task(feed())
+        yielded = 0
+        try:
+            while True:
+                if feeder.done():
+                    feeder.result()  # Surface errors from the task iterable
+                    if yielded == stats.submitted:
+                        break
+                    record = await done.get()
+                else:
+                    get_next = asyncio.create_task(done.get())
+                    await asyncio.wait(
+                        {get_next, feeder}, return_when=asyncio.FIRST_COMPLETED
+                    )
+                    if not get_next.done():
+                        get_next.cancel()
+                        continue
+                    record = get_next.result()
+                admission.release()
+                yielded += 1
+                stats.record(record)
+                stats.wall_time_seconds = time.perf_counter() - batch_start
+                yield record
+        finally:
+            feeder.cancel()
+            for pending in list(running):
+                pending.cancel()
+
+    def _strategy_tiers(self, max_cost_tier: int) -> List[Tuple[int, List]]:
+        """Strategies up to `max_cost_tier`, grouped by tier, cheapest first."""
+        tiers: Dict[int, List] = defaultdict(list)
+        for st, s in self.strategies.items():
+            if s.cost_tier <= max_cost_tier:
+                tiers[s.cost_tier].append((st, s))
+        return sorted(tiers.items())
+
+    async def _execute_task(
+        self,
+        task: ExtractionTask,
+        parse_limit: Optional[asyncio.Semaphore] = None,
+        ai_limit: Optional[asyncio.Semaphore] = None,
+        use_tiered_approach: bool = True,
+        max_cost_tier: int = MAX_COST_TIER,
+        timeout_seconds: Optional[float] = None,
+    ) -> GoldenRecord:
         task.status = TaskStatus.RUNNING
         logger.info(
             f"Starting extraction task {task.task_id} for {task.pdf_path}"
         )
-        
-        # --- Step 1: Run basic text extraction strategies ---
-        base_results = await self._run_strategies_parallel(
-            task,
-            [
-                (
-                    StrategyType.PDFPLUMBER,
-                    self.strategies[StrategyType.PDFPLUMBER]
+        task_start = time.perf_counter()
+        all_results: List[ExtractionResult] = []
+        timings: Dict[str, float] = {}
+        progress = {"tier": 0, "record": None}
+
+        try:
+            await asyncio.wait_for(
+                self._run_tiers(
+                    task, all_results, timings, progress, parse_limit,
+                    ai_limit, use_tiered_approach, max_cost_tier
                 ),
-                (
-                    StrategyType.PYMUPDF,
-                    self.strategies[StrategyType.PYMUPDF]
+                timeout=timeout_seconds,
+            )
+            golden_record = progress["record"]
+            if golden_record is None:
+                golden_record = await self.validator.validate_and_merge(
+                    all_results, task
                 )
-            ]
-        )
-
-        # --- Step 2: Select the best text and run AI analysis ---
-        all_results = list(base_results)
-        best_raw_text = self.validator.select_best_input(
-            all_results, modality="raw_text"
-        )
-        
-        if best_raw_text:
-            task.input_data = {"raw_text": best_raw_text}
-            ai_result = await self._run_strategy_safe(
-                task,
-                StrategyType.NATIVE_PDF,
-                self.strategies[StrategyType.NATIVE_PDF]
+            notes = (
+                f"Stopped at cost tier {progress['tier']} "
+                f"(confidence {golden_record.overall_confidence:.2f}, "
+                f"threshold {self.confidence_threshold:.2f})."
             )
-            if ai_result.success:
-                all_results.append(ai_result)
-        
-        # --- Step 3: Finalize and save the Golden Record ---
-        golden_record = await self.validator.validate_and_merge(
-            all_results, task
+        except asyncio.TimeoutError:
+            if not all_results:
+                task.status = TaskStatus.FAILED
+                logger.error(
+                    f"Task {task.task_id} timed out after {timeout_seconds}s "
+                    f"before any strategy finished"
+                )
+                raise
+            # Keep what the finished tiers produced, but never auto-save it
+            golden_record = await self.validator.validate_and_merge(
+                all_results, task
+            )
+            golden_record.requires_human_review = True
+            notes = (
+                f"Timed out after {timeout_seconds}s during cost tier "
+                f"{progress['tier']}; merged the results of earlier tiers."
+            )
+            logger.warning(f"Task {task.task_id}: {notes}")
+
+        golden_record.ai_adjudication_notes = " ".join(
+            filter(None, [golden_record.ai_adjudication_notes, notes])
         )
-        
+        golden_record.highest_cost_tier = progress["tier"]
+
+        # --- Finalize and save the Golden Record ---
         if not golden_record.requires_human_review:
             # Delegate saving to the validator
+            stage_start = time.perf_counter()
             await self.validator.save_golden_record(golden_record)
-        
+            timings["save"] = time.perf_counter() - stage_start
+
+        golden_record.stage_timings = timings
+        golden_record.total_processing_time = time.perf_counter() - task_start
         task.status = TaskStatus.COMPLETED
         logger.info(
             f"Completed task {task.task_id} with "
-            f"confidence {golden_record.overall_confidence:.2f}"
+            f"confidence {golden_record.overall_confidence:.2f} "
+            f"at cost tier {progress['tier']}"
         )
         return golden_record
 
+    async def _run_tiers(
+        self,
+        task: ExtractionTask,
+        all_results: List[ExtractionResult],
+        timings: Dict[str, float],
+        progress: Dict[str, Any],
+        parse_limit: Optional[asyncio.Semaphore],
+        ai_limit: Optional[asyncio.Semaphore],
+        use_tiered_approach: bool,
+        max_cost_tier: int,
+    ):
+        """
+        Runs the strategy tiers cheapest first. After each tier the results
+        so far are merged; with the tiered approach the escalation stops as
+        soon as the merged confidence reaches the threshold. Results and
+        progress are written into the caller's containers so a timeout can
+        still use the finished tiers.
+        """
+        for tier, strategies in self._strategy_tiers(max_cost_tier):
+            progress["tier"] = tier
+            limit = ai_limit if tier >= AI_COST_TIER else parse_limit
+
+            stage_start = time.perf_counter()
+            async with limit or nullcontext():
+                tier_results = await self._run_strategies_parallel(
+                    task, strategies
+                )
+            timings[f"tier_{tier}"] = time.perf_counter() - stage_start
+            all_results.extend(tier_results)
+
+            # Later tiers structure the best text and tables found so far
+            best_raw_text = self.validator.select_best_input(
+                all_results, modality="raw_text"
+            )
+            if not best_raw_text:
+                logger.warning(
+                    f"Task {task.task_id}: no text after cost tier {tier}, "
+                    f"not escalating"
+                )
+                break
+            task.input_data = {
+                **(task.input_data or {}),
+                "raw_text": best_raw_text,
+                "tables_data": self.validator.select_best_input(
+                    all_results, modality="tables_data"
+                ) or [],
+            }
+
+            stage_start = time.perf_counter()
+            record = await self.validator.validate_and_merge(all_results, task)
+            timings["validate"] = (
+                timings.get("validate", 0.0) + time.perf_counter() - stage_start
+            )
+            progress["record"] = record
+            if (
+                use_tiered_approach
+                and record.overall_confidence >= self.confidence_threshold
+            ):
+                break
+
     async def _run_strategies_parallel(
         self, task: ExtractionTask, strategies: List
     ) -> List[ExtractionResult]:
-        results = await asyncio.gather(
-            *[self._run_strategy_safe(task, st, s) for st, s in strategies]
-        )
-        return [r for r in results if r]
+        # Pool-capable strategies share one ParsedDocument in one worker job;
+        # the rest run concurrently on the loop.
+        pooled = [(st, s) for st, s in strategies if s.parse_function]
+        others = [(st, s) for st, s in strategies if not s.parse_function]
+
+        coroutines = [self._run_strategy_safe(task, st, s) for st, s in others]
+        if pooled:
+            coroutines.append(self._run_pooled_strategies(task, pooled))
+
+        results = []
+        for outcome in await asyncio.gather(*coroutines):
+            if isinstance(outcome, list):
+                results.extend(outcome)
+            elif outcome:
+                results.append(outcome)
+        return results
+
+    async def _run_pooled_strategies(
+        self, task: ExtractionTask, strategies: List
+    ) -> List[ExtractionResult]:
+        start_time = time.time()
+        try:
+            payloads = await self.executor.run_document(
+                [(st, s.parse_function) for st, s in strategies],
+                task.pdf_path
+            )
+        except Exception as e:
+            logger.error(f"Pooled parsing failed for {task.pdf_path}: {e}")
+            return [
+                ExtractionResult(
+                    strategy_type=st, success=False, error_message=str(e)
+                )
+                for st, _ in strategies
+            ]
+        elapsed = time.time() - start_time
+        results = []
+        for st, s in strategies:
+            result = s.build_result(payloads[st])
+            result.execution_time_seconds = elapsed
+            results.append(result)
+        return results
+
+    async def parse_tasks_batch(
+        self, tasks: Iterable[ExtractionTask]
+    ) -> Dict[str, List[ExtractionResult]]:
+        """
+        Submits the pool-capable parsing strategies for many tasks at once.
+
+        Every task becomes one job in the extraction process pool, running
+        all pool-capable strategies over a single ParsedDocument, so a large
+        batch keeps all workers busy without parsing any PDF twice.
+
+        Returns:
+            Dictionary mapping task_id to that task's ExtractionResults.
+        """
+        pool_functions = [
+            (s.strategy_type, s.parse_function)
+            for s in self.strategies.values() if s.parse_function
+        ]
+        jobs = [
+            (task.task_id, pool_functions, task.pdf_path) for task in tasks
+        ]
+        payloads = await self.executor.run_batch(jobs)
+
+        results: Dict[str, List[ExtractionResult]] = defaultdict(list)
+        for task_id, task_payloads in payloads.items():
+            for strategy_type, payload in task_payloads.items():
+                results[task_id].append(
+                    self.strategies[strategy_type].build_result(payload)
+                )
+        return dict(results)
+
+    def get_orchestrator_stats(self) -> Dict[str, Any]:
+        """Strategy tiers, threshold and the last batch's statistics."""
+        return {
+            "confidence_threshold": self.confidence_threshold,
+            "strategy_tiers": {
+                st.value: s.cost_tier for st, s in self.strategies.items()
+            },
+            "last_batch": (
+                self.last_batch_stats.to_dict()
+                if self.last_batch_stats else None
+            ),
+        }
+
+    def shutdown(self):
+        """Releases the extraction worker processes."""
+        self.executor.shutdown()
 
     async def _run_strategy_safe(
         self, task: ExtractionTask, st: StrategyType, s: Any
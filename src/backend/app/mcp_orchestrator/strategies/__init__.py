@@ -1,11 +1,13 @@
 from .base_strategy import BaseExtractionStrategy
 from .pdf_plumber_strategy import PDFPlumberStrategy
 from .py_mu_pdf_strategy import PyMuPDFStrategy
+from .rule_based_strategy import RuleBasedStrategy
 from .native_pdf_strategy import NativePDFStrategy
 
 __all__ = [
     "BaseExtractionStrategy",
     "PDFPlumberStrategy",
     "PyMuPDFStrategy",
+    "RuleBasedStrategy",
     "NativePDFStrategy",
 ] 
\ No newline at end of file
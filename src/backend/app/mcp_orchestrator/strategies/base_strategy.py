@@ -1,5 +1,8 @@
+import time
 from abc import ABC, abstractmethod
 from pathlib import Path
+from typing import Optional
+from ..executor import ParseFunction, ParsePayload, get_extraction_executor
 from ..models import ExtractionResult, ExtractionTask, StrategyType
 
 class BaseExtractionStrategy(ABC):
@@ -7,6 +10,10 @@ class BaseExtractionStrategy(ABC):
     Abstract base class for all extraction strategies.
     Defines the common interface and properties for different extraction methods.
     """
+    # Module-level, picklable callable doing the CPU-bound parsing. Strategies
+    # that set it run in the extraction process pool instead of on the loop.
+    parse_function: Optional[ParseFunction] = None
+
     def __init__(self, strategy_type: StrategyType, cost_tier: int):
         self.strategy_type = strategy_type
         self.cost_tier = cost_tier
@@ -25,5 +32,25 @@ class BaseExtractionStrategy(ABC):
         """
         pass
 
+    async def _extract_in_pool(self, pdf_path: Path) -> ExtractionResult:
+        """Runs `parse_function` in the process pool and wraps the payload."""
+        start_time = time.time()
+        payload = await get_extraction_executor().run(
+            type(self).parse_function, str(pdf_path)
+        )
+        result = self.build_result(payload)
+        result.execution_time_seconds = time.time() - start_time
+        return result
+
+    def build_result(self, payload: ParsePayload) -> ExtractionResult:
+        """Converts a ParsePayload into an ExtractionResult."""
+        return ExtractionResult(
+            strategy_type=self.strategy_type,
+            success=payload.success,
+            execution_time_seconds=payload.execution_time_seconds,
+            extracted_data=payload.data,
+            error_message=payload.error_message
+        )
+
     def __repr__(self) -> str:
-        return f"{self.__class__.__name__}(type={self.strategy_type}, tier={self.cost_tier})" 
\ No newline at end of file
+        return f"{self.__class__.__name__}(type={self.strategy_type}, tier={self.cost_tier})"
@@ -32,10 +32,14 @@ class NativePDFStrategy(BaseExtractionStrategy):
             
         raw_text = task.input_data.get("raw_text")
         tables = task.input_data.get("tables_data", [])
+        use_cache = task.input_data.get("use_ai_cache", True)
 
         try:
             ai_analysis = await self.ai_analyzer.analyze_pdf_content(
-                text_content=raw_text, tables=tables, filename=pdf_path.name
+                text_content=raw_text,
+                tables_data=tables,
+                filename=pdf_path.name,
+                use_cache=use_cache
             )
 
             # Flatten the AI analysis to match the expected structure
@@ -51,8 +55,10 @@ class NativePDFStrategy(BaseExtractionStrategy):
                 "pricing_information": ai_analysis.get("pricing_information"),
                 "raw_text": raw_text  # Pass through the raw text
             }
-            confidence = ai_analysis.get("confidence_assessment", {}).get(
-                "overall_confidence", 0.0
+            # Without a self-assessment, trust a named product like before
+            confidence = (ai_analysis.get("confidence_assessment") or {}).get(
+                "overall_confidence",
+                0.85 if extracted_data["product_name"] else 0.6
             )
 
             return ExtractionResult(
@@ -1,12 +1,33 @@
-import pdfplumber
 from pathlib import Path
-import time
+from typing import Any, Dict
+from app.services.parsed_document import ParsedDocument
 from .base_strategy import BaseExtractionStrategy
+from ..executor import ParsePayload
 from ..models import ExtractionResult, StrategyType, ExtractionTask
 
 
+def parse_with_pdfplumber(document: ParsedDocument) -> Dict[str, Any]:
+    """
+    CPU-bound pdfplumber parsing. Runs inside the extraction process pool,
+    so it must stay a module-level function returning plain data.
+    """
+    text_parts = []
+    tables = []
+    for page_index in range(document.page_count):
+        page_text = document.page_text(page_index)
+        if page_text:
+            text_parts.append(page_text + "\n\n")
+        
+        # Extract tables with default settings
+        tables.extend(document.page_tables(page_index))
+
+    return {"raw_text": "".join(text_parts), "tables_data": tables}
+
+
 class PDFPlumberStrategy(BaseExtractionStrategy):
     """An extraction strategy using the pdfplumber library."""
+    parse_function = staticmethod(parse_with_pdfplumber)
+
     def __init__(self):
         super().__init__(
             strategy_type=StrategyType.PDFPLUMBER, cost_tier=1
@@ -15,43 +36,17 @@ class PDFPlumberStrategy(BaseExtractionStrategy):
     async def extract(
         self, pdf_path: Path, task: ExtractionTask
     ) -> ExtractionResult:
-        start_time = time.time()
-        try:
-            text = ""
-            tables = []
-            with pdfplumber.open(pdf_path) as pdf:
-                for page in pdf.pages:
-                    page_text = page.extract_text()
-                    if page_text:
-                        text += page_text + "\n\n"
-                    
-                    # Extract tables with default settings
-                    page_tables = page.extract_tables()
-                    if page_tables:
-                        tables.extend(page_tables)
-            
-            if not text and not tables:
-                return ExtractionResult(
-                    strategy_type=self.strategy_type,
-                    success=False,
-                    execution_time_seconds=time.time() - start_time,
-                    error_message="No text or tables found by pdfplumber."
-                )
-
-            return ExtractionResult(
-                strategy_type=self.strategy_type,
-                success=True,
-                execution_time_seconds=time.time() - start_time,
-                extracted_data={
-                    "raw_text": text,
-                    "tables_data": tables
-                },
-                confidence_score=0.7  # Base confidence for this reliable method
-            )
-        except Exception as e:
-            return ExtractionResult(
-                strategy_type=self.strategy_type,
-                success=False,
-                execution_time_seconds=time.time() - start_time,
-                error_message=str(e)
-            )
\ No newline at end of file
+        return await self._extract_in_pool(pdf_path)
+
+    def build_result(self, payload: ParsePayload) -> ExtractionResult:
+        result = super().build_result(payload)
+        if not result.success:
+            return result
+
+        if not payload.data.get("raw_text") and not payload.data.get("tables_data"):
+            result.success = False
+            result.error_message = "No text or tables found by pdfplumber."
+            return result
+
+        result.confidence_score = 0.7  # Base confidence for this reliable method
+        return result
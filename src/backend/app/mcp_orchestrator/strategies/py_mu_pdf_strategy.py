@@ -1,45 +1,45 @@
-import fitz  # PyMuPDF
 from pathlib import Path
-import time
+from typing import Any, Dict
+from app.services.parsed_document import ParsedDocument
 from .base_strategy import BaseExtractionStrategy
+from ..executor import ParsePayload
 from ..models import ExtractionResult, StrategyType, ExtractionTask
 
 
+def parse_with_pymupdf(document: ParsedDocument) -> Dict[str, Any]:
+    """
+    CPU-bound PyMuPDF parsing. Runs inside the extraction process pool,
+    so it must stay a module-level function returning plain data.
+    """
+    text = "".join(
+        document.fitz_page_text(page_index) + "\n\n"
+        for page_index in range(document.page_count)
+    )
+    return {"raw_text": text}
+
+
 class PyMuPDFStrategy(BaseExtractionStrategy):
     """An extraction strategy using the PyMuPDF (fitz) library."""
+    parse_function = staticmethod(parse_with_pymupdf)
+
     def __init__(self):
         super().__init__(strategy_type=StrategyType.PYMUPDF, cost_tier=1)
 
     async def extract(
         self, pdf_path: Path, task: ExtractionTask
     ) -> ExtractionResult:
-        start_time = time.time()
-        try:
-            text = ""
-            with fitz.open(pdf_path) as doc:
-                for page in doc:
-                    text += page.get_text() + "\n\n"
-            
-            if not text.strip():
-                return ExtractionResult(
-                    strategy_type=self.strategy_type,
-                    success=False,
-                    execution_time_seconds=time.time() - start_time,
-                    error_message="No text found by PyMuPDF."
-                )
-
-            return ExtractionResult(
-                strategy_type=self.strategy_type,
-                success=True,
-                execution_time_seconds=time.time() - start_time,
-                extracted_data={"raw_text": text},
-                # PyMuPDF doesn't handle tables as well, so lower confidence
-                confidence_score=0.6
-            )
-        except Exception as e:
-            return ExtractionResult(
-                strategy_type=self.strategy_type,
-                success=False,
-                execution_time_seconds=time.time() - start_time,
-                error_message=str(e)
-            ) 
\ No newline at end of file
+        return await self._extract_in_pool(pdf_path)
+
+    def build_result(self, payload: ParsePayload) -> ExtractionResult:
+        result = super().build_result(payload)
+        if not result.success:
+            return result
+
+        if not payload.data.get("raw_text", "").strip():
+            result.success = False
+            result.error_message = "No text found by PyMuPDF."
+            return result
+
+        # PyMuPDF doesn't handle tables as well, so lower confidence
+        result.confidence_score = 0.6
+        return result
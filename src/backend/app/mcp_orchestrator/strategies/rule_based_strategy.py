@@ -0,0 +1,182 @@
+import re
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from .base_strategy import BaseExtractionStrategy
+from ..models import ExtractionResult, StrategyType, ExtractionTask
+
+# (spec name, pattern, unit, value type) - matched against lowercased text
+_SPEC_PATTERNS = [
+    (
+        "thermal_conductivity",
+        re.compile(
+            r"(?:hővezetési tényező|thermal conductivity|λ[dD]?)\s*[:=]?\s*"
+            r"(\d+[.,]\d+)\s*w/\(?m\s*[·.*]?\s*k\)?"
+        ),
+        "W/mK",
+        float,
+    ),
+    (
+        "density",
+        re.compile(
+            r"(?:testsűrűség|sűrűség|density|ρ)\s*[:=]?\s*(?:kb\.?\s*)?"
+            r"(\d+(?:[.,]\d+)?)\s*kg/m(?:³|3)"
+        ),
+        "kg/m³",
+        float,
+    ),
+    (
+        "compressive_strength",
+        re.compile(
+            r"(?:nyomószilárdság|compressive strength|σ10)\s*[:=]?\s*"
+            r"(?:≥\s*)?(\d+(?:[.,]\d+)?)\s*kpa"
+        ),
+        "kPa",
+        float,
+    ),
+    (
+        "water_vapour_diffusion",
+        re.compile(
+            r"(?:páradiffúziós ellenállási szám|vapour diffusion[a-z ]*|μ)"
+            r"\s*[:=]?\s*(\d+(?:[.,]\d+)?)\b"
+        ),
+        None,
+        float,
+    ),
+]
+
+_FIRE_CLASS_PATTERN = re.compile(
+    r"(?:tűzvédelmi osztály|euroclass|fire (?:class|reaction)|reakció tűzre)"
+    r"[^a-z0-9]{0,20}(a1|a2-s\d,\s*d\d|[b-f](?:-s\d,\s*d\d)?)\b"
+)
+_SENTENCE_END = re.compile(r"[.!?]$")
+# Header lines that look like a product name but never are one
+_GENERIC_HEADINGS = re.compile(
+    r"^(?:rockwool|leier|baumit|(?:műszaki |termék)?adatlap|"
+    r"teljesítménynyilatkozat|datasheet|product data sheet)$",
+    re.I,
+)
+
+
+def _to_number(raw: str, value_type: type) -> Optional[float]:
+    try:
+        return value_type(raw.replace(",", "."))
+    except ValueError:
+        return None
+
+
+def _extract_specs(text: str) -> Dict[str, Any]:
+    lowered = text.lower()
+    specs: Dict[str, Any] = {}
+    for name, pattern, unit, value_type in _SPEC_PATTERNS:
+        match = pattern.search(lowered)
+        if not match:
+            continue
+        value = _to_number(match.group(1), value_type)
+        if value is None:
+            continue
+        specs[name] = {"value": value, "unit": unit} if unit else value
+
+    fire_match = _FIRE_CLASS_PATTERN.search(lowered)
+    if fire_match:
+        specs["fire_classification"] = re.sub(
+            r"\s+", "", fire_match.group(1)
+        ).upper()
+    return specs
+
+
+def _extract_product_name(lines, filename: str) -> Tuple[Optional[str], float]:
+    """
+    A line containing the file name stem is the strongest signal; otherwise
+    the first short heading-like line is used with lower confidence.
+    """
+    stem = re.sub(r"[_\-]+", " ", Path(filename).stem).strip().lower()
+    stem_words = [w for w in stem.split() if len(w) > 2]
+    for line in lines[:40]:
+        lowered = line.lower()
+        if stem_words and all(word in lowered for word in stem_words[:2]):
+            if len(line) <= 80:
+                return line, 0.9
+
+    for line in lines[:15]:
+        if _GENERIC_HEADINGS.match(line):
+            continue
+        letters = sum(c.isalpha() for c in line)
+        if 3 <= len(line) <= 60 and letters >= len(line) * 0.5:
+            return line, 0.6
+    return None, 0.0
+
+
+def _extract_description(lines) -> Optional[str]:
+    for line in lines[:80]:
+        if len(line) >= 80 and _SENTENCE_END.search(line):
+            return line
+    return None
+
+
+def parse_fields_from_text(
+    raw_text: str, filename: str
+) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """
+    Regex/heuristic structuring of already extracted text. Returns the
+    fields and a confidence per found field.
+    """
+    lines = [line.strip() for line in raw_text.splitlines() if line.strip()]
+    data: Dict[str, Any] = {}
+    confidences: Dict[str, float] = {}
+
+    name, name_confidence = _extract_product_name(lines, filename)
+    if name:
+        data["product_name"] = name
+        confidences["product_name"] = name_confidence
+
+    description = _extract_description(lines)
+    if description:
+        data["description"] = description
+        confidences["description"] = 0.75
+
+    specs = _extract_specs(raw_text)
+    if specs:
+        data["technical_specifications"] = specs
+        confidences["technical_specifications"] = (
+            0.9 if len(specs) >= 3 else 0.75 if len(specs) == 2 else 0.5
+        )
+    return data, confidences
+
+
+class RuleBasedStrategy(BaseExtractionStrategy):
+    """
+    Structures the raw text of the tier-1 parsers into product fields with
+    regular expressions. No network and no process pool, so it is the cheap
+    step tried before the AI analysis.
+    """
+    def __init__(self):
+        super().__init__(strategy_type=StrategyType.RULE_BASED, cost_tier=2)
+
+    async def extract(
+        self, pdf_path: Path, task: ExtractionTask
+    ) -> ExtractionResult:
+        start_time = time.time()
+
+        raw_text = (task.input_data or {}).get("raw_text")
+        if not raw_text:
+            return ExtractionResult(
+                strategy_type=self.strategy_type,
+                success=False,
+                execution_time_seconds=time.time() - start_time,
+                error_message="RuleBasedStrategy requires 'raw_text' in input."
+            )
+
+        data, confidences = parse_fields_from_text(raw_text, pdf_path.name)
+        return ExtractionResult(
+            strategy_type=self.strategy_type,
+            success=bool(data),
+            execution_time_seconds=time.time() - start_time,
+            extracted_data=data,
+            confidence_score=(
+                sum(confidences.values()) / len(confidences)
+                if confidences else 0.0
+            ),
+            field_confidences=confidences,
+            error_message=None if data else "No product fields recognized."
+        )
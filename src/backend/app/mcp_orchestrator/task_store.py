@@ -0,0 +1,403 @@
+"""
+Durable Extraction Task Store
+=============================
+
+Persists MCP extraction tasks in the `extraction_jobs` table so they
+survive restarts and are shared by every API process and worker.
+
+Workers claim tasks with a lease: the claim sets `lease_owner` and
+`lease_expires_at`, and a running worker keeps renewing it. A task whose
+lease expired (its worker died) is claimed again by another worker until
+`max_attempts` is used up. Cancellation is a flag that the owning worker
+picks up on its next lease renewal.
+
+Claims are ordered by lane priority, then age. On PostgreSQL candidate
+rows are locked with SKIP LOCKED; the claim itself is a conditional
+UPDATE, so it is also safe on SQLite.
+"""
+
+import logging
+import uuid
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from sqlalchemy import and_, func, or_
+
+from ..database import SessionLocal, engine
+from ..models import ExtractionJob
+from .models import TaskStatus
+
+logger = logging.getLogger(__name__)
+
+# Lane name -> priority (lower runs first)
+PRIORITY_LANES = {
+    "interactive": 0,
+    "default": 1,
+    "bulk": 2,
+}
+DEFAULT_LANE = "default"
+DEFAULT_LEASE_SECONDS = 60
+DEFAULT_MAX_ATTEMPTS = 3
+
+FINISHED_STATUSES = (
+    TaskStatus.COMPLETED.value,
+    TaskStatus.FAILED.value,
+    TaskStatus.CANCELLED.value,
+)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(timezone.utc)
+
+
+class ExtractionTaskStore:
+    """Submit, claim, renew and finish extraction tasks in the database."""
+
+    def __init__(self, session_factory=None, bind=None):
+        self.session_factory = session_factory or SessionLocal
+        ExtractionJob.__table__.create(bind=bind or engine, checkfirst=True)
+
+    # --- Submission ------------------------------------------------------
+
+    def submit(
+        self,
+        pdf_path: str,
+        options: Optional[Dict[str, Any]] = None,
+        lane: str = DEFAULT_LANE,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> str:
+        """Queues one task and returns its id."""
+        return self.submit_many([pdf_path], options, lane, max_attempts)[0]
+
+    def submit_many(
+        self,
+        pdf_paths: Iterable[str],
+        options: Optional[Dict[str, Any]] = None,
+        lane: str = DEFAULT_LANE,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ) -> List[str]:
+        """Queues many tasks with the same options in one transaction."""
+        if lane not in PRIORITY_LANES:
+            raise ValueError(f"Unknown lane: {lane}")
+
+        now = _utcnow()
+        rows = [
+            {
+                "id": str(uuid.uuid4()),
+                "pdf_path": str(pdf_path),
+                "lane": lane,
+                "priority": PRIORITY_LANES[lane],
+                "status": TaskStatus.PENDING.value,
+                "options": options or {},
+                "progress": "Queued",
+                "attempts": 0,
+                "max_attempts": max_attempts,
+                "cancel_requested": False,
+                "created_at": now,
+            }
+            for pdf_path in pdf_paths
+        ]
+        if not rows:
+            return []
+
+        db = self.session_factory()
+        try:
+            db.bulk_insert_mappings(ExtractionJob, rows)
+            db.commit()
+        finally:
+            db.close()
+        return [row["id"] for row in rows]
+
+    # --- Worker side -----------------------------------------------------
+
+    def claim(
+        self,
+        worker_id: str,
+        limit: int = 1,
+        lanes: Optional[Sequence[str]] = None,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Leases up to `limit` runnable tasks to `worker_id`: pending ones and
+        running ones whose lease expired. Expired tasks that already used
+        all attempts are failed instead of claimed.
+        """
+        now = _utcnow()
+        runnable = or_(
+            and_(
+                ExtractionJob.status == TaskStatus.PENDING.value,
+                ExtractionJob.cancel_requested.is_(False),
+            ),
+            and_(
+                ExtractionJob.status == TaskStatus.RUNNING.value,
+                ExtractionJob.lease_expires_at < now,
+            ),
+        )
+
+        db = self.session_factory()
+        try:
+            query = db.query(ExtractionJob).filter(runnable)
+            if lanes:
+                query = query.filter(ExtractionJob.lane.in_(list(lanes)))
+            candidates = (
+                query.order_by(
+                    ExtractionJob.priority, ExtractionJob.created_at
+                )
+                .limit(limit * 2)
+                .with_for_update(skip_locked=True)
+                .all()
+            )
+
+            claimed = []
+            for job in candidates:
+                if len(claimed) >= limit:
+                    break
+                if job.cancel_requested or job.attempts >= job.max_attempts:
+                    self._finish_expired(db, job, now)
+                    continue
+
+                # Conditional update: only one worker wins a given row
+                won = (
+                    db.query(ExtractionJob)
+                    .filter(
+                        ExtractionJob.id == job.id,
+                        ExtractionJob.attempts == job.attempts,
+                        runnable,
+                    )
+                    .update(
+                        {
+                            "status": TaskStatus.RUNNING.value,
+                            "lease_owner": worker_id,
+                            "lease_expires_at": now + timedelta(seconds=lease_seconds),
+                            "attempts": job.attempts + 1,
+                            "started_at": now,
+                            "progress": "Claimed by worker",
+                        },
+                        synchronize_session=False,
+                    )
+                )
+                if won:
+                    claimed.append(job.id)
+            db.commit()
+
+            if not claimed:
+                return []
+            jobs = (
+                db.query(ExtractionJob)
+                .filter(ExtractionJob.id.in_(claimed))
+                .all()
+            )
+            by_id = {job.id: job.to_dict() for job in jobs}
+            return [by_id[job_id] for job_id in claimed]
+        finally:
+            db.close()
+
+    def _finish_expired(self, db, job: ExtractionJob, now: datetime):
+        if job.cancel_requested:
+            status, message = TaskStatus.CANCELLED.value, "Cancelled by user"
+        else:
+            status = TaskStatus.FAILED.value
+            message = f"Lease expired after {job.attempts} attempt(s)"
+        db.query(ExtractionJob).filter(
+            ExtractionJob.id == job.id,
+            ExtractionJob.status.notin_(FINISHED_STATUSES),
+        ).update(
+            {
+                "status": status,
+                "progress": message,
+                "error_message": message if status == TaskStatus.FAILED.value else None,
+                "lease_owner": None,
+                "finished_at": now,
+            },
+            synchronize_session=False,
+        )
+        logger.warning(f"Task {job.id}: {message}")
+
+    def renew_lease(
+        self,
+        task_id: str,
+        worker_id: str,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS,
+        progress: Optional[str] = None,
+    ) -> Optional[bool]:
+        """
+        Extends the lease of a task this worker owns.
+
+        Returns the task's `cancel_requested` flag, or None if the worker
+        lost the lease (it expired and another worker took the task).
+        """
+        values: Dict[str, Any] = {
+            "lease_expires_at": _utcnow() + timedelta(seconds=lease_seconds)
+        }
+        if progress is not None:
+            values["progress"] = progress
+
+        db = self.session_factory()
+        try:
+            owned = and_(
+                ExtractionJob.id == task_id,
+                ExtractionJob.lease_owner == worker_id,
+                ExtractionJob.status == TaskStatus.RUNNING.value,
+            )
+            updated = db.query(ExtractionJob).filter(owned).update(
+                values, synchronize_session=False
+            )
+            db.commit()
+            if not updated:
+                return None
+            return bool(
+                db.query(ExtractionJob.cancel_requested)
+                .filter(ExtractionJob.id == task_id)
+                .scalar()
+            )
+        finally:
+            db.close()
+
+    def finish(
+        self,
+        task_id: str,
+        worker_id: str,
+        status: TaskStatus,
+        result: Optional[Dict[str, Any]] = None,
+        error_message: Optional[str] = None,
+        progress: Optional[str] = None,
+    ) -> bool:
+        """Records the outcome of a task; ignored if the lease was lost."""
+        values: Dict[str, Any] = {
+            "status": status.value,
+            "result": result,
+            "error_message": error_message,
+            "lease_owner": None,
+            "lease_expires_at": None,
+            "finished_at": _utcnow(),
+        }
+        if progress is not None:
+            values["progress"] = progress
+
+        db = self.session_factory()
+        try:
+            updated = (
+                db.query(ExtractionJob)
+                .filter(
+                    ExtractionJob.id == task_id,
+                    ExtractionJob.lease_owner == worker_id,
+                    ExtractionJob.status == TaskStatus.RUNNING.value,
+                )
+                .update(values, synchronize_session=False)
+            )
+            db.commit()
+            return bool(updated)
+        finally:
+            db.close()
+
+    def release(self, task_id: str, worker_id: str) -> bool:
+        """Hands a claimed task back to the queue (e.g. on shutdown)."""
+        db = self.session_factory()
+        try:
+            updated = (
+                db.query(ExtractionJob)
+                .filter(
+                    ExtractionJob.id == task_id,
+                    ExtractionJob.lease_owner == worker_id,
+                    ExtractionJob.status == TaskStatus.RUNNING.value,
+                )
+                .update(
+                    {
+                        "status": TaskStatus.PENDING.value,
+                        "attempts": ExtractionJob.attempts - 1,
+                        "lease_owner": None,
+                        "lease_expires_at": None,
+                        "progress": "Released by worker, queued again",
+                    },
+                    synchronize_session=False,
+                )
+            )
+            db.commit()
+            return bool(updated)
+        finally:
+            db.close()
+
+    # --- API side --------------------------------------------------------
+
+    def get(self, task_id: str) -> Optional[Dict[str, Any]]:
+        db = self.session_factory()
+        try:
+            job = db.query(ExtractionJob).filter(
+                ExtractionJob.id == task_id
+            ).first()
+            return job.to_dict() if job else None
+        finally:
+            db.close()
+
+    def request_cancel(self, task_id: str) -> Optional[str]:
+        """
+        Cancels a task. Pending tasks are cancelled at once; running ones
+        get `cancel_requested` and are stopped by their worker.
+
+        Returns the task's status afterwards, or None if it does not exist.
+        """
+        db = self.session_factory()
+        try:
+            now = _utcnow()
+            db.query(ExtractionJob).filter(
+                ExtractionJob.id == task_id,
+                ExtractionJob.status == TaskStatus.PENDING.value,
+            ).update(
+                {
+                    "status": TaskStatus.CANCELLED.value,
+                    "cancel_requested": True,
+                    "progress": "Cancelled by user",
+                    "finished_at": now,
+                },
+                synchronize_session=False,
+            )
+            db.query(ExtractionJob).filter(
+                ExtractionJob.id == task_id,
+                ExtractionJob.status == TaskStatus.RUNNING.value,
+            ).update(
+                {"cancel_requested": True, "progress": "Cancellation requested"},
+                synchronize_session=False,
+            )
+            db.commit()
+            return (
+                db.query(ExtractionJob.status)
+                .filter(ExtractionJob.id == task_id)
+                .scalar()
+            )
+        finally:
+            db.close()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Task counts per status and per lane of the unfinished tasks."""
+        db = self.session_factory()
+        try:
+            by_status = dict(
+                db.query(ExtractionJob.status, func.count(ExtractionJob.id))
+                .group_by(ExtractionJob.status)
+                .all()
+            )
+            by_lane = dict(
+                db.query(ExtractionJob.lane, func.count(ExtractionJob.id))
+                .filter(ExtractionJob.status.notin_(FINISHED_STATUSES))
+                .group_by(ExtractionJob.lane)
+                .all()
+            )
+        finally:
+            db.close()
+        return {
+            "by_status": by_status,
+            "queued_by_lane": by_lane,
+            "total": sum(by_status.values()),
+        }
+
+
+# Global store instance
+_extraction_task_store = None
+
+
+def get_extraction_task_store() -> ExtractionTaskStore:
+    """Get the process-wide extraction task store."""
+    global _extraction_task_store
+    if _extraction_task_store is None:
+        _extraction_task_store = ExtractionTaskStore()
+    return _extraction_task_store
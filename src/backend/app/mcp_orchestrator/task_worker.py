@@ -0,0 +1,261 @@
+"""
+Extraction Task Worker
+======================
+
+Runs queued MCP extraction tasks from the ExtractionTaskStore.
+
+Each worker process runs `concurrency` async slots. A slot claims a task
+with a lease, runs `MCPOrchestrator.extract_pdf`, and renews the lease in
+the background while the extraction runs. If the renewal reports a
+cancellation request, or the lease was lost to another worker, the
+extraction is cancelled at its next await point.
+
+Run one or more worker processes next to the API:
+
+    python -m app.mcp_orchestrator.task_worker --concurrency 4
+    python -m app.mcp_orchestrator.task_worker --lanes interactive
+
+Dedicating workers to a lane keeps interactive requests fast while
+thousands of bulk tasks are queued.
+"""
+
+import argparse
+import asyncio
+import logging
+import os
+import signal
+import socket
+import uuid
+from typing import Any, Dict, Optional, Sequence
+
+from .models import TaskStatus
+from .task_store import (
+    DEFAULT_LEASE_SECONDS, ExtractionTaskStore, get_extraction_task_store
+)
+
+logger = logging.getLogger(__name__)
+
+
+def summarize_golden_record(golden_record) -> Dict[str, Any]:
+    """JSON-serializable summary of a Golden Record for the task store."""
+    return {
+        "confidence": golden_record.overall_confidence,
+        "completeness_score": golden_record.completeness_score,
+        "consistency_score": golden_record.consistency_score,
+        "strategies_used": golden_record.strategies_used,
+        "highest_cost_tier": golden_record.highest_cost_tier,
+        "requires_review": golden_record.requires_human_review,
+        "processing_time": golden_record.total_processing_time,
+        "field_count": len(golden_record.extracted_data),
+        "ai_notes": golden_record.ai_adjudication_notes,
+    }
+
+
+class ExtractionWorkerPool:
+    """Async pool of slots that claim and run leased extraction tasks."""
+
+    def __init__(
+        self,
+        orchestrator=None,
+        store: Optional[ExtractionTaskStore] = None,
+        concurrency: int = 4,
+        lanes: Optional[Sequence[str]] = None,
+        lease_seconds: int = DEFAULT_LEASE_SECONDS,
+        poll_interval: float = 2.0,
+        worker_id: Optional[str] = None,
+    ):
+        if orchestrator is None:
+            from .orchestrator import MCPOrchestrator
+            orchestrator = MCPOrchestrator()
+        self.orchestrator = orchestrator
+        self.store = store or get_extraction_task_store()
+        self.concurrency = concurrency
+        self.lanes = list(lanes) if lanes else None
+        self.lease_seconds = lease_seconds
+        self.poll_interval = poll_interval
+        self.worker_id = worker_id or (
+            f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        )
+        self.stats = {"completed": 0, "failed": 0, "cancelled": 0, "lost": 0}
+        self._stopping = asyncio.Event()
+
+    async def run(self):
+        """Runs all slots until `stop()` is called."""
+        logger.info(
+            f"🚀 Extraction worker {self.worker_id} started "
+            f"({self.concurrency} slots, lanes: {self.lanes or 'all'})"
+        )
+        await asyncio.gather(
+            *(self._slot() for _ in range(self.concurrency))
+        )
+        logger.info(f"🏁 Extraction worker {self.worker_id} stopped: {self.stats}")
+
+    def stop(self):
+        """Stops claiming; running tasks are handed back to the queue."""
+        self._stopping.set()
+
+    async def _slot(self):
+        while not self._stopping.is_set():
+            claimed = await asyncio.to_thread(
+                self.store.claim,
+                self.worker_id,
+                1,
+                self.lanes,
+                self.lease_seconds,
+            )
+            if not claimed:
+                try:
+                    await asyncio.wait_for(
+                        self._stopping.wait(), timeout=self.poll_interval
+                    )
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            await self._run_task(claimed[0])
+
+    async def _run_task(self, job: Dict[str, Any]):
+        task_id = job["task_id"]
+        options = job["options"] or {}
+        logger.info(f"▶️ Task {task_id} ({job['lane']}): {job['pdf_path']}")
+
+        extraction = asyncio.create_task(
+            self.orchestrator.extract_pdf(
+                pdf_path=job["pdf_path"],
+                use_tiered_approach=options.get("use_tiered_approach", True),
+                max_cost_tier=options.get("max_cost_tier", 4),
+                timeout_seconds=options.get("timeout_seconds"),
+            )
+        )
+        watchdog = asyncio.create_task(self._watch_lease(task_id, extraction))
+        try:
+            golden_record = await extraction
+        except asyncio.CancelledError:
+            # Only the watchdog's reason tells a user cancel apart from the
+            # worker task itself being cancelled (which cancels `extraction` too)
+            reason = self._watchdog_reason(watchdog)
+            if reason == "cancelled":
+                self.stats["cancelled"] += 1
+                await asyncio.to_thread(
+                    self.store.finish, task_id, self.worker_id,
+                    TaskStatus.CANCELLED, None, None, "Cancelled by user",
+                )
+                logger.info(f"⏹️ Task {task_id} cancelled")
+                return
+            if reason == "lost":
+                self.stats["lost"] += 1
+                logger.warning(f"⚠️ Lost the lease on task {task_id}")
+                return
+
+            # Shutdown or the worker being cancelled: hand the task back
+            try:
+                await asyncio.shield(asyncio.to_thread(
+                    self.store.release, task_id, self.worker_id
+                ))
+                logger.info(f"↩️ Task {task_id} released")
+            except Exception as e:
+                logger.warning(f"⚠️ Could not release task {task_id}, "
+                               f"its lease will expire: {e}")
+            if reason == "stopping":
+                return
+            raise
+        except Exception as e:
+            self.stats["failed"] += 1
+            await asyncio.to_thread(
+                self.store.finish, task_id, self.worker_id,
+                TaskStatus.FAILED, None, str(e), f"Failed: {e}",
+            )
+            logger.error(f"❌ Task {task_id} failed: {e}")
+            return
+        finally:
+            watchdog.cancel()
+
+        self.stats["completed"] += 1
+        await asyncio.to_thread(
+            self.store.finish, task_id, self.worker_id,
+            TaskStatus.COMPLETED, summarize_golden_record(golden_record),
+            None, "Extraction completed successfully",
+        )
+        logger.info(f"✅ Task {task_id} completed")
+
+    @staticmethod
+    def _watchdog_reason(watchdog: asyncio.Task) -> Optional[str]:
+        if not watchdog.done() or watchdog.cancelled():
+            return None
+        if watchdog.exception() is not None:
+            return None
+        return watchdog.result()
+
+    async def _watch_lease(self, task_id: str, extraction: asyncio.Task) -> str:
+        """
+        Renews the lease every third of its length and cancels the
+        extraction on a cancel request, a lost lease or worker shutdown.
+        Returns the reason: 'cancelled', 'lost' or 'stopping'.
+        """
+        while True:
+            try:
+                await asyncio.wait_for(
+                    self._stopping.wait(), timeout=self.lease_seconds / 3
+                )
+                reason = "stopping"
+                break
+            except asyncio.TimeoutError:
+                pass
+
+            cancel_requested = await asyncio.to_thread(
+                self.store.renew_lease,
+                task_id,
+                self.worker_id,
+                self.lease_seconds,
+                "Running extraction strategies...",
+            )
+            if cancel_requested is None:
+                reason = "lost"
+                break
+            if cancel_requested:
+                reason = "cancelled"
+                break
+
+        extraction.cancel()
+        return reason
+
+
+def main():
+    parser = argparse.ArgumentParser(description="MCP extraction task worker")
+    parser.add_argument(
+        "--concurrency", type=int,
+        default=int(os.environ.get("MCP_WORKER_CONCURRENCY", "4")),
+    )
+    parser.add_argument(
+        "--lanes", nargs="*", default=None,
+        help="Only claim tasks from these lanes (default: all)",
+    )
+    parser.add_argument(
+        "--lease-seconds", type=int,
+        default=int(os.environ.get("MCP_WORKER_LEASE_SECONDS", DEFAULT_LEASE_SECONDS)),
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    pool = ExtractionWorkerPool(
+        concurrency=args.concurrency,
+        lanes=args.lanes,
+        lease_seconds=args.lease_seconds,
+    )
+
+    async def run_until_signalled():
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, pool.stop)
+            except (NotImplementedError, AttributeError):
+                pass  # Windows: rely on KeyboardInterrupt and lease expiry
+        await pool.run()
+
+    try:
+        asyncio.run(run_until_signalled())
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
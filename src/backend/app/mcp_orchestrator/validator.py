@@ -1,13 +1,43 @@
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 import logging
 
-from .models import ExtractionResult, GoldenRecord, ExtractionTask
+from .models import (
+    ExtractionResult, ExtractionTask, FieldConfidence, GoldenRecord,
+    StrategyType
+)
 from .chroma_client import ChromaClient
 from ..database import SessionLocal
 from ..models import Product
+from ..services.chroma_pool import get_chroma_pool
 
 logger = logging.getLogger(__name__)
 
+# Weight of each product field in the overall confidence (sums to 1.0)
+FIELD_WEIGHTS = {
+    "product_name": 0.35,
+    "technical_specifications": 0.45,
+    "description": 0.2,
+}
+# Golden Records below this confidence are escalated or sent to review
+CONFIDENCE_THRESHOLD = 0.7
+
+
+def _normalize_confidence(score: Any) -> float:
+    """Clamps a confidence to 0-1; percentages (e.g. 85) are rescaled."""
+    try:
+        score = float(score)
+    except (TypeError, ValueError):
+        return 0.0
+    if score > 1.0:
+        score /= 100.0
+    return max(0.0, min(score, 1.0))
+
+
+def _same_value(a: Any, b: Any) -> bool:
+    if isinstance(a, str) and isinstance(b, str):
+        return a.strip().lower() == b.strip().lower()
+    return a == b
+
 
 class AIValidator:
     """
@@ -49,55 +79,98 @@ class AIValidator:
     ) -> GoldenRecord:
         """
         Merges results from different strategies into a single Golden Record.
-        It prioritizes data from the AI-powered NativePDFStrategy.
+
+        Every field in FIELD_WEIGHTS takes the value of the most confident
+        strategy that produced it (the AI result wins ties). The overall
+        confidence is the weighted sum of the field confidences, so missing
+        fields count as zero and completeness drives escalation.
         """
-        if not any(r.success for r in all_results):
+        successful = [r for r in all_results if r.success]
+        if not successful:
             return GoldenRecord(
                 task=task,
                 requires_human_review=True,
                 ai_adjudication_notes="No successful extractions."
             )
 
-        # Prioritize AI result
-        ai_result_data = None
-        for r in all_results:
-            if r.strategy_type == "NATIVE_PDF" and r.success:
-                ai_result_data = r.extracted_data
-                break
-        
-        # Fallback to best available data if AI failed
-        if not ai_result_data:
-            ai_result_data = {}
-
-        # Build the final data dictionary
-        tech_specs = (
-            ai_result_data.get("technical_specifications") or
-            self.select_best_input(all_results, "technical_specifications") or
-            {}
+        final_data: Dict[str, Any] = {}
+        field_confidences: Dict[str, FieldConfidence] = {}
+        agreeing = compared = 0
+        for field_name in FIELD_WEIGHTS:
+            field_confidence = self._merge_field(field_name, successful)
+            if field_confidence is None:
+                continue
+            final_data[field_name] = field_confidence.value
+            field_confidences[field_name] = field_confidence
+            candidates = (
+                len(field_confidence.supporting_strategies)
+                + len(field_confidence.conflicting_values)
+            )
+            if candidates > 1:
+                compared += 1
+                agreeing += not field_confidence.conflicting_values
+
+        final_data.setdefault("product_name", "Unknown Product")
+        final_data.setdefault("technical_specifications", {})
+        final_data.setdefault("description", None)
+        final_data["raw_text"] = self.select_best_input(all_results, "raw_text")
+        final_data["pdf_url"] = task.pdf_path
+
+        completeness = sum(
+            FIELD_WEIGHTS[name] for name in field_confidences
+        )
+        confidence = sum(
+            FIELD_WEIGHTS[name] * fc.confidence_score
+            for name, fc in field_confidences.items()
         )
-        final_data = {
-            "product_name": (
-                ai_result_data.get("product_name") or
-                self.select_best_input(all_results, "product_name") or
-                "Unknown Product"
-            ),
-            "description": (
-                ai_result_data.get("description") or
-                self.select_best_input(all_results, "description")
-            ),
-            "technical_specifications": tech_specs,
-            "raw_text": self.select_best_input(all_results, "raw_text"),
-            "pdf_url": task.pdf_path
-        }
-
-        # Simplified confidence score
-        confidence = 0.85 if ai_result_data.get("product_name") else 0.6
 
         return GoldenRecord(
             task=task,
             extracted_data=final_data,
-            overall_confidence=confidence,
-            requires_human_review=(confidence < 0.7)
+            field_confidences=field_confidences,
+            overall_confidence=round(confidence, 3),
+            completeness_score=round(completeness, 3),
+            consistency_score=round(agreeing / compared, 3) if compared else 1.0,
+            strategies_used=[r.strategy_type.value for r in successful],
+            requires_human_review=(confidence < CONFIDENCE_THRESHOLD)
+        )
+
+    def _merge_field(
+        self, field_name: str, results: List[ExtractionResult]
+    ) -> Optional[FieldConfidence]:
+        candidates = []
+        for r in results:
+            value = r.extracted_data.get(field_name)
+            if not value:
+                continue
+            score = _normalize_confidence(
+                r.field_confidences.get(field_name, r.confidence_score)
+            )
+            is_ai = r.strategy_type == StrategyType.NATIVE_PDF
+            candidates.append((score, is_ai, r, value))
+        if not candidates:
+            return None
+
+        candidates.sort(key=lambda c: (c[0], c[1]), reverse=True)
+        score, _, best, value = candidates[0]
+        supporting = [best.strategy_type.value]
+        conflicting = []
+        for _, _, r, other in candidates[1:]:
+            if _same_value(other, value):
+                supporting.append(r.strategy_type.value)
+            else:
+                conflicting.append(other)
+
+        return FieldConfidence(
+            field_name=field_name,
+            value=value,
+            confidence_score=score,
+            strategy_used=best.strategy_type,
+            conflicting_values=conflicting,
+            supporting_strategies=supporting,
+            notes=(
+                f"{len(conflicting)} conflicting value(s)" if conflicting else ""
+            )
         )
 
     async def save_golden_record(self, golden_record: GoldenRecord):
@@ -145,6 +218,7 @@ class AIValidator:
                     }],
                     ids=[chroma_id]
                 )
+                get_chroma_pool().notify_ingest("rockwool_products")
         except Exception as e:
             logger.error(
                 "Failed to save Golden Record for task %s. Error: %s",
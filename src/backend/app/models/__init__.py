@@ -1,5 +1,7 @@
 from .manufacturer import Manufacturer
 from .category import Category
 from .product import Product
+from .processed_file import ProcessedFile
+from .extraction_job import ExtractionJob
 
-__all__ = ["Manufacturer", "Category", "Product"] 
\ No newline at end of file
+__all__ = ["Manufacturer", "Category", "Product", "ProcessedFile", "ExtractionJob"] 
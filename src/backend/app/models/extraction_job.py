@@ -0,0 +1,71 @@
+from sqlalchemy import (
+    JSON, Boolean, Column, DateTime, Index, Integer, String, Text, func
+)
+
+from ..database import Base
+
+
+class ExtractionJob(Base):
+    """
+    MCP kinyerési feladatok tartós sora.
+
+    A feladatokat az API veszi fel, a worker folyamatok pedig bérlettel
+    (`lease_owner`, `lease_expires_at`) foglalják le. Lejárt bérletű
+    feladatot egy másik worker újra felvehet; a `cancel_requested` jelzést
+    a futó worker a bérlet megújításakor olvassa be. Kisebb `priority`
+    érték előbb kerül sorra.
+    """
+    __tablename__ = 'extraction_jobs'
+
+    id = Column(String(36), primary_key=True)
+    pdf_path = Column(String(1024), nullable=False)
+    lane = Column(String(32), nullable=False, default='default')
+    priority = Column(Integer, nullable=False, default=1)
+    status = Column(String(16), nullable=False, default='pending')
+    options = Column(JSON, nullable=True)
+
+    progress = Column(String(255), nullable=True)
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=3)
+    lease_owner = Column(String(128), nullable=True)
+    lease_expires_at = Column(DateTime(timezone=True), nullable=True)
+    cancel_requested = Column(Boolean, nullable=False, default=False)
+
+    result = Column(JSON, nullable=True)
+    error_message = Column(Text, nullable=True)
+
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    started_at = Column(DateTime(timezone=True), nullable=True)
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    __table_args__ = (
+        Index('ix_extraction_jobs_claim', 'status', 'priority', 'created_at'),
+    )
+
+    def to_dict(self) -> dict:
+        """Konvertálja a modellt szótárrá."""
+        return {
+            "task_id": self.id,
+            "pdf_path": self.pdf_path,
+            "lane": self.lane,
+            "priority": self.priority,
+            "status": self.status,
+            "options": self.options or {},
+            "progress": self.progress,
+            "attempts": self.attempts,
+            "max_attempts": self.max_attempts,
+            "lease_owner": self.lease_owner,
+            "lease_expires_at": self.lease_expires_at.isoformat() if self.lease_expires_at else None,
+            "cancel_requested": self.cancel_requested,
+            "result": self.result,
+            "error_message": self.error_message,
+            "created_at": self.created_at.isoformat() if self.created_at else None,
+            "started_at": self.started_at.isoformat() if self.started_at else None,
+            "finished_at": self.finished_at.isoformat() if self.finished_at else None,
+        }
+
+    def __repr__(self):
+        return (
+            f"<ExtractionJob(id='{self.id}', status='{self.status}', "
+            f"lane='{self.lane}')>"
+        )
@@ -0,0 +1,48 @@
+from sqlalchemy import (
+    BigInteger, Column, DateTime, Integer, String, UniqueConstraint, func
+)
+
+from ..database import Base
+
+
+class ProcessedFile(Base):
+    """
+    Feldolgozott PDF fájlok deduplikációs indexe.
+
+    A `file_hash` a fájl tartalmának SHA-256 hash-e (egyedi). A fájl útvonala,
+    mérete és módosítási ideje a gyors ellenőrzést szolgálja: ha ezek nem
+    változtak, a fájlt nem kell újra beolvasni a hash kiszámításához.
+    """
+    __tablename__ = 'processed_files'
+
+    id = Column(Integer, primary_key=True, index=True)
+    file_hash = Column(String(64), nullable=False, index=True)
+    file_path = Column(String(1024), nullable=False, index=True)
+    file_size = Column(BigInteger, nullable=False)
+    file_mtime_ns = Column(BigInteger, nullable=False)
+    source_filename = Column(String(512), nullable=False)
+    product_id = Column(Integer, nullable=True)
+    processed_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    __table_args__ = (
+        UniqueConstraint('file_hash', name='uq_processed_files_file_hash'),
+    )
+
+    def to_dict(self) -> dict:
+        """Konvertálja a modellt szótárrá."""
+        return {
+            "id": self.id,
+            "file_hash": self.file_hash,
+            "file_path": self.file_path,
+            "file_size": self.file_size,
+            "file_mtime_ns": self.file_mtime_ns,
+            "source_filename": self.source_filename,
+            "product_id": self.product_id,
+            "processed_at": self.processed_at.isoformat() if self.processed_at else None,
+        }
+
+    def __repr__(self):
+        return (
+            f"<ProcessedFile(id={self.id}, "
+            f"file_hash='{str(self.file_hash)[:10]}...')>"
+        )
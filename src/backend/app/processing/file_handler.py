@@ -4,40 +4,296 @@ File Handler Service for the PDF Processing Pipeline
 Responsibilities:
 - Calculating unique, content-based hashes for files.
 - Checking for duplicates against the database to prevent re-processing.
+
+Hashes are streamed SHA-256 digests of the file content. The persistent
+`processed_files` index also stores each file's path, size and mtime, so a
+file that has not changed since it was indexed is recognised without being
+read again.
 """
 import logging
-import hashlib
+import os
 from pathlib import Path
-from typing import Set, Optional
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
+from app.models.processed_file import ProcessedFile
+from app.utils import compute_file_sha256
+
 
 logger = logging.getLogger(__name__)
 
+# Stat signature used for the fast path: (size in bytes, mtime in ns)
+FileSignature = Tuple[int, int]
+
 
 class FileHandler:
     """Handles file operations like hashing and duplicate checks."""
 
+    _index_ready = False
+
     def __init__(self, db_session: Session):
         self.db_session = db_session
         self.processed_hashes_session: Set[str] = set()
+        # Hashes computed in this session: path -> (signature, file_hash)
+        self._hash_memo: Dict[str, Tuple[FileSignature, str]] = {}
+        self._ensure_index_table()
+
+    def _ensure_index_table(self):
+        """Creates the dedup index table on first use."""
+        if FileHandler._index_ready or self.db_session is None:
+            return
+        try:
+            ProcessedFile.__table__.create(
+                bind=self.db_session.get_bind(), checkfirst=True
+            )
+            FileHandler._index_ready = True
+        except Exception as e:
+            logger.warning(f"Could not create processed_files table: {e}")
+
+    @staticmethod
+    def _signature(pdf_path: Path) -> FileSignature:
+        stat = os.stat(pdf_path)
+        return stat.st_size, stat.st_mtime_ns
+
+    @staticmethod
+    def _path_key(pdf_path: Path) -> str:
+        return str(Path(pdf_path).resolve())
 
     def calculate_file_hash(self, pdf_path: Path) -> Optional[str]:
         """
-        TEMPORARILY DISABLED. Returns a dummy hash to bypass file errors.
+        Returns the SHA-256 hash of the file content, or None if the file
+        cannot be read.
+
+        If the indexed path has the same size and mtime as on disk, the
+        stored hash is returned without reading the file.
         """
-        # Return a dummy hash based on filename to allow processing
-        return hashlib.sha256(pdf_path.name.encode()).hexdigest()
+        try:
+            signature = self._signature(pdf_path)
+        except OSError as e:
+            logger.error(f"Cannot stat {pdf_path}: {e}")
+            return None
+
+        path_key = self._path_key(pdf_path)
+        memo = self._hash_memo.get(path_key)
+        if memo and memo[0] == signature:
+            return memo[1]
+
+        indexed = self._lookup_by_path([path_key]).get(path_key)
+        if indexed and indexed[0] == signature:
+            file_hash = indexed[1]
+        else:
+            try:
+                file_hash = compute_file_sha256(pdf_path)
+            except OSError as e:
+                logger.error(f"Cannot hash {pdf_path}: {e}")
+                return None
+
+        self._hash_memo[path_key] = (signature, file_hash)
+        return file_hash
 
     def is_duplicate(self, file_hash: str) -> bool:
+        """Checks the session set and the persistent index for a hash."""
+        if file_hash in self.processed_hashes_session:
+            return True
+        if self.db_session is None:
+            return False
+        try:
+            exists = (
+                self.db_session.query(ProcessedFile.id)
+                .filter(ProcessedFile.file_hash == file_hash)
+                .first()
+            )
+        except Exception as e:
+            logger.warning(f"Dedup index lookup failed: {e}")
+            self.db_session.rollback()
+            return False
+        if exists:
+            self.processed_hashes_session.add(file_hash)
+        return exists is not None
+
+    def add_hash_to_log(
+        self,
+        file_hash: str,
+        pdf_path: Optional[Path] = None,
+        product_id: Optional[int] = None,
+    ):
         """
-        TEMPORARILY DISABLED. Always returns False to allow processing.
+        Records a processed file in the persistent index.
+
+        An already indexed hash (e.g. the same file under a new name) has its
+        path, size and mtime refreshed so the fast path keeps working.
         """
-        # Always return False to ensure every file is processed
-        # This is safe because the database is currently empty.
-        return False
+        self.processed_hashes_session.add(file_hash)
+        if self.db_session is None:
+            return
+
+        path_key = self._path_key(pdf_path) if pdf_path else ""
+        size, mtime_ns = (0, 0)
+        if pdf_path:
+            try:
+                size, mtime_ns = self._signature(pdf_path)
+            except OSError:
+                pass
+
+        values = {
+            "file_path": path_key,
+            "file_size": size,
+            "file_mtime_ns": mtime_ns,
+            "source_filename": Path(pdf_path).name if pdf_path else "",
+        }
+        try:
+            with self.db_session.begin_nested():
+                self.db_session.add(ProcessedFile(
+                    file_hash=file_hash, product_id=product_id, **values
+                ))
+        except IntegrityError:
+            # Unique constraint hit: the content is already indexed
+            if pdf_path:
+                self.db_session.query(ProcessedFile).filter(
+                    ProcessedFile.file_hash == file_hash
+                ).update(values, synchronize_session=False)
+        try:
+            self.db_session.commit()
+        except Exception as e:
+            logger.error(f"Failed to record {file_hash[:10]}... in dedup index: {e}")
+            self.db_session.rollback()
+
+    def add_hashes_to_log(
+        self, entries: Iterable[Tuple[str, Optional[Path], Optional[int]]]
+    ):
+        """
+        Records many processed files with a single commit.
+
+        Args:
+            entries: (file_hash, pdf_path, product_id) tuples
+        """
+        entries = [
+            entry for entry in entries
+            if entry[0] not in self.processed_hashes_session
+        ]
+        if not entries:
+            return
+        if self.db_session is None:
+            self.processed_hashes_session.update(entry[0] for entry in entries)
+            return
+
+        rows = []
+        for file_hash, pdf_path, product_id in entries:
+            size, mtime_ns = (0, 0)
+            if pdf_path:
+                try:
+                    size, mtime_ns = self._signature(pdf_path)
+                except OSError:
+                    pass
+            rows.append(ProcessedFile(
+                file_hash=file_hash,
+                file_path=self._path_key(pdf_path) if pdf_path else "",
+                file_size=size,
+                file_mtime_ns=mtime_ns,
+                source_filename=Path(pdf_path).name if pdf_path else "",
+                product_id=product_id,
+            ))
+        try:
+            self.db_session.add_all(rows)
+            self.db_session.commit()
+            self.processed_hashes_session.update(entry[0] for entry in entries)
+        except IntegrityError:
+            # Some hashes were indexed concurrently; fall back to one by one
+            self.db_session.rollback()
+            for file_hash, pdf_path, product_id in entries:
+                self.add_hash_to_log(file_hash, pdf_path, product_id)
+
+    def find_processed(self, pdf_paths: Iterable[Path]) -> Dict[Path, str]:
+        """
+        Bulk duplicate check for a whole directory.
+
+        Unchanged files are resolved from a single path lookup; only new or
+        modified files are hashed, and their hashes are checked in a second
+        single query. Returns {path: file_hash} for already processed files.
+        """
+        pdf_paths = list(pdf_paths)
+        if not pdf_paths:
+            return {}
+
+        signatures: Dict[Path, FileSignature] = {}
+        for pdf_path in pdf_paths:
+            try:
+                signatures[pdf_path] = self._signature(pdf_path)
+            except OSError as e:
+                logger.error(f"Cannot stat {pdf_path}: {e}")
+
+        path_keys = {pdf_path: self._path_key(pdf_path) for pdf_path in signatures}
+        indexed = self._lookup_by_path(list(path_keys.values()))
+
+        processed: Dict[Path, str] = {}
+        to_hash: List[Path] = []
+        for pdf_path, signature in signatures.items():
+            entry = indexed.get(path_keys[pdf_path])
+            if entry and entry[0] == signature:
+                processed[pdf_path] = entry[1]
+                self._hash_memo[path_keys[pdf_path]] = entry
+            else:
+                to_hash.append(pdf_path)
+
+        hashed: Dict[Path, str] = {}
+        for pdf_path in to_hash:
+            file_hash = self.calculate_file_hash(pdf_path)
+            if file_hash:
+                hashed[pdf_path] = file_hash
+
+        known_hashes = self.find_processed_hashes(set(hashed.values()))
+        for pdf_path, file_hash in hashed.items():
+            if file_hash in known_hashes:
+                processed[pdf_path] = file_hash
+
+        self.processed_hashes_session.update(processed.values())
+        logger.info(
+            f"Dedup check: {len(processed)}/{len(pdf_paths)} already processed, "
+            f"{len(to_hash)} hashed"
+        )
+        return processed
+
+    def _lookup_by_path(
+        self, path_keys: List[str]
+    ) -> Dict[str, Tuple[FileSignature, str]]:
+        """Indexed (signature, file_hash) per path, in one query."""
+        if self.db_session is None or not path_keys:
+            return {}
+        try:
+            rows = (
+                self.db_session.query(
+                    ProcessedFile.file_path,
+                    ProcessedFile.file_size,
+                    ProcessedFile.file_mtime_ns,
+                    ProcessedFile.file_hash,
+                )
+                .filter(ProcessedFile.file_path.in_(path_keys))
+                .all()
+            )
+        except Exception as e:
+            logger.warning(f"Dedup index lookup failed: {e}")
+            self.db_session.rollback()
+            return {}
+        return {
+            row.file_path: ((row.file_size, row.file_mtime_ns), row.file_hash)
+            for row in rows
+        }
 
-    def add_hash_to_log(self, file_hash: str):
-        """Adds a hash to the in-memory set for the current session."""
-        self.processed_hashes_session.add(file_hash) 
\ No newline at end of file
+    def find_processed_hashes(self, file_hashes: Iterable[str]) -> Set[str]:
+        """Subset of the given hashes that are already indexed, in one query."""
+        file_hashes = set(file_hashes)
+        if self.db_session is None or not file_hashes:
+            return set()
+        try:
+            rows = (
+                self.db_session.query(ProcessedFile.file_hash)
+                .filter(ProcessedFile.file_hash.in_(file_hashes))
+                .all()
+            )
+        except Exception as e:
+            logger.warning(f"Dedup index lookup failed: {e}")
+            self.db_session.rollback()
+            return set()
+        return {row.file_hash for row in rows}
@@ -18,7 +18,6 @@ This addresses the issue where the main catalog redirects and loads content dyna
 import asyncio
 import logging
 import json
-import httpx
 import re
 from pathlib import Path
 from datetime import datetime
@@ -26,6 +25,8 @@ from urllib.parse import urljoin, urlparse
 from bs4 import BeautifulSoup
 from typing import List, Dict, Optional
 
+from app.scrapers.http_client import get_scraping_client
+
 # --- Configuration ---
 logging.basicConfig(
     level=logging.INFO, 
@@ -94,12 +95,11 @@ class BaumitEnhancedScraper:
                 'Upgrade-Insecure-Requests': '1'
             }
             
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                
-                logger.info(f"✅ Fetched {len(response.text)} chars from: {url}")
-                return response.text
+            response = await get_scraping_client().get(url, headers=headers, timeout=30.0)
+            response.raise_for_status()
+            
+            logger.info(f"✅ Fetched {len(response.text)} chars from: {url}")
+            return response.text
                 
         except Exception as e:
             logger.error(f"❌ Failed to fetch {url}: {e}")
@@ -270,22 +270,21 @@ class BaumitEnhancedScraper:
             logger.info(f"🔗 Trying API endpoint: {endpoint}")
             
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    response = await client.get(endpoint)
+                response = await get_scraping_client().get(endpoint, timeout=30.0)
+                
+                if response.status_code == 200:
+                    content_type = response.headers.get('content-type', '')
                     
-                    if response.status_code == 200:
-                        content_type = response.headers.get('content-type', '')
+                    if 'json' in content_type:
+                        data = response.json()
+                        # Process JSON product data
+                        # This would need to be adapted based on actual API structure
+                        logger.info(f"✅ Got JSON response from: {endpoint}")
                         
-                        if 'json' in content_type:
-                            data = response.json()
-                            # Process JSON product data
-                            # This would need to be adapted based on actual API structure
-                            logger.info(f"✅ Got JSON response from: {endpoint}")
-                            
-                        else:
-                            # HTML response from API endpoint
-                            products = await self._extract_products_from_content(response.text, endpoint)
-                            api_products.extend(products)
+                    else:
+                        # HTML response from API endpoint
+                        products = await self._extract_products_from_content(response.text, endpoint)
+                        api_products.extend(products)
                             
             except Exception as e:
                 logger.warning(f"⚠️  API endpoint failed {endpoint}: {e}")
@@ -22,7 +22,6 @@ This follows the proven ROCKWOOL/LEIER architecture pattern.
 import asyncio
 import logging
 import json
-import httpx
 import re
 import hashlib
 from pathlib import Path
@@ -31,6 +30,9 @@ from urllib.parse import urljoin
 from bs4 import BeautifulSoup
 from typing import List, Dict, Optional
 
+from app.scrapers.download_engine import DownloadEngine, UnexpectedContentType
+from app.scrapers.http_client import get_scraping_client
+
 # --- Configuration ---
 logging.basicConfig(
     level=logging.INFO, 
@@ -75,6 +77,7 @@ class BaumitProductCatalogScraper:
         self.downloaded_files = set()
         self.duplicate_count = 0
         self.products_by_letter = {}
+        self.downloader = DownloadEngine()
         
         # Category mappings for BAUMIT
         self.category_mappings = {
@@ -130,12 +133,11 @@ class BaumitProductCatalogScraper:
             
             logger.info(f"🔄 Fetching content from: {url}")
             
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                response = await client.get(url, headers=headers)
-                response.raise_for_status()
-                
-                logger.info(f"✅ Successfully fetched {len(response.text)} chars from: {url}")
-                return response.text
+            response = await get_scraping_client().get(url, headers=headers, timeout=30.0)
+            response.raise_for_status()
+            
+            logger.info(f"✅ Successfully fetched {len(response.text)} chars from: {url}")
+            return response.text
             
         except Exception as e:
             logger.error(f"❌ Failed to fetch {url}: {e}")
@@ -287,7 +289,7 @@ class BaumitProductCatalogScraper:
             logger.warning(f"⚠️  Failed to extract product info from element: {e}")
             return None
 
-    async def _download_pdf(self, session: httpx.AsyncClient, pdf_url: str, doc_name: str, category: str = "general") -> Dict:
+    async def _download_pdf(self, pdf_url: str, doc_name: str, category: str = "general") -> Dict:
         """
         Downloads a single PDF with smart duplicate handling and categorization.
         """
@@ -296,13 +298,6 @@ class BaumitProductCatalogScraper:
                 pdf_url = urljoin(BASE_URL, pdf_url)
             
             logger.info(f"⬇️  Downloading: {pdf_url}")
-            response = await session.get(pdf_url, follow_redirects=True)
-            response.raise_for_status()
-
-            content_type = response.headers.get('content-type', '')
-            if 'pdf' not in content_type.lower():
-                logger.warning(f"⚠️  Not a PDF file. Content-Type: {content_type}")
-                return {'status': 'skipped', 'reason': 'not_pdf'}
 
             # Clean filename
             safe_name = re.sub(r'[^\w\s-]', '', doc_name)[:50].strip()
@@ -313,7 +308,8 @@ class BaumitProductCatalogScraper:
             category_dir.mkdir(exist_ok=True)
             
             # Smart duplicate handling
-            if base_filename in self.downloaded_files:
+            is_duplicate = base_filename in self.downloaded_files
+            if is_duplicate:
                 unique_filename = self._generate_unique_filename(base_filename, pdf_url)
                 filepath = DUPLICATES_DIR / unique_filename
                 self.duplicate_count += 1
@@ -322,14 +318,22 @@ class BaumitProductCatalogScraper:
                 filepath = category_dir / base_filename
                 self.downloaded_files.add(base_filename)
 
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
+            try:
+                result = await self.downloader.download(
+                    pdf_url, filepath, timeout=60.0, expected_content_type='pdf'
+                )
+            except UnexpectedContentType as e:
+                logger.warning(f"⚠️  Not a PDF file. {e}")
+                if not is_duplicate:
+                    self.downloaded_files.discard(base_filename)
+                return {'status': 'skipped', 'reason': 'not_pdf'}
 
             return {
                 'status': 'success',
                 'filename': filepath.name,
                 'local_path': str(filepath),
-                'file_size_bytes': len(response.content),
+                'file_size_bytes': result.size,
+                'changed': result.changed,
                 'category': category,
                 'is_duplicate': 'duplicates' in str(filepath)
             }
@@ -424,25 +428,24 @@ class BaumitProductCatalogScraper:
         
         logger.info(f"📥 Starting download of {total_pdfs} PDFs...")
         
-        async with httpx.AsyncClient(timeout=60.0, follow_redirects=True) as session:
-            download_tasks = []
+        download_tasks = []
+        
+        for product in self.products:
+            pdf_links = product.get('pdf_links', [])
+            product_name = product.get('name', 'Unknown')
+            category = product.get('category', 'general')
             
-            for product in self.products:
-                pdf_links = product.get('pdf_links', [])
-                product_name = product.get('name', 'Unknown')
-                category = product.get('category', 'general')
-                
-                for pdf_url in pdf_links:
-                    task = self._download_pdf(session, pdf_url, product_name, category)
-                    download_tasks.append(task)
+            for pdf_url in pdf_links:
+                task = self._download_pdf(pdf_url, product_name, category)
+                download_tasks.append(task)
+        
+        if download_tasks:
+            results = await asyncio.gather(*download_tasks, return_exceptions=True)
             
-            if download_tasks:
-                results = await asyncio.gather(*download_tasks, return_exceptions=True)
-                
-                successful = sum(1 for r in results if isinstance(r, dict) and r.get('status') == 'success')
-                failed = len(results) - successful
-                
-                logger.info(f"📊 PDF Downloads: {successful} successful, {failed} failed")
+            successful = sum(1 for r in results if isinstance(r, dict) and r.get('status') == 'success')
+            failed = len(results) - successful
+            
+            logger.info(f"📊 PDF Downloads: {successful} successful, {failed} failed")
 
     def _log_summary(self):
         """
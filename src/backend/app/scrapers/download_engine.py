@@ -0,0 +1,302 @@
+"""
+Streaming Download Engine
+-------------------------
+
+Downloads documents straight to disk for all scrapers.
+
+Key Features:
+- Streams the body in chunks into `<target>.part` and atomically renames
+  it into place, so memory stays flat for large brochures and a crash
+  never leaves a truncated file under the final name.
+- Resumes an interrupted `.part` file with a `Range` request (guarded by
+  `If-Range`, so a changed document restarts from zero).
+- Remembers `ETag` / `Last-Modified` per URL and sends `If-None-Match` /
+  `If-Modified-Since`; an unchanged document costs a single 304.
+
+Validators are stored in a small SQLite database next to the other
+on-disk caches.
+"""
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.paths import BACKEND_DIR
+from app.scrapers.http_client import ScrapingHttpClient, get_scraping_client
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATE_PATH = BACKEND_DIR / "cache" / "download_state.sqlite3"
+CHUNK_SIZE = 256 * 1024
+
+
+class UnexpectedContentType(ValueError):
+    """The response's Content-Type did not match `expected_content_type`."""
+
+
+@dataclass
+class DownloadResult:
+    """Outcome of one download."""
+    url: str
+    path: Path
+    status: str  # 'downloaded', 'resumed' or 'not_modified'
+    size: int
+    bytes_transferred: int
+
+    @property
+    def changed(self) -> bool:
+        return self.status != 'not_modified'
+
+
+class DownloadStateStore:
+    """SQLite-backed ETag/Last-Modified validators per URL."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path else DEFAULT_STATE_PATH
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS download_state (
+                url TEXT PRIMARY KEY,
+                file_path TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                size INTEGER,
+                complete INTEGER NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT file_path, etag, last_modified, size, complete "
+                "FROM download_state WHERE url = ?",
+                (url,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {
+            'file_path': row[0],
+            'etag': row[1],
+            'last_modified': row[2],
+            'size': row[3],
+            'complete': bool(row[4]),
+        }
+
+    def put(
+        self,
+        url: str,
+        file_path: Path,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        size: Optional[int],
+        complete: bool,
+    ):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO download_state "
+                "(url, file_path, etag, last_modified, size, complete, updated_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (url, str(file_path), etag, last_modified, size, int(complete), time.time()),
+            )
+            self._conn.commit()
+
+    def forget(self, url: str):
+        with self._lock:
+            self._conn.execute("DELETE FROM download_state WHERE url = ?", (url,))
+            self._conn.commit()
+
+
+class DownloadEngine:
+    """Streaming, resumable, conditional downloads through the shared client."""
+
+    def __init__(
+        self,
+        client: Optional[ScrapingHttpClient] = None,
+        state_store: Optional[DownloadStateStore] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ):
+        self._client = client
+        self.state_store = state_store or get_download_state_store()
+        self.chunk_size = chunk_size
+        self.stats = {
+            'downloaded': 0,
+            'resumed': 0,
+            'not_modified': 0,
+            'bytes_transferred': 0,
+        }
+
+    @property
+    def client(self) -> ScrapingHttpClient:
+        return self._client or get_scraping_client()
+
+    @staticmethod
+    def _partial_path(target: Path) -> Path:
+        return target.with_name(target.name + '.part')
+
+    def _request_headers(self, target: Path, partial: Path, state) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        if not state:
+            return headers
+        validator = state['etag'] or state['last_modified']
+
+        if (
+            state['complete']
+            and Path(state['file_path']) == target
+            and target.exists()
+            and (state['size'] is None or target.stat().st_size == state['size'])
+        ):
+            # Unchanged local copy: ask the server whether it is still current
+            if state['etag']:
+                headers['If-None-Match'] = state['etag']
+            if state['last_modified']:
+                headers['If-Modified-Since'] = state['last_modified']
+        elif not state['complete'] and validator and partial.exists():
+            offset = partial.stat().st_size
+            if offset > 0:
+                headers['Range'] = f'bytes={offset}-'
+                headers['If-Range'] = validator
+        return headers
+
+    async def download(
+        self,
+        url: str,
+        target: Path,
+        headers: Optional[Dict[str, str]] = None,
+        timeout: Optional[float] = None,
+        expected_content_type: Optional[str] = None,
+    ) -> DownloadResult:
+        """
+        Downloads `url` to `target`.
+
+        Args:
+            url: Document URL
+            target: Final file path
+            headers: Extra request headers (e.g. Referer)
+            timeout: Per-request timeout in seconds
+            expected_content_type: Substring the Content-Type must contain
+                (e.g. 'pdf'); a mismatch raises UnexpectedContentType
+                before anything is written
+
+        Returns:
+            DownloadResult; `status == 'not_modified'` means the local copy
+            was already current and no body was transferred.
+        """
+        target = Path(target)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        partial = self._partial_path(target)
+
+        while True:
+            state = self.state_store.get(url)
+            request_headers = dict(headers or {})
+            request_headers.update(self._request_headers(target, partial, state))
+            kwargs: Dict[str, Any] = {'headers': request_headers}
+            if timeout is not None:
+                kwargs['timeout'] = timeout
+
+            async with self.client.stream('GET', url, **kwargs) as response:
+                if response.status_code == 304:
+                    self.stats['not_modified'] += 1
+                    logger.info(f"⏭️  Not modified: {url}")
+                    return DownloadResult(url, target, 'not_modified', target.stat().st_size, 0)
+                if response.status_code == 416 and 'Range' in request_headers:
+                    result = await self._finish_unsatisfiable_range(
+                        url, target, partial, state, response
+                    )
+                    if result is not None:
+                        return result
+                    # The partial file cannot be resumed: start over without Range
+                    logger.warning(f"⚠️  Range rejected, restarting download: {url}")
+                    await asyncio.to_thread(partial.unlink, missing_ok=True)
+                    self.state_store.forget(url)
+                    continue
+                response.raise_for_status()
+
+                content_type = response.headers.get('content-type', '')
+                if expected_content_type and expected_content_type not in content_type.lower():
+                    raise UnexpectedContentType(f"Unexpected Content-Type: {content_type}")
+
+                etag = response.headers.get('etag')
+                last_modified = response.headers.get('last-modified')
+                resumed = response.status_code == 206 and 'Range' in request_headers
+                offset = partial.stat().st_size if resumed else 0
+                if resumed:
+                    content_range = response.headers.get('content-range', '')
+                    if not content_range.startswith(f'bytes {offset}-'):
+                        raise ValueError(f"Unexpected Content-Range for {url}: {content_range}")
+                    # A 206 may omit validators; keep the ones the range was based on
+                    etag = etag or state['etag']
+                    last_modified = last_modified or state['last_modified']
+
+                # Record validators first so an interrupted body can be resumed
+                self.state_store.put(url, target, etag, last_modified, None, complete=False)
+
+                transferred = 0
+                handle = await asyncio.to_thread(open, partial, 'ab' if resumed else 'wb')
+                try:
+                    async for chunk in response.aiter_bytes(self.chunk_size):
+                        await asyncio.to_thread(handle.write, chunk)
+                        transferred += len(chunk)
+                finally:
+                    await asyncio.to_thread(handle.close)
+            break
+
+        size = offset + transferred
+        await asyncio.to_thread(os.replace, partial, target)
+        self.state_store.put(url, target, etag, last_modified, size, complete=True)
+
+        status = 'resumed' if resumed else 'downloaded'
+        self.stats[status] += 1
+        self.stats['bytes_transferred'] += transferred
+        return DownloadResult(url, target, status, size, transferred)
+
+    async def _finish_unsatisfiable_range(
+        self, url: str, target: Path, partial: Path, state, response
+    ) -> Optional[DownloadResult]:
+        """
+        Handles a 416 to a resume request. If `Content-Range: bytes */N`
+        says the partial file already holds the whole (unchanged, per
+        If-Range) document, it is moved into place; otherwise returns None.
+        """
+        content_range = response.headers.get('content-range', '')
+        total = content_range.rpartition('/')[2]
+        if not content_range.startswith('bytes */') or not total.isdigit():
+            return None
+        size = int(total)
+        if not partial.exists() or partial.stat().st_size != size:
+            return None
+
+        await asyncio.to_thread(os.replace, partial, target)
+        self.state_store.put(
+            url, target, state['etag'], state['last_modified'], size, complete=True
+        )
+        self.stats['resumed'] += 1
+        logger.info(f"✅ Partial download was already complete: {url}")
+        return DownloadResult(url, target, 'resumed', size, 0)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return dict(self.stats)
+
+
+# Global state store instance
+_download_state_store = None
+
+
+def get_download_state_store() -> DownloadStateStore:
+    """Get the process-wide download state store."""
+    global _download_state_store
+    if _download_state_store is None:
+        _download_state_store = DownloadStateStore()
+    return _download_state_store
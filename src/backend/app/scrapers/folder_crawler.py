@@ -0,0 +1,186 @@
+"""
+Breadth-First Folder Crawler
+----------------------------
+
+Bounded-concurrency BFS over a remote folder tree (e.g. the Leier
+dokumentumtár API).
+
+Key Features:
+- A shared work queue drained by `concurrency` workers, so discovery time
+  grows with tree depth and the concurrency level rather than with
+  tree size × round-trip time.
+- A shared visited set: every folder is fetched at most once, even when
+  it is reachable from several parents.
+- No per-request sleeps; politeness is enforced per host by the shared
+  scraping HTTP client's token bucket.
+- The frontier, visited set and discovered items are checkpointed to a
+  JSON file, so an interrupted crawl resumes where it stopped. The file
+  is removed once the queue drains, so the next run starts from the
+  roots again.
+- Folders whose processing fails are kept in `failed` (and in the
+  checkpoint, separately from the frontier). They are retried when an
+  interrupted crawl resumes, but never replace the roots of a later run.
+
+Nodes and items must be JSON-serializable (lists/tuples of primitives).
+"""
+import asyncio
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# process(node) -> (child nodes, discovered items)
+ProcessFn = Callable[[Any], Awaitable[Tuple[List[Any], List[Any]]]]
+
+
+def _freeze(value: Any) -> Any:
+    """Hashable form of a JSON-decoded node (lists become tuples)."""
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class FolderCrawler:
+    """Concurrent breadth-first crawler with a persisted frontier."""
+
+    def __init__(
+        self,
+        process: ProcessFn,
+        concurrency: int = 8,
+        state_path: Optional[Path] = None,
+        checkpoint_interval: float = 5.0,
+        node_key: Callable[[Any], Any] = _freeze,
+    ):
+        self.process = process
+        self.concurrency = max(1, concurrency)
+        self.state_path = Path(state_path) if state_path else None
+        self.checkpoint_interval = checkpoint_interval
+        self.node_key = node_key
+
+        self.visited: set = set()
+        self.items: List[Any] = []
+        self.failed: List[Any] = []
+        self._pending: Dict[Any, Any] = {}
+        self._last_checkpoint = 0.0
+        self.stats = {'nodes_processed': 0, 'nodes_failed': 0, 'resumed': False}
+
+    # --- Persistence -----------------------------------------------------
+
+    def _load_state(self) -> Optional[Dict[str, Any]]:
+        if not self.state_path or not self.state_path.exists():
+            return None
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable crawl state {self.state_path}: {e}")
+            return None
+
+    def _checkpoint(self, force: bool = False):
+        """Writes frontier + failed + visited + items atomically (throttled)."""
+        if not self.state_path:
+            return
+        now = time.monotonic()
+        if not force and now - self._last_checkpoint < self.checkpoint_interval:
+            return
+        self._last_checkpoint = now
+        state = {
+            'frontier': list(self._pending.values()),
+            'failed': list(self.failed),
+            'visited': list(self.visited),
+            'items': self.items,
+            'saved_at': time.time(),
+        }
+        self.state_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.state_path.with_suffix(self.state_path.suffix + '.tmp')
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(state, f, ensure_ascii=False)
+        os.replace(tmp_path, self.state_path)
+
+    def clear_state(self):
+        if self.state_path and self.state_path.exists():
+            self.state_path.unlink()
+
+    # --- Crawl -----------------------------------------------------------
+
+    async def crawl(self, roots: Iterable[Any]) -> List[Any]:
+        """
+        Crawls from `roots` (or from the saved frontier, if a previous
+        crawl was interrupted) and returns every discovered item.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        state = self._load_state()
+        if state is not None:
+            self.stats['resumed'] = True
+            self.visited = {_freeze(key) for key in state.get('visited', [])}
+            self.items = list(state.get('items', []))
+            failed = state.get('failed', [])
+            roots = state.get('frontier', []) + failed
+            logger.info(
+                f"Resuming crawl: {len(self.visited)} visited, "
+                f"{len(roots) - len(failed)} pending, {len(failed)} failed, "
+                f"{len(self.items)} items"
+            )
+
+        for node in roots:
+            key = self.node_key(node)
+            if key not in self.visited and key not in self._pending:
+                self._pending[key] = node
+                queue.put_nowait(node)
+
+        workers = [
+            asyncio.create_task(self._worker(queue)) for _ in range(self.concurrency)
+        ]
+        try:
+            await queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            if self._pending:
+                # Interrupted: keep the frontier for the next run
+                self._checkpoint(force=True)
+            else:
+                self.clear_state()
+
+        if self.failed:
+            logger.warning(f"Crawl finished with {len(self.failed)} failed nodes")
+        return self.items
+
+    async def _worker(self, queue: asyncio.Queue):
+        while True:
+            node = await queue.get()
+            key = self.node_key(node)
+            try:
+                if key not in self.visited:
+                    await self._visit(node, key, queue)
+            except asyncio.CancelledError:
+                # The node stays in `_pending`, so the forced checkpoint
+                # keeps it (and thus its subtree) in the frontier
+                queue.task_done()
+                raise
+            self._pending.pop(key, None)
+            self._checkpoint()
+            queue.task_done()
+
+    async def _visit(self, node: Any, key: Any, queue: asyncio.Queue):
+        try:
+            children, items = await self.process(node)
+        except Exception as e:
+            logger.error(f"Crawl failed for {node}: {e}")
+            self.failed.append(node)
+            self.stats['nodes_failed'] += 1
+            return
+
+        self.visited.add(key)
+        self.items.extend(items)
+        self.stats['nodes_processed'] += 1
+        for child in children:
+            child_key = self.node_key(child)
+            if child_key not in self.visited and child_key not in self._pending:
+                self._pending[child_key] = child
+                queue.put_nowait(child)
@@ -0,0 +1,300 @@
+"""
+Shared Scraping HTTP Client
+---------------------------
+
+One pooled `httpx.AsyncClient` for every Rockwool/Leier/Baumit scraper.
+
+Key Features:
+- Connection pooling with keep-alive (and HTTP/2 when `h2` is installed),
+  so repeated requests to the same site skip the TCP+TLS handshake.
+- Per-host token-bucket rate limits and concurrency caps, configured in
+  one place (`DEFAULT_HOST_LIMITS`, overridable via `SCRAPER_HOST_LIMITS`).
+- Retry with exponential backoff on 429/502/503/504 and transport errors,
+  honouring `Retry-After`.
+
+Usage:
+    client = get_scraping_client()
+    response = await client.get(url, headers={'Referer': BASE_URL})
+    response.raise_for_status()
+
+`httpx` clients and asyncio primitives belong to one event loop, so one
+client is kept per running loop; the token buckets are process-wide, so
+the rate limits hold even when scrapers run in separate `asyncio.run` calls.
+"""
+import asyncio
+import importlib.util
+import json
+import logging
+import os
+import random
+import threading
+import time
+import weakref
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, Optional
+from urllib.parse import urlparse
+
+import httpx
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_USER_AGENT = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 '
+    '(KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
+)
+RETRY_STATUSES = (429, 502, 503, 504)
+
+
+@dataclass
+class HostLimits:
+    """Rate limit and concurrency cap for one host."""
+    rate_per_second: float = 5.0
+    burst: int = 10
+    max_concurrency: int = 5
+
+
+# Central per-host configuration for all scrapers
+DEFAULT_HOST_LIMITS: Dict[str, HostLimits] = {
+    'www.rockwool.com': HostLimits(rate_per_second=4.0, burst=8, max_concurrency=6),
+    'www.leier.hu': HostLimits(rate_per_second=5.0, burst=10, max_concurrency=8),
+    'u-ertek-kalkulator.leier.hu': HostLimits(rate_per_second=2.0, burst=4, max_concurrency=3),
+    'baumit.hu': HostLimits(rate_per_second=3.0, burst=6, max_concurrency=4),
+}
+
+
+def _load_host_limits() -> Dict[str, HostLimits]:
+    """
+    Default limits merged with the `SCRAPER_HOST_LIMITS` environment
+    variable, e.g. '{"www.leier.hu": {"rate_per_second": 10}}'.
+    """
+    limits = dict(DEFAULT_HOST_LIMITS)
+    raw = os.getenv('SCRAPER_HOST_LIMITS')
+    if raw:
+        try:
+            for host, values in json.loads(raw).items():
+                base = limits.get(host, HostLimits())
+                limits[host] = HostLimits(**{**base.__dict__, **values})
+        except (ValueError, TypeError) as e:
+            logger.warning(f"Invalid SCRAPER_HOST_LIMITS, using defaults: {e}")
+    return limits
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. Tokens are reserved under a lock and the
+    caller sleeps outside it, so the bucket works across event loops.
+    """
+
+    def __init__(self, rate_per_second: float, burst: int):
+        self.rate = rate_per_second
+        self.capacity = max(1, burst)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Takes one token and returns how long to wait before using it."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            if self._tokens >= 0 or self.rate <= 0:
+                return 0.0
+            return -self._tokens / self.rate
+
+    async def acquire(self):
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+
+class ScrapingHttpClient:
+    """Pooled, rate-limited HTTP client shared by the scrapers of one event loop."""
+
+    def __init__(
+        self,
+        host_limits: Optional[Dict[str, HostLimits]] = None,
+        default_limits: Optional[HostLimits] = None,
+        buckets: Optional[Dict[str, TokenBucket]] = None,
+        timeout: float = 60.0,
+        max_connections: int = 50,
+        max_keepalive_connections: int = 20,
+        max_retries: int = 4,
+        backoff_base: float = 1.0,
+        backoff_max: float = 60.0,
+        http2: Optional[bool] = None,
+    ):
+        self.host_limits = host_limits if host_limits is not None else _load_host_limits()
+        self.default_limits = default_limits or HostLimits()
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        if http2 is None:
+            http2 = importlib.util.find_spec('h2') is not None
+        self.http2 = http2
+
+        self._client = httpx.AsyncClient(
+            timeout=httpx.Timeout(timeout),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+            ),
+            headers={'User-Agent': DEFAULT_USER_AGENT},
+            follow_redirects=True,
+            http2=http2,
+        )
+        self._buckets = buckets if buckets is not None else {}
+        self._buckets_lock = threading.Lock()
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.stats = {'requests': 0, 'retries': 0, 'throttled': 0, 'errors': 0}
+
+    # --- Per-host limits -------------------------------------------------
+
+    def limits_for(self, host: str) -> HostLimits:
+        return self.host_limits.get(host, self.default_limits)
+
+    def _bucket(self, host: str) -> TokenBucket:
+        with self._buckets_lock:
+            bucket = self._buckets.get(host)
+            if bucket is None:
+                limits = self.limits_for(host)
+                bucket = TokenBucket(limits.rate_per_second, limits.burst)
+                self._buckets[host] = bucket
+            return bucket
+
+    def _semaphore(self, host: str) -> asyncio.Semaphore:
+        semaphore = self._semaphores.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.limits_for(host).max_concurrency)
+            self._semaphores[host] = semaphore
+        return semaphore
+
+    @asynccontextmanager
+    async def _slot(self, url: str) -> AsyncIterator[None]:
+        """Waits for a concurrency slot and a rate-limit token for the URL's host."""
+        host = urlparse(url).netloc.lower()
+        async with self._semaphore(host):
+            await self._bucket(host).acquire()
+            yield
+
+    # --- Retry policy ----------------------------------------------------
+
+    def _backoff(self, attempt: int, response: Optional[httpx.Response] = None) -> float:
+        """Seconds to wait before the next attempt (Retry-After wins if present)."""
+        if response is not None:
+            retry_after = response.headers.get('retry-after')
+            if retry_after:
+                try:
+                    return min(self.backoff_max, max(0.0, float(retry_after)))
+                except ValueError:
+                    try:
+                        delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                        return min(self.backoff_max, max(0.0, delay))
+                    except (TypeError, ValueError):
+                        pass
+        delay = self.backoff_base * (2 ** attempt)
+        return min(self.backoff_max, delay * (0.5 + random.random() / 2))
+
+    # --- Requests --------------------------------------------------------
+
+    async def request(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """
+        Sends a request through the host's rate limiter, retrying
+        throttling responses and transport errors. The last response is
+        returned as-is; callers decide whether to `raise_for_status()`.
+        """
+        attempt = 0
+        while True:
+            try:
+                async with self._slot(url):
+                    self.stats['requests'] += 1
+                    response = await self._client.request(method, url, **kwargs)
+            except httpx.TransportError as e:
+                if attempt >= self.max_retries:
+                    self.stats['errors'] += 1
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(f"Transport error for {url} ({e}), retrying in {delay:.1f}s")
+            else:
+                if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    return response
+                self.stats['throttled'] += 1
+                delay = self._backoff(attempt, response)
+                logger.warning(
+                    f"HTTP {response.status_code} for {url}, retrying in {delay:.1f}s"
+                )
+                await response.aclose()
+
+            self.stats['retries'] += 1
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def get(self, url: str, **kwargs: Any) -> httpx.Response:
+        return await self.request('GET', url, **kwargs)
+
+    @asynccontextmanager
+    async def stream(self, method: str, url: str, **kwargs: Any) -> AsyncIterator[httpx.Response]:
+        """
+        Streaming request under the same host limits. The concurrency slot
+        is held until the body has been consumed; only throttling statuses
+        received before the body are retried.
+        """
+        attempt = 0
+        while True:
+            async with self._slot(url):
+                self.stats['requests'] += 1
+                async with self._client.stream(method, url, **kwargs) as response:
+                    if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                        yield response
+                        return
+                    delay = self._backoff(attempt, response)
+            self.stats['throttled'] += 1
+            self.stats['retries'] += 1
+            logger.warning(f"HTTP {response.status_code} for {url}, retrying in {delay:.1f}s")
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def aclose(self):
+        await self._client.aclose()
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            'http2': self.http2,
+            'hosts': {
+                host: limits.__dict__ for host, limits in self.host_limits.items()
+            },
+        }
+
+
+# Global client instances (one per event loop) and shared rate limiters
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, ScrapingHttpClient]" = (
+    weakref.WeakKeyDictionary()
+)
+_shared_buckets: Dict[str, TokenBucket] = {}
+_clients_lock = threading.Lock()
+
+
+def get_scraping_client() -> ScrapingHttpClient:
+    """Get the shared scraping client of the running event loop."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.get(loop)
+        if client is None:
+            client = ScrapingHttpClient(buckets=_shared_buckets)
+            _clients[loop] = client
+        return client
+
+
+async def close_scraping_client():
+    """Closes the running loop's client (call before the loop shuts down)."""
+    loop = asyncio.get_running_loop()
+    with _clients_lock:
+        client = _clients.pop(loop, None)
+    if client is not None:
+        await client.aclose()
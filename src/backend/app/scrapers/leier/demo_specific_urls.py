@@ -10,12 +10,13 @@ Demonstrates downloading product documents from specific LEIER URLs:
 """
 
 import asyncio
-import httpx
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 import re
 from pathlib import Path
 
+from app.scrapers.http_client import get_scraping_client
+
 async def demo_product_page():
     """Demo: Extract documents from a specific product page."""
     print("🚀 Demo: Extracting documents from specific product page")
@@ -23,10 +24,10 @@ async def demo_product_page():
     url = "https://www.leier.hu/hu/termekek/leier-beton-pillerzsaluzo-elem-25"
     print(f"Target: {url}")
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url)
-        response.raise_for_status()
-        html = response.text
+    client = get_scraping_client()
+    response = await client.get(url)
+    response.raise_for_status()
+    html = response.text
     
     soup = BeautifulSoup(html, 'html.parser')
     
@@ -53,10 +54,10 @@ async def demo_category_page():
     url = "https://www.leier.hu/hu/termekeink/pillerzsaluzo-elem"
     print(f"Target: {url}")
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url)
-        response.raise_for_status()
-        html = response.text
+    client = get_scraping_client()
+    response = await client.get(url)
+    response.raise_for_status()
+    html = response.text
     
     soup = BeautifulSoup(html, 'html.parser')
     
@@ -85,30 +86,30 @@ async def demo_file_server():
     print(f"Target: {url}")
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            if response.status_code == 403:
-                print("⚠️  Directory browsing disabled (403 Forbidden)")
-                print("   Files must be accessed via direct links from product pages")
-            elif response.status_code == 404:
-                print("⚠️  Directory not found (404)")
-            else:
-                response.raise_for_status()
-                html = response.text
+        client = get_scraping_client()
+        response = await client.get(url)
+        if response.status_code == 403:
+            print("⚠️  Directory browsing disabled (403 Forbidden)")
+            print("   Files must be accessed via direct links from product pages")
+        elif response.status_code == 404:
+            print("⚠️  Directory not found (404)")
+        else:
+            response.raise_for_status()
+            html = response.text
                 
-                soup = BeautifulSoup(html, 'html.parser')
-                file_links = []
-                for link in soup.find_all('a'):
-                    href = link.get('href', '')
-                    if href and any(ext in href.lower() for ext in ['.pdf', '.doc', '.zip']):
-                        full_url = urljoin(url, href)
-                        file_links.append((full_url, href))
+            soup = BeautifulSoup(html, 'html.parser')
+            file_links = []
+            for link in soup.find_all('a'):
+                href = link.get('href', '')
+                if href and any(ext in href.lower() for ext in ['.pdf', '.doc', '.zip']):
+                    full_url = urljoin(url, href)
+                    file_links.append((full_url, href))
                 
-                print(f"✅ Found {len(file_links)} files:")
-                for i, (file_url, filename) in enumerate(file_links[:5], 1):
-                    print(f"  {i}. {filename}")
+            print(f"✅ Found {len(file_links)} files:")
+            for i, (file_url, filename) in enumerate(file_links[:5], 1):
+                print(f"  {i}. {filename}")
                 
-                return file_links
+            return file_links
                 
     except Exception as e:
         print(f"❌ Error accessing file server: {e}")
@@ -134,17 +135,17 @@ async def demo_download_sample(pdf_links):
     print(f"From: {pdf_url}")
     
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.get(pdf_url)
-            response.raise_for_status()
+        client = get_scraping_client()
+        response = await client.get(pdf_url)
+        response.raise_for_status()
             
-            # Save to current directory
-            file_path = Path(safe_title)
-            with open(file_path, 'wb') as f:
-                f.write(response.content)
+        # Save to current directory
+        file_path = Path(safe_title)
+        with open(file_path, 'wb') as f:
+            f.write(response.content)
             
-            file_size = file_path.stat().st_size / 1024  # KB
-            print(f"✅ Downloaded: {safe_title} ({file_size:.1f} KB)")
+        file_size = file_path.stat().st_size / 1024  # KB
+        print(f"✅ Downloaded: {safe_title} ({file_size:.1f} KB)")
             
     except Exception as e:
         print(f"❌ Download failed: {e}")
@@ -23,7 +23,6 @@ Entry Points:
 import asyncio
 import logging
 import json
-import httpx
 import re
 from pathlib import Path
 from datetime import datetime
@@ -33,6 +32,8 @@ import os
 from typing import List, Optional, Set, Dict, Any
 from dataclasses import dataclass, asdict
 
+from app.scrapers.http_client import get_scraping_client
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -186,10 +187,9 @@ class LeierCalculatorScraper:
     async def _fetch_direct(self, url: str) -> Optional[str]:
         """Direct HTTP fetch as fallback"""
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                return response.text
+            response = await get_scraping_client().get(url, timeout=30.0)
+            response.raise_for_status()
+            return response.text
         except Exception as e:
             logger.error(f"Direct fetch failed for {url}: {e}")
             return None
@@ -14,7 +14,6 @@ Priority: HIGH - Essential for LEIER data collection
 import asyncio
 import logging
 import json
-import httpx
 import re
 import hashlib
 from pathlib import Path
@@ -25,6 +24,9 @@ import os
 from typing import List, Optional, Set, Dict, Any
 from dataclasses import dataclass, asdict
 
+from app.scrapers.download_engine import DownloadEngine
+from app.scrapers.http_client import get_scraping_client
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO, 
@@ -92,6 +94,7 @@ class LeierDocumentsScraper:
         self.documents: List[LeierDoc] = []
         self.visited_urls: Set[str] = set()
         self.downloaded_files: Set[str] = set()
+        self.downloader = DownloadEngine()
         self.stats = {
             'categories_found': 0,
             'docs_discovered': 0,
@@ -163,10 +166,9 @@ class LeierDocumentsScraper:
     async def _fetch_direct(self, url: str) -> Optional[str]:
         """Direct HTTP fetch as fallback"""
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                return response.text
+            response = await get_scraping_client().get(url, timeout=30.0)
+            response.raise_for_status()
+            return response.text
         except Exception as e:
             logger.error(f"Direct fetch failed for {url}: {e}")
             return None
@@ -373,9 +375,7 @@ class LeierDocumentsScraper:
         self.downloaded_files.add(filename)
         return filename
     
-    async def download_document(
-        self, session: httpx.AsyncClient, doc: LeierDoc
-    ) -> Dict[str, Any]:
+    async def download_document(self, doc: LeierDoc) -> Dict[str, Any]:
         """Download a single document"""
         try:
             filename = self.generate_safe_filename(doc)
@@ -384,12 +384,8 @@ class LeierDocumentsScraper:
             
             logger.info(f"⬇️  Downloading: {doc.name} -> {doc.doc_type}/{filename}")
             
-            response = await session.get(doc.url, follow_redirects=True)
-            response.raise_for_status()
-            
-            # Save file
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
+            # Stream to disk (304 if unchanged since the last run)
+            result = await self.downloader.download(doc.url, filepath, timeout=60.0)
             
             self.stats['downloads_success'] += 1
             
@@ -397,7 +393,8 @@ class LeierDocumentsScraper:
                 'status': 'success',
                 'filename': filename,
                 'path': str(filepath),
-                'size': len(response.content),
+                'size': result.size,
+                'changed': result.changed,
                 'category': doc.doc_type
             }
             
@@ -416,21 +413,15 @@ class LeierDocumentsScraper:
             f"📥 Starting download of {len(self.documents)} documents..."
         )
         
-        async with httpx.AsyncClient(timeout=60.0) as session:
-            semaphore = asyncio.Semaphore(3)  # Limit concurrent downloads
-            
-            async def download_with_limit(doc):
-                async with semaphore:
-                    return await self.download_document(session, doc)
-            
-            tasks = [download_with_limit(doc) for doc in self.documents]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
-            
-            # Process results
-            for result in results:
-                if isinstance(result, Exception):
-                    logger.error(f"Download task exception: {result}")
-                    self.stats['downloads_failed'] += 1
+        # Concurrency is capped per host by the shared scraping client
+        tasks = [self.download_document(doc) for doc in self.documents]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+        
+        # Process results
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(f"Download task exception: {result}")
+                self.stats['downloads_failed'] += 1
     
     async def run_full_scrape(self):
         """Execute complete LEIER documents scraping"""
@@ -33,6 +33,8 @@ from urllib.parse import urljoin
 import httpx
 from bs4 import BeautifulSoup
 
+from app.scrapers.http_client import get_scraping_client
+
 # LEIER URLs and patterns (updated for actual website structure)
 BASE_URL = "https://www.leier.hu"
 MAIN_DOCS_URL = f"{BASE_URL}/hu/letoltheto-dokumentumok"
@@ -44,8 +46,7 @@ class LEIERDocumentsScraper:
     def __init__(
         self, 
         base_dir: str = None, 
-        test_mode: bool = False, 
-        max_concurrent: int = 10
+        test_mode: bool = False
     ):
         """Initialize the LEIER documents scraper."""
         
@@ -80,8 +81,6 @@ class LEIERDocumentsScraper:
         
         # Configuration
         self.test_mode = test_mode
-        self.max_concurrent = max_concurrent
-        self.session_semaphore = asyncio.Semaphore(max_concurrent)
         
         # Tracking
         self.discovered_docs: Set[Tuple[str, str, str]] = set()
@@ -139,18 +138,15 @@ class LEIERDocumentsScraper:
     async def scrape_with_httpx_fallback(self, url: str) -> Optional[str]:
         """Fallback scraping method using direct HTTP requests."""
         try:
-            async with httpx.AsyncClient(
-                timeout=30.0,
-                headers={
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                                  'AppleWebKit/537.36'
-                }
-            ) as client:
-                async with self.session_semaphore:
-                    response = await client.get(url)
-                    response.raise_for_status()
-                    return response.text
-                    
+            timeout = httpx.Timeout(30.0)
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+                              'AppleWebKit/537.36'
+            }
+            response = await get_scraping_client().get(url, timeout=timeout, headers=headers)
+            response.raise_for_status()
+            return response.text
+
         except Exception as e:
             self.logger.warning(f"⚠️ HTTP fallback failed for {url}: {e}")
             return None
@@ -26,10 +26,12 @@ from pathlib import Path
 from typing import Dict, Set, Optional, Tuple, List, Any
 from urllib.parse import urljoin, urlparse
 
-import aiofiles
 import httpx
 from bs4 import BeautifulSoup
 
+from app.scrapers.download_engine import DownloadEngine
+from app.scrapers.http_client import get_scraping_client
+
 # --- Configuration ---
 BASE_URL = "https://u-ertek-kalkulator.leier.hu"
 START_URLS = [
@@ -42,9 +44,9 @@ START_URLS = [
 class LeierDownloadManagerScraper:
     """Scrapes the LEIER Download Manager system."""
 
-    def __init__(self, test_mode: bool = False, max_concurrent: int = 5):
+    def __init__(self, test_mode: bool = False):
         self.test_mode = test_mode
-        self.session_semaphore = asyncio.Semaphore(max_concurrent)
+        self.downloader = DownloadEngine()
 
         # Setup paths
         current_dir = Path(__file__).resolve().parent
@@ -96,18 +98,16 @@ class LeierDownloadManagerScraper:
         
         self.logger.info(f"Fetching page: {url}")
         try:
-            async with self.session_semaphore:
-                timeout = httpx.Timeout(45.0)
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
-                    'Accept-Language': 'en-US,en;q=0.9,hu;q=0.8',
-                    'Referer': 'https://u-ertek-kalkulator.leier.hu/'
-                }
-                async with httpx.AsyncClient(timeout=timeout, headers=headers, follow_redirects=True) as client:
-                    response = await client.get(url)
-                    response.raise_for_status()
-                    return response.text
+            timeout = httpx.Timeout(45.0)
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8',
+                'Accept-Language': 'en-US,en;q=0.9,hu;q=0.8',
+                'Referer': 'https://u-ertek-kalkulator.leier.hu/'
+            }
+            response = await get_scraping_client().get(url, timeout=timeout, headers=headers)
+            response.raise_for_status()
+            return response.text
         except Exception as e:
             self.logger.error(f"Failed to fetch {url}: {e}")
             return None
@@ -150,16 +150,10 @@ class LeierDownloadManagerScraper:
 
         self.logger.info(f"Downloading: {title} from {url}")
         try:
-            async with self.session_semaphore:
-                async with httpx.AsyncClient(timeout=180.0, follow_redirects=True) as client:
-                    response = await client.get(url)
-                    response.raise_for_status()
-
-                async with aiofiles.open(target_path, 'wb') as f:
-                    await f.write(response.content)
+            await self.downloader.download(url, target_path, timeout=180.0)
 
-                self.logger.info(f"✅ Downloaded: {safe_filename}")
-                self.downloaded_files.add(url)
+            self.logger.info(f"✅ Downloaded: {safe_filename}")
+            self.downloaded_files.add(url)
 
         except Exception as e:
             self.logger.error(f"❌ Failed to download {url}: {e}")
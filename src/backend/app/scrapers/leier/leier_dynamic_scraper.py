@@ -25,6 +25,10 @@ from typing import Dict, Set, Optional, Tuple, List
 import aiofiles
 import httpx
 
+from app.scrapers.download_engine import DownloadEngine
+from app.scrapers.folder_crawler import FolderCrawler
+from app.scrapers.http_client import get_scraping_client
+
 # --- Configuration ---
 BASE_URL = "https://www.leier.hu"
 API_BASE_URL = "https://www.leier.hu/hu/documents/api/documents"
@@ -36,7 +40,8 @@ class LeierAPIScraper:
 
     def __init__(self, test_mode: bool = False, max_concurrent: int = 5):
         self.test_mode = test_mode
-        self.session_semaphore = asyncio.Semaphore(max_concurrent)
+        self.max_concurrent = max_concurrent
+        self.downloader = DownloadEngine()
         
         # Setup paths
         current_dir = Path(__file__).resolve()
@@ -64,6 +69,7 @@ class LeierAPIScraper:
         self.failed_downloads: List[Tuple[str, str]] = []
         self.duplicate_files: Set[str] = set()
         self.api_calls_made = 0
+        self.crawl_stats: Dict = {}
 
         self.setup_logging()
 
@@ -96,13 +102,10 @@ class LeierAPIScraper:
         
         try:
             timeout = httpx.Timeout(45.0)
-            async with httpx.AsyncClient(
-                timeout=timeout, follow_redirects=True
-            ) as client:
-                response = await client.get(url)
-                response.raise_for_status()
-                self.logger.info(f"Successfully fetched API data from {url}")
-                return response.json()
+            response = await get_scraping_client().get(url, timeout=timeout)
+            response.raise_for_status()
+            self.logger.info(f"Successfully fetched API data from {url}")
+            return response.json()
         except httpx.RequestError as e:
             self.logger.error(f"HTTP error while querying {url}: {e}")
         except json.JSONDecodeError:
@@ -180,30 +183,46 @@ class LeierAPIScraper:
         ) as f:
             await f.write(json.dumps(folder_data, indent=2, ensure_ascii=False))
 
+    async def _explore_folder(self, node) -> Tuple[List, List]:
+        """Fetches one folder; returns the folders and documents it added."""
+        folder_id, folder_path = node
+        self.logger.info(f"Exploring folder: {folder_path} (ID: {folder_id})")
+
+        folder_data = await self.fetch_api_data(folder_id)
+        if not folder_data:
+            return [], []
+        await self._save_folder_response(folder_id, folder_data)
+
+        # parse_api_response is synchronous, so no other worker can touch
+        # the shared sets between the snapshots and the parse
+        known_folders = set(self.discovered_folders)
+        known_docs = set(self.discovered_docs)
+        self.parse_api_response(folder_data, folder_path)
+        return (
+            list(self.discovered_folders - known_folders),
+            list(self.discovered_docs - known_docs),
+        )
+
     async def explore_folders_recursively(self):
-        """Recursively explores all discovered folders to find documents."""
-        processed_folders = set()
-        
-        while self.discovered_folders:
-            current_folders = self.discovered_folders.copy()
-            self.discovered_folders.clear()
-            
-            for folder_id, folder_path in current_folders:
-                if folder_id in processed_folders:
-                    continue
-                    
-                processed_folders.add(folder_id)
-                self.logger.info(
-                    f"Exploring folder: {folder_path} (ID: {folder_id})"
-                )
-                
-                folder_data = await self.fetch_api_data(folder_id)
-                if folder_data:
-                    await self._save_folder_response(folder_id, folder_data)
-                    self.parse_api_response(folder_data, folder_path)
-                
-                # Rate limiting
-                await asyncio.sleep(0.5)
+        """
+        Breadth-first exploration of all discovered folders with bounded
+        concurrency. Politeness is enforced per host by the shared client;
+        an interrupted exploration resumes from its saved frontier.
+        """
+        crawler = FolderCrawler(
+            self._explore_folder,
+            concurrency=self.max_concurrent,
+            state_path=self.directories['api_responses'] / 'crawl_frontier.json',
+            node_key=lambda node: node[0],  # visit each folder id once
+        )
+        documents = await crawler.crawl(sorted(self.discovered_folders))
+        self.discovered_docs.update(tuple(doc) for doc in documents)
+        self.crawl_stats = crawler.stats
+        self.logger.info(
+            f"Exploration finished: {crawler.stats['nodes_processed']} folders, "
+            f"{crawler.stats['nodes_failed']} failed"
+            + (" (resumed)" if crawler.stats['resumed'] else "")
+        )
 
     def _create_download_directory(self, folder_path: str) -> Path:
         """Creates the directory structure for a downloaded file."""
@@ -237,21 +256,12 @@ class LeierAPIScraper:
             return
 
         try:
-            async with self.session_semaphore:
-                headers = {'Referer': BASE_URL}
-                timeout = httpx.Timeout(120.0)
-                async with httpx.AsyncClient(
-                    timeout=timeout, headers=headers
-                ) as client:
-                    response = await client.get(url)
-                    response.raise_for_status()
-
-                async with aiofiles.open(file_path, 'wb') as f:
-                    await f.write(response.content)
+            headers = {'Referer': BASE_URL}
+            await self.downloader.download(url, file_path, headers=headers, timeout=120.0)
                 
-                download_path = f"{folder_path}/{safe_filename}"
-                self.logger.info(f"✅ Downloaded: {download_path}")
-                self.downloaded_files.add(url)
+            download_path = f"{folder_path}/{safe_filename}"
+            self.logger.info(f"✅ Downloaded: {download_path}")
+            self.downloaded_files.add(url)
         except Exception as e:
             self.logger.error(f"❌ Failed to download {url}: {e}")
             self.failed_downloads.append((url, str(e)))
@@ -317,9 +327,7 @@ class LeierAPIScraper:
 
     def generate_report(self, start_time: datetime):
         """Generates and saves a JSON report of the scraping run."""
-        folders_explored_count = (
-            len(self.discovered_folders) if hasattr(self, 'discovered_folders') else 0
-        )
+        folders_explored_count = self.crawl_stats.get('nodes_processed', 0)
         report = {
             "run_timestamp": datetime.now().isoformat(),
             "duration_seconds": (datetime.now() - start_time).total_seconds(),
@@ -29,6 +29,9 @@ import aiofiles
 import httpx
 from bs4 import BeautifulSoup
 
+from app.scrapers.download_engine import DownloadEngine
+from app.scrapers.http_client import get_scraping_client
+
 # --- Configuration ---
 BASE_URL = "https://www.leier.hu"
 MAIN_PRODUCTS_URL = "https://www.leier.hu/hu/termekeink"
@@ -36,8 +39,8 @@ MAIN_PRODUCTS_URL = "https://www.leier.hu/hu/termekeink"
 class LeierProductTreeMapper:
     """Maps complete LEIER product tree with documents and metadata."""
 
-    def __init__(self, max_concurrent: int = 3):
-        self.session_semaphore = asyncio.Semaphore(max_concurrent)
+    def __init__(self):
+        self.downloader = DownloadEngine()
         
         # Setup paths
         current_dir = Path(__file__).resolve()
@@ -93,26 +96,20 @@ class LeierProductTreeMapper:
     async def fetch_page(self, url: str) -> Optional[str]:
         """Fetches HTML content from a URL."""
         try:
-            async with self.session_semaphore:
-                timeout = httpx.Timeout(45.0)
-                headers = {
-                    'User-Agent': (
-                        'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                        'AppleWebKit/537.36'
-                    ),
-                    'Accept': (
-                        'text/html,application/xhtml+xml,application/xml;'
-                        'q=0.9,*/*;q=0.8'
-                    )
-                }
-                async with httpx.AsyncClient(
-                    timeout=timeout,
-                    headers=headers,
-                    follow_redirects=True
-                ) as client:
-                    response = await client.get(url)
-                    response.raise_for_status()
-                    return response.text
+            timeout = httpx.Timeout(45.0)
+            headers = {
+                'User-Agent': (
+                    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+                    'AppleWebKit/537.36'
+                ),
+                'Accept': (
+                    'text/html,application/xhtml+xml,application/xml;'
+                    'q=0.9,*/*;q=0.8'
+                )
+            }
+            response = await get_scraping_client().get(url, timeout=timeout, headers=headers)
+            response.raise_for_status()
+            return response.text
         except Exception as e:
             self.logger.error(f"Failed to fetch {url}: {e}")
             self.failed_operations.append(("fetch_page", url, str(e)))
@@ -374,24 +371,15 @@ class LeierProductTreeMapper:
             return file_path
 
         try:
-            async with self.session_semaphore:
-                headers = {'Referer': BASE_URL}
-                timeout = httpx.Timeout(120.0)
-                async with httpx.AsyncClient(
-                    timeout=timeout, headers=headers
-                ) as client:
-                    response = await client.get(doc_url)
-                    response.raise_for_status()
-
-                async with aiofiles.open(file_path, 'wb') as f:
-                    await f.write(response.content)
+            headers = {'Referer': BASE_URL}
+            await self.downloader.download(doc_url, file_path, headers=headers, timeout=120.0)
                 
-                file_size = file_path.stat().st_size / 1024  # KB
-                self.logger.info(
-                    f"✅ Downloaded: {category_id}/{product_id}/"
-                    f"{safe_title} ({file_size:.1f} KB)"
-                )
-                return file_path
+            file_size = file_path.stat().st_size / 1024  # KB
+            self.logger.info(
+                f"✅ Downloaded: {category_id}/{product_id}/"
+                f"{safe_title} ({file_size:.1f} KB)"
+            )
+            return file_path
                 
         except Exception as e:
             self.logger.error(f"❌ Failed to download {doc_url}: {e}")
@@ -580,7 +568,7 @@ class LeierProductTreeMapper:
 
 async def main():
     """Main execution entry point."""
-    scraper = LeierProductTreeMapper(max_concurrent=5)
+    scraper = LeierProductTreeMapper()
     await scraper.run()
 
 
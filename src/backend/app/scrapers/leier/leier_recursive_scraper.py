@@ -26,6 +26,10 @@ from typing import Dict, Set, Optional, Tuple, List, Any
 import aiofiles
 import httpx
 
+from app.scrapers.download_engine import DownloadEngine
+from app.scrapers.folder_crawler import FolderCrawler
+from app.scrapers.http_client import get_scraping_client
+
 # --- Configuration ---
 BASE_URL = "https://www.leier.hu"
 INITIAL_API_URL = "https://www.leier.hu/hu/documents/api/documents"
@@ -35,7 +39,8 @@ class LeierRecursiveScraper:
 
     def __init__(self, test_mode: bool = False, max_concurrent: int = 10):
         self.test_mode = test_mode
-        self.session_semaphore = asyncio.Semaphore(max_concurrent)
+        self.max_concurrent = max_concurrent
+        self.downloader = DownloadEngine()
         
         # Paths
         current_dir = Path(__file__).resolve()
@@ -60,6 +65,7 @@ class LeierRecursiveScraper:
         self.failed_downloads: List[Tuple[str, str]] = []
         self.duplicate_files: Set[str] = set()
         self.visited_folders: Set[int] = set()
+        self.crawl_stats: Dict[str, Any] = {}
 
         self.setup_logging()
 
@@ -89,25 +95,25 @@ class LeierRecursiveScraper:
             self.visited_folders.add(folder_id)
 
         try:
-            async with httpx.AsyncClient(timeout=45.0) as client:
-                response = await client.get(url)
-                if response.status_code == 404 and folder_id is not None:
-                     # This is expected for leaf-node documents, not an error
-                    return None
-                response.raise_for_status()
-                return response.json()
+            response = await get_scraping_client().get(url, timeout=45.0)
+            if response.status_code == 404 and folder_id is not None:
+                 # This is expected for leaf-node documents, not an error
+                return None
+            response.raise_for_status()
+            return response.json()
         except httpx.RequestError as e:
             self.logger.error(f"HTTP error for {url}: {e}")
         except json.JSONDecodeError:
             self.logger.error(f"Failed to decode JSON from {url}")
         return None
 
-    async def traverse_and_discover(self, folder_id: Optional[int] = None, current_path: str = ""):
-        """Recursively traverses the document hierarchy."""
+    async def _process_folder(self, node) -> Tuple[List[Any], List[Any]]:
+        """Fetches one folder; returns its subfolders and documents for the crawler."""
+        folder_id, current_path = node
         api_data = await self.fetch_folder_contents(folder_id)
 
         if not api_data:
-            return
+            return [], []
 
         # Save API response for debugging
         folder_name = "root" if folder_id is None else str(folder_id)
@@ -121,7 +127,8 @@ class LeierRecursiveScraper:
             items = api_data['documents']
         elif 'children' in api_data and isinstance(api_data['children'], list):
             items = api_data['children']
-        
+
+        subfolders, documents = [], []
         for item in items:
             item_id = item.get('id')
             item_name = item.get('name', f"item_{item_id}")
@@ -129,9 +136,31 @@ class LeierRecursiveScraper:
 
             if item.get('is_folder') == 0:
                 doc_url = f"{BASE_URL}/hu/dokumentumtar/{item_id}"
-                self.discovered_docs.add((doc_url, item_name, new_path))
+                documents.append((doc_url, item_name, new_path))
             elif item.get('is_folder') == 1:
-                await self.traverse_and_discover(item_id, new_path)
+                subfolders.append((item_id, new_path))
+        return subfolders, documents
+
+    async def traverse_and_discover(self, folder_id: Optional[int] = None, current_path: str = ""):
+        """
+        Breadth-first traversal of the document hierarchy with bounded
+        concurrency. An interrupted traversal resumes from its saved frontier.
+        """
+        crawler = FolderCrawler(
+            self._process_folder,
+            concurrency=self.max_concurrent,
+            state_path=self.directories['api_responses'] / 'crawl_frontier.json',
+            node_key=lambda node: node[0],  # visit each folder id once
+        )
+        documents = await crawler.crawl([(folder_id, current_path)])
+        self.discovered_docs.update(tuple(doc) for doc in documents)
+        self.crawl_stats = crawler.stats
+        if crawler.stats['resumed']:
+            self.logger.info("Resumed interrupted traversal from saved frontier.")
+        self.logger.info(
+            f"Traversal finished: {crawler.stats['nodes_processed']} folders, "
+            f"{crawler.stats['nodes_failed']} failed."
+        )
 
     async def download_document(self, url: str, title: str, category_path: str):
         """Downloads a single document into its category folder."""
@@ -155,16 +184,10 @@ class LeierRecursiveScraper:
             return
 
         try:
-            async with self.session_semaphore:
-                async with httpx.AsyncClient(timeout=180.0, headers={'Referer': BASE_URL}) as client:
-                    response = await client.get(url)
-                    response.raise_for_status()
-
-                async with aiofiles.open(file_path, 'wb') as f:
-                    await f.write(response.content)
+            await self.downloader.download(url, file_path, headers={'Referer': BASE_URL}, timeout=180.0)
                 
-                self.logger.info(f"✅ Downloaded: {file_path}")
-                self.downloaded_files.add(url)
+            self.logger.info(f"✅ Downloaded: {file_path}")
+            self.downloaded_files.add(url)
         except Exception as e:
             self.logger.error(f"❌ Failed to download {url}: {e}")
             self.failed_downloads.append((url, str(e)))
@@ -200,6 +223,7 @@ class LeierRecursiveScraper:
                 "downloads_successful": len(self.downloaded_files),
                 "downloads_failed": len(self.failed_downloads),
                 "duplicates_found": len(self.duplicate_files),
+                "folders_traversed": self.crawl_stats.get('nodes_processed', 0),
             },
             "discovered_docs_sample": list(f"{path}" for _, _, path in self.discovered_docs)[:20],
             "failed_downloads": self.failed_downloads,
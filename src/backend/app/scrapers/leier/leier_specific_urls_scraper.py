@@ -24,6 +24,9 @@ import aiofiles
 import httpx
 from bs4 import BeautifulSoup
 
+from app.scrapers.download_engine import DownloadEngine
+from app.scrapers.http_client import get_scraping_client
+
 # --- Configuration ---
 BASE_URL = "https://www.leier.hu"
 
@@ -40,9 +43,9 @@ TARGET_URLS = [
 class LeierSpecificUrlsScraper:
     """Scrapes specific LEIER URLs for downloadable content."""
 
-    def __init__(self, test_mode: bool = False, max_concurrent: int = 5):
+    def __init__(self, test_mode: bool = False):
         self.test_mode = test_mode
-        self.session_semaphore = asyncio.Semaphore(max_concurrent)
+        self.downloader = DownloadEngine()
         
         # Setup paths
         current_dir = Path(__file__).resolve()
@@ -88,22 +91,16 @@ class LeierSpecificUrlsScraper:
     async def fetch_page(self, url: str) -> Optional[str]:
         """Fetches HTML content from a URL."""
         try:
-            async with self.session_semaphore:
-                timeout = httpx.Timeout(45.0)
-                headers = {
-                    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
-                                  'AppleWebKit/537.36',
-                    'Accept': 'text/html,application/xhtml+xml,application/xml;'
-                              'q=0.9,*/*;q=0.8'
-                }
-                async with httpx.AsyncClient(
-                    timeout=timeout, 
-                    headers=headers,
-                    follow_redirects=True
-                ) as client:
-                    response = await client.get(url)
-                    response.raise_for_status()
-                    return response.text
+            timeout = httpx.Timeout(45.0)
+            headers = {
+                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
+                              'AppleWebKit/537.36',
+                'Accept': 'text/html,application/xhtml+xml,application/xml;'
+                          'q=0.9,*/*;q=0.8'
+            }
+            response = await get_scraping_client().get(url, timeout=timeout, headers=headers)
+            response.raise_for_status()
+            return response.text
         except Exception as e:
             self.logger.error(f"Failed to fetch {url}: {e}")
             return None
@@ -363,21 +360,11 @@ class LeierSpecificUrlsScraper:
             return
 
         try:
-            async with self.session_semaphore:
-                headers = {'Referer': BASE_URL}
-                timeout = httpx.Timeout(120.0)
-                async with httpx.AsyncClient(
-                    timeout=timeout, 
-                    headers=headers
-                ) as client:
-                    response = await client.get(url)
-                    response.raise_for_status()
-
-                async with aiofiles.open(file_path, 'wb') as f:
-                    await f.write(response.content)
+            headers = {'Referer': BASE_URL}
+            await self.downloader.download(url, file_path, headers=headers, timeout=120.0)
                 
-                self.logger.info(f"✅ Downloaded: {source_name}/{safe_title}")
-                self.downloaded_files.add(url)
+            self.logger.info(f"✅ Downloaded: {source_name}/{safe_title}")
+            self.downloaded_files.add(url)
         except Exception as e:
             self.logger.error(f"❌ Failed to download {url}: {e}")
             self.failed_downloads.append((url, str(e)))
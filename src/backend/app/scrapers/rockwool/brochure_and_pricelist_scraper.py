@@ -17,7 +17,6 @@ This is a final, production-ready version.
 import asyncio
 import logging
 import json
-import httpx
 import re
 import hashlib
 import html
@@ -25,6 +24,8 @@ from pathlib import Path
 from datetime import datetime
 from urllib.parse import urljoin
 
+from app.scrapers.download_engine import DownloadEngine
+from app.scrapers.http_client import get_scraping_client
 
 # --- Configuration ---
 logging.basicConfig(
@@ -69,7 +70,7 @@ class RockwoolBrochureScraper:
         self.visited_urls = set()
         self.downloaded_files = set()  # Track downloaded filenames
         self.duplicate_count = 0
-
+        self.downloader = DownloadEngine()
 
 
     def _generate_unique_filename(self, base_filename: str, pdf_url: str) -> str:
@@ -85,19 +86,13 @@ class RockwoolBrochureScraper:
         
         return unique_filename
 
-    async def _download_pdf(self, session: httpx.AsyncClient, pdf_url: str, doc_name: str) -> dict:
+    async def _download_pdf(self, pdf_url: str, doc_name: str) -> dict:
         """Downloads a single PDF with smart duplicate handling."""
         try:
             if not pdf_url.startswith('http'):
                 pdf_url = urljoin(BASE_URL, pdf_url)
             
             logger.info(f"⬇️  Downloading: {pdf_url}")
-            response = await session.get(pdf_url, follow_redirects=True)
-            response.raise_for_status()
-
-            content_type = response.headers.get('content-type', '')
-            if 'pdf' not in content_type.lower():
-                raise ValueError(f"Not a PDF file. Content-Type: {content_type}")
 
             safe_name = clean_filename(doc_name)
             base_filename = f"{safe_name}.pdf"
@@ -117,14 +112,17 @@ class RockwoolBrochureScraper:
                 filepath = PDF_STORAGE_DIR / base_filename
                 self.downloaded_files.add(base_filename)
 
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
+            # Streamed to disk; raises before writing if it is not a PDF
+            result = await self.downloader.download(
+                pdf_url, filepath, timeout=60.0, expected_content_type='pdf'
+            )
 
             return {
                 'status': 'success',
                 'filename': filepath.name,
                 'local_path': str(filepath),
-                'file_size_bytes': len(response.content),
+                'file_size_bytes': result.size,
+                'changed': result.changed,
                 'is_duplicate': base_filename in self.downloaded_files or 'duplicates' in str(filepath)
             }
         except Exception as e:
@@ -139,29 +137,28 @@ class RockwoolBrochureScraper:
         logger.info("🌐 Fetching LIVE brochure content from Rockwool website...")
         
         try:
-            async with httpx.AsyncClient(timeout=30.0, follow_redirects=True) as client:
-                response = await client.get(TARGET_URL)
-                response.raise_for_status()
-                logger.info("✅ Successfully fetched LIVE brochure content!")
+            response = await get_scraping_client().get(TARGET_URL, timeout=30.0)
+            response.raise_for_status()
+            logger.info("✅ Successfully fetched LIVE brochure content!")
+            
+            # Save current content for debugging purposes only
+            # (but never use it as fallback)
+            try:
+                with open(DEBUG_FILE_PATH, 'w', encoding='utf-8') as f:
+                    f.write(response.text)
+                logger.info(f"📄 Debug copy saved to: {DEBUG_FILE_PATH}")
                 
-                # Save current content for debugging purposes only
-                # (but never use it as fallback)
-                try:
-                    with open(DEBUG_FILE_PATH, 'w', encoding='utf-8') as f:
-                        f.write(response.text)
-                    logger.info(f"📄 Debug copy saved to: {DEBUG_FILE_PATH}")
-                    
-                    # Create timestamped backup for reference
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    backup_file = f"debug_pricelists_{timestamp}.html"
-                    with open(backup_file, 'w', encoding='utf-8') as f:
-                        f.write(response.text)
-                    logger.info(f"📄 Timestamped backup: {backup_file}")
-                    
-                except Exception as save_error:
-                    logger.warning(f"⚠️  Could not save debug copy: {save_error}")
+                # Create timestamped backup for reference
+                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                backup_file = f"debug_pricelists_{timestamp}.html"
+                with open(backup_file, 'w', encoding='utf-8') as f:
+                    f.write(response.text)
+                logger.info(f"📄 Timestamped backup: {backup_file}")
                 
-                return response.text
+            except Exception as save_error:
+                logger.warning(f"⚠️  Could not save debug copy: {save_error}")
+            
+            return response.text
                 
         except Exception as e:
             logger.error(f"❌ LIVE fetch failed: {e}")
@@ -234,15 +231,14 @@ class RockwoolBrochureScraper:
         successful_downloads = 0
         failed_downloads = 0
         
-        async with httpx.AsyncClient(timeout=60.0, follow_redirects=True) as http_session:
-            tasks = [self._download_pdf(http_session, doc['pdf_url'], doc['name']) for doc in self.documents]
-            results = await asyncio.gather(*tasks)
-            
-            for result in results:
-                if result.get('status') == 'success': 
-                    successful_downloads += 1
-                else: 
-                    failed_downloads += 1
+        tasks = [self._download_pdf(doc['pdf_url'], doc['name']) for doc in self.documents]
+        results = await asyncio.gather(*tasks)
+        
+        for result in results:
+            if result.get('status') == 'success': 
+                successful_downloads += 1
+            else: 
+                failed_downloads += 1
         
         self.successful_downloads = successful_downloads
         self.failed_downloads = failed_downloads
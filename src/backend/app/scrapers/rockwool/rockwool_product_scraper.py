@@ -11,17 +11,26 @@ Key Features:
 - Extracts a hidden JSON block containing all product data.
 - Parses product information (name, category, PDF URL).
 - Downloads all related PDF documents with robust duplicate handling.
+- Incremental: diffs the parsed list against the last saved state,
+  re-checks unchanged datasheets with a conditional request (a 304 when
+  the file is current) and only hands files whose content changed
+  downstream.
 """
 import asyncio
 import logging
 import json
-import httpx
 import re
 import hashlib
 import html
 from pathlib import Path
+from typing import Dict, List, Optional
 from urllib.parse import urljoin
 
+from app.scrapers.download_engine import DownloadEngine
+from app.scrapers.http_client import get_scraping_client
+from app.scrapers.rockwool.rockwool_state_diff import (
+    ScrapeDelta, compute_content_hash, diff_scrape
+)
 from app.utils import get_project_root
 
 # --- Configuration ---
@@ -66,12 +75,19 @@ class RockwoolProductScraper:
     Scrapes Rockwool product datasheets by parsing embedded JSON data.
     """
 
-    def __init__(self):
+    def __init__(self, full_refresh: bool = False):
         self.documents = []
         self.downloaded_files = set()
         self.duplicate_count = 0
         self.successful_downloads = 0
         self.failed_downloads = 0
+        self.downloader = DownloadEngine()
+
+        # Incremental mode: only added/changed documents are downloaded
+        self.full_refresh = full_refresh
+        self.delta: Optional[ScrapeDelta] = None
+        self.file_paths: Dict[str, str] = {}  # pdf_url -> local path
+        self.changed_files: List[str] = []  # new content for the PDF pipeline
 
     async def fetch_page_content(self) -> str:
         """
@@ -81,25 +97,24 @@ class RockwoolProductScraper:
         logger.info("🌐 Fetching LIVE page content from Rockwool website...")
         
         try:
-            async with httpx.AsyncClient(
-                timeout=30.0, follow_redirects=True
-            ) as client:
-                response = await client.get(DATASHEET_URL)
-                response.raise_for_status()
-                logger.info("✅ Successfully fetched LIVE page content!")
-                
-                # Optional: Save current content for debugging purposes only
-                # (but never use it as fallback)
-                try:
-                    with open(DEBUG_FILE_PATH, 'w', encoding='utf-8') as f:
-                        f.write(response.text)
-                    logger.info(f"📄 Debug copy saved to: {DEBUG_FILE_PATH}")
-                except Exception as save_error:
-                    logger.warning(
-                        f"⚠️  Could not save debug copy: {save_error}"
-                    )
-                
-                return response.text
+            response = await get_scraping_client().get(
+                DATASHEET_URL, timeout=30.0
+            )
+            response.raise_for_status()
+            logger.info("✅ Successfully fetched LIVE page content!")
+            
+            # Optional: Save current content for debugging purposes only
+            # (but never use it as fallback)
+            try:
+                with open(DEBUG_FILE_PATH, 'w', encoding='utf-8') as f:
+                    f.write(response.text)
+                logger.info(f"📄 Debug copy saved to: {DEBUG_FILE_PATH}")
+            except Exception as save_error:
+                logger.warning(
+                    f"⚠️  Could not save debug copy: {save_error}"
+                )
+            
+            return response.text
                 
         except Exception as e:
             logger.error(f"❌ LIVE fetch failed: {e}")
@@ -158,7 +173,8 @@ class RockwoolProductScraper:
                     self.documents.append({
                         "name": item.get("title", "Unnamed Product"),
                         "category": item.get("category", "Uncategorized"),
-                        "pdf_url": urljoin(BASE_URL, pdf_url)
+                        "pdf_url": urljoin(BASE_URL, pdf_url),
+                        "content_hash": compute_content_hash(item),
                     })
 
             logger.info(
@@ -170,30 +186,84 @@ class RockwoolProductScraper:
         except Exception as e:
             logger.error(f"An unexpected error occurred during parsing: {e}")
 
-    async def download_all_pdfs(self):
+    async def compute_delta(self) -> Optional[ScrapeDelta]:
         """
-        Downloads all discovered PDFs with duplicate handling.
+        Diffs the parsed documents against the latest saved state.
+        Returns None when there is no previous state to compare with.
         """
-        if not self.documents:
+        from .rockwool_state_manager import load_latest_rockwool_state
+
+        try:
+            previous_state = await load_latest_rockwool_state()
+        except Exception as e:
+            logger.warning(f"⚠️  Could not load previous state: {e}")
+            previous_state = None
+
+        if previous_state is None:
+            logger.info("No previous state found, running a full scrape.")
+            self.delta = None
+        else:
+            self.delta = diff_scrape(
+                self.documents,
+                previous_state.products,
+                previous_state.state_id,
+            )
+        return self.delta
+
+    def _select_downloads(self) -> List[dict]:
+        """
+        Documents to fetch. The metadata hash cannot see a datasheet that
+        was revised under the same URL, so unchanged entries are fetched
+        too, into their previous local file: the download engine sends a
+        conditional request and the server answers 304 if it is current.
+        """
+        if self.full_refresh or self.delta is None:
+            return self.documents
+
+        selected = list(self.delta.to_process)
+        rechecked = 0
+        for doc in self.delta.unchanged:
+            previous_path = doc.get('previous_file_path')
+            if previous_path and Path(previous_path).exists():
+                # Keep its filename reserved for the duplicate handling
+                if Path(previous_path).parent == PDF_STORAGE_DIR:
+                    self.downloaded_files.add(Path(previous_path).name)
+                selected.append({**doc, 'target_path': previous_path})
+                rechecked += 1
+            else:
+                selected.append(doc)
+
+        logger.info(
+            f"🔁 Re-checking {rechecked} unchanged documents with conditional "
+            f"requests, {len(selected) - rechecked} to download."
+        )
+        return selected
+
+    async def download_all_pdfs(self, documents: Optional[List[dict]] = None):
+        """
+        Downloads the given PDFs (default: all discovered) with duplicate
+        handling.
+        """
+        if documents is None:
+            documents = self.documents
+        if not documents:
             logger.warning("No documents to download.")
             return
 
         logger.info(
-            f"Starting download of {len(self.documents)} "
+            f"Starting download of {len(documents)} "
             "product datasheets..."
         )
 
-        async with httpx.AsyncClient(
-            timeout=60.0, follow_redirects=True
-        ) as session:
-            tasks = [self._download_pdf(session, doc) for doc in self.documents]
-            results = await asyncio.gather(*tasks, return_exceptions=True)
+        # Per-host rate limit and concurrency cap come from the shared client
+        tasks = [self._download_pdf(doc) for doc in documents]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
 
-            for res in results:
-                if isinstance(res, dict) and res.get('status') == 'success':
-                    self.successful_downloads += 1
-                else:
-                    self.failed_downloads += 1
+        for res in results:
+            if isinstance(res, dict) and res.get('status') == 'success':
+                self.successful_downloads += 1
+            else:
+                self.failed_downloads += 1
 
     def _generate_unique_filename(
             self, base_filename: str, pdf_url: str
@@ -203,14 +273,17 @@ class RockwoolProductScraper:
         url_hash = hashlib.md5(pdf_url.encode()).hexdigest()[:8]
         return f"{name_part}_{url_hash}{extension}"
 
-    async def _download_pdf(self, session: httpx.AsyncClient, doc: dict):
+    async def _download_pdf(self, doc: dict):
         """Downloads a single PDF document."""
         pdf_url = doc['pdf_url']
         safe_name = clean_filename(doc['name'])
         base_filename = f"{safe_name}.pdf"
 
+        if doc.get('target_path'):
+            # Unchanged metadata: refresh the existing local copy in place
+            filepath = Path(doc['target_path'])
         # Check if filename already exists in our tracking set
-        if base_filename in self.downloaded_files:
+        elif base_filename in self.downloaded_files:
             # This is a duplicate - generate name and save to duplicates
             unique_filename = self._generate_unique_filename(
                 base_filename, pdf_url
@@ -228,13 +301,16 @@ class RockwoolProductScraper:
 
         logger.info(f"Downloading: {doc['name']} from {pdf_url}")
         try:
-            response = await session.get(pdf_url)
-            response.raise_for_status()
-
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
-
-            return {'status': 'success', 'path': str(filepath)}
+            # Streamed to disk; an unchanged datasheet only costs a 304
+            result = await self.downloader.download(pdf_url, filepath, timeout=60.0)
+            self.file_paths[pdf_url] = str(filepath)
+            if result.changed:
+                self.changed_files.append(str(filepath))
+            return {
+                'status': 'success',
+                'path': str(filepath),
+                'changed': result.changed,
+            }
         except Exception as e:
             logger.error(f"Failed to download {doc['name']}: {e}")
             return {'status': 'failed', 'name': doc['name'], 'error': str(e)}
@@ -248,6 +324,13 @@ class RockwoolProductScraper:
         logger.info(f"✅ Successful Downloads: {self.successful_downloads}")
         logger.info(f"❌ Failed Downloads: {self.failed_downloads}")
         logger.info(f"🔄 Duplicates Found: {self.duplicate_count}")
+        if self.delta is not None:
+            summary = self.delta.summary()
+            logger.info(
+                f"🔍 Delta: +{summary['added']} ~{summary['changed']} "
+                f"-{summary['removed']} (unchanged: {summary['unchanged']})"
+            )
+        logger.info(f"🆕 Files for PDF pipeline: {len(self.changed_files)}")
         logger.info(f"📂 Main Storage: {PDF_STORAGE_DIR.resolve()}")
         if self.duplicate_count > 0:
             logger.info(f"📂 Duplicates Storage: {DUPLICATES_DIR.resolve()}")
@@ -260,11 +343,14 @@ class RockwoolProductScraper:
         )
         html_content = await self.fetch_page_content()
         self.parse_products_from_html(html_content)
-        await self.download_all_pdfs()
+        await self.compute_delta()
+        await self.download_all_pdfs(self._select_downloads())
         self._log_summary()
         
-        # Save state after successful scraping
-        await self.save_scraping_state()
+        # Save state after successful scraping (an empty parse would make
+        # the next run treat the whole catalogue as removed/added)
+        if self.documents:
+            await self.save_scraping_state()
         
         logger.info("--- Rockwool Product Scraper Finished ---")
 
@@ -276,20 +362,19 @@ class RockwoolProductScraper:
             # Prepare products data for state manager
             products_data = []
             for doc in self.documents:
-                # Find corresponding file info from downloads
-                file_info = None
-                for downloaded_file in self.downloaded_files:
-                    if doc['name'] in downloaded_file:
-                        file_info = downloaded_file
-                        break
+                file_path = self.file_paths.get(doc['pdf_url'])
+                file_size = None
+                if file_path and Path(file_path).exists():
+                    file_size = Path(file_path).stat().st_size
                 
                 product_data = {
                     'name': doc['name'],
                     'category': doc.get('category', 'Termékadatlapok'),
                     'pdf_url': doc['pdf_url'],
-                    'file_path': file_info,
-                    'file_size_bytes': None,  # Could be enhanced to get actual size
-                    'is_duplicate': False  # Will be determined by state manager
+                    'file_path': file_path,
+                    'file_size_bytes': file_size,
+                    'is_duplicate': False,  # Will be determined by state manager
+                    'content_hash': doc.get('content_hash'),
                 }
                 products_data.append(product_data)
             
@@ -299,7 +384,10 @@ class RockwoolProductScraper:
                 'successful_downloads': self.successful_downloads,
                 'failed_downloads': self.failed_downloads,
                 'duplicates_found': self.duplicate_count,
-                'scraper_type': 'product_datasheets'
+                'scraper_type': 'product_datasheets',
+                'delta': self.delta.summary() if self.delta else None,
+                'removed_products': self.delta.removed if self.delta else [],
+                'changed_files': len(self.changed_files),
             }
             
             # Add config
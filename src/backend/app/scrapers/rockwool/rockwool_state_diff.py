@@ -0,0 +1,128 @@
+"""
+Rockwool State Diff - Inkrementális scraping változásdetektálás
+---------------------------------------------------------------
+
+Az új `downloadList` elemeit összeveti a legutóbbi mentett állapottal
+(RockwoolStateManager) URL és tartalom hash alapján, és csak a
+változásokat adja vissza:
+
+- added:     új PDF URL
+- changed:   ismert URL, de más tartalom hash (név, kategória, fájl adatok)
+- unchanged: ismert URL, azonos hash - csak feltételes kéréssel (304)
+             ellenőrizzük, hogy a fájl maga sem változott-e
+- removed:   az előző állapotban szerepelt, a mostani listában nem
+
+A hash csak a metaadatokat fedi le; a fájl tartalmának változását a
+letöltő motor feltételes kérése (ETag / Last-Modified) jelzi. Így egy
+változatlan katalógus éjszakai futása szinte semmi munkát nem végez.
+"""
+import hashlib
+import json
+import logging
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+def compute_content_hash(entry: Dict[str, Any]) -> str:
+    """
+    Stabil hash egy `downloadList` elemről. A kulcsok rendezve kerülnek a
+    JSON-ba, így a mezők sorrendje nem számít.
+    """
+    canonical = json.dumps(entry, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+@dataclass
+class ScrapeDelta:
+    """Két scraping állapot közötti különbség."""
+    added: List[Dict[str, Any]] = field(default_factory=list)
+    changed: List[Dict[str, Any]] = field(default_factory=list)
+    unchanged: List[Dict[str, Any]] = field(default_factory=list)
+    removed: List[Dict[str, Any]] = field(default_factory=list)
+    previous_state_id: Optional[str] = None
+
+    @property
+    def has_changes(self) -> bool:
+        return bool(self.added or self.changed or self.removed)
+
+    @property
+    def to_process(self) -> List[Dict[str, Any]]:
+        """Letöltendő és feldolgozandó dokumentumok (új + változott)."""
+        return self.added + self.changed
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'previous_state_id': self.previous_state_id,
+            'added': len(self.added),
+            'changed': len(self.changed),
+            'unchanged': len(self.unchanged),
+            'removed': len(self.removed),
+        }
+
+
+def _product_field(product: Any, name: str) -> Any:
+    if isinstance(product, dict):
+        return product.get(name)
+    return getattr(product, name, None)
+
+
+def diff_scrape(
+    current_documents: Iterable[Dict[str, Any]],
+    previous_products: Optional[Iterable[Any]] = None,
+    previous_state_id: Optional[str] = None,
+) -> ScrapeDelta:
+    """
+    Különbség számítása az aktuális dokumentumok és az előző állapot
+    termékei között. Mindkét oldal `pdf_url` szerint indexelt, így a
+    művelet O(n + m).
+
+    Args:
+        current_documents: Az új parse eredménye (`pdf_url`, `content_hash`)
+        previous_products: Előző állapot termékei (RockwoolProduct vagy dict)
+        previous_state_id: Az előző állapot azonosítója (naplózáshoz)
+
+    Returns:
+        ScrapeDelta; az `unchanged` elemekhez az előző `file_path` is
+        hozzá van rendelve `previous_file_path` kulcs alatt.
+    """
+    previous_by_url: Dict[str, Any] = {}
+    for product in previous_products or []:
+        url = _product_field(product, 'pdf_url')
+        if url and not _product_field(product, 'is_duplicate'):
+            previous_by_url[url] = product
+
+    delta = ScrapeDelta(previous_state_id=previous_state_id)
+    seen_urls = set()
+    for doc in current_documents:
+        url = doc['pdf_url']
+        if url in seen_urls:
+            continue
+        seen_urls.add(url)
+
+        previous = previous_by_url.get(url)
+        if previous is None:
+            delta.added.append(doc)
+        elif _product_field(previous, 'content_hash') != doc.get('content_hash'):
+            delta.changed.append(doc)
+        else:
+            delta.unchanged.append(
+                {**doc, 'previous_file_path': _product_field(previous, 'file_path')}
+            )
+
+    for url, product in previous_by_url.items():
+        if url not in seen_urls:
+            delta.removed.append({
+                'name': _product_field(product, 'name'),
+                'category': _product_field(product, 'category'),
+                'pdf_url': url,
+                'file_path': _product_field(product, 'file_path'),
+            })
+
+    logger.info(
+        "🔍 Változások az előző állapothoz (%s) képest: +%d ~%d -%d (=%d)",
+        previous_state_id or '-', len(delta.added), len(delta.changed),
+        len(delta.removed), len(delta.unchanged)
+    )
+    return delta
@@ -51,6 +51,7 @@ class RockwoolProduct:
     scraped_at: str = None
     is_duplicate: bool = False
     hash_id: Optional[str] = None
+    content_hash: Optional[str] = None
     
     def __post_init__(self):
         if self.scraped_at is None:
@@ -112,7 +113,8 @@ class RockwoolStateManager:
                 file_path=item.get('file_path'),
                 file_size_bytes=item.get('file_size_bytes'),
                 scraped_at=timestamp,
-                is_duplicate=item.get('is_duplicate', False)
+                is_duplicate=item.get('is_duplicate', False),
+                content_hash=item.get('content_hash')
             )
             products.append(product)
         
@@ -148,7 +150,7 @@ class RockwoolStateManager:
         self.state_history.append(state)
         
         logger.info(f"✅ Új állapot létrehozva: {state_id}")
-        logger.info(f"📊 Termékek: {len(products)} (ebből {statistics['duplicates']} duplikátum)")
+        logger.info(f"📊 Termékek: {len(products)} (ebből {statistics.get('duplicates', statistics.get('duplicates_found', 0))} duplikátum)")
         
         return state
     
@@ -225,10 +227,16 @@ class RockwoolStateManager:
                 file_size_bytes INTEGER,
                 is_duplicate BOOLEAN,
                 scraped_at TEXT,
+                content_hash TEXT,
                 FOREIGN KEY (state_id) REFERENCES scraping_states (state_id)
             )
         ''')
         
+        # Régebbi adatbázisok migrálása
+        columns = {row[1] for row in cursor.execute("PRAGMA table_info(products)")}
+        if 'content_hash' not in columns:
+            cursor.execute("ALTER TABLE products ADD COLUMN content_hash TEXT")
+        
         # Insert data
         cursor.execute('''
             INSERT OR REPLACE INTO scraping_states 
@@ -243,13 +251,13 @@ class RockwoolStateManager:
             cursor.execute('''
                 INSERT OR REPLACE INTO products 
                 (hash_id, state_id, name, category, pdf_url, file_path, 
-                 file_size_bytes, is_duplicate, scraped_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                 file_size_bytes, is_duplicate, scraped_at, content_hash)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             ''', (
                 product.hash_id, state.state_id, product.name, 
                 product.category, product.pdf_url, product.file_path,
                 product.file_size_bytes, product.is_duplicate, 
-                product.scraped_at
+                product.scraped_at, product.content_hash
             ))
         
         conn.commit()
@@ -258,6 +266,29 @@ class RockwoolStateManager:
         logger.info(f"🗃️  SQLite mentve: {db_filepath}")
         return db_filepath
     
+    async def load_state_from_json(self, filepath: Path) -> RockwoolScrapingState:
+        """Állapot betöltése egy korábbi JSON mentésből"""
+        with open(filepath, 'r', encoding='utf-8') as f:
+            state_dict = json.load(f)
+        
+        known_fields = set(RockwoolProduct.__dataclass_fields__)
+        products = [
+            RockwoolProduct(**{k: v for k, v in p.items() if k in known_fields})
+            for p in state_dict.get('products', [])
+        ]
+        state = RockwoolScrapingState(
+            state_id=state_dict.get('state_id'),
+            timestamp=state_dict.get('timestamp'),
+            scraper_version=state_dict.get('scraper_version', ''),
+            products=products,
+            statistics=state_dict.get('statistics', {}),
+            config=state_dict.get('config', {})
+        )
+        
+        self.current_state = state
+        logger.info(f"📂 Állapot betöltve: {filepath} ({len(products)} termék)")
+        return state
+    
     async def create_snapshot(self, name: str = None) -> Path:
         """
         Pillanatkép létrehozása a jelenlegi állapotról
@@ -0,0 +1,217 @@
+"""
+AI Response Cache
+-----------------
+Content-addressed, persistent cache for Claude responses.
+
+The cache key is a SHA-256 hash of the prompt template version, the model
+parameters that influence the answer, and the fully rendered prompt. Any
+change to the raw text, tables, filename, template or model therefore
+produces a new key, while byte-identical reruns are served from disk.
+
+Entries are stored in a small SQLite database and evicted by TTL and by
+least-recently-used order once `max_entries` is exceeded.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from app.config.ai_config import AIModelConfig, get_ai_config
+from app.paths import BACKEND_DIR
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_PATH = BACKEND_DIR / "cache" / "ai_response_cache.sqlite3"
+
+
+class AIResponseCache:
+    """SQLite-backed response cache with TTL and size eviction."""
+
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        ttl_seconds: int = 30 * 24 * 3600,
+        max_entries: int = 10000,
+        enabled: bool = True,
+    ):
+        self.db_path = Path(db_path) if db_path else DEFAULT_CACHE_PATH
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.enabled = enabled
+
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0}
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS ai_responses (
+                cache_key TEXT PRIMARY KEY,
+                model_name TEXT,
+                response_text TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_accessed REAL NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_ai_responses_last_accessed "
+            "ON ai_responses (last_accessed)"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def build_key(
+        template_text: str, model_config: AIModelConfig, prompt: str
+    ) -> str:
+        """Hashes (template version, model config, rendered prompt)."""
+        template_version = hashlib.sha256(
+            template_text.encode("utf-8")
+        ).hexdigest()
+        model_part = json.dumps(
+            {
+                "provider": model_config.provider,
+                "model_name": model_config.model_name,
+                "temperature": model_config.temperature,
+                "max_tokens": model_config.max_tokens,
+            },
+            sort_keys=True,
+        )
+        digest = hashlib.sha256()
+        for part in (template_version, model_part, prompt):
+            digest.update(part.encode("utf-8"))
+            digest.update(b"\x00")
+        return digest.hexdigest()
+
+    def get(self, cache_key: str) -> Optional[str]:
+        """Returns the cached response text or None on miss/expiry."""
+        if not self.enabled:
+            return None
+
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT response_text, created_at FROM ai_responses "
+                "WHERE cache_key = ?",
+                (cache_key,),
+            ).fetchone()
+
+            if row is None:
+                self.stats["misses"] += 1
+                return None
+
+            response_text, created_at = row
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                self._conn.execute(
+                    "DELETE FROM ai_responses WHERE cache_key = ?",
+                    (cache_key,),
+                )
+                self._conn.commit()
+                self.stats["misses"] += 1
+                self.stats["evictions"] += 1
+                return None
+
+            self._conn.execute(
+                "UPDATE ai_responses SET last_accessed = ? "
+                "WHERE cache_key = ?",
+                (now, cache_key),
+            )
+            self._conn.commit()
+            self.stats["hits"] += 1
+            return response_text
+
+    def set(
+        self, cache_key: str, response_text: str, model_name: str = ""
+    ):
+        """Stores a response and enforces the size limit."""
+        if not self.enabled:
+            return
+
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO ai_responses "
+                "(cache_key, model_name, response_text, created_at, last_accessed) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (cache_key, model_name, response_text, now, now),
+            )
+            self.stats["writes"] += 1
+            self._evict_locked(now)
+            self._conn.commit()
+
+    def _evict_locked(self, now: float):
+        """Removes expired entries and trims to max_entries (LRU)."""
+        evicted = 0
+        if self.ttl_seconds:
+            evicted += self._conn.execute(
+                "DELETE FROM ai_responses WHERE created_at < ?",
+                (now - self.ttl_seconds,),
+            ).rowcount
+
+        if self.max_entries:
+            count = self._conn.execute(
+                "SELECT COUNT(*) FROM ai_responses"
+            ).fetchone()[0]
+            overflow = count - self.max_entries
+            if overflow > 0:
+                evicted += self._conn.execute(
+                    "DELETE FROM ai_responses WHERE cache_key IN ("
+                    "SELECT cache_key FROM ai_responses "
+                    "ORDER BY last_accessed ASC LIMIT ?)",
+                    (overflow,),
+                ).rowcount
+
+        self.stats["evictions"] += max(evicted, 0)
+
+    def clear(self) -> int:
+        """Deletes all entries and returns how many were removed."""
+        with self._lock:
+            removed = self._conn.execute(
+                "DELETE FROM ai_responses"
+            ).rowcount
+            self._conn.commit()
+        return removed
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Returns hit/miss counters and current cache size."""
+        with self._lock:
+            entries = self._conn.execute(
+                "SELECT COUNT(*) FROM ai_responses"
+            ).fetchone()[0]
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "enabled": self.enabled,
+            "entries": entries,
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hit_rate": round(self.stats["hits"] / lookups, 4) if lookups else 0.0,
+            "db_path": str(self.db_path),
+        }
+
+
+# Global cache instance
+_ai_response_cache = None
+
+
+def get_ai_response_cache() -> AIResponseCache:
+    """Get the process-wide AI response cache, configured from AIModelConfig."""
+    global _ai_response_cache
+    if _ai_response_cache is None:
+        model_config = get_ai_config().get_model_config()
+        _ai_response_cache = AIResponseCache(
+            db_path=model_config.response_cache_path,
+            ttl_seconds=model_config.response_cache_ttl_seconds,
+            max_entries=model_config.response_cache_max_entries,
+            enabled=model_config.response_cache_enabled,
+        )
+    return _ai_response_cache
@@ -2,16 +2,42 @@
 import os
 import json
 import logging
+import random
 import re
+import asyncio
+import threading
+import weakref
 from typing import Dict, List, Any
 
-from anthropic import Anthropic
+from anthropic import (
+    AsyncAnthropic,
+    APIConnectionError,
+    APIStatusError,
+    APITimeoutError,
+)
 
 # REFACTORING: Import the new AI configuration system
 from app.config.ai_config import get_ai_config
+from app.services.ai_response_cache import AIResponseCache, get_ai_response_cache
 
 logger = logging.getLogger(__name__)
 
+# Concurrency limit shared by every AnalysisService instance. asyncio
+# primitives are bound to one event loop, so there is one semaphore per loop.
+_api_semaphores: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_api_semaphores_lock = threading.Lock()
+
+
+def _get_api_semaphore(max_concurrent_requests: int) -> asyncio.Semaphore:
+    """Returns the running loop's Claude API semaphore, creating it once."""
+    loop = asyncio.get_running_loop()
+    with _api_semaphores_lock:
+        semaphore = _api_semaphores.get(loop)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(max(1, max_concurrent_requests))
+            _api_semaphores[loop] = semaphore
+    return semaphore
+
 
 class AnalysisService:
     """
@@ -40,13 +66,23 @@ class AnalysisService:
                 "❌ ANTHROPIC_API_KEY not found in environment variables"
             )
         
-        self.client = Anthropic(api_key=api_key)
-        
         # DECOUPLING: Load all AI configuration from external sources
         self.config = get_ai_config()
         self.model_config = self.config.get_model_config()
         self.prompt_templates = self.config.get_prompt_templates()
 
+        # ASYNC: Non-blocking client. Retries are handled by _make_api_call
+        # so that backoff and concurrency limiting stay under our control.
+        self.client = AsyncAnthropic(
+            api_key=api_key,
+            base_url=self.model_config.base_url,
+            timeout=float(self.model_config.timeout_seconds),
+            max_retries=0,
+        )
+        
+        # CACHING: Byte-identical prompts are served from the response cache
+        self.response_cache = get_ai_response_cache()
+
         logger.info(f"✅ Analysis Service initialized with model: {self.model_config.model_name}")
         logger.info(f"📊 Configuration: temp={self.model_config.temperature}, "
                    f"max_tokens={self.model_config.max_tokens}")
@@ -55,12 +91,14 @@ class AnalysisService:
         self,
         text_content: str,
         tables_data: List[Dict],
-        filename: str
+        filename: str,
+        use_cache: bool = True
     ) -> Dict[str, Any]:
         """
         Analyzes PDF content using a multi-step process:
         1. Creates a detailed prompt.
-        2. Makes a robust API call to the AI model.
+        2. Makes a robust API call to the AI model (or reuses a cached
+           response for a byte-identical prompt).
         3. Parses the structured JSON response.
 
         This method is the primary entry point for AI analysis.
@@ -69,6 +107,7 @@ class AnalysisService:
             text_content: Raw text extracted from the PDF.
             tables_data: List of table dictionaries from the PDF.
             filename: The name of the source PDF file.
+            use_cache: Set to False to bypass the response cache.
 
         Returns:
             A dictionary containing the structured analysis results.
@@ -81,12 +120,30 @@ class AnalysisService:
                 filename=filename
             )
             
-            # Step 2: Make the API call using the generated prompt
-            response_text = await self._make_api_call(prompt)
+            # Step 2: Reuse a cached response or make the API call
+            cache_key = AIResponseCache.build_key(
+                self.prompt_templates.extraction_prompt,
+                self.model_config,
+                prompt
+            )
+            response_text = (
+                self.response_cache.get(cache_key) if use_cache else None
+            )
+            from_cache = response_text is not None
+            if not from_cache:
+                response_text = await self._make_api_call(prompt)
             
             # Step 3: Parse the structured JSON from the AI's response
             parsed_response = self._parse_response(response_text)
             
+            # Only cache responses that parsed into a usable result
+            if use_cache and not from_cache and "error" not in parsed_response.get(
+                "extraction_metadata", {}
+            ):
+                self.response_cache.set(
+                    cache_key, response_text, self.model_config.model_name
+                )
+            
             return parsed_response
 
         except Exception as e:
@@ -120,6 +177,12 @@ class AnalysisService:
         
         REFACTORING: Token limits, retry logic, and API parameters are now
         externally configurable instead of hardcoded constants.
+        
+        CONCURRENCY: Calls are awaited on the async client, so the event loop
+        keeps running other tasks. At most `max_concurrent_requests` calls
+        are in flight per event loop, across all service instances; each one is bounded by
+        `timeout_seconds`, and 429/5xx responses are retried with
+        exponential backoff up to `max_retries` times.
         """
         # EXTERNALIZED: All parameters come from configuration
         max_tokens = self.model_config.max_tokens
@@ -129,13 +192,9 @@ class AnalysisService:
 
         while max_tokens >= min_tokens:
             try:
-                response = self.client.messages.create(
-                    model=self.model_config.model_name,  # EXTERNALIZED: Model name
-                    max_tokens=max_tokens,
-                    temperature=self.model_config.temperature,  # EXTERNALIZED: Temperature
-                    messages=[{"role": "user", "content": prompt}],
+                return await self._create_message_with_backoff(
+                    prompt, max_tokens
                 )
-                return response.content[0].text
             except Exception as e:
                 last_error = e
                 if "max_tokens" in str(e):
@@ -151,6 +210,57 @@ class AnalysisService:
         logger.error("Failed to get a response from Claude after reducing tokens.")
         raise last_error or RuntimeError("Unknown API call failure.")
 
+    async def _create_message_with_backoff(
+        self, prompt: str, max_tokens: int
+    ) -> str:
+        """
+        Sends a single message request, retrying transient failures.
+        
+        Rate limits (429), server errors (5xx), timeouts and connection
+        errors are retried with jittered exponential backoff. The semaphore
+        slot is released while sleeping so waiting calls do not starve
+        other requests.
+        """
+        attempt = 0
+        while True:
+            try:
+                async with _get_api_semaphore(
+                    self.model_config.max_concurrent_requests
+                ):
+                    response = await self.client.messages.create(
+                        model=self.model_config.model_name,  # EXTERNALIZED: Model name
+                        max_tokens=max_tokens,
+                        temperature=self.model_config.temperature,  # EXTERNALIZED: Temperature
+                        messages=[{"role": "user", "content": prompt}],
+                        timeout=float(self.model_config.timeout_seconds),
+                    )
+                return response.content[0].text
+            except Exception as e:
+                if not self._is_retryable_error(e) or attempt >= self.model_config.max_retries:
+                    raise
+                delay = self._get_backoff_delay(attempt)
+                attempt += 1
+                logger.warning(
+                    f"Transient Claude API error ({e.__class__.__name__}). "
+                    f"Retry {attempt}/{self.model_config.max_retries} in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+
+    @staticmethod
+    def _is_retryable_error(error: Exception) -> bool:
+        """Returns True for rate limit, server, timeout and connection errors."""
+        if isinstance(error, (APITimeoutError, APIConnectionError)):
+            return True
+        if isinstance(error, APIStatusError):
+            return error.status_code == 429 or error.status_code >= 500
+        return False
+
+    def _get_backoff_delay(self, attempt: int) -> float:
+        """Exponential backoff with full jitter, capped by configuration."""
+        base = self.model_config.retry_backoff_seconds * (2 ** attempt)
+        capped = min(base, self.model_config.max_backoff_seconds)
+        return random.uniform(capped / 2, capped)
+
     def _parse_response(self, response_text: str) -> Dict[str, Any]:
         """
         Parses the JSON response from the AI, cleaning it if necessary.
@@ -224,7 +334,8 @@ class AnalysisService:
             "temperature": model_config.temperature,
             "max_tokens": model_config.max_tokens,
             "timeout_seconds": model_config.timeout_seconds,
-            "max_retries": model_config.max_retries
+            "max_retries": model_config.max_retries,
+            "max_concurrent_requests": model_config.max_concurrent_requests
         }
 
     # Backward compatibility shim
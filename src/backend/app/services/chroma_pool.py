@@ -0,0 +1,253 @@
+"""
+ChromaDB Connection Pool
+------------------------
+Application-lifetime ChromaDB client for the search endpoints.
+
+Instead of building a new `HttpClient` (plus heartbeat and fallback
+attempts) on every request, one client is kept per process and reused.
+Collection handles and collection counts are cached; a background thread
+heartbeats the active endpoint and fails over to the next configured one
+when it stops answering.
+
+Writers call `notify_ingest()` after adding documents, which bumps the
+collection version and invalidates the cached count. Other caches can
+subscribe to these events with `add_ingest_listener()`.
+"""
+
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ENDPOINTS = "chroma:8000,localhost:8001"
+
+
+def _parse_endpoints(value: str) -> List[Tuple[str, int]]:
+    """Parses 'host:port,host:port' into a list of (host, port) tuples."""
+    endpoints = []
+    for item in value.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        host, _, port = item.partition(":")
+        endpoints.append((host, int(port or 8000)))
+    return endpoints
+
+
+class ChromaConnectionPool:
+    """Shared ChromaDB client with cached collections and endpoint failover."""
+
+    def __init__(
+        self,
+        endpoints: Optional[List[Tuple[str, int]]] = None,
+        health_check_interval: float = 15.0,
+        count_ttl_seconds: float = 60.0,
+    ):
+        self.endpoints = endpoints or _parse_endpoints(
+            os.getenv("CHROMA_ENDPOINTS", DEFAULT_ENDPOINTS)
+        )
+        self.health_check_interval = health_check_interval
+        self.count_ttl_seconds = count_ttl_seconds
+
+        self._client = None
+        self._active_endpoint: Optional[Tuple[str, int]] = None
+        self._collections: Dict[str, Any] = {}
+        self._counts: Dict[str, Tuple[int, float]] = {}
+        self._versions: Dict[str, int] = {}
+        self._listeners: List[Callable[[Optional[str]], None]] = []
+        self._lock = threading.RLock()
+
+        self._health_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
+        self.stats = {"connects": 0, "failovers": 0, "failed_heartbeats": 0}
+
+    # --- Connection management -------------------------------------------
+
+    def _connect(self, preferred: Optional[Tuple[str, int]] = None):
+        """Connects to the first endpoint that answers a heartbeat."""
+        import chromadb
+        from chromadb.config import Settings
+
+        candidates = list(self.endpoints)
+        if preferred in candidates:
+            candidates.remove(preferred)
+            candidates.insert(0, preferred)
+
+        last_error: Optional[Exception] = None
+        for host, port in candidates:
+            try:
+                client = chromadb.HttpClient(
+                    host=host,
+                    port=port,
+                    settings=Settings(anonymized_telemetry=False),
+                )
+                client.heartbeat()
+            except Exception as e:
+                last_error = e
+                logger.warning(f"ChromaDB endpoint {host}:{port} unavailable: {e}")
+                continue
+
+            if self._active_endpoint and self._active_endpoint != (host, port):
+                self.stats["failovers"] += 1
+                logger.warning(f"🔁 ChromaDB failover to {host}:{port}")
+            self._client = client
+            self._active_endpoint = (host, port)
+            self._collections.clear()
+            self.stats["connects"] += 1
+            logger.info(f"✅ ChromaDB connected to {host}:{port}")
+            return client
+
+        self._client = None
+        raise ConnectionError(f"No ChromaDB endpoint available: {last_error}")
+
+    def get_client(self):
+        """Returns the shared client, connecting on first use."""
+        with self._lock:
+            if self._client is None:
+                self._connect(self._active_endpoint)
+            return self._client
+
+    def get_collection(self, name: str):
+        """Returns a cached collection handle."""
+        with self._lock:
+            collection = self._collections.get(name)
+            if collection is None:
+                collection = self.get_client().get_collection(name)
+                self._collections[name] = collection
+            return collection
+
+    def check_health(self) -> bool:
+        """Heartbeats the active endpoint and fails over if it is down."""
+        with self._lock:
+            client = self._client
+        if client is None:
+            return False
+        try:
+            client.heartbeat()
+            return True
+        except Exception as e:
+            self.stats["failed_heartbeats"] += 1
+            logger.warning(f"ChromaDB heartbeat failed: {e}")
+
+        with self._lock:
+            try:
+                self._connect()
+                return True
+            except ConnectionError as e:
+                logger.error(f"ChromaDB unavailable: {e}")
+                return False
+
+    def invalidate_connection(self):
+        """Drops the client so the next request reconnects (e.g. after an error)."""
+        with self._lock:
+            self._client = None
+            self._collections.clear()
+
+    # --- Background health checker ---------------------------------------
+
+    def start_health_checker(self):
+        """Starts the daemon thread that heartbeats the active endpoint."""
+        if self._health_thread and self._health_thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._health_thread = threading.Thread(
+            target=self._health_loop, name="chroma-health", daemon=True
+        )
+        self._health_thread.start()
+
+    def stop_health_checker(self):
+        self._stop_event.set()
+        if self._health_thread:
+            self._health_thread.join(timeout=self.health_check_interval)
+            self._health_thread = None
+
+    def _health_loop(self):
+        while not self._stop_event.wait(self.health_check_interval):
+            if self._client is None:
+                try:
+                    self.get_client()
+                except ConnectionError:
+                    continue
+            else:
+                self.check_health()
+            # Refresh counts in the background so requests never block on them
+            for name in list(self._collections):
+                self._refresh_count(name)
+
+    # --- Collection counts and ingest events -----------------------------
+
+    def _refresh_count(self, name: str) -> int:
+        try:
+            count = self.get_collection(name).count()
+        except Exception as e:
+            logger.warning(f"Could not count collection '{name}': {e}")
+            return self._counts.get(name, (0, 0.0))[0]
+        self._counts[name] = (count, time.time())
+        return count
+
+    def collection_count(self, name: str, max_age: Optional[float] = None) -> int:
+        """
+        Cached document count, refreshed after ingest events or once it is
+        older than `max_age` (default: `count_ttl_seconds`).
+        """
+        if max_age is None:
+            max_age = self.count_ttl_seconds
+        cached = self._counts.get(name)
+        if cached and time.time() - cached[1] < max_age:
+            return cached[0]
+        return self._refresh_count(name)
+
+    def collection_version(self, name: str) -> int:
+        """Monotonic counter bumped on every ingest into the collection."""
+        return self._versions.get(name, 0)
+
+    def notify_ingest(self, name: Optional[str] = None):
+        """
+        Marks a collection (or all, if name is None) as changed: the cached
+        count is dropped, the version is bumped and listeners are notified.
+        """
+        with self._lock:
+            names = [name] if name else list(set(self._versions) | set(self._counts))
+            for collection_name in names:
+                self._counts.pop(collection_name, None)
+                self._versions[collection_name] = (
+                    self._versions.get(collection_name, 0) + 1
+                )
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(name)
+            except Exception as e:
+                logger.warning(f"Ingest listener failed: {e}")
+
+    def add_ingest_listener(self, listener: Callable[[Optional[str]], None]):
+        """Registers a callback invoked with the collection name on ingest."""
+        with self._lock:
+            self._listeners.append(listener)
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "active_endpoint": (
+                f"{self._active_endpoint[0]}:{self._active_endpoint[1]}"
+                if self._active_endpoint else None
+            ),
+            "connected": self._client is not None,
+            "cached_collections": list(self._collections),
+            "collection_versions": dict(self._versions),
+        }
+
+
+# Global pool instance
+_chroma_pool = None
+
+
+def get_chroma_pool() -> ChromaConnectionPool:
+    """Get the process-wide ChromaDB connection pool."""
+    global _chroma_pool
+    if _chroma_pool is None:
+        _chroma_pool = ChromaConnectionPool()
+    return _chroma_pool
@@ -0,0 +1,368 @@
+"""
+Incremental PostgreSQL -> ChromaDB Sync
+---------------------------------------
+Keeps the product documents of the RAG collection in step with the
+`products` table without re-embedding the whole catalogue.
+
+Per product, the content hash of the document text and metadata that was
+last written to ChromaDB is kept in a local SQLite state file, together
+with a per-collection watermark on `coalesce(updated_at, created_at)`.
+A sync then
+
+1. reads only rows changed since the watermark, in keyset-paginated
+   batches with their category eagerly loaded,
+2. upserts only the documents whose hash changed (a price update, which
+   is not part of the document, costs no embedding at all), in bounded
+   batches, and
+3. deletes the documents of products that no longer exist.
+
+A full sync walks every product by id instead of the watermark; it is
+used for the first run, when the collection lost documents, or when
+category names changed (they do not touch `products.updated_at`).
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from sqlalchemy import and_, func, or_
+from sqlalchemy.orm import joinedload
+
+from app.database import SessionLocal
+from app.models.product import Product
+from app.paths import BACKEND_DIR
+from app.services.chroma_pool import get_chroma_pool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SYNC_STATE_PATH = BACKEND_DIR / "cache" / "chroma_sync_state.sqlite3"
+SYNC_COLLECTION = "pdf_products"
+PRODUCT_ID_PREFIX = "product_"
+
+
+def build_product_document(product: Product) -> Tuple[str, Dict[str, Any]]:
+    """Document text and metadata of one product, as stored in ChromaDB."""
+    doc_text = f"{product.name}\n{product.description or ''}"
+    if product.technical_specs:
+        for key, value in product.technical_specs.items():
+            if isinstance(value, dict):
+                val = value.get('value', '')
+                unit = value.get('unit', '')
+                doc_text += f"\n{key}: {val} {unit}"
+            else:
+                doc_text += f"\n{key}: {value}"
+
+    metadata = {
+        'product_id': product.id,
+        'name': product.name,
+        'category': product.category.name if product.category else 'Unknown',
+        'doc_type': 'Termék',
+    }
+    return doc_text, metadata
+
+
+def document_hash(doc_text: str, metadata: Dict[str, Any]) -> str:
+    canonical = json.dumps(
+        [doc_text, metadata], sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class ChromaSyncStateStore:
+    """SQLite-backed synced hashes and watermarks per collection."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path else DEFAULT_SYNC_STATE_PATH
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS synced_products (
+                collection TEXT NOT NULL,
+                product_id INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                synced_at REAL NOT NULL,
+                PRIMARY KEY (collection, product_id)
+            )
+            """
+        )
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sync_watermarks (
+                collection TEXT PRIMARY KEY,
+                changed_at TEXT NOT NULL,
+                synced_at REAL NOT NULL
+            )
+            """
+        )
+        self._conn.commit()
+
+    def get_hashes(self, collection: str, product_ids: List[int]) -> Dict[int, str]:
+        if not product_ids:
+            return {}
+        placeholders = ",".join("?" * len(product_ids))
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT product_id, content_hash FROM synced_products "
+                f"WHERE collection = ? AND product_id IN ({placeholders})",
+                (collection, *product_ids),
+            ).fetchall()
+        return dict(rows)
+
+    def product_ids(self, collection: str) -> Set[int]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT product_id FROM synced_products WHERE collection = ?",
+                (collection,),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def mark_synced(self, collection: str, hashes: Dict[int, str]):
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO synced_products "
+                "(collection, product_id, content_hash, synced_at) "
+                "VALUES (?, ?, ?, ?)",
+                [(collection, pid, h, now) for pid, h in hashes.items()],
+            )
+            self._conn.commit()
+
+    def remove(self, collection: str, product_ids: List[int]):
+        with self._lock:
+            self._conn.executemany(
+                "DELETE FROM synced_products "
+                "WHERE collection = ? AND product_id = ?",
+                [(collection, pid) for pid in product_ids],
+            )
+            self._conn.commit()
+
+    def get_watermark(self, collection: str) -> Optional[datetime]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT changed_at FROM sync_watermarks WHERE collection = ?",
+                (collection,),
+            ).fetchone()
+        return datetime.fromisoformat(row[0]) if row else None
+
+    def set_watermark(self, collection: str, changed_at: datetime):
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_watermarks "
+                "(collection, changed_at, synced_at) VALUES (?, ?, ?)",
+                (collection, changed_at.isoformat(), time.time()),
+            )
+            self._conn.commit()
+
+    def clear(self, collection: str):
+        """Forgets everything synced to a collection (forces a full sync)."""
+        with self._lock:
+            self._conn.execute(
+                "DELETE FROM synced_products WHERE collection = ?", (collection,)
+            )
+            self._conn.execute(
+                "DELETE FROM sync_watermarks WHERE collection = ?", (collection,)
+            )
+            self._conn.commit()
+
+
+class ChromaSyncEngine:
+    """Incremental, hash-checked product sync into one ChromaDB collection."""
+
+    def __init__(
+        self,
+        session_factory=None,
+        collection_name: str = SYNC_COLLECTION,
+        state_store: Optional[ChromaSyncStateStore] = None,
+        collection=None,
+        read_batch_size: int = 500,
+        write_batch_size: int = 100,
+        overlap_seconds: float = 5.0,
+    ):
+        """
+        Args:
+            read_batch_size: Rows per keyset page read from PostgreSQL.
+            write_batch_size: Documents per ChromaDB upsert/delete call.
+            overlap_seconds: The watermark is re-read with this overlap,
+                so rows committed late with an earlier timestamp are not
+                missed. Re-read rows with unchanged hashes cost nothing.
+        """
+        self.session_factory = session_factory or SessionLocal
+        self.collection_name = collection_name
+        self.state = state_store or ChromaSyncStateStore()
+        self._collection = collection
+        self.read_batch_size = read_batch_size
+        self.write_batch_size = write_batch_size
+        self.overlap = timedelta(seconds=overlap_seconds)
+
+    @property
+    def collection(self):
+        if self._collection is None:
+            self._collection = get_chroma_pool().get_client().get_or_create_collection(
+                name=self.collection_name,
+                metadata={'description': 'ROCKWOOL PDF products'}
+            )
+        return self._collection
+
+    def sync(self, full: bool = False) -> Dict[str, Any]:
+        """
+        Runs one sync and returns its statistics.
+
+        Args:
+            full: Walk all products instead of the rows changed since the
+                watermark. Only changed documents are written either way.
+        """
+        start = time.perf_counter()
+        stats = {
+            'mode': 'full' if full else 'incremental',
+            'read': 0, 'upserted': 0, 'unchanged': 0, 'deleted': 0,
+        }
+
+        known_ids = self.state.product_ids(self.collection_name)
+        watermark = self.state.get_watermark(self.collection_name)
+        if self._collection_lost_documents(known_ids):
+            logger.warning(
+                "⚠️ ChromaDB collection '%s' has fewer documents than synced, "
+                "resyncing all products", self.collection_name
+            )
+            self.state.clear(self.collection_name)
+            known_ids, watermark = set(), None
+        if watermark is None:
+            stats['mode'] = 'full'
+        if stats['mode'] == 'full':
+            # Product documents written outside this engine (or before it)
+            known_ids |= self._collection_product_ids()
+
+        session = self.session_factory()
+        try:
+            since = None if stats['mode'] == 'full' else watermark - self.overlap
+            newest = watermark
+            pending: Dict[int, Tuple[str, Dict[str, Any], str]] = {}
+
+            for products in self._iter_changed(session, since):
+                stats['read'] += len(products)
+                synced_hashes = self.state.get_hashes(
+                    self.collection_name, [p.id for p in products]
+                )
+                for product in products:
+                    changed_at = product.updated_at or product.created_at
+                    if changed_at and (newest is None or changed_at > newest):
+                        newest = changed_at
+
+                    doc_text, metadata = build_product_document(product)
+                    content_hash = document_hash(doc_text, metadata)
+                    if synced_hashes.get(product.id) == content_hash:
+                        stats['unchanged'] += 1
+                        continue
+                    pending[product.id] = (doc_text, metadata, content_hash)
+                    if len(pending) >= self.write_batch_size:
+                        stats['upserted'] += self._flush(pending)
+
+            stats['upserted'] += self._flush(pending)
+
+            current_ids = {row[0] for row in session.query(Product.id)}
+        finally:
+            session.close()
+
+        stats['deleted'] = self._delete_missing(known_ids - current_ids)
+        if newest is not None:
+            self.state.set_watermark(self.collection_name, newest)
+        if stats['upserted'] or stats['deleted']:
+            get_chroma_pool().notify_ingest(self.collection_name)
+
+        stats['elapsed_seconds'] = round(time.perf_counter() - start, 3)
+        logger.info(
+            "🔄 ChromaDB sync (%s): %d read, %d upserted, %d unchanged, "
+            "%d deleted in %.3fs", stats['mode'], stats['read'],
+            stats['upserted'], stats['unchanged'], stats['deleted'],
+            stats['elapsed_seconds']
+        )
+        return stats
+
+    def _iter_changed(self, session, since: Optional[datetime]) -> Iterator[List[Product]]:
+        """
+        Yields pages of products, keyset-paginated on (changed_at, id), or
+        on id alone for a full walk. Categories are loaded with the page.
+        """
+        changed_at = func.coalesce(Product.updated_at, Product.created_at)
+        last: Optional[Tuple[Any, int]] = None
+
+        while True:
+            query = session.query(Product).options(joinedload(Product.category))
+            if since is None:
+                if last is not None:
+                    query = query.filter(Product.id > last[1])
+                query = query.order_by(Product.id)
+            else:
+                if last is None:
+                    query = query.filter(changed_at >= since)
+                else:
+                    query = query.filter(or_(
+                        changed_at > last[0],
+                        and_(changed_at == last[0], Product.id > last[1]),
+                    ))
+                query = query.order_by(changed_at, Product.id)
+
+            products = query.limit(self.read_batch_size).all()
+            if not products:
+                return
+            yield products
+            tail = products[-1]
+            last = (tail.updated_at or tail.created_at, tail.id)
+            # Free the page before reading the next one
+            session.expunge_all()
+
+    def _flush(self, pending: Dict[int, Tuple[str, Dict[str, Any], str]]) -> int:
+        if not pending:
+            return 0
+        product_ids = list(pending)
+        self.collection.upsert(
+            ids=[f"{PRODUCT_ID_PREFIX}{pid}" for pid in product_ids],
+            documents=[pending[pid][0] for pid in product_ids],
+            metadatas=[pending[pid][1] for pid in product_ids],
+        )
+        self.state.mark_synced(
+            self.collection_name,
+            {pid: pending[pid][2] for pid in product_ids},
+        )
+        pending.clear()
+        return len(product_ids)
+
+    def _delete_missing(self, product_ids: Set[int]) -> int:
+        deleted = 0
+        ordered = sorted(product_ids)
+        for start in range(0, len(ordered), self.write_batch_size):
+            batch = ordered[start:start + self.write_batch_size]
+            self.collection.delete(
+                ids=[f"{PRODUCT_ID_PREFIX}{pid}" for pid in batch]
+            )
+            self.state.remove(self.collection_name, batch)
+            deleted += len(batch)
+        return deleted
+
+    def _collection_product_ids(self) -> Set[int]:
+        """Product ids that have a document in the collection."""
+        result = self.collection.get(where={'doc_type': 'Termék'}, include=[])
+        product_ids = set()
+        for doc_id in result.get('ids', []):
+            if doc_id.startswith(PRODUCT_ID_PREFIX):
+                try:
+                    product_ids.add(int(doc_id[len(PRODUCT_ID_PREFIX):]))
+                except ValueError:
+                    pass
+        return product_ids
+
+    def _collection_lost_documents(self, known_ids: Set[int]) -> bool:
+        """True if the collection holds fewer documents than we synced."""
+        return bool(known_ids) and self.collection.count() < len(known_ids)
@@ -1,14 +1,22 @@
 
 import logging
+import random
+import time
+from collections import Counter
 from pathlib import Path
-from typing import Dict, List, Tuple, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Iterator, List, Tuple, Any, Optional
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 
-import fitz  # PyMuPDF
-import pdfplumber
 import PyPDF2
 
+from app.services.parsed_document import ParsedDocument
+from app.services.page_checkpoint_store import PageCheckpointStore
+from app.services.table_method_stats import (
+    TableMethodStatsStore, document_family, get_table_method_stats_store
+)
+from app.utils import compute_file_sha256
+
 # Advanced table extraction imports (optional)
 try:
     import camelot
@@ -24,6 +32,24 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Score multiplier per table method in `_calculate_quality_score`
+METHOD_QUALITY_BONUS = {
+    'camelot_lattice': 1.0,
+    'camelot_stream': 0.9,
+    'tabula': 0.8,
+    'pymupdf_advanced': 0.7,
+    'pdfplumber_backup': 0.6,
+}
+
+# Adaptive early-exit score per method. A method without accuracy data
+# peaks at 100 × bonus × 0.5, so a flat threshold would let the fallbacks
+# stop the search at their ceiling; they are not listed and never exit early.
+DEFAULT_EARLY_EXIT_THRESHOLDS = {
+    'camelot_lattice': 50.0,
+    'camelot_stream': 45.0,
+    'tabula': 40.0,
+}
+
 
 @dataclass
 class TableExtractionResult:
@@ -38,75 +64,144 @@ class TableExtractionResult:
         return asdict(self)
 
 
+@dataclass
+class PageRecord:
+    """Text and tables of a single PDF page"""
+    page_number: int
+    text: str
+    tables: List[Dict[str, Any]] = field(default_factory=list)
+    from_checkpoint: bool = False
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
 class RealPDFExtractor:
     """Real PDF text extraction using multiple methods"""
     
-    def __init__(self):
+    def __init__(self, checkpoint_store: Optional[PageCheckpointStore] = None):
         self.extraction_methods = ["pdfplumber", "pypdf2", "pymupdf"]
+        self.checkpoint_store = checkpoint_store
         self.stats = {
             "pages_processed": 0,
             "text_extracted": 0,
             "tables_found": 0,
         }
     
-    def extract_text_pdfplumber(
-        self, pdf_path: Path
-    ) -> Tuple[str, List[Dict]]:
-        """Extract text and tables using pdfplumber (primary method)"""
-        
-        text_content = ""
-        tables_data = []
-        total_cells = 0
+    def iter_pages(
+        self,
+        pdf_path: Path,
+        document: Optional[ParsedDocument] = None,
+        file_hash: Optional[str] = None
+    ) -> Iterator[PageRecord]:
+        """
+        Stream pdfplumber page records (page number, text, tables) one page
+        at a time.
+        
+        With a checkpoint store configured, every page is persisted as soon
+        as it is extracted, keyed by the file's content hash and page number.
+        Pages already checkpointed for the same file are yielded from the
+        store without re-extraction.
+        
+        Args:
+            pdf_path: Path to the PDF file
+            document: Optional shared ParsedDocument
+            file_hash: Content hash of the file, computed if not given
+        """
+        store = self.checkpoint_store
+        if store and not file_hash:
+            file_hash = compute_file_sha256(pdf_path)
         
-        pdf = None
+        owns_document = document is None
+        if owns_document:
+            document = ParsedDocument(pdf_path)
         try:
-            pdf = pdfplumber.open(pdf_path)
-            for page_num, page in enumerate(pdf.pages):
+            for page_num in range(document.page_count):
+                page_number = page_num + 1
                 try:
-                    # Extract text from page
-                    page_text = page.extract_text()
-                    if page_text:
-                        text_content += f"\n\n--- Page {page_num + 1} ---\n{page_text}"
+                    if store:
+                        checkpoint = store.get(file_hash, page_number)
+                        if checkpoint is not None:
+                            yield PageRecord(
+                                page_number=page_number,
+                                text=checkpoint["text"],
+                                tables=checkpoint["tables"],
+                                from_checkpoint=True
+                            )
+                            continue
                     
-                    # Extract tables from page
-                    page_tables = page.extract_tables()
-                    for table_idx, table in enumerate(page_tables):
+                    page_text = document.page_text(page_num)
+                    page_tables = []
+                    for table_idx, table in enumerate(document.page_tables(page_num)):
                         if table and len(table) > 0:
                             rows = len(table)
                             cols = len(table[0]) if table[0] else 0
-                            cells = rows * cols
-                            total_cells += cells
-                            
-                            tables_data.append({
-                                "page": page_num + 1,
+                            page_tables.append({
+                                "page": page_number,
                                 "table_index": table_idx,
                                 "data": table,
                                 "rows": rows,
                                 "columns": cols,
-                                "total_cells": cells,
+                                "total_cells": rows * cols,
                                 "headers": table[0] if table else [],
                                 "extraction_method": "pdfplumber"
                             })
+                    
+                    if store:
+                        store.put(
+                            file_hash, page_number, page_text, page_tables
+                        )
+                    self.stats["pages_processed"] += 1
+                    yield PageRecord(
+                        page_number=page_number,
+                        text=page_text,
+                        tables=page_tables
+                    )
                 except Exception as page_error:
-                    logger.warning(f"Error processing page {page_num + 1}: {page_error}")
+                    logger.warning(f"Error processing page {page_number}: {page_error}")
                     continue
+        finally:
+            # ✅ CRITICAL: Explicit file handle cleanup for Windows
+            if owns_document:
+                document.close()
+    
+    def extract_text_pdfplumber(
+        self,
+        pdf_path: Path,
+        document: Optional[ParsedDocument] = None,
+        file_hash: Optional[str] = None
+    ) -> Tuple[str, List[Dict]]:
+        """
+        Extract text and tables using pdfplumber (primary method)
+        
+        Built on iter_pages: the text is joined in a single pass and, with a
+        checkpoint store, only missing pages are extracted.
         
+        Args:
+            pdf_path: Path to the PDF file
+            document: Optional shared ParsedDocument; pages already parsed by
+                another consumer are reused instead of re-parsed.
+            file_hash: Optional content hash used as the checkpoint key
+        """
+        text_parts = []
+        tables_data = []
+        
+        try:
+            for record in self.iter_pages(pdf_path, document, file_hash):
+                if record.text:
+                    text_parts.append(
+                        f"\n\n--- Page {record.page_number} ---\n{record.text}"
+                    )
+                tables_data.extend(record.tables)
         except Exception as e:
             logger.error(f"PDFPlumber extraction failed: {e}")
             raise
-        finally:
-            # ✅ CRITICAL: Explicit file handle cleanup for Windows
-            if pdf:
-                try:
-                    pdf.close()
-                except:
-                    pass
         
-        return text_content, tables_data
+        return "".join(text_parts), tables_data
     
     def extract_text_pypdf2(self, pdf_path: Path) -> str:
         """Fallback extraction using PyPDF2"""
-        text_content = ""
+        text_parts = []
         
         try:
             with open(pdf_path, 'rb') as file:
@@ -115,7 +210,7 @@ class RealPDFExtractor:
                 for page_num, page in enumerate(pdf_reader.pages):
                     page_text = page.extract_text()
                     if page_text:
-                        text_content += (
+                        text_parts.append(
                             f"\\n\\n--- Page {page_num + 1} ---\\n{page_text}"
                         )
         
@@ -123,73 +218,60 @@ class RealPDFExtractor:
             logger.error(f"PyPDF2 extraction failed: {e}")
             raise
         
-        return text_content
+        return "".join(text_parts)
     
     def extract_text_pymupdf(
-        self, pdf_path: Path
+        self, pdf_path: Path, document: Optional[ParsedDocument] = None
     ) -> Tuple[str, List[Dict]]:
         """Extract text and structured data using PyMuPDF"""
-        text_content = ""
+        text_parts = []
         tables = []
         
-        doc = None
+        owns_document = document is None
+        if owns_document:
+            document = ParsedDocument(pdf_path)
         try:
-            doc = fitz.open(pdf_path)
-            
-            for page_num in range(len(doc)):
-                page = None
+            for page_num in range(document.page_count):
                 try:
-                    page = doc.load_page(page_num)
-                    
                     # Extract text
-                    page_text = page.get_text()
+                    page_text = document.fitz_page_text(page_num)
                     if page_text:
-                        text_content += (
+                        text_parts.append(
                             f"\\n\\n--- Page {page_num + 1} ---\\n{page_text}"
                         )
-                    
-                    # Extract tables (simplified)
-                    # Note: PyMuPDF table extraction requires additional processing
-                    blocks = page.get_text("dict")
-                    for block in blocks.get("blocks", []):
-                        if "lines" in block:
-                            # Process text blocks that might contain tabular data
-                            pass
-                            
                 except Exception as page_error:
                     logger.warning(f"Error processing PyMuPDF page {page_num + 1}: {page_error}")
                     continue
-                finally:
-                    # Clean up page object
-                    if page:
-                        try:
-                            del page
-                        except:
-                            pass
             
         except Exception as e:
             logger.error(f"PyMuPDF extraction failed: {e}")
             raise
         finally:
             # ✅ CRITICAL: Explicit document cleanup for Windows
-            if doc:
-                try:
-                    doc.close()
-                except:
-                    pass
+            if owns_document:
+                document.close()
         
-        return text_content, tables
+        return "".join(text_parts), tables
     
     def extract_pdf_content(
-        self, pdf_path: Path
+        self,
+        pdf_path: Path,
+        document: Optional[ParsedDocument] = None,
+        file_hash: Optional[str] = None
     ) -> Tuple[str, List[Dict], str]:
-        """Extract PDF content using best available method"""
+        """
+        Extract PDF content using best available method
+        
+        Pass a shared ParsedDocument to reuse page parses across extractors.
+        """
         
         logger.info(f"🔍 Extracting PDF content: {pdf_path.name}")
         
         # Try pdfplumber first (best for tables)
         try:
-            text, tables = self.extract_text_pdfplumber(pdf_path)
+            text, tables = self.extract_text_pdfplumber(
+                pdf_path, document, file_hash
+            )
             if text.strip():
                 # Calculate total dimensions for logging
                 total_cells = sum(t.get('total_cells', 0) for t in tables)
@@ -223,7 +305,7 @@ class RealPDFExtractor:
         
         # Last resort: PyMuPDF
         try:
-            text, tables = self.extract_text_pymupdf(pdf_path)
+            text, tables = self.extract_text_pymupdf(pdf_path, document)
             if text.strip():
                 cell_count = sum(
                     len(t.get('data', [])) * len(t.get('data', [[]])[0]) 
@@ -249,15 +331,40 @@ class AdvancedTableExtractor:
     1. CAMELOT (elsődleges eszköz)
     2. Deep Learning validáció 
     3. Manuális végső ellenőrzés
+    
+    Adaptív módban (alapértelmezés) a módszerek a dokumentumcsalád
+    (pl. rockwool_datasheet, leier_pricelist) korábbi nyerési aránya
+    szerint futnak, az első, a módszer saját küszöbét
+    (`early_exit_thresholds`) elérő eredménynél megállnak, és csak a
+    táblázatra utaló oldalakat (vonalazás vagy rácsszerű szóelrendezés)
+    dolgozzák fel. A tartalék módszereknek (pymupdf, pdfplumber) nincs
+    küszöbük, ezek után a keresés folytatódik. `explore_rate` eséllyel egy
+    futás mégis minden módszert kipróbál, hogy a statisztika friss maradjon.
     """
     
-    def __init__(self):
+    def __init__(
+        self,
+        adaptive: bool = True,
+        early_exit_thresholds: Optional[Dict[str, float]] = None,
+        explore_rate: float = 0.05,
+        stats_store: Optional[TableMethodStatsStore] = None
+    ):
         self.extraction_methods = []
+        self.adaptive = adaptive
+        self.early_exit_thresholds = (
+            DEFAULT_EARLY_EXIT_THRESHOLDS if early_exit_thresholds is None
+            else early_exit_thresholds
+        )
+        self.explore_rate = explore_rate
+        self._stats_store = stats_store
         self.stats = {
             'camelot_success': 0,
             'tabula_success': 0,
             'fallback_used': 0,
-            'total_extractions': 0
+            'total_extractions': 0,
+            'early_exits': 0,
+            'methods_run': 0,
+            'pages_skipped': 0
         }
         
         # Initialize available methods
@@ -281,7 +388,72 @@ class AdvancedTableExtractor:
         
         logger.info(f"Table extraction methods available: {len(self.extraction_methods)}")
     
-    def extract_tables_hybrid(self, pdf_path: Path) -> TableExtractionResult:
+    @property
+    def stats_store(self) -> TableMethodStatsStore:
+        if self._stats_store is None:
+            self._stats_store = get_table_method_stats_store()
+        return self._stats_store
+    
+    def _page_has_table_layout(self, document: ParsedDocument, page_index: int) -> bool:
+        """
+        Olcsó előszűrés: vonalazás (vízszintes és függőleges élek) vagy
+        legalább 3 sorban ismétlődő, 3+ oszlopos szóelrendezés.
+        """
+        edges = document.page_edges(page_index)
+        horizontal = sum(
+            1 for e in edges if e['orientation'] == 'h' and e['x1'] - e['x0'] > 20
+        )
+        vertical = sum(
+            1 for e in edges if e['orientation'] == 'v' and e['bottom'] - e['top'] > 8
+        )
+        if horizontal >= 3 and vertical >= 2 or horizontal >= 4:
+            return True
+        
+        rows: Dict[int, List[float]] = {}
+        for word in document.page_words(page_index):
+            rows.setdefault(round(word['top'] / 3), []).append(word['x0'])
+        wide_rows = [xs for xs in rows.values() if len(xs) >= 3]
+        if len(wide_rows) < 3:
+            return False
+        column_hits = Counter(
+            x for xs in wide_rows for x in {round(x0 / 5) for x0 in xs}
+        )
+        aligned_columns = sum(1 for hits in column_hits.values() if hits >= 3)
+        return aligned_columns >= 3
+    
+    def _candidate_pages(self, document: ParsedDocument) -> List[int]:
+        """Táblázatot valószínűleg tartalmazó oldalak (1-től számozva)."""
+        pages = []
+        for page_index in range(document.page_count):
+            try:
+                if self._page_has_table_layout(document, page_index):
+                    pages.append(page_index + 1)
+            except Exception as e:
+                logger.debug(f"Layout check failed on page {page_index + 1}: {e}")
+                pages.append(page_index + 1)
+        self.stats['pages_skipped'] += document.page_count - len(pages)
+        return pages
+    
+    @staticmethod
+    def _camelot_pages(pages: Optional[List[int]]) -> str:
+        return ','.join(str(page) for page in pages) if pages else 'all'
+    
+    @staticmethod
+    def _page_indices(document: ParsedDocument, pages: Optional[List[int]]) -> List[int]:
+        if pages is None:
+            return list(range(document.page_count))
+        return [page - 1 for page in pages]
+    
+    def _ordered_methods(self, family: str, explore: bool):
+        if not self.adaptive or explore:
+            return list(self.extraction_methods)
+        by_name = dict(self.extraction_methods)
+        ranked = self.stats_store.rank_methods(family, list(by_name))
+        return [(name, by_name[name]) for name in ranked]
+    
+    def extract_tables_hybrid(
+        self, pdf_path: Path, document: Optional[ParsedDocument] = None
+    ) -> Optional[TableExtractionResult]:
         """
         🚀 Hibrid táblázat kinyerés ROCKWOOL PDF-ekhez
         
@@ -289,21 +461,50 @@ class AdvancedTableExtractor:
         1. CAMELOT (elsődleges)
         2. Deep Learning validáció
         3. Manuális ellenőrzés
+        
+        A pymupdf és pdfplumber módszerek a megosztott ParsedDocument
+        oldalait használják, ha meg van adva. None, ha adaptív módban
+        egyetlen oldal sem tűnik táblázatnak (nem futott kinyerés).
         """
         
         start_time = datetime.now()
         logger.info(f"🔍 Advanced table extraction: {pdf_path.name}")
         
+        owns_document = document is None
+        if owns_document:
+            document = ParsedDocument(pdf_path)
+        try:
+            return self._extract_tables_with_document(
+                pdf_path, document, start_time
+            )
+        finally:
+            if owns_document:
+                document.close()
+    
+    def _extract_tables_with_document(
+        self, pdf_path: Path, document: ParsedDocument, start_time: datetime
+    ) -> Optional[TableExtractionResult]:
         best_result = None
         best_score = 0
         extraction_attempts = []
         
-        # Try each extraction method
-        for method_name, method_func in self.extraction_methods:
+        family = document_family(pdf_path)
+        explore = self.adaptive and random.random() < self.explore_rate
+        pages = None
+        if self.adaptive and not explore:
+            pages = self._candidate_pages(document)
+            if not pages:
+                logger.info("⏭️ No table-like pages, skipping table extraction")
+                return None
+        timings: Dict[str, float] = {}
+        
+        # Try each extraction method (historically best first in adaptive mode)
+        for method_name, method_func in self._ordered_methods(family, explore):
+            method_started = time.perf_counter()
             try:
                 logger.info(f"📊 Trying {method_name}...")
                 
-                tables = method_func(pdf_path)
+                tables = method_func(pdf_path, document, pages)
                 quality_score = self._calculate_quality_score(tables)
                 
                 extraction_attempts.append({
@@ -331,6 +532,31 @@ class AdvancedTableExtractor:
                     'success': False
                 })
                 continue
+            finally:
+                timings[method_name] = time.perf_counter() - method_started
+                self.stats['methods_run'] += 1
+            
+            # Early exit: good enough, skip the remaining (slower) methods
+            threshold = self.early_exit_thresholds.get(
+                best_result['method'] if best_result else None
+            )
+            if (
+                self.adaptive and not explore and threshold is not None
+                and best_score >= threshold
+            ):
+                self.stats['early_exits'] += 1
+                logger.info(
+                    f"⏹️ {best_result['method']} reached its quality threshold, stopping"
+                )
+                break
+        
+        if self.adaptive:
+            try:
+                self.stats_store.record(
+                    family, timings, best_result['method'] if best_result else None
+                )
+            except Exception as e:
+                logger.warning(f"Could not record table method stats: {e}")
         
         # Deep Learning Validáció
         if best_result and best_result['quality_score'] > 0.5:
@@ -371,7 +597,12 @@ class AdvancedTableExtractor:
             processing_time=processing_time
         )
     
-    def _camelot_lattice(self, pdf_path: Path) -> List[Dict]:
+    def _camelot_lattice(
+        self,
+        pdf_path: Path,
+        document: Optional[ParsedDocument] = None,
+        pages: Optional[List[int]] = None
+    ) -> List[Dict]:
         """Extract tables using CAMELOT lattice method"""
         
         tables = []
@@ -381,7 +612,7 @@ class AdvancedTableExtractor:
             camelot_tables = camelot.read_pdf(
                 str(pdf_path), 
                 flavor='lattice',
-                pages='all'
+                pages=self._camelot_pages(pages)
             )
             
             for i, table in enumerate(camelot_tables):
@@ -395,6 +626,8 @@ class AdvancedTableExtractor:
                                 "page": table.page,
                                 "data": table_data,
                                 "extraction_method": "camelot_lattice",
+                                "method": "camelot_lattice",
+                                "accuracy": table.parsing_report.get('accuracy', 50) / 100,
                                 "rows": len(table_data),
                                 "columns": len(table_data[0]) if table_data else 0,
                                 "parsing_report": {
@@ -429,7 +662,12 @@ class AdvancedTableExtractor:
         
         return tables
     
-    def _camelot_stream(self, pdf_path: Path) -> List[Dict]:
+    def _camelot_stream(
+        self,
+        pdf_path: Path,
+        document: Optional[ParsedDocument] = None,
+        pages: Optional[List[int]] = None
+    ) -> List[Dict]:
         """CAMELOT Stream method - for tables without borders"""
         
         if not CAMELOT_AVAILABLE:
@@ -438,7 +676,7 @@ class AdvancedTableExtractor:
         tables = camelot.read_pdf(
             str(pdf_path),
             flavor='stream',
-            pages='all',
+            pages=self._camelot_pages(pages),
             row_tol=10,  # Row tolerance
             column_tol=0  # Column tolerance
         )
@@ -462,7 +700,12 @@ class AdvancedTableExtractor:
         
         return extracted_tables
     
-    def _tabula_extract(self, pdf_path: Path) -> List[Dict]:
+    def _tabula_extract(
+        self,
+        pdf_path: Path,
+        document: Optional[ParsedDocument] = None,
+        pages: Optional[List[int]] = None
+    ) -> List[Dict]:
         """TABULA extraction - Java-based reliable fallback"""
         
         if not TABULA_AVAILABLE:
@@ -482,7 +725,7 @@ class AdvancedTableExtractor:
             try:
                 tables = tabula.read_pdf(
                     str(pdf_path),
-                    pages='all',
+                    pages=pages or 'all',
                     **strategy
                 )
                 
@@ -511,21 +754,26 @@ class AdvancedTableExtractor:
         
         return extracted_tables
     
-    def _pymupdf_advanced(self, pdf_path: Path) -> List[Dict]:
+    def _pymupdf_advanced(
+        self,
+        pdf_path: Path,
+        document: Optional[ParsedDocument] = None,
+        pages: Optional[List[int]] = None
+    ) -> List[Dict]:
         """PyMuPDF advanced table detection"""
         
-        doc = fitz.open(pdf_path)
+        owns_document = document is None
+        if owns_document:
+            document = ParsedDocument(pdf_path)
         extracted_tables = []
         
-        for page_num in range(len(doc)):
-            page = doc[page_num]
-            
-            # Try to find tables using PyMuPDF
-            try:
-                tables = page.find_tables()
+        try:
+            for page_num in self._page_indices(document, pages):
+                # Try to find tables using PyMuPDF
+                tables = document.fitz_page_tables(page_num)
                 
                 for table_idx, table in enumerate(tables):
-                    table_data = table.extract()
+                    table_data = table['data']
                     
                     if not table_data or len(table_data) < 2:
                         continue
@@ -536,37 +784,44 @@ class AdvancedTableExtractor:
                         'page': page_num + 1,
                         'method': 'pymupdf_advanced',
                         'table_index': table_idx,
-                        'bbox': table.bbox
+                        'bbox': table['bbox']
                     })
-                    
-            except AttributeError:
-                # Fallback if find_tables is not available
-                logger.debug("PyMuPDF find_tables not available, using basic extraction")
-                
-        doc.close()
+        finally:
+            if owns_document:
+                document.close()
         return extracted_tables
     
-    def _pdfplumber_backup(self, pdf_path: Path) -> List[Dict]:
+    def _pdfplumber_backup(
+        self,
+        pdf_path: Path,
+        document: Optional[ParsedDocument] = None,
+        pages: Optional[List[int]] = None
+    ) -> List[Dict]:
         """PDFPlumber backup method"""
         
         tables = []
         
+        owns_document = document is None
+        if owns_document:
+            document = ParsedDocument(pdf_path)
         try:
-            with pdfplumber.open(pdf_path) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    page_tables = page.extract_tables()
-                    
-                    for table_idx, table in enumerate(page_tables):
-                        if table and len(table) > 1:
-                            tables.append({
-                                'data': table,
-                                'headers': table[0] if table else [],
-                                'page': page_num + 1,
-                                'method': 'pdfplumber_backup',
-                                'table_index': table_idx
-                            })
+            for page_num in self._page_indices(document, pages):
+                page_tables = document.page_tables(page_num)
+                
+                for table_idx, table in enumerate(page_tables):
+                    if table and len(table) > 1:
+                        tables.append({
+                            'data': table,
+                            'headers': table[0] if table else [],
+                            'page': page_num + 1,
+                            'method': 'pdfplumber_backup',
+                            'table_index': table_idx
+                        })
         except Exception as e:
             logger.error(f"PDFPlumber backup failed: {e}")
+        finally:
+            if owns_document:
+                document.close()
         
         return tables
     
@@ -607,16 +862,12 @@ class AdvancedTableExtractor:
             size_score = min(rows * cols / 20, 1.0)  # Normalize by 20 cells
             
             # Method bonus
-            method_bonus = {
-                'camelot_lattice': 1.0,
-                'camelot_stream': 0.9,
-                'tabula': 0.8,
-                'pymupdf_advanced': 0.7,
-                'pdfplumber_backup': 0.6
-            }.get(table.get('method', 'unknown'), 0.5)
+            method_bonus = METHOD_QUALITY_BONUS.get(table.get('method', 'unknown'), 0.5)
             
-            # Accuracy bonus (if available)
+            # Accuracy bonus (if available); camelot reports percentages
             accuracy_bonus = table.get('accuracy', 0.5)
+            if accuracy_bonus > 1:
+                accuracy_bonus /= 100
             
             # Calculate final score
             score = (size_score * method_bonus * accuracy_bonus) * 100
@@ -635,8 +886,12 @@ class AdvancedTableExtractor:
         # Base confidence from quality score
         quality_confidence = min(best_result['quality_score'] / 100, 1.0)
         
-        # Multiple methods agreement bonus
-        method_agreement = len(successful_attempts) / len(attempts)
+        # Multiple methods agreement bonus, only over the methods that were
+        # compared: a single method (early exit) counts as neutral
+        if len(attempts) > 1:
+            method_agreement = len(successful_attempts) / len(attempts)
+        else:
+            method_agreement = 0.5
         
         # Final confidence
         confidence = (quality_confidence * 0.7) + (method_agreement * 0.3)
@@ -1,8 +1,9 @@
 import logging
 import os
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Optional, List, Dict, Any, Sequence, Set, Tuple
 from pathlib import Path
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from app.models.processing_models import PDFExtractionResult
@@ -11,10 +12,16 @@ from app.models.manufacturer import Manufacturer
 from app.models.category import Category
 # from app.models.processed_file_log import ProcessedFileLog
 from app.processing.file_handler import FileHandler
+from app.services.chroma_pool import get_chroma_pool
 
 
 logger = logging.getLogger(__name__)
 
+CHROMA_COLLECTION = "pdf_products"
+
+# Chunks per ChromaDB add/upsert call in batch ingestion
+CHROMA_BATCH_SIZE = 1000
+
 
 class DataIngestionService:
     """Handles all database interactions for PDF processing results."""
@@ -59,7 +66,7 @@ class DataIngestionService:
             
             self.chroma_collection = (
                 self.chroma_client.get_or_create_collection(
-                    name="pdf_products",
+                    name=CHROMA_COLLECTION,
                     metadata={
                         "description": "PDF product data for RAG pipeline"
                     }
@@ -74,24 +81,244 @@ class DataIngestionService:
             self.chroma_collection = None
 
     def ingest_data(
-        self, result: 'PDFExtractionResult', pdf_path_str: str
-    ):
+        self,
+        result: 'PDFExtractionResult',
+        file_hash: str,
+        pdf_path: Optional[Path] = None
+    ) -> Optional[int]:
         """
         Main ingestion method that handles deduplication and database writes.
-        """
-        file_hash = self.file_handler.calculate_file_hash(Path(pdf_path_str))
 
+        `file_hash` is the content hash computed by the caller's FileHandler;
+        the file is recorded in the dedup index only after a successful write.
+        """
         if self.file_handler.is_duplicate(file_hash):
             logger.info(
                 "⏭️ Skipping duplicate file based on hash: %s",
                 result.source_filename
             )
-            return
+            return None
 
         product_id = self.ingest_to_postgresql(result)
         if product_id:
             self.ingest_to_chromadb(result, product_id)
-            self.file_handler.add_hash_to_log(file_hash)
+            self.file_handler.add_hash_to_log(
+                file_hash, pdf_path=pdf_path, product_id=product_id
+            )
+        return product_id
+
+    def ingest_batch(
+        self,
+        results: Sequence['PDFExtractionResult'],
+        file_hashes: Optional[Sequence[str]] = None,
+        pdf_paths: Optional[Sequence[Optional[Path]]] = None,
+        chroma_batch_size: int = CHROMA_BATCH_SIZE
+    ) -> List[Optional[int]]:
+        """
+        Bulk counterpart of `ingest_data` for large loads.
+
+        Manufacturers and categories are resolved once per batch, products
+        are upserted on SKU in a single transaction, and Chroma chunks are
+        written in batched `upsert` calls.
+
+        Args:
+            results: Extraction results to ingest
+            file_hashes: Optional content hashes, parallel to `results`;
+                already indexed files are skipped and new ones recorded
+            pdf_paths: Optional source paths, parallel to `results`
+            chroma_batch_size: Maximum number of chunks per Chroma call
+
+        Returns:
+            Product id per result (None for skipped or failed results)
+        """
+        results = list(results)
+        product_ids: List[Optional[int]] = [None] * len(results)
+        if not results or not self.db_session:
+            return product_ids
+
+        pending = list(range(len(results)))
+        if file_hashes:
+            known = self.file_handler.find_processed_hashes(file_hashes)
+            seen: Set[str] = set()
+            pending = []
+            for index, file_hash in enumerate(file_hashes):
+                if file_hash in known or file_hash in seen:
+                    continue
+                seen.add(file_hash)
+                pending.append(index)
+            skipped = len(results) - len(pending)
+            if skipped:
+                logger.info("⏭️ Skipping %d duplicate files in batch", skipped)
+        if not pending:
+            return product_ids
+
+        try:
+            manufacturers = self._resolve_by_name(
+                Manufacturer,
+                {
+                    results[i].extraction_metadata.get("manufacturer", "ROCKWOOL")
+                    for i in pending
+                },
+                lambda name: {"description": f"{name} products"}
+            )
+            categories = self._resolve_by_name(
+                Category,
+                {self._determine_category(results[i].technical_specs) for i in pending},
+                lambda name: {}
+            )
+
+            rows_by_sku: Dict[str, Dict[str, Any]] = {}
+            sku_by_index: Dict[int, str] = {}
+            for i in pending:
+                result = results[i]
+                values = self._build_product_values(
+                    result,
+                    manufacturers[result.extraction_metadata.get(
+                        "manufacturer", "ROCKWOOL"
+                    )],
+                    categories[self._determine_category(result.technical_specs)]
+                )
+                # Last result wins when two results map to the same SKU
+                rows_by_sku[values["sku"]] = values
+                sku_by_index[i] = values["sku"]
+
+            ids_by_sku = self._upsert_products(list(rows_by_sku.values()))
+            self.db_session.commit()
+        except Exception as e:
+            logger.error("❌ PostgreSQL batch ingestion failed: %s", e)
+            self.db_session.rollback()
+            return product_ids
+
+        for i, sku in sku_by_index.items():
+            product_ids[i] = ids_by_sku.get(sku)
+        logger.info(
+            "✅ Ingested %d products to PostgreSQL in one batch",
+            len(ids_by_sku)
+        )
+
+        self._ingest_batch_to_chromadb(
+            [(results[i], product_ids[i]) for i in pending if product_ids[i]],
+            chroma_batch_size
+        )
+
+        if file_hashes:
+            self.file_handler.add_hashes_to_log(
+                (
+                    file_hashes[i],
+                    pdf_paths[i] if pdf_paths else None,
+                    product_ids[i],
+                )
+                for i in pending if product_ids[i]
+            )
+        return product_ids
+
+    def _resolve_by_name(self, model, names: Set[str], defaults) -> Dict[str, Any]:
+        """Loads rows by name in one query and creates the missing ones."""
+        rows = {
+            row.name: row
+            for row in self.db_session.query(model).filter(model.name.in_(names))
+        }
+        missing = [model(name=name, **defaults(name)) for name in names - rows.keys()]
+        if missing:
+            self.db_session.add_all(missing)
+            self.db_session.flush()
+            rows.update({row.name: row for row in missing})
+        return rows
+
+    def _upsert_products(self, rows: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Inserts or updates products keyed on SKU and returns {sku: id}.
+
+        Uses a single INSERT .. ON CONFLICT on PostgreSQL and SQLite; other
+        dialects fall back to an ORM flush of the new rows.
+        """
+        if not rows:
+            return {}
+
+        dialect = self.db_session.get_bind().dialect.name
+        if dialect in ("postgresql", "sqlite"):
+            if dialect == "postgresql":
+                from sqlalchemy.dialects.postgresql import insert
+            else:
+                from sqlalchemy.dialects.sqlite import insert
+
+            stmt = insert(Product).values(rows)
+            set_ = {
+                column: getattr(stmt.excluded, column)
+                for column in rows[0]
+                if column != "sku"
+            }
+            # Column onupdate is not applied to ON CONFLICT DO UPDATE
+            set_["updated_at"] = func.now()
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[Product.sku],
+                set_=set_
+            ).returning(Product.id, Product.sku)
+            return {sku: product_id for product_id, sku in self.db_session.execute(stmt)}
+
+        existing = {
+            product.sku: product
+            for product in self.db_session.query(Product).filter(
+                Product.sku.in_([row["sku"] for row in rows])
+            )
+        }
+        for row in rows:
+            product = existing.get(row["sku"])
+            if product is None:
+                product = Product(**row)
+                self.db_session.add(product)
+                existing[row["sku"]] = product
+            else:
+                for column, value in row.items():
+                    setattr(product, column, value)
+                product.updated_at = func.now()
+        self.db_session.flush()
+        return {sku: product.id for sku, product in existing.items()}
+
+    def _ingest_batch_to_chromadb(
+        self,
+        items: List[Tuple['PDFExtractionResult', int]],
+        batch_size: int
+    ):
+        """Upserts the chunks of many products in `batch_size` slices."""
+        if not self.chroma_collection or not items:
+            return
+
+        documents: List[str] = []
+        metadatas: List[Dict] = []
+        ids: List[str] = []
+        for result, product_id in items:
+            docs, metas, chunk_ids = self._create_chunked_documents(
+                result, product_id
+            )
+            documents.extend(docs)
+            metadatas.extend(metas)
+            ids.extend(chunk_ids)
+
+        written = 0
+        for start in range(0, len(documents), batch_size):
+            end = start + batch_size
+            try:
+                self.chroma_collection.upsert(
+                    documents=documents[start:end],
+                    metadatas=metadatas[start:end],
+                    ids=ids[start:end]
+                )
+                written += len(ids[start:end])
+            except Exception as e:
+                logger.error(
+                    "❌ ChromaDB batch upsert failed for chunks %d-%d: %s",
+                    start, end, e
+                )
+        pruned = self._prune_stale_chunks(
+            [product_id for _, product_id in items], set(ids)
+        )
+        logger.info(
+            "✅ Upserted %d chunks to ChromaDB for %d products",
+            written, len(items)
+        )
+        if written or pruned:
+            get_chroma_pool().notify_ingest(CHROMA_COLLECTION)
 
     def ingest_to_postgresql(
         self, result: 'PDFExtractionResult'
@@ -126,30 +353,9 @@ class DataIngestionService:
                 self.db_session.add(category)
                 self.db_session.flush()
 
-            def make_utf8_safe(text: str) -> str:
-                if not text:
-                    return ""
-                return text.encode('utf-8', 'replace').decode('utf-8')
-
-            specs = result.technical_specs or {}
-            specs['source_pdf'] = make_utf8_safe(result.source_filename)
-
-            description_text = (
-                f"A {result.product_name} egy {manufacturer_name} által "
-                f"gyártott {category_name.lower()} termék. A forrás: "
-                f"'{result.source_filename}'."
-            )
-
-            product = Product(
-                name=make_utf8_safe(result.product_name),
-                description=description_text,
-                full_text_content=make_utf8_safe(result.extracted_text),
-                manufacturer_id=manufacturer.id,
-                category_id=category.id,
-                technical_specs=specs,
-                price=self._extract_price_from_result(result),
-                sku=self._generate_sku(result.product_name)
-            )
+            product = Product(**self._build_product_values(
+                result, manufacturer, category
+            ))
             self.db_session.add(product)
             self.db_session.commit()
             logger.info(
@@ -181,22 +387,50 @@ class DataIngestionService:
                 logger.warning("No documents to ingest to ChromaDB.")
                 return
 
-            self.chroma_collection.add(
+            self.chroma_collection.upsert(
                 documents=documents,
                 metadatas=metadatas,
                 ids=ids
             )
+            self._prune_stale_chunks([product_id], set(ids))
             logger.info(
                 "✅ Ingested %d chunks to ChromaDB for product ID %d",
                 len(documents),
                 product_id
             )
+            get_chroma_pool().notify_ingest(CHROMA_COLLECTION)
         except Exception as e:
             logger.error(
                 "❌ ChromaDB ingestion failed for product ID %d: %s",
                 product_id, e
             )
 
+    def _prune_stale_chunks(
+        self, product_ids: List[int], current_ids: Set[str]
+    ) -> int:
+        """
+        Deletes chunks of `product_ids` that are not in `current_ids`.
+
+        Chunk ids are positional (`prod_{id}_chunk_{i}`), so re-ingesting
+        a product with fewer chunks would otherwise leave the tail of the
+        previous version searchable.
+        """
+        try:
+            existing = self.chroma_collection.get(
+                where={"product_id": {"$in": product_ids}}, include=[]
+            )
+            stale = [
+                chunk_id for chunk_id in existing["ids"]
+                if chunk_id not in current_ids
+            ]
+            if stale:
+                self.chroma_collection.delete(ids=stale)
+                logger.info("🗑️ Deleted %d stale chunks from ChromaDB", len(stale))
+            return len(stale)
+        except Exception as e:
+            logger.error("❌ ChromaDB stale chunk cleanup failed: %s", e)
+            return 0
+
     def _create_chunked_documents(
         self, result: 'PDFExtractionResult', product_id: int
     ) -> Tuple[List[str], List[Dict], List[str]]:
@@ -243,6 +477,39 @@ class DataIngestionService:
 
         return documents, metadatas, ids
 
+    @staticmethod
+    def _make_utf8_safe(text: str) -> str:
+        if not text:
+            return ""
+        return text.encode('utf-8', 'replace').decode('utf-8')
+
+    def _build_product_values(
+        self,
+        result: 'PDFExtractionResult',
+        manufacturer: Manufacturer,
+        category: Category
+    ) -> Dict[str, Any]:
+        """Column values of the Product row created for one result."""
+        specs = result.technical_specs or {}
+        specs['source_pdf'] = self._make_utf8_safe(result.source_filename)
+
+        description_text = (
+            f"A {result.product_name} egy {manufacturer.name} által "
+            f"gyártott {category.name.lower()} termék. A forrás: "
+            f"'{result.source_filename}'."
+        )
+
+        return {
+            "name": self._make_utf8_safe(result.product_name),
+            "description": description_text,
+            "full_text_content": self._make_utf8_safe(result.extracted_text),
+            "manufacturer_id": manufacturer.id,
+            "category_id": category.id,
+            "technical_specs": specs,
+            "price": self._extract_price_from_result(result),
+            "sku": self._generate_sku(result.product_name),
+        }
+
     def _determine_category(self, specs: Dict[str, Any]) -> str:
         if 'hővezetési' in str(specs).lower() or 'szigetelés' in str(specs).lower():
             return "Hőszigetelés"
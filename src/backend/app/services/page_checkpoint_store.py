@@ -0,0 +1,181 @@
+"""
+Page Checkpoint Store
+---------------------
+Persists per-page extraction results so that long documents never have
+to be re-extracted from the first page.
+
+Each checkpoint is keyed by the file's content hash and page number only.
+A crashed extraction resumes from the first missing page of the same file;
+a changed file (new hash) is extracted from scratch. Pages are never
+shared between files: a page's content stream alone does not identify its
+rendering (fonts, XObjects and images live in the page resources).
+
+The store is capped at `max_pages` rows; the least recently used pages are
+evicted first.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+from app.paths import BACKEND_DIR
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHECKPOINT_PATH = BACKEND_DIR / "cache" / "page_checkpoints.sqlite3"
+DEFAULT_MAX_PAGES = 20000
+# How many puts between two size checks
+_EVICTION_CHECK_INTERVAL = 100
+
+
+class PageCheckpointStore:
+    """SQLite-backed storage of per-page text and tables."""
+
+    def __init__(
+        self, db_path: Optional[Path] = None, max_pages: int = DEFAULT_MAX_PAGES
+    ):
+        self.db_path = Path(db_path) if db_path else DEFAULT_CHECKPOINT_PATH
+        self.max_pages = max_pages
+        self.stats = {"reused_pages": 0, "extracted_pages": 0, "evicted_pages": 0}
+        self._lock = threading.Lock()
+        self._puts_since_check = 0
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        columns = {
+            row[1] for row in
+            self._conn.execute("PRAGMA table_info(page_checkpoints)")
+        }
+        if "page_fingerprint" in columns:
+            # Old layout that shared pages across files by fingerprint
+            logger.info("Dropping page checkpoints with the old fingerprint layout")
+            self._conn.execute("DROP TABLE page_checkpoints")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS page_checkpoints (
+                file_hash TEXT NOT NULL,
+                page_number INTEGER NOT NULL,
+                text TEXT NOT NULL,
+                tables_json TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                last_used_at REAL NOT NULL,
+                PRIMARY KEY (file_hash, page_number)
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_page_checkpoints_last_used "
+            "ON page_checkpoints (last_used_at)"
+        )
+        self._conn.commit()
+
+    def get(self, file_hash: str, page_number: int) -> Optional[Dict[str, Any]]:
+        """Returns {'text', 'tables'} for a page, or None if it must be extracted."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT text, tables_json FROM page_checkpoints "
+                "WHERE file_hash = ? AND page_number = ?",
+                (file_hash, page_number),
+            ).fetchone()
+            if row is not None:
+                self._conn.execute(
+                    "UPDATE page_checkpoints SET last_used_at = ? "
+                    "WHERE file_hash = ? AND page_number = ?",
+                    (time.time(), file_hash, page_number),
+                )
+                self._conn.commit()
+
+        if row is None:
+            return None
+        self.stats["reused_pages"] += 1
+        return {"text": row[0], "tables": json.loads(row[1])}
+
+    def put(
+        self,
+        file_hash: str,
+        page_number: int,
+        text: str,
+        tables: List[Dict[str, Any]],
+    ):
+        """Persists one page immediately, so a crash loses at most this page."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO page_checkpoints "
+                "(file_hash, page_number, text, tables_json, created_at, last_used_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    file_hash,
+                    page_number,
+                    text,
+                    json.dumps(tables, ensure_ascii=False, default=str),
+                    now,
+                    now,
+                ),
+            )
+            self._puts_since_check += 1
+            if self._puts_since_check >= _EVICTION_CHECK_INTERVAL:
+                self._puts_since_check = 0
+                self._evict_locked()
+            self._conn.commit()
+        self.stats["extracted_pages"] += 1
+
+    def _evict_locked(self):
+        """Deletes the least recently used pages above `max_pages`."""
+        (count,) = self._conn.execute(
+            "SELECT COUNT(*) FROM page_checkpoints"
+        ).fetchone()
+        excess = count - self.max_pages
+        if excess <= 0:
+            return
+        self._conn.execute(
+            "DELETE FROM page_checkpoints WHERE rowid IN ("
+            "SELECT rowid FROM page_checkpoints "
+            "ORDER BY last_used_at LIMIT ?)",
+            (excess,),
+        )
+        self.stats["evicted_pages"] += excess
+        logger.info(f"Evicted {excess} least recently used page checkpoints")
+
+    def completed_pages(self, file_hash: str) -> Set[int]:
+        """Page numbers already checkpointed for a file."""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT page_number FROM page_checkpoints WHERE file_hash = ?",
+                (file_hash,),
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def clear(self, file_hash: Optional[str] = None) -> int:
+        """Deletes checkpoints for one file, or all of them."""
+        with self._lock:
+            if file_hash:
+                removed = self._conn.execute(
+                    "DELETE FROM page_checkpoints WHERE file_hash = ?",
+                    (file_hash,),
+                ).rowcount
+            else:
+                removed = self._conn.execute(
+                    "DELETE FROM page_checkpoints"
+                ).rowcount
+            self._conn.commit()
+        return removed
+
+
+# Global store instance
+_page_checkpoint_store = None
+
+
+def get_page_checkpoint_store() -> PageCheckpointStore:
+    """Get the process-wide page checkpoint store."""
+    global _page_checkpoint_store
+    if _page_checkpoint_store is None:
+        _page_checkpoint_store = PageCheckpointStore()
+    return _page_checkpoint_store
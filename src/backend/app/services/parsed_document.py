@@ -0,0 +1,161 @@
+"""
+Parsed PDF Document
+-------------------
+A per-task, lazily parsed view of a single PDF that every extraction
+strategy can share.
+
+Without it the same file is opened and fully parsed by PDFPlumberStrategy,
+PyMuPDFStrategy, RealPDFExtractor and several AdvancedTableExtractor
+methods. ParsedDocument opens each library's handle at most once and
+memoizes page text, words and table candidates per page, so the second
+consumer of a page gets it for free. Use it as a context manager; closing
+it evicts all memoized data and releases the file handles.
+"""
+
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Union
+
+import fitz  # PyMuPDF
+import pdfplumber
+
+logger = logging.getLogger(__name__)
+
+
+class ParsedDocument:
+    """Memoizing wrapper around the pdfplumber and PyMuPDF handles of one PDF."""
+
+    def __init__(self, pdf_path: Union[str, Path]):
+        self.pdf_path = Path(pdf_path)
+        self._plumber_pdf = None
+        self._fitz_doc = None
+        self._page_count: Optional[int] = None
+
+        # Per-page memo tables, keyed by zero-based page index
+        self._page_text: Dict[int, str] = {}
+        self._page_words: Dict[int, List[Dict[str, Any]]] = {}
+        self._page_tables: Dict[int, List[List[List[Any]]]] = {}
+        self._page_edges: Dict[int, List[Dict[str, Any]]] = {}
+        self._fitz_page_text: Dict[int, str] = {}
+        self._fitz_page_tables: Dict[int, List[Dict[str, Any]]] = {}
+
+    def __enter__(self) -> "ParsedDocument":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    # --- Library handles -------------------------------------------------
+
+    @property
+    def plumber_pdf(self):
+        """The pdfplumber handle, opened on first use."""
+        if self._plumber_pdf is None:
+            self._plumber_pdf = pdfplumber.open(self.pdf_path)
+        return self._plumber_pdf
+
+    @property
+    def fitz_doc(self):
+        """The PyMuPDF handle, opened on first use."""
+        if self._fitz_doc is None:
+            self._fitz_doc = fitz.open(self.pdf_path)
+        return self._fitz_doc
+
+    @property
+    def page_count(self) -> int:
+        """Number of pages, taken from whichever handle is already open."""
+        if self._page_count is None:
+            if self._fitz_doc is not None or self._plumber_pdf is None:
+                self._page_count = len(self.fitz_doc)
+            else:
+                self._page_count = len(self._plumber_pdf.pages)
+        return self._page_count
+
+    # --- pdfplumber artifacts --------------------------------------------
+
+    def page_text(self, page_index: int) -> str:
+        """pdfplumber text of a page ('' if the page has no text layer)."""
+        if page_index not in self._page_text:
+            page = self.plumber_pdf.pages[page_index]
+            self._page_text[page_index] = page.extract_text() or ""
+        return self._page_text[page_index]
+
+    def page_words(self, page_index: int) -> List[Dict[str, Any]]:
+        """pdfplumber word boxes of a page."""
+        if page_index not in self._page_words:
+            page = self.plumber_pdf.pages[page_index]
+            self._page_words[page_index] = page.extract_words()
+        return self._page_words[page_index]
+
+    def page_tables(self, page_index: int) -> List[List[List[Any]]]:
+        """pdfplumber table candidates of a page (default settings)."""
+        if page_index not in self._page_tables:
+            page = self.plumber_pdf.pages[page_index]
+            self._page_tables[page_index] = page.extract_tables() or []
+        return self._page_tables[page_index]
+
+    def page_edges(self, page_index: int) -> List[Dict[str, Any]]:
+        """
+        pdfplumber line/rect/curve edges of a page (ruling lines), reduced
+        to 'orientation', 'x0', 'x1', 'top' and 'bottom'.
+        """
+        if page_index not in self._page_edges:
+            page = self.plumber_pdf.pages[page_index]
+            self._page_edges[page_index] = [
+                {
+                    "orientation": edge.get("orientation"),
+                    "x0": edge["x0"],
+                    "x1": edge["x1"],
+                    "top": edge["top"],
+                    "bottom": edge["bottom"],
+                }
+                for edge in page.edges
+            ]
+        return self._page_edges[page_index]
+
+    # --- PyMuPDF artifacts -----------------------------------------------
+
+    def fitz_page_text(self, page_index: int) -> str:
+        """PyMuPDF text of a page."""
+        if page_index not in self._fitz_page_text:
+            page = self.fitz_doc.load_page(page_index)
+            self._fitz_page_text[page_index] = page.get_text() or ""
+        return self._fitz_page_text[page_index]
+
+    def fitz_page_tables(self, page_index: int) -> List[Dict[str, Any]]:
+        """
+        PyMuPDF `find_tables` candidates of a page as plain dicts with
+        'data' and 'bbox'. Returns [] on PyMuPDF builds without find_tables.
+        """
+        if page_index not in self._fitz_page_tables:
+            page = self.fitz_doc.load_page(page_index)
+            candidates = []
+            try:
+                for table in page.find_tables():
+                    candidates.append({
+                        "data": table.extract(),
+                        "bbox": tuple(table.bbox),
+                    })
+            except AttributeError:
+                logger.debug("PyMuPDF find_tables not available")
+            self._fitz_page_tables[page_index] = candidates
+        return self._fitz_page_tables[page_index]
+
+    # --- Lifecycle -------------------------------------------------------
+
+    def close(self):
+        """Release file handles and evict all memoized page data."""
+        for handle in (self._plumber_pdf, self._fitz_doc):
+            if handle is not None:
+                try:
+                    handle.close()
+                except Exception:
+                    pass
+        self._plumber_pdf = None
+        self._fitz_doc = None
+        self._page_text.clear()
+        self._page_words.clear()
+        self._page_tables.clear()
+        self._page_edges.clear()
+        self._fitz_page_text.clear()
+        self._fitz_page_tables.clear()
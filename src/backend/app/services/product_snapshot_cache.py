@@ -0,0 +1,283 @@
+"""
+Product Snapshot Cache
+----------------------
+Process-wide, read-mostly snapshot of the product catalogue for the
+ranking code in RecommendationAgent.
+
+The snapshot is loaded with a single joined column query (no per-row lazy
+loads of manufacturer/category) and keeps only the fields the ranking
+needs; `full_text_content`, raw specs, images and documents are left in
+PostgreSQL. After the first load it refreshes incrementally: only rows
+whose `updated_at`/`created_at` is newer than the last high-water mark,
+minus `overlap_seconds`, are fetched. The overlap catches rows from long
+transactions (timestamps are taken at transaction start) that commit
+after a shorter one already moved the mark; re-read rows that did not
+change are dropped by comparing their snapshot form. Deletions are detected by comparing the count and sum of the
+live product ids with the snapshot's, so a delete followed by an insert
+is not mistaken for "nothing deleted".
+
+The catalogue is loaded in full unless `max_products` is set; a capped
+snapshot is reported as `truncated` in the statistics and always
+reconciles deletions against the full id list.
+
+`refresh()` returns a dict that is never mutated afterwards (changes are
+applied copy-on-write), so agents can iterate it without locking.
+"""
+
+import logging
+import threading
+import time
+from datetime import datetime, timedelta
+from typing import Any, Dict, Optional, Set
+
+from sqlalchemy import func
+
+from app.database import SessionLocal
+from app.models.category import Category
+from app.models.manufacturer import Manufacturer
+from app.models.product import Product
+
+logger = logging.getLogger(__name__)
+
+# Descriptions longer than this are truncated in the snapshot
+MAX_DESCRIPTION_CHARS = 1000
+
+
+class ProductSnapshotCache:
+    """Shared, incrementally refreshed product snapshot."""
+
+    def __init__(
+        self,
+        refresh_interval_seconds: float = 30.0,
+        max_products: Optional[int] = None,
+        session_factory=SessionLocal,
+        overlap_seconds: float = 60.0,
+    ):
+        self.refresh_interval_seconds = refresh_interval_seconds
+        self.overlap = timedelta(seconds=overlap_seconds)
+        self.max_products = max_products
+        self.session_factory = session_factory
+
+        self._products: Dict[int, Dict[str, Any]] = {}
+        self._high_water_mark: Optional[datetime] = None
+        self._loaded = False
+        self._truncated = False
+        self._last_refresh = 0.0
+        self._force_refresh = True
+        self._lock = threading.Lock()
+        self.version = 0
+        self.stats = {
+            "full_loads": 0,
+            "incremental_refreshes": 0,
+            "rows_loaded": 0,
+            "rows_deleted": 0,
+        }
+
+    @staticmethod
+    def _columns():
+        return (
+            Product.id,
+            Product.name,
+            Product.description,
+            Product.sku,
+            Product.manufacturer_id,
+            Product.category_id,
+            Product.price,
+            Product.currency,
+            Product.unit,
+            Product.technical_specs,
+            Product.source_url,
+            Product.is_active,
+            Product.in_stock,
+            func.coalesce(Product.updated_at, Product.created_at).label("changed_at"),
+            Manufacturer.name.label("manufacturer_name"),
+            Category.name.label("category_name"),
+        )
+
+    @staticmethod
+    def _to_snapshot(row) -> Dict[str, Any]:
+        specs = row.technical_specs or {}
+        applications = specs.get("applications") if isinstance(specs, dict) else None
+        return {
+            "id": row.id,
+            "name": row.name or "",
+            "description": (row.description or "")[:MAX_DESCRIPTION_CHARS],
+            "sku": row.sku,
+            "manufacturer_id": row.manufacturer_id,
+            "category_id": row.category_id,
+            "manufacturer": row.manufacturer_name or "",
+            "category": row.category_name or "",
+            "price": float(row.price) if row.price else None,
+            "currency": row.currency,
+            "unit": row.unit,
+            "technical_specs": specs if isinstance(specs, dict) else {},
+            "applications": list(applications) if isinstance(applications, list) else [],
+            "source_url": row.source_url,
+            "is_active": row.is_active,
+            "in_stock": row.in_stock,
+            "updated_at": row.changed_at.isoformat() if row.changed_at else None,
+        }
+
+    def _query(self, db):
+        return (
+            db.query(*self._columns())
+            .outerjoin(Manufacturer, Product.manufacturer_id == Manufacturer.id)
+            .outerjoin(Category, Product.category_id == Category.id)
+        )
+
+    def refresh(self, force: bool = False) -> Dict[int, Dict[str, Any]]:
+        """
+        Returns the current snapshot, refreshing it first if the refresh
+        interval has elapsed, an ingest was signalled, or `force` is set.
+        """
+        now = time.monotonic()
+        if (
+            not force
+            and not self._force_refresh
+            and now - self._last_refresh < self.refresh_interval_seconds
+        ):
+            return self._products
+
+        with self._lock:
+            if (
+                not force
+                and not self._force_refresh
+                and now - self._last_refresh < self.refresh_interval_seconds
+            ):
+                return self._products
+            db = self.session_factory()
+            try:
+                if not self._loaded or force:
+                    self._full_load(db)
+                else:
+                    self._incremental_load(db)
+            except Exception as e:
+                logger.error(f"Termék snapshot frissítési hiba: {e}")
+            finally:
+                db.close()
+            self._last_refresh = time.monotonic()
+            self._force_refresh = False
+        return self._products
+
+    def _full_load(self, db):
+        start = time.perf_counter()
+        products: Dict[int, Dict[str, Any]] = {}
+        high_water_mark = None
+        query = (
+            self._query(db)
+            .order_by(func.coalesce(Product.updated_at, Product.created_at).desc())
+        )
+        if self.max_products is not None:
+            query = query.limit(self.max_products)
+        for row in query.yield_per(1000):
+            products[row.id] = self._to_snapshot(row)
+            if row.changed_at and (high_water_mark is None or row.changed_at > high_water_mark):
+                high_water_mark = row.changed_at
+
+        self._truncated = self._at_capacity(products)
+        if self._truncated:
+            logger.warning(
+                f"Termék snapshot elérte a max_products korlátot ({self.max_products}), "
+                f"a régebben módosított termékek kimaradnak"
+            )
+        self._products = products
+        self._high_water_mark = high_water_mark
+        self._loaded = True
+        self.version += 1
+        self.stats["full_loads"] += 1
+        self.stats["rows_loaded"] += len(products)
+        logger.info(
+            f"Termék snapshot betöltve: {len(products)} termék "
+            f"({(time.perf_counter() - start) * 1000:.0f} ms)"
+        )
+
+    def _at_capacity(self, products: Dict[int, Dict[str, Any]]) -> bool:
+        return self.max_products is not None and len(products) >= self.max_products
+
+    def _deleted_ids(self, db, expected_ids: Set[int]) -> Set[int]:
+        """
+        Snapshot ids that no longer exist in PostgreSQL. The id list is only
+        read if the live id count or sum differs from `expected_ids` (or
+        the snapshot is truncated and cannot be compared).
+        """
+        if not self._truncated:
+            live_count, live_sum = db.query(
+                func.count(Product.id), func.sum(Product.id)
+            ).one()
+            if live_count == len(expected_ids) and (live_sum or 0) == sum(expected_ids):
+                return set()
+        live_ids = {product_id for (product_id,) in db.query(Product.id)}
+        return set(self._products) - live_ids
+
+    def _incremental_load(self, db):
+        changed_at = func.coalesce(Product.updated_at, Product.created_at)
+        query = self._query(db)
+        if self._high_water_mark is not None:
+            # Re-read behind the mark so late commits are not missed;
+            # unchanged rows are filtered out below
+            query = query.filter(changed_at >= self._high_water_mark - self.overlap)
+        fetched = query.all()
+        rows = [
+            row for row in fetched
+            if self._products.get(row.id) != self._to_snapshot(row)
+        ]
+        deleted_ids = self._deleted_ids(
+            db, set(self._products).union(row.id for row in fetched)
+        )
+
+        if not rows and not deleted_ids:
+            self.stats["incremental_refreshes"] += 1
+            return
+
+        products = dict(self._products)
+        for product_id in deleted_ids:
+            products.pop(product_id, None)
+        for row in rows:
+            if row.id in products or not self._at_capacity(products):
+                products[row.id] = self._to_snapshot(row)
+            else:
+                self._truncated = True
+            if row.changed_at and (
+                self._high_water_mark is None or row.changed_at > self._high_water_mark
+            ):
+                self._high_water_mark = row.changed_at
+
+        self._products = products
+        self.version += 1
+        self.stats["incremental_refreshes"] += 1
+        self.stats["rows_loaded"] += len(rows)
+        self.stats["rows_deleted"] += len(deleted_ids)
+        logger.info(
+            f"Termék snapshot frissítve: {len(rows)} változott, "
+            f"{len(deleted_ids)} törölt termék"
+        )
+
+    def invalidate(self, *_args):
+        """Forces a refresh on the next `refresh()` call (e.g. after ingest)."""
+        self._force_refresh = True
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            **self.stats,
+            "products": len(self._products),
+            "version": self.version,
+            "truncated": self._truncated,
+            "high_water_mark": (
+                self._high_water_mark.isoformat() if self._high_water_mark else None
+            ),
+        }
+
+
+# Global snapshot instance
+_product_snapshot_cache = None
+
+
+def get_product_snapshot_cache() -> ProductSnapshotCache:
+    """Get the process-wide product snapshot cache."""
+    global _product_snapshot_cache
+    if _product_snapshot_cache is None:
+        from app.services.chroma_pool import get_chroma_pool
+
+        _product_snapshot_cache = ProductSnapshotCache()
+        get_chroma_pool().add_ingest_listener(_product_snapshot_cache.invalidate)
+    return _product_snapshot_cache
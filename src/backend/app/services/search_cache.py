@@ -0,0 +1,180 @@
+"""
+RAG Search Cache
+----------------
+Two-tier in-memory cache for the `/search/rag` endpoint.
+
+1. Query embeddings: normalized query text -> embedding vector (LRU).
+   A cache hit skips the embedding model entirely.
+2. Search results: (normalized query, limit, collection version, document
+   count) -> raw ChromaDB query result (TTL + LRU). A hit skips the
+   ChromaDB query.
+
+Both tiers subscribe to the ChromaDB pool's ingest events, so any write in
+this process clears them; the collection version in the result key
+additionally guards against races between a write and a concurrent lookup.
+
+Writers in other processes (Celery workers, the MCP task worker, the
+PostgreSQL sync script) cannot reach those listeners. For them the result
+key contains the collection's document count, read from ChromaDB at most
+`count_max_age_seconds` ago, so added or deleted documents show up within
+that bound. Documents updated in place by another process are only bounded
+by `result_ttl_seconds`, which is kept short for that reason.
+"""
+
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from app.services.chroma_pool import get_chroma_pool
+
+logger = logging.getLogger(__name__)
+
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a search query."""
+    return _WHITESPACE_RE.sub(" ", query).strip().lower()
+
+
+class _LRUTier:
+    """Thread-safe LRU map with optional TTL and hit/miss counters."""
+
+    def __init__(self, max_entries: int, ttl_seconds: Optional[float] = None):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Any, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "invalidations": 0}
+
+    def get(self, key) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            value, stored_at = entry
+            if self.ttl_seconds and time.monotonic() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self.stats["misses"] += 1
+                self.stats["evictions"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._entries[key] = (value, time.monotonic())
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def clear(self) -> int:
+        with self._lock:
+            removed = len(self._entries)
+            self._entries.clear()
+            self.stats["invalidations"] += 1
+        return removed
+
+    def get_statistics(self) -> Dict[str, Any]:
+        lookups = self.stats["hits"] + self.stats["misses"]
+        return {
+            **self.stats,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "ttl_seconds": self.ttl_seconds,
+            "hit_rate": round(self.stats["hits"] / lookups, 4) if lookups else 0.0,
+        }
+
+
+class RAGSearchCache:
+    """Embedding and result caches for vector search over one pool."""
+
+    def __init__(
+        self,
+        embedding_max_entries: int = 5000,
+        result_max_entries: int = 2000,
+        result_ttl_seconds: float = 60.0,
+        count_max_age_seconds: float = 10.0,
+    ):
+        self.embeddings = _LRUTier(embedding_max_entries)
+        self.results = _LRUTier(result_max_entries, result_ttl_seconds)
+        self.count_max_age_seconds = count_max_age_seconds
+        self._embedding_function = None
+        self._pool = get_chroma_pool()
+        self._pool.add_ingest_listener(self._on_ingest)
+
+    def _on_ingest(self, collection_name: Optional[str]):
+        self.embeddings.clear()
+        self.results.clear()
+        logger.debug(f"RAG search cache invalidated by ingest into {collection_name}")
+
+    @property
+    def embedding_function(self):
+        """ChromaDB's default client-side embedding function, loaded once."""
+        if self._embedding_function is None:
+            from chromadb.utils import embedding_functions
+            self._embedding_function = (
+                embedding_functions.DefaultEmbeddingFunction()
+            )
+        return self._embedding_function
+
+    def embed_query(self, query: str) -> List[float]:
+        """Returns the (cached) embedding of a normalized query."""
+        key = normalize_query(query)
+        embedding = self.embeddings.get(key)
+        if embedding is None:
+            embedding = [float(x) for x in self.embedding_function([key])[0]]
+            self.embeddings.set(key, embedding)
+        return embedding
+
+    def search(self, collection_name: str, query: str, limit: int) -> Dict[str, Any]:
+        """Cached `collection.query` for a text query."""
+        key = (
+            normalize_query(query),
+            limit,
+            collection_name,
+            self._pool.collection_version(collection_name),
+            self._pool.collection_count(
+                collection_name, max_age=self.count_max_age_seconds
+            ),
+        )
+        results = self.results.get(key)
+        if results is not None:
+            return results
+
+        embedding = self.embed_query(query)
+        collection = self._pool.get_collection(collection_name)
+        results = collection.query(query_embeddings=[embedding], n_results=limit)
+        self.results.set(key, results)
+        return results
+
+    def clear(self) -> Dict[str, int]:
+        return {
+            "embeddings": self.embeddings.clear(),
+            "results": self.results.clear(),
+        }
+
+    def get_statistics(self) -> Dict[str, Any]:
+        return {
+            "embeddings": self.embeddings.get_statistics(),
+            "results": self.results.get_statistics(),
+            "count_max_age_seconds": self.count_max_age_seconds,
+        }
+
+
+# Global cache instance
+_rag_search_cache = None
+
+
+def get_rag_search_cache() -> RAGSearchCache:
+    """Get the process-wide RAG search cache."""
+    global _rag_search_cache
+    if _rag_search_cache is None:
+        _rag_search_cache = RAGSearchCache()
+    return _rag_search_cache
@@ -0,0 +1,138 @@
+"""
+Table Method Statistics
+-----------------------
+Persists, per document family, how often each table extraction method was
+tried, how often it produced the winning result and how long it took.
+
+AdvancedTableExtractor uses these win-rates to try the historically best
+method for a family (e.g. Rockwool datasheets vs. Leier price lists)
+first and to stop as soon as a result is good enough.
+"""
+
+import logging
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+from app.paths import BACKEND_DIR
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_STATS_PATH = BACKEND_DIR / "cache" / "table_method_stats.sqlite3"
+
+_MANUFACTURERS = ("rockwool", "leier", "baumit")
+_DOCUMENT_TYPES = (
+    ("pricelist", re.compile(r"arlista|árlista|price|pricelist|arjegyzek", re.I)),
+    ("datasheet", re.compile(r"adatlap|datasheet|termekadat|teljesitmeny|dop", re.I)),
+    ("brochure", re.compile(r"brosur|brosúr|brochure|katalogus|catalog", re.I)),
+)
+
+
+def document_family(pdf_path: Path) -> str:
+    """
+    Coarse document family from the file path, e.g. 'rockwool_datasheet'
+    or 'leier_pricelist'. Unknown parts fall back to 'other'/'document'.
+    """
+    text = str(pdf_path).lower()
+    manufacturer = next((m for m in _MANUFACTURERS if m in text), "other")
+    doc_type = next(
+        (name for name, pattern in _DOCUMENT_TYPES if pattern.search(text)),
+        "document",
+    )
+    return f"{manufacturer}_{doc_type}"
+
+
+class TableMethodStatsStore:
+    """SQLite-backed attempts/wins/time counters per (family, method)."""
+
+    def __init__(self, db_path: Optional[Path] = None):
+        self.db_path = Path(db_path) if db_path else DEFAULT_STATS_PATH
+        self._lock = threading.Lock()
+
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(self.db_path), check_same_thread=False
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS table_method_stats (
+                family TEXT NOT NULL,
+                method TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                wins INTEGER NOT NULL DEFAULT 0,
+                total_seconds REAL NOT NULL DEFAULT 0,
+                updated_at REAL NOT NULL,
+                PRIMARY KEY (family, method)
+            )
+            """
+        )
+        self._conn.commit()
+
+    def record(
+        self, family: str, timings: Dict[str, float], winner: Optional[str]
+    ):
+        """Records one extraction: seconds per tried method and the winner."""
+        now = time.time()
+        with self._lock:
+            for method, seconds in timings.items():
+                self._conn.execute(
+                    "INSERT INTO table_method_stats "
+                    "(family, method, attempts, wins, total_seconds, updated_at) "
+                    "VALUES (?, ?, 1, ?, ?, ?) "
+                    "ON CONFLICT(family, method) DO UPDATE SET "
+                    "attempts = attempts + 1, wins = wins + excluded.wins, "
+                    "total_seconds = total_seconds + excluded.total_seconds, "
+                    "updated_at = excluded.updated_at",
+                    (family, method, int(method == winner), seconds, now),
+                )
+            self._conn.commit()
+
+    def get_stats(self, family: str) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT method, attempts, wins, total_seconds "
+                "FROM table_method_stats WHERE family = ?",
+                (family,),
+            ).fetchall()
+        return {
+            method: {
+                "attempts": attempts,
+                "wins": wins,
+                "win_rate": wins / attempts if attempts else 0.0,
+                "avg_seconds": total_seconds / attempts if attempts else 0.0,
+            }
+            for method, attempts, wins, total_seconds in rows
+        }
+
+    def rank_methods(self, family: str, methods: Sequence[str]) -> List[str]:
+        """
+        Orders methods by smoothed win-rate (Laplace), then by average run
+        time. Methods without history keep their configured order.
+        """
+        stats = self.get_stats(family)
+        position = {method: i for i, method in enumerate(methods)}
+
+        def key(method: str):
+            entry = stats.get(method)
+            if not entry:
+                return (-0.5, 0.0, position[method])
+            win_rate = (entry["wins"] + 1) / (entry["attempts"] + 2)
+            return (-win_rate, entry["avg_seconds"], position[method])
+
+        return sorted(methods, key=key)
+
+
+# Global store instance
+_table_method_stats_store = None
+
+
+def get_table_method_stats_store() -> TableMethodStatsStore:
+    """Get the process-wide table method statistics store."""
+    global _table_method_stats_store
+    if _table_method_stats_store is None:
+        _table_method_stats_store = TableMethodStatsStore()
+    return _table_method_stats_store
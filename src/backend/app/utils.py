@@ -2,6 +2,7 @@
 Project-wide utility functions.
 """
 import os
+import hashlib
 from pathlib import Path
 import logging
 
@@ -39,6 +40,18 @@ def get_project_root() -> Path:
         return Path.cwd()
 
 
+def compute_file_sha256(file_path: Path, chunk_size: int = 1024 * 1024) -> str:
+    """
+    Streams a file through SHA-256 in fixed-size chunks, so memory use stays
+    flat regardless of file size.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def clean_utf8(text: str) -> str:
     """
     Cleans a string to ensure it's valid UTF-8.
@@ -0,0 +1,377 @@
+#!/usr/bin/env python3
+"""
+Staged PDF Pipeline
+-------------------
+Runs the RealPDFProcessor stages for many files at once, connected by
+bounded queues:
+
+    feeder -> [extract: process pool] -> [ai: async workers] -> [ingest: single writer]
+
+- Text and table extraction are CPU bound and run in a process pool, so
+  several PDFs are parsed in parallel without holding the GIL.
+- AI analysis is network bound and runs with its own concurrency limit.
+- Ingestion is batched and done by a single writer, which keeps the DB
+  session single-threaded and turns N small transactions into a few
+  `ingest_batch` calls.
+
+The bounded queues provide backpressure, so memory stays flat and total
+time is governed by the slowest stage instead of the sum of all stages.
+Per-stage throughput and queue depth are collected in `PipelineStats`.
+"""
+
+import asyncio
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+# Extractors cached per worker process
+_worker_extractors: Optional[Tuple[Any, Any]] = None
+
+
+def _get_worker_extractors(use_checkpoints: bool):
+    global _worker_extractors
+    if _worker_extractors is None:
+        from app.services.extraction_service import (
+            AdvancedTableExtractor, RealPDFExtractor
+        )
+        from app.services.page_checkpoint_store import get_page_checkpoint_store
+
+        _worker_extractors = (
+            RealPDFExtractor(
+                checkpoint_store=(
+                    get_page_checkpoint_store() if use_checkpoints else None
+                )
+            ),
+            AdvancedTableExtractor(),
+        )
+    return _worker_extractors
+
+
+def extract_document(
+    pdf_path: str, file_hash: Optional[str], use_checkpoints: bool = True
+) -> Dict[str, Any]:
+    """
+    Text and table extraction for one PDF from a single shared parse.
+
+    Top-level and JSON-serializable in both directions, so it can run in a
+    process pool or a Celery worker.
+    """
+    from app.services.parsed_document import ParsedDocument
+
+    started_at = datetime.now()
+    path = Path(pdf_path)
+    text_extractor, table_extractor = _get_worker_extractors(use_checkpoints)
+
+    with ParsedDocument(path) as document:
+        text, simple_tables, text_method = text_extractor.extract_pdf_content(
+            path, document, file_hash
+        )
+        table_result = table_extractor.extract_tables_hybrid(path, document)
+
+    return {
+        'pdf_path': str(path),
+        'file_hash': file_hash,
+        'started_at': started_at.isoformat(),
+        'text': text,
+        'text_method': text_method,
+        'simple_tables': simple_tables,
+        'table_result': table_result.to_dict() if table_result else None,
+    }
+
+
+def table_result_from_extraction(extraction: Dict[str, Any]):
+    """Rebuilds the TableExtractionResult of an `extract_document` output."""
+    if not extraction.get('table_result'):
+        return None
+
+    from app.services.extraction_service import TableExtractionResult
+
+    return TableExtractionResult(**extraction['table_result'])
+
+
+@dataclass
+class StageStats:
+    """Counters of one pipeline stage."""
+    name: str
+    processed: int = 0
+    failed: int = 0
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0
+
+    def to_dict(self, elapsed: float) -> Dict[str, Any]:
+        return {
+            'processed': self.processed,
+            'failed': self.failed,
+            'busy_seconds': round(self.busy_seconds, 2),
+            'throughput_per_second': (
+                round(self.processed / elapsed, 3) if elapsed > 0 else 0.0
+            ),
+            'max_queue_depth': self.max_queue_depth,
+        }
+
+
+@dataclass
+class PipelineStats:
+    """Per-stage throughput and queue depth of one pipeline run."""
+    stages: Dict[str, StageStats] = field(default_factory=dict)
+    started: float = field(default_factory=time.monotonic)
+    finished: Optional[float] = None
+
+    def stage(self, name: str) -> StageStats:
+        return self.stages.setdefault(name, StageStats(name))
+
+    @property
+    def elapsed(self) -> float:
+        return (self.finished or time.monotonic()) - self.started
+
+    def to_dict(self) -> Dict[str, Any]:
+        elapsed = self.elapsed
+        return {
+            'elapsed_seconds': round(elapsed, 2),
+            'stages': {
+                name: stage.to_dict(elapsed) for name, stage in self.stages.items()
+            },
+        }
+
+
+class StagedPDFPipeline:
+    """
+    Pipelined `process_files` for a RealPDFProcessor.
+
+    Args:
+        processor: Supplies the analysis/ingestion services and stats
+        extract_workers: Processes for text + table extraction
+            (default: CPU count)
+        ai_concurrency: Concurrent AI analysis calls
+        ingest_batch_size: Results per `ingest_batch` call
+        queue_size: Capacity of each inter-stage queue
+        executor: Custom executor for the extraction stage
+        monitor_interval: Seconds between queue depth log lines
+    """
+
+    def __init__(
+        self,
+        processor,
+        extract_workers: Optional[int] = None,
+        ai_concurrency: int = 4,
+        ingest_batch_size: int = 20,
+        queue_size: int = 8,
+        executor: Optional[Executor] = None,
+        monitor_interval: float = 10.0,
+    ):
+        self.processor = processor
+        self.extract_workers = extract_workers or os.cpu_count() or 2
+        self.ai_concurrency = max(1, ai_concurrency)
+        self.ingest_batch_size = max(1, ingest_batch_size)
+        self.queue_size = max(1, queue_size)
+        self.executor = executor
+        self.monitor_interval = monitor_interval
+        self.stats = PipelineStats()
+
+    def _put_depth(self, stage: str, queue: asyncio.Queue):
+        stats = self.stats.stage(stage)
+        stats.max_queue_depth = max(stats.max_queue_depth, queue.qsize())
+
+    async def run(self, pdf_files: List[Path]) -> List[Any]:
+        """Processes the files; returns the consolidated results in completion order."""
+        self.stats = PipelineStats()
+        extract_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        ai_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        ingest_queue: asyncio.Queue = asyncio.Queue(self.queue_size)
+        results: List[Any] = []
+
+        # 'spawn': workers must not inherit the parent's DB/SQLite connections
+        executor = self.executor or ProcessPoolExecutor(
+            self.extract_workers, mp_context=multiprocessing.get_context('spawn')
+        )
+        queues = {'extract': extract_queue, 'ai': ai_queue, 'ingest': ingest_queue}
+        monitor = asyncio.create_task(self._monitor(queues))
+        try:
+            extractors = [
+                asyncio.create_task(self._extract_worker(executor, extract_queue, ai_queue))
+                for _ in range(self.extract_workers)
+            ]
+            analyzers = [
+                asyncio.create_task(self._ai_worker(ai_queue, ingest_queue))
+                for _ in range(self.ai_concurrency)
+            ]
+            writer = asyncio.create_task(self._ingest_writer(ingest_queue, results))
+
+            await self._feed(pdf_files, extract_queue)
+            for _ in extractors:
+                await extract_queue.put(_DONE)
+            await asyncio.gather(*extractors)
+            for _ in analyzers:
+                await ai_queue.put(_DONE)
+            await asyncio.gather(*analyzers)
+            await ingest_queue.put(_DONE)
+            await writer
+        finally:
+            monitor.cancel()
+            if self.executor is None:
+                executor.shutdown(wait=False, cancel_futures=True)
+            self.stats.finished = time.monotonic()
+
+        self._log_stats()
+        return results
+
+    # --- Stages ----------------------------------------------------------
+
+    async def _feed(self, pdf_files: List[Path], extract_queue: asyncio.Queue):
+        """Hashes (memoized by the bulk dedup check) and enqueues new files."""
+        file_handler = self.processor.file_handler
+        seen_hashes = set()
+        for pdf_path in pdf_files:
+            file_hash = file_handler.calculate_file_hash(pdf_path)
+            if not file_hash:
+                self.processor.processing_stats["failed"] += 1
+                continue
+            if file_hash in seen_hashes or file_hash in file_handler.processed_hashes_session:
+                logger.info(f"Skipping duplicate file: {pdf_path.name}")
+                self.processor.processing_stats["skipped_duplicates"] += 1
+                continue
+            seen_hashes.add(file_hash)
+            await extract_queue.put((pdf_path, file_hash))
+            self._put_depth('extract', extract_queue)
+
+    async def _extract_worker(
+        self, executor: Executor, extract_queue: asyncio.Queue, ai_queue: asyncio.Queue
+    ):
+        loop = asyncio.get_running_loop()
+        stats = self.stats.stage('extract')
+        use_checkpoints = self.processor.extraction_service.checkpoint_store is not None
+        while True:
+            item = await extract_queue.get()
+            if item is _DONE:
+                return
+            pdf_path, file_hash = item
+            started = time.monotonic()
+            try:
+                extraction = await loop.run_in_executor(
+                    executor, extract_document, str(pdf_path), file_hash, use_checkpoints
+                )
+            except Exception as e:
+                logger.error(f"Extraction failed for {pdf_path.name}: {e}")
+                stats.failed += 1
+                self.processor.processing_stats["failed"] += 1
+                continue
+            finally:
+                stats.busy_seconds += time.monotonic() - started
+            stats.processed += 1
+            await ai_queue.put(extraction)
+            self._put_depth('ai', ai_queue)
+
+    async def _ai_worker(self, ai_queue: asyncio.Queue, ingest_queue: asyncio.Queue):
+        stats = self.stats.stage('ai')
+        processor = self.processor
+        while True:
+            extraction = await ai_queue.get()
+            if extraction is _DONE:
+                return
+            pdf_path = Path(extraction['pdf_path'])
+            started = time.monotonic()
+            try:
+                table_result = table_result_from_extraction(extraction)
+                ai_analysis = {}
+                if processor.enable_ai_analysis:
+                    ai_analysis = await processor.analysis_service.analyze_content(
+                        text_content=extraction['text'],
+                        tables=(
+                            table_result.tables if table_result
+                            else extraction['simple_tables']
+                        ),
+                        pdf_name=pdf_path.name
+                    )
+                result = processor._consolidate_results(
+                    pdf_path,
+                    datetime.fromisoformat(extraction['started_at']),
+                    extraction['text'],
+                    extraction['text_method'],
+                    table_result,
+                    ai_analysis,
+                )
+            except Exception as e:
+                logger.error(f"Analysis failed for {pdf_path.name}: {e}")
+                stats.failed += 1
+                processor.processing_stats["failed"] += 1
+                continue
+            finally:
+                stats.busy_seconds += time.monotonic() - started
+            stats.processed += 1
+            await ingest_queue.put((result, extraction['file_hash'], pdf_path))
+            self._put_depth('ingest', ingest_queue)
+
+    async def _ingest_writer(self, ingest_queue: asyncio.Queue, results: List[Any]):
+        """Single writer: flushes when a batch is full or the queue runs dry."""
+        batch: List[Tuple[Any, str, Path]] = []
+        while True:
+            item = await ingest_queue.get()
+            if item is not _DONE:
+                batch.append(item)
+            if batch and (
+                item is _DONE
+                or len(batch) >= self.ingest_batch_size
+                or ingest_queue.empty()
+            ):
+                await self._flush(batch, results)
+                batch = []
+            if item is _DONE:
+                return
+
+    async def _flush(self, batch: List[Tuple[Any, str, Path]], results: List[Any]):
+        stats = self.stats.stage('ingest')
+        processor = self.processor
+        started = time.monotonic()
+        try:
+            await asyncio.to_thread(
+                processor.ingestion_service.ingest_batch,
+                [result for result, _, _ in batch],
+                [file_hash for _, file_hash, _ in batch],
+                [pdf_path for _, _, pdf_path in batch],
+            )
+        except Exception as e:
+            logger.error(f"Batch ingestion failed ({len(batch)} files): {e}")
+            stats.failed += len(batch)
+            processor.processing_stats["failed"] += len(batch)
+            return
+        finally:
+            stats.busy_seconds += time.monotonic() - started
+
+        stats.processed += len(batch)
+        for result, file_hash, _ in batch:
+            processor.file_handler.processed_hashes_session.add(file_hash)
+            processor.processing_stats["successful"] += 1
+            processor.processing_stats["total_processed"] += 1
+            processor.processing_stats["total_extraction_time"] += result.processing_time
+            results.append(result)
+
+    # --- Reporting -------------------------------------------------------
+
+    async def _monitor(self, queues: Dict[str, asyncio.Queue]):
+        while True:
+            await asyncio.sleep(self.monitor_interval)
+            depths = ", ".join(f"{name}={q.qsize()}" for name, q in queues.items())
+            done = ", ".join(
+                f"{name}={stage.processed}" for name, stage in self.stats.stages.items()
+            )
+            logger.info(f"📊 Pipeline queues: {depths} | processed: {done}")
+
+    def _log_stats(self):
+        report = self.stats.to_dict()
+        logger.info(f"📊 Pipeline finished in {report['elapsed_seconds']}s")
+        for name, stage in report['stages'].items():
+            logger.info(
+                f"   {name}: {stage['processed']} done, {stage['failed']} failed, "
+                f"{stage['throughput_per_second']}/s, "
+                f"busy {stage['busy_seconds']}s, max queue {stage['max_queue_depth']}"
+            )
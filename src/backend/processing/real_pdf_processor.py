@@ -19,7 +19,7 @@ sys.path.insert(0, str(_backend_root))
 # Standard Library Imports
 import logging
 import asyncio
-from typing import Dict, List, Optional
+from typing import Any, Dict, List, Optional
 from datetime import datetime
 
 # Third-Party Imports
@@ -32,11 +32,14 @@ from app.models.processing_models import PDFExtractionResult
 from app.services.extraction_service import (
     RealPDFExtractor, AdvancedTableExtractor
 )
+from app.services.parsed_document import ParsedDocument
+from app.services.page_checkpoint_store import get_page_checkpoint_store
 from app.services.ingestion_service import DataIngestionService
 from app.processing.file_handler import FileHandler
 from app.processing.analysis_service import AnalysisService
 from app.processing.confidence_scorer import ConfidenceScorer
 from app.utils import clean_utf8
+from processing.pdf_pipeline import StagedPDFPipeline
 
 # -- Environment and Logging Configuration --
 load_dotenv()
@@ -51,17 +54,89 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def consolidate_results(
+    confidence_scorer: ConfidenceScorer,
+    pdf_path: Path,
+    start_time: datetime,
+    text: str,
+    text_method: str,
+    table_result,
+    ai_analysis,
+) -> PDFExtractionResult:
+    """
+    Consolidates all extracted data into the final result object,
+    ensuring it's always well-formed.
+    """
+    tables = table_result.tables if table_result else []
+    table_method = table_result.extraction_method if table_result else "none"
+
+    # Ensure ai_analysis is a dict even on failure
+    if not isinstance(ai_analysis, dict):
+        ai_analysis = {}
+
+    # Calculate confidence score
+    confidence = confidence_scorer.calculate_enhanced_confidence(
+        text_content=text,
+        tables=tables,
+        ai_analysis=ai_analysis,
+        extraction_method=text_method
+    )
+
+    processing_time = (datetime.now() - start_time).total_seconds()
+
+    product_name = ai_analysis.get("product_identification", {}).get(
+        "product_name", pdf_path.stem
+    )
+
+    # This now includes the guaranteed 'extraction_metadata' field
+    return PDFExtractionResult(
+        product_name=product_name,
+        extracted_text=clean_utf8(text),
+        technical_specs=ai_analysis.get("technical_specifications", {}),
+        pricing_info=ai_analysis.get("pricing_information", {}),
+        extraction_metadata=ai_analysis.get("extraction_metadata", {}),
+        tables_data=tables,
+        confidence_score=confidence,
+        source_filename=pdf_path.name,
+        processing_time=processing_time,
+        extraction_method=text_method,
+        table_extraction_method=table_method,
+        table_quality_score=table_result.quality_score if table_result else 0.0,
+        advanced_tables_used=bool(table_result),
+    )
+
+
 class RealPDFProcessor:
     """Orchestrates the PDF processing pipeline using dedicated services."""
 
-    def __init__(self, db_session: Session, enable_ai_analysis: bool = True):
+    def __init__(
+        self,
+        db_session: Session,
+        enable_ai_analysis: bool = True,
+        enable_page_checkpoints: bool = True,
+        extract_workers: Optional[int] = None,
+        ai_concurrency: int = 4,
+        ingest_batch_size: int = 20,
+        queue_size: int = 8
+    ):
         """Initialize with dedicated services."""
         self.db_session = db_session
         self.enable_ai_analysis = enable_ai_analysis
 
+        # Pipeline settings for multi-file processing
+        self.extract_workers = extract_workers
+        self.ai_concurrency = ai_concurrency
+        self.ingest_batch_size = ingest_batch_size
+        self.queue_size = queue_size
+        self.pipeline_stats: Dict[str, Any] = {}
+
         # Initialize services
         self.file_handler = FileHandler(db_session)
-        self.extraction_service = RealPDFExtractor()
+        self.extraction_service = RealPDFExtractor(
+            checkpoint_store=(
+                get_page_checkpoint_store() if enable_page_checkpoints else None
+            )
+        )
         self.table_extractor = AdvancedTableExtractor()
         self.analysis_service = AnalysisService()
         self.confidence_scorer = ConfidenceScorer()
@@ -93,13 +168,20 @@ class RealPDFProcessor:
             self.processing_stats["skipped_duplicates"] += 1
             return None
 
-        # 2. Extract Content
-        text, simple_tables, text_method = (
-            self.extraction_service.extract_pdf_content(pdf_path)
-        )
+        # 2-3. Extract content and tables from a single shared parse;
+        # memoized pages are evicted when the block exits.
+        with ParsedDocument(pdf_path) as document:
+            # 2. Extract Content
+            text, simple_tables, text_method = (
+                self.extraction_service.extract_pdf_content(
+                    pdf_path, document, file_hash
+                )
+            )
 
-        # 3. Extract Tables using Advanced Method
-        table_result = self.table_extractor.extract_tables_hybrid(pdf_path)
+            # 3. Extract Tables using Advanced Method
+            table_result = self.table_extractor.extract_tables_hybrid(
+                pdf_path, document
+            )
 
         # 4. Analyze with AI
         ai_analysis = {}
@@ -115,11 +197,13 @@ class RealPDFProcessor:
             pdf_path, start_time, text, text_method, table_result, ai_analysis
         )
 
-        # 6. Ingest Data
-        self.ingestion_service.ingest_data(consolidated_result, file_hash)
+        # 6. Ingest Data (records the file in the dedup index on success)
+        self.ingestion_service.ingest_data(
+            consolidated_result, file_hash, pdf_path
+        )
 
         # 7. Update logs and stats
-        self.file_handler.add_hash_to_log(file_hash)
+        self.file_handler.processed_hashes_session.add(file_hash)
         self.processing_stats["successful"] += 1
         self.processing_stats["total_processed"] += 1
         processing_time = (datetime.now() - start_time).total_seconds()
@@ -133,53 +217,18 @@ class RealPDFProcessor:
     def _consolidate_results(
         self, pdf_path, start_time, text, text_method, table_result, ai_analysis
     ) -> PDFExtractionResult:
-        """
-        Consolidates all extracted data into the final result object,
-        ensuring it's always well-formed.
-        """
-        tables = table_result.tables if table_result else []
-        table_method = table_result.extraction_method if table_result else "none"
-
-        # Ensure ai_analysis is a dict even on failure
-        if not isinstance(ai_analysis, dict):
-            ai_analysis = {}
-
-        # Calculate confidence score
-        confidence = self.confidence_scorer.calculate_enhanced_confidence(
-            text_content=text,
-            tables=tables,
-            ai_analysis=ai_analysis,
-            extraction_method=text_method
-        )
-
-        processing_time = (datetime.now() - start_time).total_seconds()
-
-        product_name = ai_analysis.get("product_identification", {}).get(
-            "product_name", pdf_path.stem
-        )
-        
-        # This now includes the guaranteed 'extraction_metadata' field
-        return PDFExtractionResult(
-            product_name=product_name,
-            extracted_text=clean_utf8(text),
-            technical_specs=ai_analysis.get("technical_specifications", {}),
-            pricing_info=ai_analysis.get("pricing_information", {}),
-            extraction_metadata=ai_analysis.get("extraction_metadata", {}),
-            tables_data=tables,
-            confidence_score=confidence,
-            source_filename=pdf_path.name,
-            processing_time=processing_time,
-            extraction_method=text_method,
-            table_extraction_method=table_method,
-            table_quality_score=table_result.quality_score if table_result else 0.0,
-            advanced_tables_used=bool(table_result),
+        """Consolidates the stage outputs (see `consolidate_results`)."""
+        return consolidate_results(
+            self.confidence_scorer, pdf_path, start_time, text, text_method,
+            table_result, ai_analysis
         )
 
     async def process_directory(
         self, pdf_directory: Path, output_file: Optional[Path] = None
     ) -> List[PDFExtractionResult]:
         """
-        Processes all PDF files in a given directory concurrently.
+        Processes all PDF files in a given directory concurrently
+        (see `process_files`).
         """
         if not pdf_directory.exists():
             raise FileNotFoundError(f"Directory not found: {pdf_directory}")
@@ -190,12 +239,36 @@ class RealPDFProcessor:
             return []
 
         logger.info(f"Found {len(pdf_files)} PDF files to process")
-        results = []
+        return await self.process_files(pdf_files, output_file)
+
+    async def process_files(
+        self, pdf_files: List[Path], output_file: Optional[Path] = None
+    ) -> List[PDFExtractionResult]:
+        """
+        Processes an explicit list of PDF files, e.g. only the datasheets
+        an incremental scrape reported as added or changed.
 
-        for pdf_path in pdf_files:
-            result = await self.process_pdf(pdf_path)
-            if result:
-                results.append(result)
+        The files flow through a staged pipeline (process-pool extraction,
+        concurrent AI analysis, batched single-writer ingestion); per-stage
+        throughput and queue depth end up in `pipeline_stats`.
+        """
+        pdf_files = [Path(p) for p in pdf_files]
+
+        # Skip already processed files with one bulk index lookup
+        already_processed = self.file_handler.find_processed(pdf_files)
+        if already_processed:
+            self.processing_stats["skipped_duplicates"] += len(already_processed)
+            pdf_files = [p for p in pdf_files if p not in already_processed]
+
+        pipeline = StagedPDFPipeline(
+            self,
+            extract_workers=self.extract_workers,
+            ai_concurrency=self.ai_concurrency,
+            ingest_batch_size=self.ingest_batch_size,
+            queue_size=self.queue_size,
+        )
+        results = await pipeline.run(pdf_files)
+        self.pipeline_stats = pipeline.stats.to_dict()
 
         logger.info(
             "Processing complete: %d/%d successful",
@@ -220,9 +293,9 @@ class RealPDFProcessor:
             json.dump(results_data, f, indent=2, ensure_ascii=False)
         logger.info(f"Results saved to {output_file}")
 
-    def get_processing_stats(self) -> Dict[str, int]:
+    def get_processing_stats(self) -> Dict[str, Any]:
         """Get current processing statistics."""
-        return self.processing_stats.copy()
+        return {**self.processing_stats, "pipeline": self.pipeline_stats}
 
 
 async def main():
@@ -1,74 +1,47 @@
 #!/usr/bin/env python3
 """
 PostgreSQL → ChromaDB szinkronizálás
+
+Inkrementális: csak a legutóbbi futás óta változott termékeket olvassa be,
+és csak a ténylegesen megváltozott dokumentumokat írja (upsert) a
+ChromaDB-be. A törölt termékek dokumentumai is törlődnek.
+
+    python sync_postgresql_to_chromadb.py          # inkrementális
+    python sync_postgresql_to_chromadb.py --full   # teljes ellenőrzés
 """
 
-from app.database import SessionLocal
-from app.models.product import Product
-import chromadb
+import argparse
+
+from app.services.chroma_sync import ChromaSyncEngine, SYNC_COLLECTION
 
-def sync_postgresql_to_chromadb():
+
+def sync_postgresql_to_chromadb(full: bool = False, collection_name: str = SYNC_COLLECTION):
     """Szinkronizálja a PostgreSQL termékeket a ChromaDB-be"""
-    
-    session = SessionLocal()
-    client = chromadb.HttpClient(host='chroma', port=8000)
-    
+
     try:
-        # Termékek lekérése PostgreSQL-ből
-        products = session.query(Product).all()
-        print(f'📊 PostgreSQL termékek: {len(products)}')
-        
-        # ChromaDB collection
-        collection = client.get_or_create_collection(
-            name='pdf_products',
-            metadata={'description': 'ROCKWOOL PDF products'}
-        )
-        
-        # Termékek feltöltése ChromaDB-be
-        documents = []
-        metadatas = []
-        ids = []
-        
-        for product in products:
-            # Dokumentum szöveg összeállítása
-            doc_text = f"{product.name}\n{product.description or ''}"
-            if product.technical_specs:
-                for key, value in product.technical_specs.items():
-                    if isinstance(value, dict):
-                        val = value.get('value', '')
-                        unit = value.get('unit', '')
-                        doc_text += f"\n{key}: {val} {unit}"
-                    else:
-                        doc_text += f"\n{key}: {value}"
-            
-            documents.append(doc_text)
-            metadatas.append({
-                'product_id': product.id,
-                'name': product.name,
-                'category': product.category.name if product.category else 'Unknown',
-                'doc_type': 'Termék'
-            })
-            ids.append(f'product_{product.id}')
-        
-        # Feltöltés ChromaDB-be
-        if documents:
-            collection.add(
-                documents=documents,
-                metadatas=metadatas,
-                ids=ids
-            )
-            print(f'✅ {len(documents)} termék feltöltve ChromaDB-be!')
-        
+        engine = ChromaSyncEngine(collection_name=collection_name)
+        stats = engine.sync(full=full)
+
+        print(f"📊 Mód: {stats['mode']}, beolvasott termékek: {stats['read']}")
+        print(f"✅ {stats['upserted']} dokumentum frissítve, "
+              f"{stats['unchanged']} változatlan, {stats['deleted']} törölve "
+              f"({stats['elapsed_seconds']:.3f}s)")
+
         # Ellenőrzés
-        final_count = collection.count()
+        final_count = engine.collection.count()
         print(f'📊 ChromaDB végső állapot: {final_count} dokumentum')
-        
+        return stats
+
     except Exception as e:
         print(f'❌ Hiba: {e}')
         import traceback
         traceback.print_exc()
-    finally:
-        session.close()
+
 
 if __name__ == '__main__':
-    sync_postgresql_to_chromadb() 
\ No newline at end of file
+    parser = argparse.ArgumentParser(description='PostgreSQL → ChromaDB szinkronizálás')
+    parser.add_argument('--full', action='store_true',
+                        help='Minden termék ellenőrzése (pl. kategória átnevezés után)')
+    parser.add_argument('--collection', default=SYNC_COLLECTION)
+    args = parser.parse_args()
+    sync_postgresql_to_chromadb(full=args.full, collection_name=args.collection)
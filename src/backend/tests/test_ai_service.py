@@ -0,0 +1,81 @@
+import asyncio
+import dataclasses
+from types import SimpleNamespace
+
+import httpx
+import pytest
+from anthropic import BadRequestError, RateLimitError
+
+from app.services import ai_service
+
+
+def api_error(error_class, status_code):
+    request = httpx.Request("POST", "https://api.anthropic.com/v1/messages")
+    return error_class(
+        "error", response=httpx.Response(status_code, request=request), body=None
+    )
+
+
+class FakeMessages:
+    def __init__(self, failures=()):
+        self.failures = list(failures)
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        if self.failures:
+            raise self.failures.pop(0)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return SimpleNamespace(content=[SimpleNamespace(text='{"ok": true}')])
+
+
+def make_service(monkeypatch, messages, **config):
+    monkeypatch.setenv("ANTHROPIC_API_KEY", "test-key")
+    monkeypatch.setattr(ai_service, "get_ai_response_cache", lambda: None)
+    service = ai_service.AnalysisService()
+    service.model_config = dataclasses.replace(
+        service.model_config, retry_backoff_seconds=0.001, **config
+    )
+    service.client = SimpleNamespace(messages=messages)
+    return service
+
+
+async def test_concurrency_limit_is_shared_by_all_instances(monkeypatch):
+    messages = FakeMessages()
+    services = [
+        make_service(monkeypatch, messages, max_concurrent_requests=2)
+        for _ in range(3)
+    ]
+
+    await asyncio.gather(*(
+        service._make_api_call(f"prompt {i}")
+        for i in range(4)
+        for service in services
+    ))
+
+    assert messages.calls == 12
+    assert messages.max_in_flight == 2
+
+
+async def test_rate_limit_errors_are_retried_with_backoff(monkeypatch):
+    messages = FakeMessages(failures=[
+        api_error(RateLimitError, 429), api_error(RateLimitError, 429)
+    ])
+    service = make_service(monkeypatch, messages, max_retries=3)
+
+    assert await service._make_api_call("prompt") == '{"ok": true}'
+    assert messages.calls == 3
+
+
+async def test_client_errors_are_not_retried(monkeypatch):
+    messages = FakeMessages(failures=[api_error(BadRequestError, 400)])
+    service = make_service(monkeypatch, messages, max_retries=3)
+
+    with pytest.raises(BadRequestError):
+        await service._make_api_call("prompt")
+    assert messages.calls == 1
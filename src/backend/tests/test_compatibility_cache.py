@@ -0,0 +1,101 @@
+import time
+from datetime import datetime
+
+import fakeredis
+import pytest
+
+from app.agents.compatibility import cache as cache_module
+from app.agents.compatibility.cache import (
+    CompatibilityCache, InMemoryCacheBackend, RedisCacheBackend
+)
+from app.agents.compatibility.models import (
+    CompatibilityLevel, CompatibilityResult, CompatibilityType
+)
+
+
+def make_result(product_a_id=1, product_b_id=2):
+    return CompatibilityResult(
+        product_a_id=product_a_id,
+        product_b_id=product_b_id,
+        compatibility_type=CompatibilityType.TECHNICAL_SPECS,
+        compatibility_level=CompatibilityLevel.FULLY_COMPATIBLE,
+        confidence_score=0.9,
+        reasons=["λ = 0,035 W/mK"],
+        recommendations=[],
+        technical_notes=[],
+        checked_at=datetime(2026, 1, 1, 12, 0),
+    )
+
+
+@pytest.fixture(params=["memory", "redis"])
+def make_backend(request):
+    def factory(max_entries):
+        if request.param == "memory":
+            return InMemoryCacheBackend(max_entries=max_entries)
+        return RedisCacheBackend(client=fakeredis.FakeRedis(), max_entries=max_entries)
+    return factory
+
+
+def test_least_recently_used_entry_is_evicted(make_backend):
+    backend = make_backend(max_entries=2)
+    backend.set("a", "1", None)
+    time.sleep(0.01)  # Redis LRU scores are wall-clock timestamps
+    backend.set("b", "2", None)
+    time.sleep(0.01)
+    assert backend.get("a") == "1"  # "b" is now the least recently used
+    time.sleep(0.01)
+
+    backend.set("c", "3", None)
+
+    assert backend.get("b") is None
+    assert backend.get("a") == "1"
+    assert backend.get("c") == "3"
+    assert backend.size() == 2
+    assert backend.evictions == 1
+
+
+def test_memory_entries_expire_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    backend = InMemoryCacheBackend()
+    backend.set("a", "1", 60)
+
+    now[0] += 59
+    assert backend.get("a") == "1"
+    now[0] += 2
+    assert backend.get("a") is None
+    assert backend.expirations == 1
+
+
+def test_redis_entries_expire_after_ttl():
+    client = fakeredis.FakeRedis()
+    backend = RedisCacheBackend(client=client)
+    backend.set("a", "1", 60)
+    assert 0 < client.ttl("compatibility:a") <= 60
+
+    backend.set("b", "2", 1)
+    time.sleep(1.1)
+
+    assert backend.get("b") is None
+    assert backend.expirations == 1
+    assert backend.size() == 1
+
+
+def test_results_round_trip_through_redis():
+    cache = CompatibilityCache(backend=RedisCacheBackend(client=fakeredis.FakeRedis()))
+    cache.cache_result(1, 2, [make_result()], "v1", "v1")
+
+    # The pair is keyed symmetrically
+    cached = cache.get_cached_result(2, 1, "v1", "v1")
+
+    assert cached == [make_result()]
+    assert cache.stats["cache_hits"] == 1
+
+
+def test_changed_product_version_misses(make_backend):
+    cache = CompatibilityCache(backend=make_backend(max_entries=10))
+    cache.cache_result(1, 2, [make_result()], "2026-01-01", "2026-01-01")
+
+    assert cache.get_cached_result(1, 2, "2026-02-01", "2026-01-01") is None
+    assert cache.get_cached_result(1, 2, "2026-01-01", "2026-01-01") is not None
+    assert cache.stats["cache_misses"] == 1
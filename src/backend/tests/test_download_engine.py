@@ -0,0 +1,148 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from app.scrapers.download_engine import DownloadEngine, DownloadStateStore
+from app.scrapers.http_client import ScrapingHttpClient
+
+BODY = bytes(range(256)) * 64  # 16 KiB
+ETAG = '"datasheet-v1"'
+
+
+class DocumentHandler(BaseHTTPRequestHandler):
+    """Serves BODY with an ETag, answering conditional and Range requests."""
+
+    def do_GET(self):
+        self.server.requests.append(dict(self.headers))
+        if self.headers.get("If-None-Match") == ETAG:
+            self.send_response(304)
+            self.send_header("ETag", ETAG)
+            self.end_headers()
+            return
+
+        range_header = self.headers.get("Range")
+        if range_header and self.headers.get("If-Range") == ETAG:
+            offset = int(range_header.split("=")[1].rstrip("-"))
+            if offset >= len(BODY):
+                self.send_response(416)
+                self.send_header("Content-Range", f"bytes */{len(BODY)}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+            body = BODY[offset:]
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {offset}-{len(BODY) - 1}/{len(BODY)}"
+            )
+        else:
+            body = BODY
+            self.send_response(200)
+        self.send_header("Content-Type", "application/pdf")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", ETAG)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), DocumentHandler)
+    httpd.requests = []
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    client = ScrapingHttpClient(host_limits={}, http2=False)
+    yield DownloadEngine(
+        client=client, state_store=DownloadStateStore(tmp_path / "state.sqlite3")
+    )
+    await client.aclose()
+
+
+def document_url(server):
+    return f"http://127.0.0.1:{server.server_address[1]}/datasheet.pdf"
+
+
+async def test_fresh_download_streams_to_target(server, engine, tmp_path):
+    target = tmp_path / "datasheet.pdf"
+
+    result = await engine.download(
+        document_url(server), target, expected_content_type="pdf"
+    )
+
+    assert result.status == "downloaded"
+    assert result.changed
+    assert target.read_bytes() == BODY
+    assert not (tmp_path / "datasheet.pdf.part").exists()
+    assert engine.state_store.get(document_url(server))["etag"] == ETAG
+
+
+async def test_unchanged_document_costs_a_304(server, engine, tmp_path):
+    target = tmp_path / "datasheet.pdf"
+    await engine.download(document_url(server), target)
+
+    result = await engine.download(document_url(server), target)
+
+    assert result.status == "not_modified"
+    assert not result.changed
+    assert result.bytes_transferred == 0
+    assert server.requests[-1]["If-None-Match"] == ETAG
+    assert target.read_bytes() == BODY
+
+
+async def test_interrupted_download_resumes_with_range(server, engine, tmp_path):
+    url = document_url(server)
+    target = tmp_path / "datasheet.pdf"
+    offset = 5000
+    (tmp_path / "datasheet.pdf.part").write_bytes(BODY[:offset])
+    engine.state_store.put(url, target, ETAG, None, None, complete=False)
+
+    result = await engine.download(url, target)
+
+    assert result.status == "resumed"
+    assert result.bytes_transferred == len(BODY) - offset
+    assert server.requests[-1]["Range"] == f"bytes={offset}-"
+    assert server.requests[-1]["If-Range"] == ETAG
+    assert target.read_bytes() == BODY
+
+
+async def test_complete_partial_file_is_finished_on_416(server, engine, tmp_path):
+    url = document_url(server)
+    target = tmp_path / "datasheet.pdf"
+    (tmp_path / "datasheet.pdf.part").write_bytes(BODY)
+    engine.state_store.put(url, target, ETAG, None, None, complete=False)
+
+    result = await engine.download(url, target)
+
+    assert result.status == "resumed"
+    assert result.bytes_transferred == 0
+    assert target.read_bytes() == BODY
+    assert not (tmp_path / "datasheet.pdf.part").exists()
+    assert engine.state_store.get(url)["size"] == len(BODY)
+
+
+async def test_unsatisfiable_range_restarts_without_range(server, engine, tmp_path):
+    url = document_url(server)
+    target = tmp_path / "datasheet.pdf"
+    # Longer than the document: the range can never be satisfied
+    (tmp_path / "datasheet.pdf.part").write_bytes(BODY + b"garbage")
+    engine.state_store.put(url, target, ETAG, None, None, complete=False)
+
+    result = await engine.download(url, target)
+
+    assert result.status == "downloaded"
+    assert "Range" in server.requests[0]
+    assert "Range" not in server.requests[1]
+    assert target.read_bytes() == BODY
+
+    # A later run is not stuck on the rejected range either
+    assert (await engine.download(url, target)).status == "not_modified"
@@ -0,0 +1,71 @@
+import asyncio
+import json
+
+from app.scrapers.folder_crawler import FolderCrawler
+
+TREE = {
+    "root": ["a", "b"],
+    "a": ["a1"],
+    "b": ["b1", "b2"],
+    "a1": [],
+    "b1": [],
+    "b2": [],
+}
+
+
+async def test_interrupted_crawl_keeps_in_flight_nodes(tmp_path):
+    state_path = tmp_path / "crawl_state.json"
+    blocked = asyncio.Event()
+
+    async def blocking_process(node):
+        if node == "a":
+            blocked.set()
+            await asyncio.Event().wait()
+        return TREE[node], [f"item-{node}"]
+
+    crawler = FolderCrawler(blocking_process, concurrency=1, state_path=state_path)
+    crawl = asyncio.create_task(crawler.crawl(["root"]))
+    await asyncio.wait_for(blocked.wait(), timeout=5)
+    await asyncio.sleep(0.05)
+    crawl.cancel()
+    await asyncio.gather(crawl, return_exceptions=True)
+
+    state = json.loads(state_path.read_text(encoding="utf-8"))
+    assert sorted(state["frontier"]) == ["a", "b"]
+
+    async def process(node):
+        return TREE[node], [f"item-{node}"]
+
+    resumed = FolderCrawler(process, concurrency=2, state_path=state_path)
+    items = await resumed.crawl(["root"])
+
+    assert resumed.stats["resumed"]
+    assert sorted(items) == sorted(f"item-{node}" for node in TREE)
+    assert not state_path.exists()
+
+
+async def test_failing_node_does_not_block_later_crawls(tmp_path):
+    state_path = tmp_path / "crawl_state.json"
+    tree = {key: list(children) for key, children in TREE.items()}
+    attempts = []
+
+    async def process(node):
+        if node == "b":
+            attempts.append(node)
+            raise RuntimeError("HTTP 500")
+        return tree[node], [f"item-{node}"]
+
+    crawler = FolderCrawler(process, state_path=state_path)
+    await crawler.crawl(["root"])
+    assert crawler.failed == ["b"]
+    assert not state_path.exists()
+
+    # A folder added later is found by the next run from the roots
+    tree["root"].append("c")
+    tree["c"] = []
+    crawler = FolderCrawler(process, state_path=state_path)
+    items = await crawler.crawl(["root"])
+
+    assert not crawler.stats["resumed"]
+    assert "item-c" in items
+    assert attempts == ["b", "b"]
@@ -0,0 +1,76 @@
+import chromadb
+import pytest
+from chromadb.api.types import EmbeddingFunction
+
+from app.models.processing_models import PDFExtractionResult
+from app.services import ingestion_service
+from app.services.ingestion_service import DataIngestionService
+
+
+class LengthEmbedding(EmbeddingFunction):
+    """Offline stand-in for the default ONNX embedding model."""
+
+    def __init__(self):
+        pass
+
+    def __call__(self, input):
+        return [[float(len(text)), 1.0] for text in input]
+
+
+def make_result(text):
+    return PDFExtractionResult(
+        product_name="Airrock HD",
+        extracted_text=text,
+        technical_specs={},
+        pricing_info={},
+        tables_data=[],
+        confidence_score=0.9,
+        source_filename="airrock_hd.pdf",
+        processing_time=0.1,
+        extraction_method="pymupdf",
+        table_extraction_method="none",
+        table_quality_score=0.0,
+        advanced_tables_used=False,
+        extraction_metadata={"manufacturer": "ROCKWOOL"},
+    )
+
+
+@pytest.fixture
+def service(monkeypatch):
+    monkeypatch.setattr(DataIngestionService, "_init_chromadb", lambda self: None)
+    monkeypatch.setattr(
+        ingestion_service.get_chroma_pool(), "notify_ingest", lambda name: None
+    )
+    service = DataIngestionService(db_session=None)
+    client = chromadb.EphemeralClient()
+    service.chroma_collection = client.get_or_create_collection(
+        name="test_products", embedding_function=LengthEmbedding()
+    )
+    yield service
+    client.delete_collection("test_products")
+
+
+def chunk_ids(service, product_id):
+    found = service.chroma_collection.get(where={"product_id": product_id})
+    return sorted(found["ids"])
+
+
+@pytest.mark.parametrize("batched", [True, False])
+def test_reingesting_a_shorter_document_drops_old_chunks(service, batched):
+    def ingest(result, product_id):
+        if batched:
+            service._ingest_batch_to_chromadb([(result, product_id)], batch_size=2)
+        else:
+            service.ingest_to_chromadb(result, product_id)
+
+    ingest(make_result("x" * 3500), 7)
+    ingest(make_result("y" * 1500), 8)
+    assert len(chunk_ids(service, 7)) == 5  # general + 4 text chunks
+
+    ingest(make_result("z" * 500), 7)
+
+    assert chunk_ids(service, 7) == ["prod_7_chunk_0", "prod_7_chunk_1"]
+    [text_chunk] = service.chroma_collection.get(ids=["prod_7_chunk_1"])["documents"]
+    assert "zzz" in text_chunk
+    # Other products' chunks are untouched
+    assert len(chunk_ids(service, 8)) == 3
@@ -0,0 +1,64 @@
+import time
+
+import numpy as np
+
+from app.agents.near_duplicate import (
+    NearDuplicateIndex, normalize_text, optimal_bands, shingle_hashes, text_shingles
+)
+
+
+def test_optimal_bands_without_np_trapezoid(monkeypatch):
+    expected = optimal_bands(0.5, 128)
+    # NumPy < 2.0 has no np.trapezoid (and NumPy 2 dropped np.trapz)
+    monkeypatch.delattr(np, "trapezoid", raising=False)
+
+    assert optimal_bands(0.5, 128) == expected
+    bands, rows = expected
+    assert bands * rows <= 128
+
+
+def test_index_builds_with_computed_bands():
+    index = NearDuplicateIndex(lsh_threshold=0.5, num_perm=64)
+
+    assert index.bands * index.rows <= 64
+
+
+def test_shingle_hashes_match_the_shingle_set():
+    text = normalize_text("Airrock HD kőzetgyapot hőszigetelő lemez, λ = 0,035 W/mK " * 3)
+
+    assert len(shingle_hashes(text, 5)) == len(text_shingles(text, 5))
+    assert len(shingle_hashes("ab", 5)) == 1
+    assert len(shingle_hashes("", 5)) == 0
+
+
+def test_signature_estimates_jaccard_similarity():
+    index = NearDuplicateIndex(num_perm=256)
+    name = "Frontrock S"
+    description_a = "homlokzati vakolható kőzetgyapot lemez 50 mm vastagságban"
+    description_b = "homlokzati vakolható kőzetgyapot lemez 80 mm vastagságban"
+    shingles_a = text_shingles(normalize_text(f"{name} {description_a}"), 5)
+    shingles_b = text_shingles(normalize_text(f"{name} {description_b}"), 5)
+    jaccard = len(shingles_a & shingles_b) / len(shingles_a | shingles_b)
+
+    estimate = np.mean(
+        index.signature(name, description_a) == index.signature(name, description_b)
+    )
+
+    assert abs(estimate - jaccard) < 0.1
+
+
+def test_signatures_stay_cheap_for_large_batches():
+    random = np.random.RandomState(0)
+    words = "kőzetgyapot hőszigetelő lemez homlokzati tetőtéri lépésálló mm W/mK".split()
+    items = [
+        (f"Rockwool {i}", " ".join(random.choice(words, size=60)))
+        for i in range(2000)
+    ]
+    index = NearDuplicateIndex()
+
+    started = time.perf_counter()
+    for name, description in items:
+        index.signature(name, description)
+
+    # ~0.2 ms per product-sized text; the per-shingle crc32 version was 2-4× slower
+    assert time.perf_counter() - started < 2.0
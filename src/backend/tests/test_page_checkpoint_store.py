@@ -0,0 +1,27 @@
+from app.services.page_checkpoint_store import PageCheckpointStore
+
+
+def test_checkpoints_are_keyed_by_file_and_page(tmp_path):
+    store = PageCheckpointStore(tmp_path / "checkpoints.sqlite3")
+    store.put("hash-a", 1, "page one", [{"data": [["x"]]}])
+
+    assert store.get("hash-a", 1) == {"text": "page one", "tables": [{"data": [["x"]]}]}
+    assert store.get("hash-a", 2) is None
+    # Another file never receives this file's pages
+    assert store.get("hash-b", 1) is None
+    assert store.completed_pages("hash-a") == {1}
+
+
+def test_least_recently_used_pages_are_evicted(tmp_path, monkeypatch):
+    monkeypatch.setattr(
+        "app.services.page_checkpoint_store._EVICTION_CHECK_INTERVAL", 1
+    )
+    store = PageCheckpointStore(tmp_path / "checkpoints.sqlite3", max_pages=3)
+    for page in range(1, 4):
+        store.put("hash-a", page, f"page {page}", [])
+    store.get("hash-a", 1)  # Page 1 is now more recent than page 2
+
+    store.put("hash-a", 4, "page 4", [])
+
+    assert store.completed_pages("hash-a") == {1, 3, 4}
+    assert store.stats["evicted_pages"] == 1
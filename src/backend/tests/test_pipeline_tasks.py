@@ -0,0 +1,103 @@
+import fitz
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.database
+import app.processing.analysis_service
+import app.services.ingestion_service
+import processing.pdf_pipeline
+from app.celery_app import PIPELINE_TASK_ROUTES, celery_app
+from app.celery_tasks.pipeline_tasks import dispatch_task
+from app.models.processed_file import ProcessedFile
+from app.processing.file_handler import FileHandler
+from app.services.extraction_service import AdvancedTableExtractor, RealPDFExtractor
+
+
+class StubAnalysisService:
+    async def analyze_content(self, text_content, tables, pdf_name):
+        return {
+            "product_identification": {"product_name": "Airrock HD"},
+            "technical_specifications": {"thermal_conductivity": "0,035 W/mK"},
+            "pricing_information": {},
+            "extraction_metadata": {"confidence_score": 0.9},
+        }
+
+
+class RecordingIngestionService:
+    batches = []
+
+    def __init__(self, db_session):
+        pass
+
+    def ingest_batch(self, results, file_hashes, pdf_paths):
+        RecordingIngestionService.batches.append((results, file_hashes, pdf_paths))
+        return list(range(1, len(results) + 1))
+
+
+class NoStats:
+    def rank_methods(self, family, methods):
+        return list(methods)
+
+    def record(self, family, timings, winner):
+        pass
+
+
+@pytest.fixture
+def eager_celery(monkeypatch, tmp_path):
+    previous = (celery_app.conf.task_always_eager, celery_app.conf.task_eager_propagates)
+    celery_app.conf.update(task_always_eager=True, task_eager_propagates=True)
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'pipeline.sqlite3'}")
+    ProcessedFile.__table__.create(bind=engine)
+    monkeypatch.setattr(app.database, "SessionLocal", sessionmaker(bind=engine))
+    monkeypatch.setattr(FileHandler, "_index_ready", True)
+    monkeypatch.setattr(
+        app.processing.analysis_service, "AnalysisService", StubAnalysisService
+    )
+    monkeypatch.setattr(
+        app.services.ingestion_service, "DataIngestionService", RecordingIngestionService
+    )
+    monkeypatch.setattr(processing.pdf_pipeline, "_worker_extractors", (
+        RealPDFExtractor(checkpoint_store=None),
+        AdvancedTableExtractor(stats_store=NoStats()),
+    ))
+    RecordingIngestionService.batches = []
+    yield
+    celery_app.conf.update(
+        task_always_eager=previous[0], task_eager_propagates=previous[1]
+    )
+
+
+def make_pdf(path, text):
+    document = fitz.open()
+    page = document.new_page()
+    page.insert_text((72, 72), text)
+    document.save(str(path))
+    document.close()
+    return path
+
+
+def test_dispatch_runs_extract_analyze_and_ingest(eager_celery, tmp_path):
+    pdf_path = make_pdf(
+        tmp_path / "airrock_hd.pdf", "Airrock HD hovezetesi tenyezo 0,035 W/mK"
+    )
+
+    summary = dispatch_task.delay([str(pdf_path)]).get()
+
+    assert summary["pdfs"] == 1
+    assert summary["batches"] == 1
+    [(results, file_hashes, pdf_paths)] = RecordingIngestionService.batches
+    assert [str(path) for path in pdf_paths] == [str(pdf_path)]
+    assert results[0].product_name == "Airrock HD"
+    assert "Airrock HD" in results[0].extracted_text
+    assert file_hashes[0]
+
+
+def test_every_routed_task_is_registered():
+    celery_app.loader.import_default_modules()
+    registered = set(celery_app.tasks)
+
+    for route in PIPELINE_TASK_ROUTES:
+        if not route.endswith("*"):
+            assert route in registered
@@ -0,0 +1,88 @@
+from datetime import datetime, timedelta
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.models.category import Category
+from app.models.manufacturer import Manufacturer
+from app.models.product import Product
+from app.services.product_snapshot_cache import ProductSnapshotCache
+
+
+@pytest.fixture
+def session_factory(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'products.sqlite3'}")
+    for model in (Manufacturer, Category, Product):
+        model.__table__.create(bind=engine)
+    factory = sessionmaker(bind=engine)
+    db = factory()
+    db.add(Manufacturer(id=1, name="ROCKWOOL"))
+    db.add(Category(id=1, name="Hőszigetelés"))
+    for product_id in (1, 2, 3):
+        db.add(Product(
+            id=product_id, name=f"Termék {product_id}", sku=f"SKU-{product_id}",
+            manufacturer_id=1, category_id=1, created_at=datetime(2026, 1, 1),
+        ))
+    db.commit()
+    db.close()
+    return factory
+
+
+def replace_product(session_factory, deleted_id, new_id):
+    db = session_factory()
+    db.query(Product).filter(Product.id == deleted_id).delete()
+    db.add(Product(
+        id=new_id, name=f"Termék {new_id}", sku=f"SKU-{new_id}",
+        manufacturer_id=1, category_id=1,
+        created_at=datetime(2026, 1, 1) + timedelta(days=new_id),
+    ))
+    db.commit()
+    db.close()
+
+
+def test_delete_plus_insert_is_reconciled(session_factory):
+    cache = ProductSnapshotCache(session_factory=session_factory)
+    assert set(cache.refresh()) == {1, 2, 3}
+
+    replace_product(session_factory, deleted_id=2, new_id=4)
+    cache.invalidate()
+
+    assert set(cache.refresh()) == {1, 3, 4}
+    assert cache.stats["full_loads"] == 1
+    assert cache.stats["rows_deleted"] == 1
+
+
+def test_truncated_snapshot_still_drops_deleted_products(session_factory):
+    cache = ProductSnapshotCache(session_factory=session_factory, max_products=2)
+    snapshot = cache.refresh()
+    assert len(snapshot) == 2
+    assert cache.get_statistics()["truncated"]
+
+    deleted_id = next(iter(snapshot))
+    replace_product(session_factory, deleted_id=deleted_id, new_id=5)
+    cache.invalidate()
+
+    assert deleted_id not in cache.refresh()
+    assert cache.stats["full_loads"] == 1
+
+
+def test_late_commit_behind_the_mark_is_picked_up(session_factory):
+    cache = ProductSnapshotCache(session_factory=session_factory, overlap_seconds=60)
+    cache.refresh()
+    replace_product(session_factory, deleted_id=3, new_id=4)  # Mark: Jan 5
+    cache.invalidate()
+    cache.refresh()
+
+    # A long transaction stamped before the mark commits afterwards
+    db = session_factory()
+    db.add(Product(
+        id=6, name="Termék 6", sku="SKU-6", manufacturer_id=1, category_id=1,
+        created_at=datetime(2026, 1, 5) - timedelta(seconds=30),
+    ))
+    db.commit()
+    db.close()
+    cache.invalidate()
+
+    assert 6 in cache.refresh()
+    assert cache.stats["full_loads"] == 1
@@ -0,0 +1,50 @@
+from app.services import search_cache
+from app.services.chroma_pool import ChromaConnectionPool
+
+
+class FakeCollection:
+    def __init__(self):
+        self.documents = ["a", "b"]
+        self.queries = 0
+
+    def count(self):
+        return len(self.documents)
+
+    def query(self, query_embeddings, n_results):
+        self.queries += 1
+        return {"documents": [self.documents[:n_results]]}
+
+
+def make_cache(monkeypatch, **kwargs):
+    pool = ChromaConnectionPool(endpoints=[("localhost", 8000)])
+    collection = FakeCollection()
+    monkeypatch.setattr(pool, "get_collection", lambda name: collection)
+    monkeypatch.setattr(search_cache, "get_chroma_pool", lambda: pool)
+    cache = search_cache.RAGSearchCache(**kwargs)
+    cache._embedding_function = lambda texts: [[0.0, 1.0]]
+    return cache, pool, collection
+
+
+def test_ingest_in_this_process_invalidates_results(monkeypatch):
+    cache, pool, collection = make_cache(monkeypatch)
+
+    cache.search("products", "Kőzetgyapot  ", 5)
+    cache.search("products", "kőzetgyapot", 5)
+    assert collection.queries == 1
+
+    pool.notify_ingest("products")
+    cache.search("products", "kőzetgyapot", 5)
+    assert collection.queries == 2
+
+
+def test_write_by_another_process_is_seen_through_the_count(monkeypatch):
+    cache, pool, collection = make_cache(monkeypatch, count_max_age_seconds=0)
+
+    first = cache.search("products", "kőzetgyapot", 5)
+    # Another process adds a document: no ingest event reaches this one
+    collection.documents.append("c")
+    second = cache.search("products", "kőzetgyapot", 5)
+
+    assert collection.queries == 2
+    assert first["documents"] == [["a", "b"]]
+    assert second["documents"] == [["a", "b", "c"]]
@@ -0,0 +1,63 @@
+from pathlib import Path
+
+from app.services.extraction_service import AdvancedTableExtractor
+
+# 4 × 5 = 20 cells: full size score, so the score is 100 × bonus × accuracy
+FULL_TABLE = [[f"{row}:{col}" for col in range(5)] for row in range(4)]
+
+
+class FakeStatsStore:
+    def rank_methods(self, family, methods):
+        return list(methods)
+
+    def record(self, family, timings, winner):
+        pass
+
+
+def make_extractor(methods, candidate_pages=(1,)):
+    extractor = AdvancedTableExtractor(explore_rate=0.0, stats_store=FakeStatsStore())
+    calls = []
+
+    def method(name, accuracy=None):
+        def run(pdf_path, document, pages):
+            calls.append(name)
+            table = {'data': FULL_TABLE, 'method': name}
+            if accuracy is not None:
+                table['accuracy'] = accuracy
+            return [table]
+        return name, run
+
+    extractor.extraction_methods = [method(*spec) for spec in methods]
+    extractor._candidate_pages = lambda document: list(candidate_pages)
+    return extractor, calls
+
+
+def test_fallback_at_its_ceiling_does_not_stop_the_search():
+    extractor, calls = make_extractor(
+        [('pdfplumber_backup',), ('camelot_lattice', 90)]
+    )
+
+    result = extractor.extract_tables_hybrid(Path("datasheet.pdf"), document=object())
+
+    assert calls == ['pdfplumber_backup', 'camelot_lattice']
+    assert result.extraction_method == 'camelot_lattice'
+
+
+def test_early_exit_does_not_count_as_method_agreement():
+    extractor, calls = make_extractor(
+        [('camelot_lattice', 90), ('pdfplumber_backup',)]
+    )
+
+    result = extractor.extract_tables_hybrid(Path("datasheet.pdf"), document=object())
+
+    assert calls == ['camelot_lattice']
+    assert extractor.stats['early_exits'] == 1
+    # 0.7 × quality (0.9) + 0.3 × neutral agreement (0.5)
+    assert result.confidence == 0.78
+
+
+def test_no_table_pages_returns_no_result():
+    extractor, calls = make_extractor([('camelot_lattice', 90)], candidate_pages=())
+
+    assert extractor.extract_tables_hybrid(Path("datasheet.pdf"), document=object()) is None
+    assert calls == []
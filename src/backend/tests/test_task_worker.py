@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.mcp_orchestrator.models import TaskStatus
+from app.mcp_orchestrator.task_store import ExtractionTaskStore
+from app.mcp_orchestrator.task_worker import ExtractionWorkerPool
+
+
+class BlockingOrchestrator:
+    """Extraction that runs until it is cancelled."""
+
+    def __init__(self):
+        self.started = asyncio.Event()
+
+    async def extract_pdf(self, **kwargs):
+        self.started.set()
+        await asyncio.Event().wait()
+
+
+@pytest.fixture
+def store(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'jobs.sqlite3'}")
+    return ExtractionTaskStore(sessionmaker(bind=engine), bind=engine)
+
+
+def make_pool(store, orchestrator):
+    return ExtractionWorkerPool(
+        orchestrator=orchestrator,
+        store=store,
+        concurrency=1,
+        lease_seconds=0.3,
+        poll_interval=0.05,
+        worker_id="worker-1",
+    )
+
+
+async def test_cancelling_the_worker_releases_the_task(store):
+    task_id = store.submit("/tmp/a.pdf")
+    orchestrator = BlockingOrchestrator()
+    pool = make_pool(store, orchestrator)
+
+    pool_task = asyncio.create_task(pool.run())
+    await asyncio.wait_for(orchestrator.started.wait(), timeout=5)
+    pool_task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await asyncio.wait_for(pool_task, timeout=5)
+
+    job = store.get(task_id)
+    assert job["status"] == TaskStatus.PENDING.value
+    assert job["attempts"] == 0
+    assert pool.stats["cancelled"] == 0
+
+
+async def test_user_cancel_finishes_the_task_as_cancelled(store):
+    task_id = store.submit("/tmp/a.pdf")
+    orchestrator = BlockingOrchestrator()
+    pool = make_pool(store, orchestrator)
+
+    pool_task = asyncio.create_task(pool.run())
+    await asyncio.wait_for(orchestrator.started.wait(), timeout=5)
+    store.request_cancel(task_id)
+    for _ in range(50):
+        if store.get(task_id)["status"] == TaskStatus.CANCELLED.value:
+            break
+        await asyncio.sleep(0.05)
+    pool.stop()
+    await asyncio.wait_for(pool_task, timeout=5)
+
+    assert store.get(task_id)["status"] == TaskStatus.CANCELLED.value
+    assert pool.stats["cancelled"] == 1